@@ -848,8 +848,12 @@ def main(argv: list[str] | None = None) -> int:
         from contextlib import nullcontext
         ctx = nullcontext()
 
+    from edison.core.utils.git.service import enable_git_service
+
     result: int
-    with ctx:
+    # One git service per invocation: repository facts and worktree lists are
+    # memoized until Edison runs a git write (see edison.core.utils.git.service).
+    with ctx, enable_git_service():
         with span("cli.total"):
             help_requested = _is_help_requested(argv)
             spec = None if help_requested else _resolve_fast_command_module(argv)
@@ -1081,6 +1085,11 @@ def main(argv: list[str] | None = None) -> int:
         print("\nProfiling (top spans):", file=sys.stderr)
         for name, ms in top:
             print(f"- {name}: {ms:.1f}ms", file=sys.stderr)
+        counters = profiler.counters
+        if counters:
+            print("\nProfiling (counters):", file=sys.stderr)
+            for name, value in sorted(counters.items()):
+                print(f"- {name}: {value}", file=sys.stderr)
 
     return result
 
@@ -18,6 +18,8 @@ from pathlib import Path
 from typing import Dict, List, Any
 
 from edison.cli import OutputFormatter, add_json_flag, add_repo_root_flag, add_dry_run_flag, get_repo_root
+from edison.core.composition.core.tree_snapshot import get_tree_snapshot, layer_roots
+from edison.core.composition.includes.cache import IncludeCache, enable_include_cache
 from edison.core.composition.registries._types_manager import ComposableTypesManager
 from edison.core.config import ConfigManager
 from edison.core.config.domains.composition import CompositionConfig
@@ -117,7 +119,11 @@ def main(args: argparse.Namespace) -> int:
         profiling_enabled = bool(getattr(args, "profile", False))
         profiler = Profiler() if profiling_enabled else None
 
-        with (enable_profiler(profiler) if profiler else nullcontext()):
+        # One include cache per compose run: shared snippet files are read and
+        # section-parsed once across every content type and entity.
+        with (enable_profiler(profiler) if profiler else nullcontext()), enable_include_cache(
+            IncludeCache()
+        ) as include_cache:
             with span("compose.all.total"):
                 # Repo root + config
                 with span("compose.repo_root"):
@@ -133,6 +139,13 @@ def main(args: argparse.Namespace) -> int:
                     types_manager = ComposableTypesManager(project_root=repo_root)
                     adapter_loader = AdapterLoader(project_root=repo_root)
 
+                # List every layer directory once; each registry's discovery is
+                # then answered from the shared snapshot. Vendor checkouts are
+                # listed lazily (only the content-type dirs discovery asks for).
+                tree = get_tree_snapshot()
+                with span("compose.discovery.prime"):
+                    tree.prime(layer_roots(repo_root, include_vendors=False))
+
                 # Enabled types + request selection
                 enabled_types = {t.name for t in types_manager.get_enabled_types()}
 
@@ -285,6 +298,8 @@ def main(args: argparse.Namespace) -> int:
                     payload: Dict[str, Any] = dict(results)
                     if profiler is not None:
                         payload["profiling"] = profiler.to_dict()
+                        payload["profiling"]["include_cache"] = include_cache.stats.to_dict()
+                        payload["profiling"]["tree_snapshot"] = tree.stats.to_dict()
                     formatter.json_output(payload)
                 else:
                     for key, files in results.items():
@@ -0,0 +1,132 @@
+"""
+Edison compose watch command.
+
+SUMMARY: Watch layer directories and recompose only affected outputs on change
+
+Runs an initial full compose, then keeps config, registries and a source →
+output dependency graph warm. Each save recomposes and rewrites only the
+entities built from the changed file (and entities that include them).
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Optional
+
+from edison.cli import OutputFormatter, add_json_flag, add_repo_root_flag, get_repo_root
+from edison.core.composition.watch import IncrementalComposer, RebuildResult
+from edison.core.utils.fswatch import PollingWatcher, create_watcher
+
+SUMMARY = "Watch layer directories and recompose only affected outputs on change"
+
+
+def register_args(parser: argparse.ArgumentParser) -> None:
+    """Register command-specific arguments."""
+    parser.add_argument(
+        "--type",
+        dest="types",
+        action="append",
+        default=None,
+        help="Only watch/compose this content type (repeatable, e.g. --type guidelines)",
+    )
+    parser.add_argument(
+        "--polling",
+        action="store_true",
+        help="Use mtime polling instead of inotify",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        dest="poll_interval",
+        type=float,
+        default=0.25,
+        help="Polling interval in seconds when inotify is unavailable (default: 0.25)",
+    )
+    parser.add_argument(
+        "--max-rebuilds",
+        dest="max_rebuilds",
+        type=int,
+        default=None,
+        help="Exit after N incremental rebuilds (useful for scripting)",
+    )
+    add_json_flag(parser)
+    add_repo_root_flag(parser)
+
+
+def _report(formatter: OutputFormatter, result: RebuildResult, *, json_mode: bool) -> None:
+    if json_mode:
+        formatter.json_output(result.to_dict())
+        return
+    kind = "full" if result.full else "incremental"
+    formatter.text(
+        f"[{kind}] {len(result.written)} written, {len(result.removed)} removed "
+        f"in {result.duration_ms:.1f}ms"
+    )
+    if not result.full:
+        for entity in result.entities:
+            formatter.text(f"  - {entity}")
+
+
+def main(args: argparse.Namespace) -> int:
+    """Watch layers and recompose incrementally."""
+    json_mode = bool(getattr(args, "json", False))
+    formatter = OutputFormatter(json_mode=json_mode)
+
+    watcher = None
+    try:
+        repo_root = get_repo_root(args)
+        composer = IncrementalComposer(repo_root, types=getattr(args, "types", None))
+        _report(formatter, composer.full_build(), json_mode=json_mode)
+
+        roots = composer.watch_roots()
+        watcher = create_watcher(
+            roots,
+            ignore=composer.is_ignored,
+            force_polling=bool(getattr(args, "polling", False)),
+            poll_interval=float(getattr(args, "poll_interval", 0.25) or 0.25),
+        )
+        if not json_mode:
+            mode = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+            formatter.text(f"Watching {len(roots)} layer root(s) via {mode} (Ctrl+C to stop)")
+
+        max_rebuilds: Optional[int] = getattr(args, "max_rebuilds", None)
+        rebuilds = 0
+        stale = False
+        while max_rebuilds is None or rebuilds < max_rebuilds:
+            changed = watcher.wait(timeout=1.0)
+            if not changed and not getattr(watcher, "overflowed", False):
+                continue
+            try:
+                if stale or getattr(watcher, "overflowed", False):
+                    # Kernel dropped events, or the last rebuild failed part-way:
+                    # resync with a full rebuild.
+                    result = composer.reload()
+                else:
+                    result = composer.apply_changes(changed)
+            except Exception as e:
+                # Broken includes/config are routine while editing; keep watching.
+                stale = True
+                rebuilds += 1
+                formatter.error(e, error_code="compose_watch_rebuild_error")
+                continue
+            stale = False
+            if not result.written and not result.removed and not result.full:
+                continue
+            rebuilds += 1
+            _report(formatter, result, json_mode=json_mode)
+        return 0
+
+    except KeyboardInterrupt:
+        return 0
+    except Exception as e:
+        formatter.error(e, error_code="compose_watch_error")
+        return 1
+    finally:
+        if watcher is not None:
+            watcher.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    register_args(parser)
+    args = parser.parse_args()
+    sys.exit(main(args))
@@ -0,0 +1,67 @@
+"""
+Edison evidence archive command.
+
+SUMMARY: Pack old validation rounds into the task's evidence archive
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from edison.cli import OutputFormatter, add_json_flag, add_repo_root_flag, get_repo_root
+from edison.cli._utils import resolve_existing_task_id
+
+SUMMARY = "Pack old validation rounds into the task's evidence archive"
+
+
+def register_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("task_id", help="Task identifier")
+    parser.add_argument(
+        "--unpack",
+        type=int,
+        metavar="ROUND",
+        help="Restore an archived round directory instead of packing",
+    )
+    add_json_flag(parser)
+    add_repo_root_flag(parser)
+
+
+def main(args: argparse.Namespace) -> int:
+    formatter = OutputFormatter(json_mode=getattr(args, "json", False))
+    try:
+        project_root = get_repo_root(args)
+        task_id = resolve_existing_task_id(project_root=project_root, raw_task_id=str(args.task_id))
+
+        from edison.core.qa.evidence.service import EvidenceService
+
+        ev_svc = EvidenceService(task_id, project_root=project_root)
+        unpack = getattr(args, "unpack", None)
+        if unpack is not None:
+            round_dir = ev_svc.unpack_round(int(unpack))
+            payload = {"taskId": task_id, "unpacked": int(unpack), "roundDir": str(round_dir)}
+            message = f"Unpacked round {unpack} to {round_dir}"
+        else:
+            packed = ev_svc.archive_rounds()
+            payload = {"taskId": task_id, "packed": packed, "archived": ev_svc.archived_rounds()}
+            message = (
+                f"Packed rounds {', '.join(map(str, packed))} for {task_id}"
+                if packed
+                else f"No rounds to pack for {task_id} (the latest round stays on disk)"
+            )
+
+        if formatter.json_mode:
+            formatter.json_output(payload)
+        else:
+            formatter.text(message)
+        return 0
+
+    except Exception as e:
+        formatter.error(e, error_code="evidence_archive_error")
+        return 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    register_args(parser)
+    sys.exit(main(parser.parse_args()))
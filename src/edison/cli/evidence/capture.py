@@ -7,9 +7,11 @@ SUMMARY: Run configured CI commands and capture output as evidence
 from __future__ import annotations
 
 import argparse
+import codecs
+import math
 import os
-import subprocess
 import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
@@ -93,28 +95,49 @@ def _command_output_filename(command_name: str, *, evidence_files: dict[str, str
     return filename or f"command-{command_name}.txt"
 
 
-def _run_command(command: str, cwd: Path, *, pipefail: bool = True) -> tuple[int, str, datetime, datetime]:
-    """Run a shell command and capture combined stdout+stderr."""
+def _run_command(command: str, cwd: Path, output_path: Path, *, pipefail: bool = True) -> tuple[int, datetime, datetime]:
+    """Run a shell command, streaming its stdout+stderr into `output_path`.
+
+    Output is captured in bounded memory (teed to scratch files next to
+    `output_path`) and joined as UTF-8, so large test/build logs never have to
+    fit in memory.
+    """
+    from edison.core.utils.stream_capture import StreamCaptureOptions
+    from edison.core.utils.subprocess import run_with_timeout
+
     started_at = datetime.now(tz=timezone.utc)
     wrapped = f"set -o pipefail; {command}" if pipefail else command
+    stdout_path = output_path.with_name(output_path.name + ".stdout")
+    stderr_path = output_path.with_name(output_path.name + ".stderr")
     try:
-        cp = subprocess.run(
-            wrapped,
-            shell=True,
-            executable="/bin/bash",
+        cp = run_with_timeout(
+            ["/bin/bash", "-c", wrapped],
             cwd=str(cwd),
-            capture_output=True,
-            text=True,
+            timeout=math.inf,
             check=False,
-            env=None,
+            stream_capture=StreamCaptureOptions(stdout_path=stdout_path, stderr_path=stderr_path),
         )
         exit_code = int(cp.returncode)
-        output = (cp.stdout or "") + (cp.stderr or "")
+        _join_utf8([stdout_path, stderr_path], output_path)
     except Exception as e:
         exit_code = 1
-        output = str(e)
+        output_path.write_text(str(e), encoding="utf-8")
+    finally:
+        stdout_path.unlink(missing_ok=True)
+        stderr_path.unlink(missing_ok=True)
     completed_at = datetime.now(tz=timezone.utc)
-    return exit_code, output, started_at, completed_at
+    return exit_code, started_at, completed_at
+
+
+def _join_utf8(sources: list[Path], dest: Path) -> None:
+    """Concatenate `sources` into `dest`, replacing invalid UTF-8 as it streams."""
+    with open(dest, "wb") as out:
+        for src in sources:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            with open(src, "rb") as fh:
+                while chunk := fh.read(1 << 16):
+                    out.write(decoder.decode(chunk).encode("utf-8"))
+            out.write(decoder.decode(b"", final=True).encode("utf-8"))
 
 
 def main(args: argparse.Namespace) -> int:
@@ -253,6 +276,17 @@ def main(args: argparse.Namespace) -> int:
 
         evidence_files = evidence_files_cfg
 
+        from edison.core.qa.evidence.output_store import CommandOutputStore
+
+        output_store: CommandOutputStore | None = None
+        store_cfg = (qa_cfg.validation_config.get("evidence", {}) or {}).get("outputStore", {}) or {}
+        if isinstance(store_cfg, dict) and bool(store_cfg.get("enabled", False)):
+            output_store = CommandOutputStore.for_project(
+                project_root,
+                compression=str(store_cfg.get("compression") or "gzip"),
+                min_bytes=int(store_cfg.get("minBytes", 0) or 0),
+            )
+
         tdd_cfg = TDDConfig(repo_root=project_root)
         hmac_key = ""
         try:
@@ -336,61 +370,69 @@ def main(args: argparse.Namespace) -> int:
 
             return 0
 
-        for cmd_name, cmd_string in ci_commands.items():
-            cmd = str(cmd_string).strip()
-            if not cmd or _looks_like_placeholder(cmd):
-                continue
-
-            filename = str(evidence_files.get(cmd_name) or f"command-{cmd_name}.txt").strip()
-            if not filename:
-                filename = f"command-{cmd_name}.txt"
-
-            lock_info: dict[str, Any]
-            if no_lock:
-                lock_info = {
-                    "lockKey": f"evidence-capture:{cmd_name}",
-                    "lockPath": "",
-                    "waitedMs": 0,
-                    "lockBypassed": True,
-                }
-                exit_code, output, started_at, completed_at = _run_command(cmd, project_root, pipefail=True)
-            else:
-                from edison.core.utils.locks.evidence_capture import acquire_evidence_capture_lock
-
-                with acquire_evidence_capture_lock(
-                    project_root=project_root,
-                    command_group=cmd_name,
-                    session_id=session_id,
-                ) as acquired:
-                    lock_info = {**acquired, "lockBypassed": False}
-                    if not formatter.json_mode:
-                        formatter.text(
-                            f"Lock acquired for '{cmd_name}' (waited {int(acquired.get('waitedMs') or 0)}ms): "
-                            f"{acquired.get('lockPath')}"
+        # Streamed command output lands here before it is written as evidence.
+        with tempfile.TemporaryDirectory(prefix="edison-capture-") as scratch_name:
+            scratch = Path(scratch_name)
+            for cmd_name, cmd_string in ci_commands.items():
+                cmd = str(cmd_string).strip()
+                if not cmd or _looks_like_placeholder(cmd):
+                    continue
+
+                filename = str(evidence_files.get(cmd_name) or f"command-{cmd_name}.txt").strip()
+                if not filename:
+                    filename = f"command-{cmd_name}.txt"
+
+                lock_info: dict[str, Any]
+                if no_lock:
+                    lock_info = {
+                        "lockKey": f"evidence-capture:{cmd_name}",
+                        "lockPath": "",
+                        "waitedMs": 0,
+                        "lockBypassed": True,
+                    }
+                    exit_code, started_at, completed_at = _run_command(
+                        cmd, project_root, scratch / Path(filename).name, pipefail=True
+                    )
+                else:
+                    from edison.core.utils.locks.evidence_capture import acquire_evidence_capture_lock
+
+                    with acquire_evidence_capture_lock(
+                        project_root=project_root,
+                        command_group=cmd_name,
+                        session_id=session_id,
+                    ) as acquired:
+                        lock_info = {**acquired, "lockBypassed": False}
+                        if not formatter.json_mode:
+                            formatter.text(
+                                f"Lock acquired for '{cmd_name}' (waited {int(acquired.get('waitedMs') or 0)}ms): "
+                                f"{acquired.get('lockPath')}"
+                            )
+                        exit_code, started_at, completed_at = _run_command(
+                            cmd, project_root, scratch / Path(filename).name, pipefail=True
                         )
-                    exit_code, output, started_at, completed_at = _run_command(cmd, project_root, pipefail=True)
-
-            evidence_path = snap_dir / filename
-            write_command_evidence(
-                path=evidence_path,
-                task_id=task_id,
-                round_num=0,
-                command_name=cmd_name,
-                command=cmd,
-                cwd=str(project_root),
-                exit_code=exit_code,
-                output=output,
-                started_at=started_at,
-                completed_at=completed_at,
-                shell="bash",
-                pipefail=True,
-                runner="edison evidence capture",
-                hmac_key=hmac_key or None,
-                fingerprint=fingerprint,
-            )
 
-            results.append(
-                {
+                evidence_path = snap_dir / filename
+                blob = write_command_evidence(
+                    path=evidence_path,
+                    task_id=task_id,
+                    round_num=0,
+                    command_name=cmd_name,
+                    command=cmd,
+                    cwd=str(project_root),
+                    exit_code=exit_code,
+                    output="",
+                    output_path=scratch / Path(filename).name,
+                    started_at=started_at,
+                    completed_at=completed_at,
+                    shell="bash",
+                    pipefail=True,
+                    runner="edison evidence capture",
+                    hmac_key=hmac_key or None,
+                    fingerprint=fingerprint,
+                    output_store=output_store,
+                )
+
+                result: dict[str, Any] = {
                     "name": cmd_name,
                     "command": cmd,
                     "exitCode": exit_code,
@@ -398,29 +440,35 @@ def main(args: argparse.Namespace) -> int:
                     "path": str(evidence_path.relative_to(project_root)),
                     "lock": lock_info,
                 }
-            )
-            if exit_code == 0:
-                passed += 1
-            else:
-                failed += 1
-                if not formatter.json_mode:
-                    display_path = str(evidence_path)
-                    try:
-                        display_path = str(evidence_path.relative_to(project_root))
-                    except Exception:
+                if blob is not None:
+                    result["outputBlob"] = {
+                        **blob.frontmatter(),
+                        "storedBytes": blob.stored_size,
+                        "deduplicated": blob.deduplicated,
+                    }
+                results.append(result)
+                if exit_code == 0:
+                    passed += 1
+                else:
+                    failed += 1
+                    if not formatter.json_mode:
                         display_path = str(evidence_path)
-
-                    print(
-                        f"Command '{cmd_name}' failed (exitCode={exit_code}). Evidence: {display_path}",
-                        file=sys.stderr,
-                    )
-                    print(
-                        "Hint: if this is due to missing environment variables, configure them in `.edison/config/ci.yaml` "
-                        f"under `ci.commands.{cmd_name}` (or prefix env vars when running `edison evidence capture`).",
-                        file=sys.stderr,
-                    )
-                if not continue_on_failure:
-                    break
+                        try:
+                            display_path = str(evidence_path.relative_to(project_root))
+                        except Exception:
+                            display_path = str(evidence_path)
+
+                        print(
+                            f"Command '{cmd_name}' failed (exitCode={exit_code}). Evidence: {display_path}",
+                            file=sys.stderr,
+                        )
+                        print(
+                            "Hint: if this is due to missing environment variables, configure them in `.edison/config/ci.yaml` "
+                            f"under `ci.commands.{cmd_name}` (or prefix env vars when running `edison evidence capture`).",
+                            file=sys.stderr,
+                        )
+                    if not continue_on_failure:
+                        break
 
         payload: dict[str, Any] = {
             "taskId": task_id,
@@ -436,6 +484,8 @@ def main(args: argparse.Namespace) -> int:
             ),
             "preset": resolved_preset,
         }
+        if output_store is not None:
+            payload["outputStore"] = output_store.stats()
 
         # Always include the preset-aware status for the current repo fingerprint so
         # agents running a targeted `--only` capture don't mistakenly assume they
@@ -456,6 +506,13 @@ def main(args: argparse.Namespace) -> int:
             formatter.text(f"Captured {len(results)} command(s): {passed} passed, {failed} failed (mode={mode_label}{preset_label})")
             if results:
                 formatter.text("Review evidence outputs before proceeding.")
+            store_stats = payload.get("outputStore") or {}
+            if store_stats.get("outputs"):
+                formatter.text(
+                    f"Output store: {store_stats['blobs']} blob(s) for {store_stats['outputs']} output(s), "
+                    f"{store_stats['storedBytes']} of {store_stats['logicalBytes']} bytes on disk "
+                    f"(saved {store_stats['savedBytes']})"
+                )
             if preset_status is not None and not bool(preset_status.get("success", False)):
                 missing_files = preset_status.get("missing") or []
                 missing_cmds = preset_status.get("missingCommands") or []
@@ -14,6 +14,7 @@ from typing import Any, Dict, Optional
 
 from edison.cli import OutputFormatter, add_json_flag
 from edison.core.session import worktree
+from edison.core.utils.git.service import note_git_command
 
 SUMMARY = "Commit changes in the shared-state meta worktree"
 
@@ -64,6 +65,7 @@ def _run_git_commit(
         if stage_all:
             cmd.insert(2, "-a")
 
+        note_git_command(cmd)
         cp = subprocess.run(
             cmd,
             cwd=cwd,
@@ -0,0 +1,72 @@
+"""
+Edison git worktree-pool command.
+
+SUMMARY: Manage the pre-warmed session worktree pool
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from edison.cli import OutputFormatter, add_json_flag
+from edison.core.session import worktree
+
+SUMMARY = "Manage the pre-warmed session worktree pool"
+
+
+def register_args(parser: argparse.ArgumentParser) -> None:
+    """Register command-specific arguments."""
+    parser.add_argument(
+        "--fill",
+        action="store_true",
+        help="Create entries until the pool holds worktrees.pool.size ready worktrees",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Validate pool entries and remove unhealthy ones",
+    )
+    parser.add_argument(
+        "--base-branch",
+        type=str,
+        help="Base ref for new pool entries (default: resolved session base ref)",
+    )
+    add_json_flag(parser)
+
+
+def main(args: argparse.Namespace) -> int:
+    """Fill, check, or list the worktree pool - delegates to worktree library."""
+    formatter = OutputFormatter(json_mode=getattr(args, "json", False))
+
+    try:
+        result: dict = {}
+        if args.check:
+            result.update(worktree.check_worktree_pool())
+        if args.fill:
+            created = worktree.fill_worktree_pool(base_branch=args.base_branch)
+            result["created"] = [str(p) for p in created]
+        entries = worktree.list_pool_entries()
+        result["ready"] = entries
+
+        if args.json:
+            formatter.json_output(result)
+        else:
+            for label in ("removed", "created"):
+                for path in result.get(label) or []:
+                    formatter.text(f"{label.capitalize()}: {path}")
+            formatter.text(f"Ready pool worktrees: {len(entries)}")
+            for entry in entries:
+                formatter.text(f"  {entry.get('path')} @ {str(entry.get('commit') or '')[:12]}")
+        return 0
+
+    except Exception as e:
+        formatter.error(e, error_code="worktree_pool_error")
+        return 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    register_args(parser)
+    args = parser.parse_args()
+    sys.exit(main(args))
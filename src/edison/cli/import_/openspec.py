@@ -46,6 +46,11 @@ def register_args(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Skip creating QA records for imported tasks",
     )
+    parser.add_argument(
+        "--atomic",
+        action="store_true",
+        help="Write all imported task and QA files or none (staged publish)",
+    )
     add_dry_run_flag(parser)
     add_json_flag(parser)
     add_repo_root_flag(parser)
@@ -83,6 +88,7 @@ def main(args: argparse.Namespace) -> int:
             dry_run=dry_run,
             include_archived=include_archived,
             project_root=repo_root,
+            staged=bool(getattr(args, "atomic", False)),
         )
 
         output = {
@@ -42,6 +42,11 @@ def register_args(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Skip creating QA records for imported tasks",
     )
+    parser.add_argument(
+        "--atomic",
+        action="store_true",
+        help="Write all imported task and QA files or none (staged publish)",
+    )
     add_dry_run_flag(parser)
     add_json_flag(parser)
     add_repo_root_flag(parser)
@@ -86,6 +91,7 @@ def main(args: argparse.Namespace) -> int:
             create_qa=create_qa,
             dry_run=dry_run,
             project_root=repo_root,
+            staged=bool(getattr(args, "atomic", False)),
         )
 
         # Format output
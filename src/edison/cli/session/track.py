@@ -157,6 +157,12 @@ def register_args(parser: argparse.ArgumentParser) -> None:
         action="store_true",
         help="Include stopped processes (default: active only)",
     )
+    processes_parser.add_argument(
+        "--tail",
+        type=int,
+        metavar="LINES",
+        help="Show the last LINES of output for processes with a log (orchestrators)",
+    )
     add_json_flag(processes_parser)
     add_repo_root_flag(processes_parser)
 
@@ -312,6 +318,22 @@ def main(args: argparse.Namespace) -> int:
 
             active_only = not bool(getattr(args, "all", False))
             procs = list_processes(repo_root=repo_root, active_only=active_only)
+            tail_lines = getattr(args, "tail", None)
+            if tail_lines is not None:
+                from edison.core.orchestrator.pty_pump import get_output_tail, read_log_tail
+
+                for it in procs:
+                    log_path = it.get("logPath")
+                    if not log_path:
+                        continue
+                    # Prefer the in-memory ring buffer (same process); else seek to the log's end.
+                    pid = it.get("processId")
+                    live = get_output_tail(str(it.get("sessionId") or ""), int(pid)) if pid else None
+                    it["outputTail"] = (
+                        live.text(lines=int(tail_lines))
+                        if live is not None
+                        else read_log_tail(Path(str(log_path)), lines=int(tail_lines))
+                    )
             if formatter.json_mode:
                 formatter.json_output({"processes": procs, "count": len(procs)})
             else:
@@ -325,6 +347,8 @@ def main(args: argparse.Namespace) -> int:
                         sid = it.get("sessionId")
                         ref = f"task={task}" if task else f"session={sid}" if sid else "unscoped"
                         formatter.text(f"- {kind} pid={pid} {ref} state={it.get('state')}")
+                        for line in str(it.get("outputTail") or "").splitlines():
+                            formatter.text(f"    | {line}")
 
         return 0
 
@@ -108,8 +108,10 @@ def audit_event(event: str, *, repo_root: Path | None = None, **fields: Any) ->
 def truncate_text(text: str, *, max_bytes: int) -> str:
     if max_bytes <= 0:
         return ""
-    raw = text.encode("utf-8", errors="replace")
-    if len(raw) <= max_bytes:
+    # Every char encodes to >= 1 byte, so a max_bytes-char prefix covers the
+    # clipped region without encoding (a potentially huge) full text.
+    raw = text[:max_bytes].encode("utf-8", errors="replace")
+    if len(text) <= max_bytes and len(raw) <= max_bytes:
         return text
     clipped = raw[:max_bytes]
     return clipped.decode("utf-8", errors="replace")
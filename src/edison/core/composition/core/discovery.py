@@ -11,13 +11,13 @@ Directory conventions:
 """
 from __future__ import annotations
 
-import os
 from dataclasses import dataclass
 from fnmatch import fnmatch
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
 from .errors import CompositionValidationError
+from .tree_snapshot import TreeSnapshot, get_tree_snapshot
 
 
 @dataclass
@@ -54,6 +54,7 @@ class LayerDiscovery:
         exclude_globs: Optional[List[str]] = None,
         allow_shadowing: bool = False,
         vendor_roots: Optional[List[Tuple[str, Path]]] = None,
+        tree: Optional[TreeSnapshot] = None,
     ) -> None:
         self.content_type = content_type
         self.core_dir = core_dir
@@ -75,6 +76,8 @@ class LayerDiscovery:
         self.file_pattern = file_pattern
         self.exclude_globs = list(exclude_globs or [])
         self.allow_shadowing = allow_shadowing
+        # Directory listings are shared by every registry in the process.
+        self.tree = tree if tree is not None else get_tree_snapshot()
         self._core_cache: Optional[Dict[str, LayerSource]] = None
         self._vendor_new_cache: Dict[str, Dict[str, LayerSource]] = {}
         self._vendor_overlay_cache: Dict[str, Dict[str, LayerSource]] = {}
@@ -105,26 +108,23 @@ class LayerDiscovery:
         return False
 
     def _iter_matching_files(
-        self, root_dir: Path, *, exclude_dirnames: Set[str] | None = None
-    ):
-        """Yield files under root_dir matching file_pattern without following symlinks."""
-        exclude_dirnames = exclude_dirnames or set()
-        for dirpath, dirnames, filenames in os.walk(root_dir, followlinks=False):
-            dirpath_path = Path(dirpath)
-            # Prune excluded directories and symlinked directories.
-            dirnames[:] = [
-                d
-                for d in dirnames
-                if d not in exclude_dirnames and not (dirpath_path / d).is_symlink()
-            ]
-            for filename in filenames:
-                if not fnmatch(filename, self.file_pattern):
-                    continue
-                path = dirpath_path / filename
-                if path.is_symlink():
-                    continue
-                yield path
-    
+        self,
+        root_dir: Path,
+        *,
+        exclude_dirnames: Set[str] | None = None,
+        include_symlinks: bool = False,
+    ) -> List[Path]:
+        """Return files under root_dir matching file_pattern without following symlinked dirs.
+
+        Symlinked files are skipped unless include_symlinks is True.
+        """
+        return self.tree.files(
+            root_dir,
+            self.file_pattern,
+            exclude_dirnames=exclude_dirnames or (),
+            include_symlinks=include_symlinks,
+        )
+
     def discover_core(self) -> Dict[str, LayerSource]:
         """Discover all core entity definitions."""
         if self._core_cache is not None:
@@ -137,11 +137,11 @@ class LayerDiscovery:
             self._core_cache = entities
             return entities
         
-        # Support both flat and nested structures
-        for path in type_dir.rglob(self.file_pattern):
-            # Skip files in overlays/ (shouldn't exist in core, but be safe)
-            if "overlays" in path.parts:
-                continue
+        # Support both flat and nested structures; skip overlays/ (shouldn't
+        # exist in core, but be safe).
+        for path in self._iter_matching_files(
+            type_dir, exclude_dirnames={"overlays"}, include_symlinks=True
+        ):
             if self._is_excluded(type_dir, path):
                 continue
             name = self._entity_key(type_dir, path)
@@ -334,9 +334,9 @@ class LayerDiscovery:
             self._pack_new_cache[cache_key] = entities
             return entities
 
-        for path in type_dir.rglob(self.file_pattern):
-            if "overlays" in path.parts:
-                continue
+        for path in self._iter_matching_files(
+            type_dir, exclude_dirnames={"overlays"}, include_symlinks=True
+        ):
             if self._is_excluded(type_dir, path):
                 continue
             name = self._entity_key(type_dir, path)
@@ -362,7 +362,7 @@ class LayerDiscovery:
             self._pack_overlay_cache[cache_key] = entities
             return entities
 
-        for path in overlays_dir.rglob(self.file_pattern):
+        for path in self._iter_matching_files(overlays_dir, include_symlinks=True):
             if self._is_excluded(overlays_dir, path):
                 continue
             name = self._entity_key(overlays_dir, path)
@@ -427,9 +427,9 @@ class LayerDiscovery:
             self._layer_new_cache[cache_key] = entities
             return entities
 
-        for path in type_dir.rglob(self.file_pattern):
-            if "overlays" in path.parts:
-                continue
+        for path in self._iter_matching_files(
+            type_dir, exclude_dirnames={"overlays"}, include_symlinks=True
+        ):
             if self._is_excluded(type_dir, path):
                 continue
             name = self._entity_key(type_dir, path)
@@ -454,7 +454,7 @@ class LayerDiscovery:
             self._layer_overlay_cache[cache_key] = entities
             return entities
 
-        for path in overlays_dir.rglob(self.file_pattern):
+        for path in self._iter_matching_files(overlays_dir, include_symlinks=True):
             if self._is_excluded(overlays_dir, path):
                 continue
             name = self._entity_key(overlays_dir, path)
@@ -0,0 +1,212 @@
+"""Process-wide snapshot of layer directory trees.
+
+Every `ComposableRegistry` builds its own `LayerDiscovery`, and every discovery
+walks the same layer roots (core, vendors, pack roots, overlay layers) with its
+own `rglob`. `compose all` therefore lists the same directories once per content
+type. `TreeSnapshot` lists each directory once per process and answers every
+registry's query (`files(type_dir, pattern)`) from memory.
+
+Invalidation is by directory mtime: adding, removing or renaming an entry
+updates the mtime of its parent directory, so a query re-stats the directories
+it visits (cheap) and re-lists only those whose (mtime_ns, inode) changed.
+Directories modified within `_RACY_WINDOW_NS` of being listed are re-listed on
+the next query, so writes landing in the same timestamp tick are never missed.
+
+Traversal semantics match the previous `Path.rglob` / `os.walk(followlinks=False)`
+scans: symlinked directories are never descended into, results are yielded in
+pre-order (a directory's files before its subdirectories).
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from edison.core.config.cache import register_cache_clearer
+
+# Coarse filesystem timestamps (e.g. 1s/2s granularity) can hide a write that
+# lands in the same tick as the listing; treat such listings as unverified.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass
+class _DirListing:
+    stamp: Tuple[int, int]  # (st_mtime_ns, st_ino)
+    listed_ns: int
+    files: List[Tuple[str, bool]] = field(default_factory=list)  # (name, is_symlink)
+    dirs: List[str] = field(default_factory=list)  # real (non-symlink) subdirectories
+
+    @property
+    def trusted(self) -> bool:
+        return self.stamp[0] < self.listed_ns - _RACY_WINDOW_NS
+
+
+@dataclass
+class TreeSnapshotStats:
+    """Counters for profiling snapshot effectiveness."""
+
+    listings: int = 0
+    reused: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"listings": self.listings, "reused": self.reused}
+
+
+class TreeSnapshot:
+    """Shared directory listings validated by directory mtimes."""
+
+    def __init__(self) -> None:
+        self._dirs: Dict[str, _DirListing] = {}
+        self._lock = threading.Lock()
+        self.stats = TreeSnapshotStats()
+
+    def _list(self, directory: str, stamp: Tuple[int, int]) -> _DirListing:
+        listing = _DirListing(stamp=stamp, listed_ns=time.time_ns())
+        with os.scandir(directory) as it:
+            for entry in it:
+                try:
+                    is_symlink = entry.is_symlink()
+                    if entry.is_dir(follow_symlinks=False):
+                        listing.dirs.append(entry.name)
+                    elif not (is_symlink and entry.is_dir()):
+                        listing.files.append((entry.name, is_symlink))
+                except OSError:
+                    continue
+        self.stats.listings += 1
+        return listing
+
+    def _listing(self, directory: str) -> Optional[_DirListing]:
+        try:
+            st = os.stat(directory)
+        except OSError:
+            with self._lock:
+                self._dirs.pop(directory, None)
+            return None
+        stamp = (st.st_mtime_ns, st.st_ino)
+        with self._lock:
+            cached = self._dirs.get(directory)
+        if cached is not None and cached.stamp == stamp and cached.trusted:
+            self.stats.reused += 1
+            return cached
+        try:
+            listing = self._list(directory, stamp)
+        except OSError:
+            return None
+        with self._lock:
+            self._dirs[directory] = listing
+        return listing
+
+    def walk(
+        self,
+        root: Path,
+        *,
+        exclude_dirnames: Iterable[str] = (),
+    ) -> Iterator[Tuple[Path, List[Tuple[str, bool]]]]:
+        """Yield (directory, files) for `root` and its real subdirectories in pre-order."""
+        excluded = set(exclude_dirnames)
+        stack = [str(root)]
+        while stack:
+            current = stack.pop()
+            listing = self._listing(current)
+            if listing is None:
+                continue
+            yield Path(current), listing.files
+            stack.extend(
+                os.path.join(current, d) for d in reversed(listing.dirs) if d not in excluded
+            )
+
+    def files(
+        self,
+        root: Path,
+        pattern: str,
+        *,
+        exclude_dirnames: Iterable[str] = (),
+        include_symlinks: bool = True,
+    ) -> List[Path]:
+        """Return files under `root` whose name matches `pattern` (fnmatch)."""
+        out: List[Path] = []
+        for directory, files in self.walk(root, exclude_dirnames=exclude_dirnames):
+            for name, is_symlink in files:
+                if is_symlink and not include_symlinks:
+                    continue
+                if fnmatch(name, pattern):
+                    out.append(directory / name)
+        return out
+
+    def prime(self, roots: Iterable[Path]) -> None:
+        """List every directory under `roots` up front (one scandir pass)."""
+        for root in roots:
+            for _ in self.walk(root):
+                pass
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Forget listings for `path` and below (or everything)."""
+        with self._lock:
+            if path is None:
+                self._dirs.clear()
+                return
+            prefix = str(path)
+            for key in [k for k in self._dirs if k == prefix or k.startswith(prefix + os.sep)]:
+                self._dirs.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._dirs)
+
+
+def layer_roots(project_root: Path, *, include_vendors: bool = True) -> List[Path]:
+    """Distinct layer roots (core, vendors, pack roots, overlay layers) for a project.
+
+    Roots nested inside another root are folded into it. Vendor roots are whole
+    external checkouts; pass include_vendors=False to leave them out.
+    """
+    from .paths import CompositionPathResolver
+
+    ctx = CompositionPathResolver(project_root).layer_context
+    candidates: List[Path] = [ctx.core_dir]
+    if include_vendors:
+        candidates.extend(p for _name, p in ctx.vendor_roots)
+    candidates.extend(r.path for r in ctx.pack_roots)
+    candidates.extend(p for _id, p in ctx.overlay_layers)
+
+    roots: List[Path] = []
+    for cand in candidates:
+        try:
+            resolved = cand.resolve()
+        except OSError:
+            continue
+        if not resolved.is_dir():
+            continue
+        if any(resolved == r or r in resolved.parents for r in roots):
+            continue
+        roots = [r for r in roots if resolved not in r.parents]
+        roots.append(resolved)
+    return roots
+
+
+_SNAPSHOT = TreeSnapshot()
+
+
+def get_tree_snapshot() -> TreeSnapshot:
+    """Return the process-wide layer tree snapshot."""
+    return _SNAPSHOT
+
+
+def clear_tree_snapshot() -> None:
+    """Drop all cached directory listings."""
+    _SNAPSHOT.invalidate()
+
+
+register_cache_clearer("composition.tree_snapshot", clear_tree_snapshot)
+
+
+__all__ = [
+    "TreeSnapshot",
+    "TreeSnapshotStats",
+    "clear_tree_snapshot",
+    "get_tree_snapshot",
+    "layer_roots",
+]
@@ -29,7 +29,7 @@ from __future__ import annotations
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from .core.report import CompositionReport
 from .core.sections import SectionParser
@@ -43,6 +43,9 @@ from .transformers.references import ReferenceRenderer
 from .transformers.variables import VariableTransformer
 from .transformers.functions import FunctionTransformer
 
+if TYPE_CHECKING:
+    from .includes.cache import IncludeCache
+
 
 class CodeLiteralProtector(ContentTransformer):
     """Protect template directive tokens inside Markdown code spans/fences.
@@ -157,6 +160,8 @@ class ConditionalTransformer(ContentTransformer):
             full_path = self._resolve_path(path, context)
             if full_path and full_path.exists():
                 context.record_include(path)
+                if context.file_cache is not None:
+                    return context.file_cache.read_text(full_path)
                 return full_path.read_text(encoding="utf-8")
             return ""
 
@@ -255,6 +260,7 @@ class TemplateEngine:
         *,
         strip_section_markers: bool = True,
         protect_code_literals: bool = True,
+        include_cache: Optional["IncludeCache"] = None,
     ) -> None:
         """Initialize the template engine.
 
@@ -263,6 +269,8 @@ class TemplateEngine:
             packs: List of active pack names
             project_root: Project root path
             source_dir: Directory for resolving includes
+            include_cache: Run-level include cache (defaults to the active one,
+                see `edison.core.composition.includes.cache.enable_include_cache`)
         """
         self.config = config or {}
         self.packs = packs or []
@@ -271,6 +279,11 @@ class TemplateEngine:
         self.include_provider = include_provider
         self.strip_section_markers = strip_section_markers
         self.protect_code_literals = protect_code_literals
+        if include_cache is None:
+            from .includes.cache import get_active_include_cache
+
+            include_cache = get_active_include_cache()
+        self.include_cache = include_cache
 
         # Load custom functions from layered functions/ folders
         try:
@@ -374,6 +387,8 @@ class TemplateEngine:
             include_provider=self.include_provider,
             strip_section_markers=self.strip_section_markers,
             context_vars=merged_vars,
+            file_cache=self.include_cache,
+            dependent=f"{entity_type}/{entity_name}",
         )
 
         # Execute pipeline
@@ -5,10 +5,19 @@ NOTE:
 - This package provides *where to load include targets from* (the composed view).
 """
 
+from .cache import IncludeCache, enable_include_cache, get_active_include_cache
 from .provider import ComposedIncludeProvider, merge_extends_preserve_sections
 from .resolution import ComposeError, resolve_includes
 
-__all__ = ["ComposedIncludeProvider", "merge_extends_preserve_sections", "ComposeError", "resolve_includes"]
+__all__ = [
+    "ComposedIncludeProvider",
+    "merge_extends_preserve_sections",
+    "ComposeError",
+    "resolve_includes",
+    "IncludeCache",
+    "enable_include_cache",
+    "get_active_include_cache",
+]
 
 
 
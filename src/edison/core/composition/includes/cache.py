@@ -0,0 +1,239 @@
+"""Per-compose-run include cache shared across composed entities.
+
+`compose all` renders hundreds of entities, and many of them include the same
+shared snippets (`{{include:...}}` / `{{include-section:...}}`). The per-entity
+`TransformContext` caches only help within a single entity; this module keeps
+file contents and a parsed section map per include target for the whole run.
+
+Entries are keyed by the resolved file path and validated against the file's
+(mtime_ns, size) so an edit between two lookups is always observed. The cache
+also records the include graph (entity → include targets) so callers holding
+composed output can invalidate exactly the dependents of a changed file.
+
+Usage:
+    with enable_include_cache(IncludeCache()):
+        ... compose ...
+
+TemplateEngine picks up the active cache automatically (ContextVar-based, the
+same pattern as `edison.core.utils.profiling`).
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from edison.core.composition.core.sections import SectionParser
+
+
+_ACTIVE_INCLUDE_CACHE: ContextVar["IncludeCache | None"] = ContextVar(
+    "_ACTIVE_INCLUDE_CACHE", default=None
+)
+
+
+@dataclass
+class _SectionIndex:
+    """Parsed section map for one piece of content."""
+
+    sections: Dict[str, str]
+    # Lookups that were not in the single-pass map (nested/overlapping or
+    # case-variant names) are resolved once via SectionParser and memoized.
+    fallback: Dict[str, Optional[str]] = field(default_factory=dict)
+
+
+@dataclass
+class _FileEntry:
+    stamp: Tuple[int, int]  # (mtime_ns, size)
+    content: str
+    index: Optional[_SectionIndex] = None
+
+
+@dataclass
+class IncludeCacheStats:
+    file_hits: int = 0
+    file_misses: int = 0
+    section_hits: int = 0
+    section_parses: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "file_hits": self.file_hits,
+            "file_misses": self.file_misses,
+            "section_hits": self.section_hits,
+            "section_parses": self.section_parses,
+        }
+
+
+class IncludeCache:
+    """File content + section index cache for one compose run."""
+
+    def __init__(self, parser: Optional[SectionParser] = None) -> None:
+        self._parser = parser or SectionParser()
+        self._files: Dict[Path, _FileEntry] = {}
+        # Provider-backed include content (composed view) is not a file; index it by
+        # include path and re-use the index only while the content is unchanged.
+        self._provided: Dict[str, Tuple[str, _SectionIndex]] = {}
+        self._deps: Dict[str, Set[str]] = {}
+        self._rdeps: Dict[str, Set[str]] = {}
+        self.stats = IncludeCacheStats()
+
+    # ------------------------------------------------------------------
+    # File content
+    # ------------------------------------------------------------------
+
+    def _entry(self, path: Path) -> _FileEntry:
+        key = path.resolve()
+        st = key.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        entry = self._files.get(key)
+        if entry is not None and entry.stamp == stamp:
+            self.stats.file_hits += 1
+            return entry
+        self.stats.file_misses += 1
+        entry = _FileEntry(stamp=stamp, content=key.read_text(encoding="utf-8"))
+        self._files[key] = entry
+        return entry
+
+    def read_text(self, path: Path) -> str:
+        """Return file content, re-reading only when (mtime_ns, size) changed."""
+        return self._entry(path).content
+
+    # ------------------------------------------------------------------
+    # Sections
+    # ------------------------------------------------------------------
+
+    def _build_index(self, content: str) -> _SectionIndex:
+        self.stats.section_parses += 1
+        sections: Dict[str, str] = {}
+
+        def _walk(text: str) -> None:
+            for match in self._parser.SECTION_PATTERN.finditer(text):
+                # First occurrence wins, matching SectionParser.extract_section.
+                sections.setdefault(match.group(1), match.group(2).strip())
+                # Nested sections are consumed by the outer match; index them too.
+                _walk(match.group(2))
+
+        _walk(content)
+        return _SectionIndex(sections=sections)
+
+    def _lookup(self, index: _SectionIndex, content: str, section_name: str) -> Optional[str]:
+        found = index.sections.get(section_name)
+        if found is not None:
+            self.stats.section_hits += 1
+            return found
+        if section_name not in index.fallback:
+            index.fallback[section_name] = self._parser.extract_section(content, section_name)
+        else:
+            self.stats.section_hits += 1
+        return index.fallback[section_name]
+
+    def get_section(self, path: Path, section_name: str) -> Optional[str]:
+        """Extract a section from a file, parsing the file at most once per version."""
+        entry = self._entry(path)
+        if entry.index is None:
+            entry.index = self._build_index(entry.content)
+        return self._lookup(entry.index, entry.content, section_name)
+
+    def get_provided_section(self, include_path: str, content: str, section_name: str) -> Optional[str]:
+        """Extract a section from provider-supplied (composed) include content."""
+        cached = self._provided.get(include_path)
+        if cached is None or cached[0] != content:
+            cached = (content, self._build_index(content))
+            self._provided[include_path] = cached
+        return self._lookup(cached[1], content, section_name)
+
+    # ------------------------------------------------------------------
+    # Include graph
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def normalize_target(target: str) -> str:
+        """Normalize an include target to an entity-style key (no suffix/leading slash)."""
+        raw = target.strip().strip("'\"").lstrip("/")
+        return Path(raw).with_suffix("").as_posix() if raw else raw
+
+    def record_dependency(self, dependent: str, target: str) -> None:
+        """Record that `dependent` (e.g. "agents/api-builder") included `target`."""
+        node = self.normalize_target(target)
+        if not dependent or not node:
+            return
+        self._deps.setdefault(dependent, set()).add(node)
+        self._rdeps.setdefault(node, set()).add(dependent)
+
+    def dependencies_of(self, dependent: str) -> Set[str]:
+        """Return the direct include targets recorded for `dependent`."""
+        return set(self._deps.get(dependent, set()))
+
+    def dependents_of(self, target: str, *, transitive: bool = True) -> Set[str]:
+        """Return entities that included `target` (optionally through other includes).
+
+        Include-only fragments are themselves composed entities, so a dependent key
+        such as "guidelines/includes/foo" is followed when it is also a target.
+        """
+        start = self.normalize_target(target)
+        result: Set[str] = set()
+        stack = [start]
+        visited: Set[str] = set()
+        while stack:
+            node = stack.pop()
+            if node in visited:
+                continue
+            visited.add(node)
+            for dep in self._rdeps.get(node, set()):
+                if dep in result:
+                    continue
+                result.add(dep)
+                if transitive:
+                    stack.append(dep)
+        return result
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Drop cached content for `path` (or everything when omitted).
+
+        The include graph is kept; it is re-recorded as entities are recomposed.
+        """
+        if path is None:
+            self._files.clear()
+            self._provided.clear()
+            return
+        self._files.pop(path.resolve(), None)
+        # Provider content for a changed file is recomposed by the caller; drop any
+        # section index derived from it so the next lookup re-parses.
+        self._provided.clear()
+
+    def forget_dependent(self, dependent: str) -> None:
+        """Remove recorded edges for `dependent` before it is recomposed."""
+        for node in self._deps.pop(dependent, set()):
+            rdeps = self._rdeps.get(node)
+            if rdeps is not None:
+                rdeps.discard(dependent)
+                if not rdeps:
+                    self._rdeps.pop(node, None)
+
+
+@contextmanager
+def enable_include_cache(cache: IncludeCache) -> Iterator[IncludeCache]:
+    """Activate `cache` for all TemplateEngine runs in this context."""
+    token = _ACTIVE_INCLUDE_CACHE.set(cache)
+    try:
+        yield cache
+    finally:
+        _ACTIVE_INCLUDE_CACHE.reset(token)
+
+
+def get_active_include_cache() -> Optional[IncludeCache]:
+    return _ACTIVE_INCLUDE_CACHE.get()
+
+
+__all__ = [
+    "IncludeCache",
+    "IncludeCacheStats",
+    "enable_include_cache",
+    "get_active_include_cache",
+]
@@ -133,6 +133,9 @@ class ComposableRegistry(CompositionBase, Generic[T]):
             )
         return self._discovery
 
+    def invalidate_discovery(self) -> None:
+        """Forget discovered layer files so the next lookup rescans the layers."""
+        self._discovery = None
 
     @property
     def strategy(self) -> MarkdownCompositionStrategy:
@@ -504,7 +507,26 @@ class ComposableRegistry(CompositionBase, Generic[T]):
         Returns:
             List of LayerContent in order (core → vendors → packs → user → project)
         """
-        layers: List[LayerContent] = []
+        return [
+            LayerContent(content=path.read_text(encoding="utf-8"), source=source, path=path)
+            for source, path in self._gather_layer_paths(name, packs)
+        ]
+
+    def layer_source_paths(self, name: str, packs: List[str]) -> List[Path]:
+        """Return every layer file contributing to an entity, in layer order."""
+        return [path for _source, path in self._gather_layer_paths(name, packs)]
+
+    def _gather_layer_paths(
+        self,
+        name: str,
+        packs: List[str],
+    ) -> List[tuple[str, Path]]:
+        """Return (source_label, path) for every layer file contributing to an entity.
+
+        This is the discovery half of `_gather_layers` (no file reads), also used
+        to build source → entity dependency graphs for incremental composition.
+        """
+        layers: List[tuple[str, Path]] = []
 
         # Discover core entities
         core_entities = self.discovery.discover_core()
@@ -512,15 +534,12 @@ class ComposableRegistry(CompositionBase, Generic[T]):
 
         # Always include core if present
         if name in core_entities:
-            path = core_entities[name].path
-            content = path.read_text(encoding="utf-8")
-            layers.append(LayerContent(content=content, source="core", path=path))
+            layers.append(("core", core_entities[name].path))
 
         # Helper to append if present
         def _append(source_path: Path, source_label: str) -> None:
             if source_path and source_path.exists():
-                content = source_path.read_text(encoding="utf-8")
-                layers.append(LayerContent(content=content, source=source_label, path=source_path))
+                layers.append((source_label, source_path))
 
         # Vendors (core < vendors < packs < overlay layers)
         for vendor_name, vendor_new, vendor_over in self.discovery.iter_vendor_layers(existing):
@@ -551,7 +570,7 @@ class ComposableRegistry(CompositionBase, Generic[T]):
                 ext = self.file_pattern[1:]
             for layer_id, layer_root in self.discovery.overlay_layers:
                 candidate = (layer_root / self.content_type / f"{name}{ext}").resolve()
-                if candidate.is_file() and all(l.path != candidate for l in layers):
+                if candidate.is_file() and all(l[1] != candidate for l in layers):
                     _append(candidate, layer_id)
 
         return layers
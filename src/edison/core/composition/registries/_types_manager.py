@@ -223,16 +223,9 @@ class ComposableTypesManager(CompositionBase):
             
             written: List[Path] = []
             for name, content in results.items():
-                with span("compose.file.write", type=type_name, entity=name):
-                    file_path = self._resolve_file_path(type_cfg, name, output_path)
-                    target_path = path_mapper(file_path) if path_mapper else file_path
-                    # Unified output writer (single source of truth for file writes)
-                    policy = self._comp_config.resolve_write_policy(
-                        path=target_path,
-                        content_type=type_name,
-                    )
-                    self.writer.write_text_with_policy(target_path, content, policy=policy)
-                    written.append(target_path)
+                written.append(
+                    self._write_entity_content(type_cfg, name, content, output_path, path_mapper)
+                )
 
             # Prune stale generated files for this type.
             # IMPORTANT: We only prune inside the project's `_generated/` subtree and
@@ -265,6 +258,72 @@ class ComposableTypesManager(CompositionBase):
             
             return written
     
+    def write_entity(
+        self,
+        type_name: str,
+        name: str,
+        packs: Optional[List[str]] = None,
+        *,
+        include_provider: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> Optional[Path]:
+        """Compose and write a single entity of a type.
+
+        Used by incremental composition (`edison compose watch`) to rewrite only
+        the outputs affected by a change. Unlike write_type, stale files are not
+        pruned.
+
+        Returns:
+            Written file path, or None if the entity no longer composes.
+        """
+        type_cfg = self.get_type(type_name)
+        if not type_cfg or not type_cfg.enabled:
+            return None
+        registry = self.get_registry(type_name)
+        if not registry:
+            return None
+
+        packs = packs or registry.get_active_packs()
+        if include_provider is None:
+            include_provider = ComposedIncludeProvider(
+                types_manager=self,
+                packs=tuple(packs),
+                materialize=False,
+            ).build()
+        with span("compose.entity.compose", type=type_name, entity=name):
+            result = registry.compose(name, packs, include_provider=include_provider)
+        if result is None:
+            return None
+
+        output_path = self._comp_config.resolve_output_path(type_cfg.output_path)
+        return self._write_entity_content(type_cfg, name, self._to_string(result), output_path, None)
+
+    def resolve_entity_output(self, type_name: str, name: str) -> Optional[Path]:
+        """Return the output path an entity of a type is written to."""
+        type_cfg = self.get_type(type_name)
+        if not type_cfg or not type_cfg.output_path:
+            return None
+        output_path = self._comp_config.resolve_output_path(type_cfg.output_path)
+        return self._resolve_file_path(type_cfg, name, output_path)
+
+    def _write_entity_content(
+        self,
+        type_cfg: ContentTypeConfig,
+        name: str,
+        content: str,
+        output_path: Path,
+        path_mapper: Optional[Callable[[Path], Path]],
+    ) -> Path:
+        with span("compose.file.write", type=type_cfg.name, entity=name):
+            file_path = self._resolve_file_path(type_cfg, name, output_path)
+            target_path = path_mapper(file_path) if path_mapper else file_path
+            # Unified output writer (single source of truth for file writes)
+            policy = self._comp_config.resolve_write_policy(
+                path=target_path,
+                content_type=type_cfg.name,
+            )
+            self.writer.write_text_with_policy(target_path, content, policy=policy)
+            return target_path
+
     def _resolve_file_path(
         self,
         type_cfg: ContentTypeConfig,
@@ -354,9 +354,12 @@ class MarkdownCompositionStrategy(CompositionStrategy):
             protect_code_literals=context.protect_code_literals,
         )
 
-        # Pass context_vars from CompositionContext to TemplateEngine
+        # Pass context_vars from CompositionContext to TemplateEngine. Entity name/type
+        # identify the dependent in the run-level include graph.
         result, _report = engine.process(
             content,
+            entity_name=str(context.context_vars.get("name") or "unknown"),
+            entity_type=str(context.context_vars.get("content_type") or "template"),
             context_vars=context.context_vars,
         )
         return result
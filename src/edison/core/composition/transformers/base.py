@@ -27,6 +27,7 @@ from edison.core.utils.profiling import span
 
 if TYPE_CHECKING:
     from edison.core.config import ConfigManager
+    from edison.core.composition.includes.cache import IncludeCache
 
 
 @dataclass
@@ -67,6 +68,11 @@ class TransformContext:
     # Hot-path caches (per-entity) to avoid repeated IO + parsing during template processing.
     include_cache: Dict[str, str] = field(default_factory=dict)
     section_cache: Dict[str, str] = field(default_factory=dict)
+    # Optional run-level cache (file content + parsed section maps) shared across
+    # every entity composed in one run, plus the entity key used to record the
+    # include graph (e.g. "agents/api-builder").
+    file_cache: Optional["IncludeCache"] = None
+    dependent: Optional[str] = None
 
     def get_config(self, path: str) -> Any:
         """Get config value by dot-separated path.
@@ -82,10 +88,14 @@ class TransformContext:
     def record_include(self, path: str) -> None:
         """Record that an include was resolved."""
         self.includes_resolved.add(path)
+        if self.file_cache is not None and self.dependent:
+            self.file_cache.record_dependency(self.dependent, path)
 
     def record_section_extract(self, path: str, section: str) -> None:
         """Record that a section was extracted."""
         self.sections_extracted.add(f"{path}#{section}")
+        if self.file_cache is not None and self.dependent:
+            self.file_cache.record_dependency(self.dependent, path)
 
     def record_variable(self, name: str, resolved: bool) -> None:
         """Record variable resolution result."""
@@ -141,7 +141,10 @@ class IncludeResolver(ContentTransformer):
         # Read and recursively process
         try:
             with span("template.include.read", path=path):
-                included_content = full_path.read_text(encoding="utf-8")
+                if context.file_cache is not None:
+                    included_content = context.file_cache.read_text(full_path)
+                else:
+                    included_content = full_path.read_text(encoding="utf-8")
             context.record_include(path)
 
             # Recursively resolve includes in included content
@@ -251,7 +254,12 @@ class SectionExtractor(ContentTransformer):
             provided = context.include_provider(file_path)
             if provided is not None:
                 try:
-                    section_content = self.parser.extract_section(provided, section_name)
+                    if context.file_cache is not None:
+                        section_content = context.file_cache.get_provided_section(
+                            file_path, provided, section_name
+                        )
+                    else:
+                        section_content = self.parser.extract_section(provided, section_name)
                     if section_content is None:
                         return f"<!-- ERROR: Section '{section_name}' not found in {file_path} -->"
                     context.record_section_extract(file_path, section_name)
@@ -270,10 +278,16 @@ class SectionExtractor(ContentTransformer):
             return f"<!-- ERROR: File not found for section extract: {file_path} -->"
 
         try:
-            with span("template.section.read", path=file_path, section=section_name):
-                file_content = full_path.read_text(encoding="utf-8")
-            with span("template.section.parse", path=file_path, section=section_name):
-                section_content = self.parser.extract_section(file_content, section_name)
+            if context.file_cache is not None:
+                # Run-level cache: the file is read and its section map built once
+                # per (path, mtime) for every entity composed in this run.
+                with span("template.section.cached", path=file_path, section=section_name):
+                    section_content = context.file_cache.get_section(full_path, section_name)
+            else:
+                with span("template.section.read", path=file_path, section=section_name):
+                    file_content = full_path.read_text(encoding="utf-8")
+                with span("template.section.parse", path=file_path, section=section_name):
+                    section_content = self.parser.extract_section(file_content, section_name)
 
             if section_content is None:
                 return f"<!-- ERROR: Section '{section_name}' not found in {file_path} -->"
@@ -0,0 +1,363 @@
+"""Incremental composition for `edison compose watch`.
+
+`compose all` rediscovers every layer and recomposes every entity. While editing
+a single guideline or pack file that is far more work than needed. This module
+keeps a warm `ComposableTypesManager` (config, registries, discovery caches)
+and a dependency graph between source files and composed outputs:
+
+- layer sources: (type, entity) ← every core/vendor/pack/overlay file that
+  contributes to it (from registry discovery, no file reads)
+- includes: entity ← include targets, recorded by the run-level `IncludeCache`
+  while composing
+
+On a change only the affected entities (plus their include dependents) are
+recomposed and rewritten. New/deleted files trigger a rediscovery of the
+affected content types; config changes trigger a full rebuild with fresh
+config.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from edison.core.composition.includes import ComposedIncludeProvider
+from edison.core.composition.includes.cache import IncludeCache, enable_include_cache
+from edison.core.composition.registries._base import ComposableRegistry
+from edison.core.composition.registries._types_manager import ComposableTypesManager
+from edison.core.config.domains.composition import ContentTypeConfig
+from edison.core.utils.profiling import span
+
+EntityRef = Tuple[str, str]  # (type_name, entity_name)
+
+# Editor swap/backup files never affect composition.
+_IGNORED_SUFFIXES = (".swp", ".swx", ".swo", "~", ".tmp")
+_IGNORED_DIRNAMES = {".git", "__pycache__", "_generated", "node_modules"}
+# Generator types (rosters, state machine docs) aggregate data from other types;
+# they are cheap and re-run whenever an incremental rebuild writes anything.
+_AGGREGATE_CONTENT_PATHS = {"generators"}
+
+
+@dataclass
+class RebuildResult:
+    """Outcome of one (full or incremental) rebuild."""
+
+    written: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    entities: List[str] = field(default_factory=list)
+    full: bool = False
+    duration_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "full": self.full,
+            "duration_ms": round(self.duration_ms, 2),
+            "entities": list(self.entities),
+            "written": [str(p) for p in self.written],
+            "removed": [str(p) for p in self.removed],
+        }
+
+
+class CompositionDependencyGraph:
+    """Bidirectional map between layer source files and composed entities."""
+
+    def __init__(self) -> None:
+        self._by_source: Dict[Path, Set[EntityRef]] = {}
+        self._by_entity: Dict[EntityRef, Set[Path]] = {}
+
+    def set_sources(self, ref: EntityRef, sources: Iterable[Path]) -> None:
+        self.remove_entity(ref)
+        resolved = {Path(p).resolve() for p in sources}
+        self._by_entity[ref] = resolved
+        for src in resolved:
+            self._by_source.setdefault(src, set()).add(ref)
+
+    def remove_entity(self, ref: EntityRef) -> None:
+        for src in self._by_entity.pop(ref, set()):
+            refs = self._by_source.get(src)
+            if refs is not None:
+                refs.discard(ref)
+                if not refs:
+                    self._by_source.pop(src, None)
+
+    def entities_for(self, path: Path) -> Set[EntityRef]:
+        return set(self._by_source.get(Path(path).resolve(), set()))
+
+    def entities_of_type(self, type_name: str) -> Set[EntityRef]:
+        return {ref for ref in self._by_entity if ref[0] == type_name}
+
+    def entities(self) -> Set[EntityRef]:
+        return set(self._by_entity)
+
+    def sources_of(self, ref: EntityRef) -> Set[Path]:
+        return set(self._by_entity.get(ref, set()))
+
+    def __len__(self) -> int:
+        return len(self._by_entity)
+
+
+class IncrementalComposer:
+    """Warm composition state that rewrites only outputs affected by a change."""
+
+    def __init__(self, project_root: Path, *, types: Optional[Iterable[str]] = None) -> None:
+        self.project_root = Path(project_root).resolve()
+        self._only_types = set(types) if types else None
+        self._load()
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        with span("compose.watch.load"):
+            self.types_manager = ComposableTypesManager(project_root=self.project_root)
+            self.packs: List[str] = list(self.types_manager.get_active_packs())
+        self.include_cache = IncludeCache()
+        self.graph = CompositionDependencyGraph()
+        # Types whose registry cannot report per-entity sources (custom compose);
+        # any change under their content path recomposes the whole type.
+        self._coarse_types: Set[str] = set()
+        self._outputs: Set[Path] = set()
+
+    def selected_types(self) -> List[ContentTypeConfig]:
+        return [
+            t
+            for t in self.types_manager.get_enabled_types()
+            if self._only_types is None or t.name in self._only_types
+        ]
+
+    def _registry(self, type_name: str) -> Optional[ComposableRegistry]:
+        registry = self.types_manager.get_registry(type_name)
+        return registry if isinstance(registry, ComposableRegistry) else None
+
+    def _entity_key(self, ref: EntityRef) -> Optional[str]:
+        registry = self._registry(ref[0])
+        if registry is None:
+            return None
+        return f"{registry.content_type}/{ref[1]}"
+
+    def _ref_for_key(self, key: str) -> Set[EntityRef]:
+        """Map an include-graph dependent key ("content_type/name") back to entities."""
+        refs: Set[EntityRef] = set()
+        for type_cfg in self.selected_types():
+            registry = self._registry(type_cfg.name)
+            if registry is None:
+                continue
+            prefix = registry.content_type.strip("/") + "/"
+            if key.startswith(prefix):
+                refs.add((type_cfg.name, key[len(prefix) :]))
+        return refs
+
+    def _index_type(self, type_name: str) -> None:
+        registry = self._registry(type_name)
+        for ref in self.graph.entities_of_type(type_name):
+            self.graph.remove_entity(ref)
+        if registry is None:
+            self._coarse_types.add(type_name)
+            return
+        try:
+            names = registry.discover_all(self.packs)
+            for name in names:
+                sources = registry.layer_source_paths(name, self.packs)
+                self.graph.set_sources((type_name, name), sources or [names[name]])
+            self._coarse_types.discard(type_name)
+        except Exception:
+            self._coarse_types.add(type_name)
+
+    # ------------------------------------------------------------------
+    # Watch scope
+    # ------------------------------------------------------------------
+
+    def watch_roots(self) -> List[Path]:
+        """Layer roots to watch: core, vendors, pack roots and overlay layers."""
+        from edison.core.composition.core.tree_snapshot import layer_roots
+
+        return layer_roots(self.project_root)
+
+    def is_ignored(self, path: Path) -> bool:
+        name = path.name
+        if name.endswith(_IGNORED_SUFFIXES) or name.startswith(".#"):
+            return True
+        if _IGNORED_DIRNAMES.intersection(path.parts):
+            return True
+        try:
+            return path.resolve() in self._outputs
+        except OSError:
+            return False
+
+    @staticmethod
+    def _is_config_path(path: Path) -> bool:
+        if path.name in {"pack.yaml", "pack.yml"}:
+            return True
+        if path.suffix not in {".yaml", ".yml"}:
+            return False
+        return "config" in path.parts or "config.local" in path.parts
+
+    def _types_for_path(self, path: Path) -> Set[str]:
+        posix = "/" + path.as_posix().strip("/") + "/"
+        matched: Set[str] = set()
+        for type_cfg in self.selected_types():
+            content_path = (type_cfg.content_path or type_cfg.name).strip("/")
+            if content_path and f"/{content_path}/" in posix:
+                matched.add(type_cfg.name)
+        return matched
+
+    # ------------------------------------------------------------------
+    # Rebuilds
+    # ------------------------------------------------------------------
+
+    def full_build(self) -> RebuildResult:
+        """Compose and write every selected type, then index sources."""
+        start = time.perf_counter()
+        result = RebuildResult(full=True)
+        with span("compose.watch.full"), enable_include_cache(self.include_cache):
+            for type_cfg in self.selected_types():
+                written = self.types_manager.write_type(type_cfg.name, self.packs)
+                result.written.extend(written)
+                self._index_type(type_cfg.name)
+        self._outputs = {p.resolve() for p in result.written}
+        result.entities = sorted(f"{t}/{n}" for t, n in self.graph.entities())
+        result.duration_ms = (time.perf_counter() - start) * 1000.0
+        return result
+
+    def reload(self) -> RebuildResult:
+        """Drop config/registry state and rebuild everything.
+
+        Config/pack activation changes can alter every output; start from fresh
+        config but keep the process (and imports) warm.
+        """
+        from edison.core.config.cache import clear_all_caches
+
+        clear_all_caches()
+        self._load()
+        return self.full_build()
+
+    def _include_dependents(self, refs: Set[EntityRef]) -> Set[EntityRef]:
+        out: Set[EntityRef] = set()
+        for ref in refs:
+            key = self._entity_key(ref)
+            if key is None:
+                continue
+            for dependent in self.include_cache.dependents_of(key):
+                out |= self._ref_for_key(dependent)
+        return out
+
+    def _path_include_dependents(self, path: Path) -> Set[EntityRef]:
+        """Entities that include `path` directly, even if it is not an entity itself.
+
+        Include targets are recorded relative to a layer root, a pack directory or
+        the project root, so every trailing sub-path below those roots is tried.
+        """
+        try:
+            resolved = path.resolve()
+        except OSError:
+            return set()
+        out: Set[EntityRef] = set()
+        for root in [*self.watch_roots(), self.project_root]:
+            if root not in resolved.parents:
+                continue
+            parts = resolved.relative_to(root).with_suffix("").parts
+            for i in range(len(parts)):
+                for dependent in self.include_cache.dependents_of("/".join(parts[i:])):
+                    out |= self._ref_for_key(dependent)
+        return out
+
+    def _is_generated_output(self, path: Path) -> bool:
+        """True when `path` lies inside the project's `_generated/` subtree."""
+        from edison.core.utils.paths import get_project_config_dir
+
+        project_dir = get_project_config_dir(self.project_root, create=False)
+        generated_root = (project_dir / "_generated").resolve()
+        return generated_root in path.resolve().parents
+
+    def apply_changes(self, changed: Iterable[Path]) -> RebuildResult:
+        """Recompose and rewrite only the outputs affected by `changed` paths."""
+        start = time.perf_counter()
+        relevant = {Path(p) for p in changed if not self.is_ignored(Path(p))}
+        if not relevant:
+            return RebuildResult()
+
+        if any(self._is_config_path(p) for p in relevant):
+            return self.reload()
+
+        affected: Set[EntityRef] = set()
+        removed: Set[EntityRef] = set()
+        rediscover: Set[str] = set()
+        whole_types: Set[str] = set()
+
+        for path in relevant:
+            self.include_cache.invalidate(path)
+            # Includes/partials may not be entities of any type; recompose their includers.
+            affected |= self._path_include_dependents(path)
+            refs = self.graph.entities_for(path)
+            if refs and path.exists():
+                affected |= refs
+                continue
+            # New, deleted or renamed file: discovery for its type(s) changed.
+            types = self._types_for_path(path) | {ref[0] for ref in refs}
+            rediscover |= types - self._coarse_types
+            whole_types |= types & self._coarse_types
+
+        for type_name in rediscover:
+            registry = self._registry(type_name)
+            before = self.graph.entities_of_type(type_name)
+            if registry is not None:
+                registry.invalidate_discovery()
+            self._index_type(type_name)
+            after = self.graph.entities_of_type(type_name)
+            removed |= before - after
+            affected |= after - before
+            # New overlay files change the sources of an existing entity.
+            for path in relevant:
+                affected |= self.graph.entities_for(path)
+
+        affected |= self._include_dependents(affected | removed)
+        affected -= removed
+
+        result = RebuildResult()
+        with span("compose.watch.incremental", entities=len(affected)), enable_include_cache(
+            self.include_cache
+        ):
+            provider = ComposedIncludeProvider(
+                types_manager=self.types_manager,
+                packs=tuple(self.packs),
+                materialize=False,
+            ).build()
+            if affected or removed:
+                whole_types |= {
+                    t.name for t in self.selected_types() if t.content_path in _AGGREGATE_CONTENT_PATHS
+                }
+            for type_name in sorted(whole_types):
+                result.written.extend(self.types_manager.write_type(type_name, self.packs))
+                result.entities.append(f"{type_name}/*")
+            for ref in sorted(affected):
+                if ref[0] in whole_types:
+                    continue
+                key = self._entity_key(ref)
+                if key:
+                    self.include_cache.forget_dependent(key)
+                written = self.types_manager.write_entity(
+                    ref[0], ref[1], self.packs, include_provider=provider
+                )
+                if written is not None:
+                    result.written.append(written)
+                    result.entities.append(f"{ref[0]}/{ref[1]}")
+
+        for ref in sorted(removed):
+            key = self._entity_key(ref)
+            if key:
+                self.include_cache.forget_dependent(key)
+            out = self.types_manager.resolve_entity_output(*ref)
+            # Same containment rule as write_type's pruning: never delete outside `_generated/`.
+            if out is not None and out.exists() and self._is_generated_output(out):
+                out.unlink()
+                result.removed.append(out)
+                self._outputs.discard(out.resolve())
+
+        self._outputs |= {p.resolve() for p in result.written}
+        result.duration_ms = (time.perf_counter() - start) * 1000.0
+        return result
+
+
+__all__ = ["CompositionDependencyGraph", "IncrementalComposer", "RebuildResult"]
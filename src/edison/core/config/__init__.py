@@ -23,6 +23,7 @@ from __future__ import annotations
 from .manager import ConfigManager
 from .cache import get_cached_config, clear_all_caches, is_cached
 from .base import BaseDomainConfig
+from .layered import LayeredConfigView
 
 # Re-export domain configs for convenience
 from .domains import (
@@ -42,6 +43,7 @@ __all__ = [
     # Core
     "ConfigManager",
     "BaseDomainConfig",
+    "LayeredConfigView",
     # Caching
     "get_cached_config",
     "clear_all_caches",
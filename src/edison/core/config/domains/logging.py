@@ -167,6 +167,21 @@ class LoggingConfig(BaseDomainConfig):
         orch = self.section.get("orchestrator") or {}
         return int(orch.get("max_prompt_bytes", 0) or 0)
 
+    @cached_property
+    def orchestrator_output_max_bytes(self) -> int:
+        orch = self.section.get("orchestrator") or {}
+        return int(orch.get("output_max_bytes", 0) or 0)
+
+    @cached_property
+    def orchestrator_output_backups(self) -> int:
+        orch = self.section.get("orchestrator") or {}
+        return int(orch.get("output_backups", 3) or 0)
+
+    @cached_property
+    def orchestrator_output_tail_bytes(self) -> int:
+        orch = self.section.get("orchestrator") or {}
+        return int(orch.get("output_tail_bytes", 0) or 0)
+
     @cached_property
     def guards_enabled(self) -> bool:
         guards = self.section.get("guards") or {}
@@ -0,0 +1,141 @@
+"""Lazy, copy-on-write view over stacked config layers.
+
+`ConfigManager` stacks many YAML layers (core, packs, overlay layers,
+project-local). Folding them with `deep_merge` materializes a fresh nested dict
+at every step, so the cost grows with layers x config size. `LayeredConfigView`
+keeps references to the layer dicts instead and resolves a key only when it is
+read, with exactly the `deep_merge` semantics:
+
+- dict over dict merges recursively
+- list over list goes through `merge_arrays` ("+", "=", "-" markers, merge-by-id)
+- anything else replaces, and a dict that replaces a non-dict starts a new
+  merge chain (earlier dict values for that key are discarded)
+
+Layers are never copied or mutated. Resolved children are cached, so repeated
+reads of a subtree are O(1), and `materialize(path)` builds plain dicts only
+for the subtree that is asked for.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from edison.core.utils.merge import merge_arrays
+
+_MISSING = object()
+
+
+class LayeredConfigView(Mapping[str, Any]):
+    """Read-only chain-map over config layers (lowest priority first).
+
+    Example:
+        >>> view = LayeredConfigView([{"a": {"b": 1}}, {"a": {"c": 2}}])
+        >>> view.get_path("a.c")
+        2
+        >>> view.materialize()
+        {'a': {'b': 1, 'c': 2}}
+    """
+
+    __slots__ = ("_layers", "_resolved", "_keys", "_materialized")
+
+    def __init__(self, layers: Iterable[Optional[Dict[str, Any]]]) -> None:
+        # Empty/None layers are no-ops for deep_merge (`override or {}`).
+        self._layers: Tuple[Dict[str, Any], ...] = tuple(layer for layer in layers if layer)
+        self._resolved: Dict[str, Any] = {}
+        self._keys: Optional[List[str]] = None
+        self._materialized: Optional[Dict[str, Any]] = None
+
+    @property
+    def layers(self) -> Sequence[Dict[str, Any]]:
+        """The underlying layer dicts (do not mutate)."""
+        return self._layers
+
+    def with_layer(self, layer: Optional[Dict[str, Any]]) -> "LayeredConfigView":
+        """Return a new view with `layer` stacked on top (existing layers are shared)."""
+        return LayeredConfigView((*self._layers, layer))
+
+    # ---------- Mapping protocol ----------
+
+    def _resolve(self, key: str) -> Any:
+        if key in self._resolved:
+            return self._resolved[key]
+
+        chain: List[Dict[str, Any]] = []
+        value: Any = _MISSING
+        for layer in self._layers:
+            if key not in layer:
+                continue
+            v = layer[key]
+            if isinstance(v, dict):
+                if not chain:
+                    value = _MISSING
+                chain.append(v)
+            elif isinstance(v, list) and not chain and isinstance(value, list):
+                value = merge_arrays(value, v)
+            else:
+                chain = []
+                value = v
+
+        resolved = LayeredConfigView(chain) if chain else value
+        if resolved is not _MISSING:
+            self._resolved[key] = resolved
+        return resolved
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._resolve(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return any(key in layer for layer in self._layers)
+
+    def __iter__(self) -> Iterator[str]:
+        if self._keys is None:
+            # deep_merge keeps the first-seen position of every key.
+            keys: Dict[str, None] = {}
+            for layer in self._layers:
+                keys.update(dict.fromkeys(layer))
+            self._keys = list(keys)
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"LayeredConfigView(layers={len(self._layers)})"
+
+    # ---------- Access helpers ----------
+
+    def get_path(self, path: str, default: Any = None) -> Any:
+        """Resolve a dot-notation key (e.g. ``"tasks.readiness"``)."""
+        current: Any = self
+        for part in path.split("."):
+            if isinstance(current, Mapping) and part in current:
+                current = current[part]
+            else:
+                return default
+        return current
+
+    def materialize(self, path: Optional[str] = None) -> Any:
+        """Return the merged value as plain data (the whole config, or one subtree).
+
+        Only the requested subtree is built. Results are cached on the view and
+        shared between calls, so treat them as read-only (copy before mutating).
+
+        Raises:
+            KeyError: If `path` does not resolve
+        """
+        if path:
+            value = self.get_path(path, _MISSING)
+            if value is _MISSING:
+                raise KeyError(path)
+            return value.materialize() if isinstance(value, LayeredConfigView) else value
+        if self._materialized is None:
+            self._materialized = {
+                key: (value.materialize() if isinstance(value, LayeredConfigView) else value)
+                for key, value in ((k, self[k]) for k in self)
+            }
+        return self._materialized
+
+
+__all__ = ["LayeredConfigView"]
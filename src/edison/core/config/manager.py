@@ -4,7 +4,7 @@ Edison Framework Configuration Management (YAML-only, no legacy fallbacks).
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, Optional, Union, TYPE_CHECKING
 import os
 import json
 import re
@@ -14,6 +14,7 @@ from edison.core.utils.merge import deep_merge as _deep_merge, merge_arrays
 from edison.data import get_data_path
 from edison.core.utils.profiling import span
 from edison.core.config.cache import get_cached_config
+from edison.core.config.layered import LayeredConfigView
 
 # Module logger (warnings are user-visible via CLI log config).
 logger = logging.getLogger(__name__)
@@ -264,7 +265,13 @@ class ConfigManager:
 
         return merge_yaml_directory(cfg, directory)
 
-    def _get_bootstrap_packs(self, cfg: Dict[str, Any]) -> List[str]:
+    def _directory_layers(self, directory: Path) -> List[Dict[str, Any]]:
+        """Parse all YAML files from a directory as config layers (merge order)."""
+        from edison.core.utils.layered_yaml import yaml_directory_layers
+
+        return yaml_directory_layers(directory)
+
+    def _get_bootstrap_packs(self, cfg: Mapping[str, Any]) -> List[str]:
         """Extract active packs from bootstrap config (Phase 1).
 
         This is used during two-phase loading to determine which packs
@@ -300,14 +307,16 @@ class ConfigManager:
         Returns:
             Configuration with pack overlays merged
         """
-        roots = self._iter_pack_roots()
+        return LayeredConfigView([cfg, *self._pack_layers(active_packs)]).materialize()
 
+    def _pack_layers(self, active_packs: List[str]) -> List[Dict[str, Any]]:
+        """Parse config layers for active packs in low→high precedence order."""
+        roots = self._iter_pack_roots()
+        layers: List[Dict[str, Any]] = []
         for pack_name in active_packs:
             for root in roots:
-                pack_config_dir = root.path / pack_name / "config"
-                cfg = self._load_directory(pack_config_dir, cfg)
-
-        return cfg
+                layers.extend(self._directory_layers(root.path / pack_name / "config"))
+        return layers
 
     def _find_user_only_packs(self, active_packs: List[str]) -> List[str]:
         """Return packs that resolve only from the user packs directory."""
@@ -512,35 +521,41 @@ class ConfigManager:
             Merged configuration dictionary
         """
         with span("config.load_config.total", include_packs=include_packs, validate=validate):
-            cfg: Dict[str, Any] = {}
             active_packs: List[str] = []
+            pack_layers: List[Dict[str, Any]] = []
 
             # Layer 1: Core config (bundled defaults)
             with span("config.load_config.core"):
-                cfg = self._load_directory(self.core_config_dir, cfg)
+                core_layers = self._directory_layers(self.core_config_dir)
+
+            # Layer 3: User config (wins over packs)
+            with span("config.load_config.layers", count=len(self._layer_stack.layers)):
+                overlay_layers = [
+                    layer for cfg_dir in self._iter_overlay_config_dirs() for layer in self._directory_layers(cfg_dir)
+                ]
 
-            # Phase 1 bootstrap: Get active packs from core + project (without pack configs)
+            # Last: Project-local config (wins over all committed config)
+            with span("config.load_config.project_local"):
+                local_layers = self._directory_layers(self.project_local_config_dir)
+
+            # Phase 1 bootstrap: Get active packs from core + project (without pack configs).
+            # Only the `packs` subtree of the view is ever resolved.
             if include_packs:
                 with span("config.load_config.bootstrap"):
-                    bootstrap_cfg = dict(cfg)
-                    for cfg_dir in self._iter_overlay_config_dirs():
-                        bootstrap_cfg = self._load_directory(cfg_dir, bootstrap_cfg)
-                    bootstrap_cfg = self._load_directory(self.project_local_config_dir, bootstrap_cfg)
-                    active_packs = self._get_bootstrap_packs(bootstrap_cfg)
+                    bootstrap = LayeredConfigView([*core_layers, *overlay_layers, *local_layers])
+                    active_packs = self._get_bootstrap_packs(bootstrap)
 
                 # Layer 2: Pack configs (bundled + project packs)
                 if active_packs:
                     with span("config.load_config.packs", count=len(active_packs)):
-                        cfg = self._load_pack_configs(cfg, active_packs)
-
-            # Layer 3: User config (wins over packs)
-            with span("config.load_config.layers", count=len(self._layer_stack.layers)):
-                for cfg_dir in self._iter_overlay_config_dirs():
-                    cfg = self._load_directory(cfg_dir, cfg)
-
-            # Last: Project-local config (wins over all committed config)
-            with span("config.load_config.project_local"):
-                cfg = self._load_directory(self.project_local_config_dir, cfg)
+                        pack_layers = self._pack_layers(active_packs)
+
+            # Merge every layer once (core → packs → layers → project-local) instead of
+            # re-copying the accumulated config after each file.
+            layers = [*core_layers, *pack_layers, *overlay_layers, *local_layers]
+            with span("config.load_config.merge", count=len(layers)):
+                # The view is discarded, so its freshly built dicts can be mutated below.
+                cfg: Dict[str, Any] = LayeredConfigView(layers).materialize()
 
             # Layer 6: Environment overrides
             with span("config.load_config.env"):
@@ -6,6 +6,9 @@ This module provides the foundation for entity management:
 - **Base classes**: EntityMetadata, BaseEntity, StateHistoryEntry
 - **Repository pattern**: BaseRepository for CRUD operations
 - **File persistence**: FileRepositoryMixin for file-based storage
+- **Batched saves**: BulkSaveMixin.save_many for markdown repositories;
+  plan_save_many + publish_save_plans publish several repositories as one batch
+- **Entity cache**: process-scoped read-through cache shared by file repositories
 
 Example usage:
     from edison.core.entity import BaseRepository, BaseEntity, EntityMetadata
@@ -49,11 +52,17 @@ from .exceptions import (
 )
 from .manager import BaseEntityManager
 from .repository import BaseRepository
+from .cache import (
+    EntityCache,
+    get_entity_cache,
+    clear_entity_caches,
+)
 from .file_repository import (
     FileRepositoryMixin,
     FileLockMixin,
 )
 from .session_scoped import SessionScopedMixin
+from .bulk import BulkSaveMixin, SavePlan, publish_save_plans
 
 __all__ = [
     # Protocols
@@ -85,8 +94,16 @@ __all__ = [
     "BaseRepository",
     "FileRepositoryMixin",
     "FileLockMixin",
+    # Entity cache
+    "EntityCache",
+    "get_entity_cache",
+    "clear_entity_caches",
     # Session-scoped records
     "SessionScopedMixin",
+    # Batched saves
+    "BulkSaveMixin",
+    "SavePlan",
+    "publish_save_plans",
 ]
 
 
@@ -0,0 +1,153 @@
+"""Batched saves for markdown-backed repositories.
+
+`save_many` persists a batch of entities with the per-save overheads paid once:
+
+- one listing of the state directories instead of probing every state per entity
+- the creation template read once for the whole batch
+- file writes spread over a thread pool
+- optional all-or-nothing publication (`staged=True`)
+
+`plan_save_many` renders a batch without writing it, and `publish_save_plans`
+writes several plans (e.g. tasks and their QA records) as one batch, so an
+all-or-nothing publish can span repositories.
+
+Each entity is rendered exactly as `save()` would render it (existing bodies and
+extra frontmatter are preserved; new entities get the template body), and all
+rendering happens before the first write, so a malformed existing file aborts
+the batch with nothing written.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+
+from .exceptions import PersistenceError
+from .protocols import Entity
+
+T = TypeVar("T", bound=Entity)
+
+
+@dataclass
+class SavePlan:
+    """Rendered-but-unwritten batch produced by `BulkSaveMixin.plan_save_many`."""
+
+    entity_type: str
+    writes: Dict[Path, str] = field(default_factory=dict)
+    stale: List[Path] = field(default_factory=list)
+    invalidate: Callable[..., None] = lambda *paths: None
+
+
+def publish_save_plans(
+    plans: Sequence[SavePlan],
+    *,
+    staged: bool = False,
+    max_workers: Optional[int] = None,
+) -> List[Path]:
+    """Write every plan's files in one `write_text_many` batch.
+
+    Files left behind by entities that moved state are unlinked only after the
+    whole batch was published, so with `staged=True` a failure leaves the tree
+    exactly as it was.
+
+    Returns:
+        Paths written, in plan order
+
+    Raises:
+        PersistenceError: If writing fails
+    """
+    from edison.core.utils.io import write_text_many
+
+    writes: Dict[Path, str] = {}
+    for plan in plans:
+        writes.update(plan.writes)
+    stale = [p for plan in plans for p in plan.stale if p not in writes]
+    if not writes and not stale:
+        return []
+    try:
+        write_text_many(list(writes.items()), staged=staged, max_workers=max_workers)
+        for path in stale:
+            path.unlink(missing_ok=True)
+    except OSError as exc:
+        kinds = "/".join(dict.fromkeys(plan.entity_type for plan in plans))
+        raise PersistenceError(f"Failed to save {len(writes)} {kinds} files: {exc}") from exc
+    finally:
+        for plan in plans:
+            plan.invalidate(*plan.writes, *plan.stale)
+    return list(writes)
+
+
+class BulkSaveMixin(Generic[T]):
+    """Mixin adding `save_many` to markdown repositories.
+
+    The mixin expects the repository to define:
+    - entity_type: str - The entity type name
+    - _index_entity_paths() -> Dict[str, Path] - From SessionScopedMixin
+    - _invalidate_cached(*paths) - From FileRepositoryMixin
+    - _target_path(entity) -> Path - Where `save()` would write the entity
+    - _load_template_text() -> str - Raw creation template
+    - _render_for_save(entity, current_path, template) -> str - File content
+    """
+
+    def save_many(
+        self,
+        entities: Sequence[T],
+        *,
+        staged: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> List[Path]:
+        """Save many entities (update existing or create new).
+
+        Equivalent to calling `save()` for each entity in order; when the same
+        entity id appears more than once the last one wins.
+
+        Args:
+            entities: Entities to save
+            staged: Publish every file or none (see `write_text_many`)
+            max_workers: Writer thread pool size
+
+        Returns:
+            Paths written, in first-seen order
+
+        Raises:
+            PersistenceError: If rendering or writing fails
+        """
+        if not entities:
+            return []
+        return publish_save_plans([self.plan_save_many(entities)], staged=staged, max_workers=max_workers)
+
+    def plan_save_many(self, entities: Sequence[T]) -> SavePlan:
+        """Render `entities` as `save_many` would, without writing anything.
+
+        Raises:
+            PersistenceError: If rendering fails
+        """
+        plan = SavePlan(
+            entity_type=self.entity_type,  # type: ignore[attr-defined]
+            invalidate=self._invalidate_cached,  # type: ignore[attr-defined]
+        )
+        if not entities:
+            return plan
+
+        existing = self._index_entity_paths()  # type: ignore[attr-defined]
+        template = self._load_template_text()  # type: ignore[attr-defined]
+
+        by_id: Dict[str, T] = {}
+        for entity in entities:
+            by_id[str(entity.id)] = entity
+
+        for entity_id, entity in by_id.items():
+            current = existing.get(entity_id)
+            target = self._target_path(entity)  # type: ignore[attr-defined]
+            plan.writes[target] = self._render_for_save(entity, current, template)  # type: ignore[attr-defined]
+            if current is not None and current != target:
+                plan.stale.append(current)
+        plan.stale = [p for p in plan.stale if p not in plan.writes]
+        return plan
+
+
+__all__ = [
+    "BulkSaveMixin",
+    "SavePlan",
+    "publish_save_plans",
+]
@@ -0,0 +1,62 @@
+"""Process-scoped read-through cache for file-backed entities.
+
+Guards, conditions, actions and context builders each construct their own
+repository and call `get()`, so a single CLI invocation re-reads and re-parses the
+same session JSON and task/QA markdown many times. Repositories for the same
+project root share one `EntityCache` (an identity map keyed by file path) built
+on `StatCache`: entries are validated by stat signature, recently modified files
+are not cached, and callers always receive a deep copy. Repositories invalidate
+write-through on save/move/delete.
+
+Under `--profile` the `entity.cache.hit` counter is the number of parses avoided.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+from edison.core.config.cache import register_cache_clearer
+from edison.core.utils.io.file_cache import RACY_WINDOW_NS, StatCache
+
+
+class EntityCache(StatCache):
+    """Identity map of parsed entities keyed by absolute file path."""
+
+    def __init__(self) -> None:
+        super().__init__(counter_prefix="entity.cache")
+
+
+_CACHES: Dict[str, EntityCache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_entity_cache(project_root: Optional[Path] = None) -> EntityCache:
+    """Return the cache shared by all repositories of `project_root`."""
+    key = os.path.abspath(project_root) if project_root is not None else ""
+    with _CACHES_LOCK:
+        cache = _CACHES.get(key)
+        if cache is None:
+            cache = _CACHES[key] = EntityCache()
+        return cache
+
+
+def clear_entity_caches() -> None:
+    """Drop all cached entities for every project root."""
+    with _CACHES_LOCK:
+        caches = list(_CACHES.values())
+        _CACHES.clear()
+    for cache in caches:
+        cache.clear()
+
+
+register_cache_clearer("entity.cache", clear_entity_caches)
+
+
+__all__ = [
+    "EntityCache",
+    "RACY_WINDOW_NS",
+    "clear_entity_caches",
+    "get_entity_cache",
+]
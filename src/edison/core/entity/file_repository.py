@@ -7,6 +7,7 @@ to repositories. It handles:
 - File locking for concurrent access
 - Atomic writes for data safety
 - State-based directory organization
+- Read-through caching of parsed entities (see `cache.EntityCache`)
 """
 from __future__ import annotations
 
@@ -15,6 +16,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
 
 from .base import EntityId
+from .cache import EntityCache, get_entity_cache
 from .protocols import Entity
 from .exceptions import PersistenceError, LockError
 import fcntl
@@ -123,6 +125,26 @@ class FileRepositoryMixin(Generic[T]):
             raise FileNotFoundError(f"{entity_type.title()} {entity_id} not found")
         return path
     
+    def _entity_cache(self) -> EntityCache:
+        """Get the entity cache shared by all repositories of this project."""
+        return get_entity_cache(getattr(self, "project_root", None))
+
+    def _load_cached(self, path: Path, loader: Callable[[Path], Optional[T]]) -> Optional[T]:
+        """Load an entity through the shared cache, parsing only on a miss.
+
+        Args:
+            path: Entity file
+            loader: Parses the file; exceptions propagate, None is not cached
+
+        Returns:
+            A private copy of the entity (safe to mutate)
+        """
+        return self._entity_cache().get(path, loader)
+
+    def _invalidate_cached(self, *paths: Path) -> None:
+        """Drop cached entities for paths this repository wrote, moved or deleted."""
+        self._entity_cache().invalidate(*paths)
+
     def _read_file(self, path: Path) -> Dict[str, Any]:
         """Read and parse a JSON file.
         
@@ -174,6 +196,8 @@ class FileRepositoryMixin(Generic[T]):
                 path.write_text(content, encoding="utf-8")
         except OSError as e:
             raise PersistenceError(f"Cannot write {path}: {e}")
+        finally:
+            self._invalidate_cached(path)
     
     def _move_to_state(
         self,
@@ -209,6 +233,8 @@ class FileRepositoryMixin(Generic[T]):
             return safe_move_file(source, dest, repo_root=project_root)
         except Exception as e:
             raise PersistenceError(f"Cannot move {source} to {dest}: {e}")
+        finally:
+            self._invalidate_cached(source, dest)
     
     def _safe_move_file(
         self,
@@ -239,6 +265,8 @@ class FileRepositoryMixin(Generic[T]):
             return safe_move_file(source, dest, repo_root=project_root)
         except Exception as e:
             raise PersistenceError(f"Cannot move {source} to {dest}: {e}")
+        finally:
+            self._invalidate_cached(source, dest)
     
     def _list_files_in_state(self, state: str) -> List[Path]:
         """List all entity files in a state directory.
@@ -6,13 +6,15 @@ discovery to repositories. It handles:
 - Session base path discovery
 - Session record path resolution
 - Combined global + session directory search
+- One-pass id -> path index for batch operations
 
 Used by TaskRepository and QARepository for session-scoped records.
 """
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Generic, List, Optional, TypeVar
+from typing import Dict, Generic, List, Optional, TypeVar
 
 from .base import EntityId
 from .protocols import Entity
@@ -118,6 +120,34 @@ class SessionScopedMixin(Generic[T]):
 
         return None
 
+    def _index_entity_paths(self) -> Dict[str, Path]:
+        """Map every entity id to its path from one listing of each directory.
+
+        Resolves ids exactly like `_find_entity_path_with_sessions` (global
+        directories first, then sessions; first match wins) but lists each state
+        directory once instead of probing it per id.
+
+        Returns:
+            Dict mapping entity id to file path
+        """
+        suffix = self.file_extension  # type: ignore
+        states = self._get_states_to_search()  # type: ignore
+        dirs = [self._get_state_dir(state) for state in states]  # type: ignore
+        for base in self._get_session_bases():
+            dirs.extend(base / self.record_subdir / state for state in states)
+
+        found: Dict[str, Path] = {}
+        for directory in dirs:
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name.endswith(suffix) and entry.is_file():
+                        found.setdefault(entry.name[: -len(suffix)], Path(entry.path))
+        return found
+
 
 __all__ = [
     "SessionScopedMixin",
@@ -210,10 +210,12 @@ def sync_openspec_changes(
     dry_run: bool = False,
     include_archived: bool = False,
     project_root: Optional[Path] = None,
+    staged: bool = False,
 ) -> SyncResult:
     """Import/sync OpenSpec changes into Edison tasks.
 
     Matching is by OpenSpec change-id -> Edison task id `{prefix}-{change-id}`.
+    With `staged=True` the task and QA files are published all-or-nothing.
     """
     repo_root = project_root or src.repo_root
     changes = list_openspec_changes(src, include_archived=include_archived)
@@ -246,6 +248,7 @@ def sync_openspec_changes(
         dry_run=dry_run,
         project_root=repo_root,
         updatable_states={"todo"},
+        staged=staged,
     )
 
 
@@ -14,7 +14,7 @@ source of truth, eliminating drift when specs change.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import List, Optional
 
@@ -234,6 +234,7 @@ def generate_edison_task(
     prefix: str,
     *,
     project_root: Path,
+    metadata: Optional[EntityMetadata] = None,
 ) -> Task:
     """Generate an Edison Task from a SpecKit task.
 
@@ -244,6 +245,7 @@ def generate_edison_task(
         speckit_task: Parsed SpecKit task
         feature: Feature folder metadata
         prefix: Task ID prefix (e.g., "auth" -> "auth-T001")
+        metadata: Creation metadata (default: stamped now by "speckit-import")
 
     Returns:
         Edison Task object ready for persistence
@@ -274,7 +276,7 @@ def generate_edison_task(
                 "task_id": speckit_task.id,
             },
         },
-        metadata=EntityMetadata.create(created_by="speckit-import"),
+        metadata=metadata or EntityMetadata.create(created_by="speckit-import"),
     )
 
 
@@ -403,6 +405,7 @@ def sync_speckit_feature(
     create_qa: bool = True,
     dry_run: bool = False,
     project_root: Optional[Path] = None,
+    staged: bool = False,
 ) -> SyncResult:
     """Import or sync a SpecKit feature with Edison tasks.
 
@@ -419,6 +422,7 @@ def sync_speckit_feature(
         create_qa: Whether to create QA records (default True)
         dry_run: Preview changes without writing (default False)
         project_root: Project root directory
+        staged: Publish all task/QA files or none (default False)
 
     Returns:
         SyncResult with created, updated, flagged, skipped task IDs
@@ -431,10 +435,13 @@ def sync_speckit_feature(
 
     depends_map = _compute_speckit_depends_on(feature.tasks)
     edison_depends = {
-        tid: [f"{prefix}-{dep}" for dep in deps]
+        f"{prefix}-{tid}": [f"{prefix}-{dep}" for dep in deps]
         for tid, deps in depends_map.items()
     }
 
+    # All tasks created by one import share a creation timestamp.
+    stamp = EntityMetadata.create(created_by="speckit-import")
+
     result = sync_items_to_tasks(
         feature.tasks,
         task_repo=task_repo,
@@ -444,6 +451,7 @@ def sync_speckit_feature(
             feature,
             prefix,
             project_root=resolved_project_root,
+            metadata=replace(stamp),
         ),
         update_task=lambda task, t: _update_edison_task(
             task,
@@ -459,53 +467,13 @@ def sync_speckit_feature(
         dry_run=dry_run,
         project_root=resolved_project_root,
         updatable_states={"todo"},
+        staged=staged,
+        depends_on=edison_depends,
     )
 
-    if not dry_run:
-        _sync_relationship_depends_on(
-            task_ids=sorted(set(result.created + result.updated)),
-            prefix=prefix,
-            depends_on_map=edison_depends,
-            project_root=resolved_project_root,
-        )
-
     return result
 
 
-def _sync_relationship_depends_on(
-    *,
-    task_ids: list[str],
-    prefix: str,
-    depends_on_map: dict[str, list[str]],
-    project_root: Path,
-) -> None:
-    """Set `depends_on` relationships for SpecKit-managed tasks.
-
-    SpecKit ordering is expressed in Edison as `depends_on` edges. We persist both:
-    - `depends_on` edges on the dependent task
-    - inverse `blocks` edges on the dependency task
-
-    This uses the relationship service so invariants are enforced centrally.
-    """
-    from edison.core.task.relationships.service import TaskRelationshipService
-
-    svc = TaskRelationshipService(project_root=project_root)
-
-    for task_id in task_ids:
-        task = svc.repo.get(task_id)
-        if not task:
-            continue
-
-        speckit_id = _extract_speckit_id(task_id, prefix)
-        desired = depends_on_map.get(speckit_id, [])
-
-        # Replace (override) existing dependencies to match SpecKit ordering.
-        for dep in list(task.depends_on or []):
-            svc.remove(task_id=task_id, rel_type="depends_on", target_id=dep)
-        for dep in desired:
-            svc.add(task_id=task_id, rel_type="depends_on", target_id=dep)
-
-
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
@@ -4,17 +4,27 @@ Importers should be "thin":
 - Parse external artifacts into typed items
 - Render Edison task title/description/tags
 - Use sync_items_to_tasks to create/update/flag tasks consistently
+
+Writes are batched: the created/updated/flagged tasks, their `depends_on`
+relationship edits and the new QA records are rendered first and published as
+one `write_text_many` batch (all-or-nothing with `staged=True`; files of tasks
+that changed state are unlinked only after the publish). The sync is recorded as
+one `import.sync` audit event.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Callable, List, Optional, Sequence, Set, TypeVar
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Set, TypeVar
 
+from edison.core.entity import publish_save_plans
 from edison.core.task.models import Task
 from edison.core.task.repository import TaskRepository
 
+if TYPE_CHECKING:
+    from edison.core.qa.models import QARecord
+
 TItem = TypeVar("TItem")
 TKey = TypeVar("TKey")
 
@@ -45,10 +55,15 @@ def sync_items_to_tasks(
     dry_run: bool,
     project_root: Optional[Path],
     updatable_states: Set[str] | None = None,
+    staged: bool = False,
+    depends_on: Optional[Dict[str, List[str]]] = None,
 ) -> SyncResult:
     """Sync external items into Edison tasks.
 
     Precedence rules are importer-specific via callbacks; core mechanics are shared.
+    `depends_on` (Edison task id -> dependency ids) replaces the `depends_on`
+    edges of every created/updated task. With `staged=True` all task and QA
+    files are published all-or-nothing.
     """
     result = SyncResult()
 
@@ -58,6 +73,8 @@ def sync_items_to_tasks(
     managed_tasks = [t for t in task_repo.find_all() if is_managed_task(t)]
     existing_by_key = {task_key(t): t for t in managed_tasks}
     desired_keys = {item_key(i) for i in items}
+    to_save: List[Task] = []
+    new_task_ids: List[str] = []
 
     for item in items:
         key = item_key(item)
@@ -69,27 +86,56 @@ def sync_items_to_tasks(
                 continue
             if not dry_run:
                 update_task(existing, item)
-                task_repo.save(existing)
+                to_save.append(existing)
             result.updated.append(new_task.id)
         else:
             if not dry_run:
-                task_repo.save(new_task)
-                if create_qa:
-                    create_qa_record(
-                        task_id=new_task.id,
-                        project_root=project_root,
-                        created_by=qa_created_by,
-                    )
+                to_save.append(new_task)
+                new_task_ids.append(new_task.id)
             result.created.append(new_task.id)
 
     # Flag removed
     for key, existing in existing_by_key.items():
         if key in desired_keys:
             continue
-        if not dry_run:
-            flag_task_as_removed(task_repo, existing, removed_tag=removed_tag)
+        if not dry_run and removed_tag not in existing.tags:
+            existing.tags.append(removed_tag)
+            to_save.append(existing)
         result.flagged.append(existing.id)
 
+    if dry_run:
+        return result
+
+    if depends_on is not None:
+        from edison.core.task.relationships.service import TaskRelationshipService
+
+        pending = {t.id: t for t in to_save}
+        desired = {
+            task_id: depends_on.get(task_id, [])
+            for task_id in sorted(set(result.created + result.updated))
+        }
+        svc = TaskRelationshipService(project_root=project_root)
+        to_save.extend(svc.plan_depends_on(desired, pending=pending, skip_missing=True))
+
+    plans = [task_repo.plan_save_many(to_save)]
+    if create_qa and new_task_ids:
+        from edison.core.qa.workflow.repository import QARepository
+
+        records = _qa_records(task_ids=new_task_ids, created_by=qa_created_by)
+        plans.append(QARepository(project_root).plan_save_many(records))
+    publish_save_plans(plans, staged=staged)
+
+    from edison.core.audit.logger import audit_event
+
+    audit_event(
+        "import.sync",
+        repo_root=project_root,
+        created=len(result.created),
+        updated=len(result.updated),
+        flagged=len(result.flagged),
+        skipped=len(result.skipped),
+        qa_created=len(new_task_ids) if create_qa else 0,
+    )
     return result
 
 
@@ -100,19 +146,45 @@ def flag_task_as_removed(repo: TaskRepository, task: Task, *, removed_tag: str)
 
 
 def create_qa_record(*, task_id: str, project_root: Optional[Path], created_by: str) -> None:
-    from edison.core.qa.models import QARecord
+    create_qa_records(task_ids=[task_id], project_root=project_root, created_by=created_by)
+
+
+def create_qa_records(
+    *,
+    task_ids: Sequence[str],
+    project_root: Optional[Path],
+    created_by: str,
+    staged: bool = False,
+) -> None:
+    """Create (or refresh) the waiting QA record of each task in one batch."""
     from edison.core.qa.workflow.repository import QARepository
-    from edison.core.entity import EntityMetadata
 
-    qa_repo = QARepository(project_root)
-    qa = QARecord(
-        id=f"{task_id}-qa",
-        task_id=task_id,
-        state="waiting",
-        title=f"QA {task_id}",
-        metadata=EntityMetadata.create(created_by=created_by),
-    )
-    qa_repo.save(qa)
+    records = _qa_records(task_ids=task_ids, created_by=created_by)
+    QARepository(project_root).save_many(records, staged=staged)
 
 
-__all__ = ["SyncResult", "sync_items_to_tasks", "flag_task_as_removed", "create_qa_record"]
+def _qa_records(*, task_ids: Sequence[str], created_by: str) -> List["QARecord"]:
+    from edison.core.qa.models import QARecord
+    from edison.core.entity import EntityMetadata
+
+    # One timestamp for the whole batch (each record gets its own copy).
+    stamp = EntityMetadata.create(created_by=created_by)
+    return [
+        QARecord(
+            id=f"{task_id}-qa",
+            task_id=task_id,
+            state="waiting",
+            title=f"QA {task_id}",
+            metadata=replace(stamp),
+        )
+        for task_id in task_ids
+    ]
+
+
+__all__ = [
+    "SyncResult",
+    "sync_items_to_tasks",
+    "flag_task_as_removed",
+    "create_qa_record",
+    "create_qa_records",
+]
@@ -0,0 +1,196 @@
+"""Local full-text index for the file-store memory provider.
+
+The file store keeps human-readable artifacts (`patterns.md`, `gotchas.md`, the
+codebase map and per-session insight JSONs). This module keeps a SQLite FTS5
+index next to them so they can be searched offline with BM25 ranking:
+
+- `entries` holds one row per indexed item, unique on (kind, key); it doubles as
+  the persisted dedupe set for bullet files (an indexed lookup instead of
+  rereading the whole file on every save)
+- `entries_fts` is an external-content FTS5 table kept in sync by triggers
+- the index is derived data: when it is missing, or when the artifacts changed
+  outside the provider (hand edits, a failed write), it is rebuilt from them
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+SCHEMA_VERSION = 1
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    text TEXT NOT NULL,
+    session_id TEXT,
+    UNIQUE (kind, key)
+);
+CREATE INDEX IF NOT EXISTS entries_session ON entries (session_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    text, content='entries', content_rowid='id', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_au AFTER UPDATE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO entries_fts(rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+
+@dataclass(frozen=True)
+class IndexedEntry:
+    kind: str
+    key: str
+    text: str
+    session_id: Optional[str]
+    score: float  # BM25 relevance (higher is better)
+
+
+def fts_query(text: str) -> str:
+    """Turn free text into an FTS5 OR-query of quoted terms ("" when no terms)."""
+    terms = dict.fromkeys(t.lower() for t in _TOKEN_RE.findall(text or ""))
+    return " OR ".join(f'"{t}"' for t in terms)
+
+
+class FileStoreIndex:
+    """SQLite FTS5 index (BM25) over file-store memory entries."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.created = not self.path.exists()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(
+            "INSERT OR IGNORE INTO meta(key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),)
+        )
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several writes into one SQLite transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else str(row[0])
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO meta(key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+                (key, value),
+            )
+
+    def clear(self) -> None:
+        """Drop every indexed entry (before a rebuild)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+
+    def contains(self, kind: str, key: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM entries WHERE kind = ? AND key = ?", (kind, key)).fetchone()
+        return row is not None
+
+    def add_unique(self, kind: str, text: str, *, session_id: Optional[str] = None) -> bool:
+        """Insert `text` keyed by itself; return False when it was already present."""
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT OR IGNORE INTO entries(kind, key, text, session_id) VALUES (?, ?, ?, ?)",
+                (kind, text, text, session_id),
+            )
+            return cur.rowcount == 1
+
+    def upsert(self, kind: str, key: str, text: str, *, session_id: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO entries(kind, key, text, session_id) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(kind, key) DO UPDATE SET text = excluded.text, session_id = excluded.session_id "
+                "WHERE entries.text != excluded.text OR entries.session_id IS NOT excluded.session_id",
+                (kind, key, text, session_id),
+            )
+
+    def replace_session(self, session_id: str, kind: str, items: Iterable[tuple[str, str]]) -> None:
+        """Replace all `kind` entries of a session with (key, text) items."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE session_id = ? AND kind = ?", (session_id, kind))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries(kind, key, text, session_id) VALUES (?, ?, ?, ?)",
+                ((kind, key, text, session_id) for key, text in items),
+            )
+
+    def search(self, query: str, *, limit: int) -> list[IndexedEntry]:
+        match = fts_query(query)
+        if not match or limit <= 0:
+            return []
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT e.kind, e.key, e.text, e.session_id, bm25(entries_fts) AS rank "
+                "FROM entries_fts JOIN entries e ON e.id = entries_fts.rowid "
+                "WHERE entries_fts MATCH ? ORDER BY rank LIMIT ?",
+                (match, int(limit)),
+            ).fetchall()
+        # FTS5's bm25() is negative (more negative = more relevant).
+        return [IndexedEntry(kind=k, key=key, text=t, session_id=s, score=-float(r)) for k, key, t, s, r in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_INDEXES: dict[Path, FileStoreIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def open_index(path: Path) -> FileStoreIndex:
+    """Return the shared open index for `path` (one connection per process)."""
+    key = Path(path).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None or not key.exists():
+            if index is not None:
+                index.close()
+            index = FileStoreIndex(key)
+            _INDEXES[key] = index
+        return index
+
+
+def close_indexes() -> None:
+    with _INDEXES_LOCK:
+        indexes = list(_INDEXES.values())
+        _INDEXES.clear()
+    for index in indexes:
+        index.close()
+
+
+__all__ = ["FileStoreIndex", "IndexedEntry", "close_indexes", "fts_query", "open_index"]
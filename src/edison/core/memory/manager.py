@@ -1,14 +1,28 @@
-"""Memory manager (provider selection + aggregation)."""
+"""Memory manager (provider selection + aggregation).
+
+Searches fan out to all providers concurrently under one shared deadline
+(`memory.defaults.searchTimeoutSeconds`). Providers that miss the deadline are
+skipped and the hits that did arrive are returned (see `last_incomplete`).
+Per-provider results are memoized in a small process-wide TTL/LRU cache
+(`memory.defaults.searchCacheTtlSeconds`) that any write through the manager
+invalidates.
+"""
 
 from __future__ import annotations
 
+import concurrent.futures
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from time import monotonic
+from typing import Any, Callable, Iterable, Optional
 
 from edison.core.config import ConfigManager
+from edison.core.config.cache import register_cache_clearer
+from edison.core.memory.file_index import close_indexes
 from edison.core.memory.models import MemoryHit
-from edison.core.memory.providers import MemoryProvider
+from edison.core.memory.providers import MemoryProvider, close_provider_instances
 
 
 @dataclass(frozen=True)
@@ -16,6 +30,78 @@ class MemoryConfig:
     enabled: bool
     max_hits: int
     providers: dict[str, dict[str, Any]]
+    search_timeout_seconds: float = 15.0
+    search_cache_ttl_seconds: float = 30.0
+
+
+class _SearchCache:
+    """Small thread-safe TTL + LRU cache of per-provider search results."""
+
+    def __init__(self, *, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._items: OrderedDict[tuple[Any, ...], tuple[float, tuple[MemoryHit, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...], *, ttl: float) -> Optional[list[MemoryHit]]:
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is None:
+                return None
+            stored_at, hits = entry
+            if monotonic() - stored_at > ttl:
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return list(hits)
+
+    def put(self, key: tuple[Any, ...], hits: list[MemoryHit]) -> None:
+        with self._lock:
+            self._items[key] = (monotonic(), tuple(hits))
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def invalidate(self, project_root: Optional[Path] = None) -> None:
+        with self._lock:
+            if project_root is None:
+                self._items.clear()
+                return
+            root = str(project_root)
+            for key in [k for k in self._items if k[0] == root]:
+                del self._items[key]
+
+
+_SEARCH_CACHE = _SearchCache()
+
+
+def _submit(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> concurrent.futures.Future[Any]:
+    """Run `fn` on a daemon thread.
+
+    Not a ThreadPoolExecutor: its workers are joined at interpreter exit, so a
+    provider stuck past the deadline would hold the CLI open until it finished.
+    """
+    future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+
+    def _run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=_run, name="edison-memory-search", daemon=True).start()
+    return future
+
+
+def clear_memory_caches() -> None:
+    """Drop memoized search results and reused provider instances."""
+    _SEARCH_CACHE.invalidate()
+    close_provider_instances()
+    close_indexes()
+
+
+register_cache_clearer("memory", clear_memory_caches)
 
 
 def _load_memory_config(*, project_root: Path, validate_config: bool) -> MemoryConfig:
@@ -27,7 +113,13 @@ def _load_memory_config(*, project_root: Path, validate_config: bool) -> MemoryC
     defaults = mem.get("defaults", {}) if isinstance(mem.get("defaults", {}), dict) else {}
     max_hits = int(defaults.get("maxHits", 5))
     providers = mem.get("providers", {}) if isinstance(mem.get("providers", {}), dict) else {}
-    return MemoryConfig(enabled=enabled, max_hits=max_hits, providers=providers)
+    return MemoryConfig(
+        enabled=enabled,
+        max_hits=max_hits,
+        providers=providers,
+        search_timeout_seconds=float(defaults.get("searchTimeoutSeconds", 15)),
+        search_cache_ttl_seconds=float(defaults.get("searchCacheTtlSeconds", 30)),
+    )
 
 
 class MemoryManager:
@@ -38,6 +130,7 @@ class MemoryManager:
         self._validate_config = bool(validate_config)
         self._cfg = _load_memory_config(project_root=project_root, validate_config=self._validate_config)
         self._providers: list[MemoryProvider] = self._build_providers()
+        self.last_incomplete: tuple[str, ...] = ()
 
     @property
     def enabled(self) -> bool:
@@ -70,24 +163,75 @@ class MemoryManager:
 
         return providers
 
-    def search(self, query: str, *, limit: Optional[int] = None) -> list[MemoryHit]:
+    def search(
+        self, query: str, *, limit: Optional[int] = None, timeout_seconds: Optional[float] = None
+    ) -> list[MemoryHit]:
         if not self.enabled:
             return []
         effective_limit = self._cfg.max_hits if limit is None else max(0, int(limit))
 
         hits: list[MemoryHit] = []
-        for provider in self._providers:
+        for provider_hits in self.search_by_provider(
+            query, limit=effective_limit, timeout_seconds=timeout_seconds
+        ).values():
+            hits.extend(provider_hits)
+
+        hits.sort(key=lambda h: (h.score is not None, h.score or 0.0), reverse=True)
+        return hits[:effective_limit]
+
+    def search_by_provider(
+        self,
+        query: str,
+        *,
+        limit: int,
+        provider_ids: Optional[Iterable[str]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> dict[str, list[MemoryHit]]:
+        """Query providers concurrently; return hits per provider id (in provider order).
+
+        Providers that fail are treated as empty. Providers still running when
+        the shared deadline expires are left out and listed in `last_incomplete`.
+        """
+        self.last_incomplete = ()
+        if not self.enabled:
+            return {}
+        wanted = set(provider_ids) if provider_ids is not None else None
+        providers = [p for p in self._providers if wanted is None or getattr(p, "id", None) in wanted]
+        ttl = float(self._cfg.search_cache_ttl_seconds)
+        root = str(self.project_root)
+
+        results: dict[str, list[MemoryHit]] = {}
+        pending: dict[concurrent.futures.Future[list[MemoryHit]], tuple[str, tuple[Any, ...]]] = {}
+        for provider in providers:
+            pid = str(getattr(provider, "id", ""))
+            key = (root, pid, query, int(limit))
+            cached = _SEARCH_CACHE.get(key, ttl=ttl) if ttl > 0 else None
+            if cached is not None:
+                results[pid] = cached
+                continue
+            pending[_submit(provider.search, query, limit=limit)] = (pid, key)
+
+        timeout = self._cfg.search_timeout_seconds if timeout_seconds is None else timeout_seconds
+        done, not_done = concurrent.futures.wait(pending, timeout=max(0.0, float(timeout)))
+        for future in done:
+            pid, key = pending[future]
             try:
-                hits.extend(provider.search(query, limit=effective_limit))
+                provider_hits = list(future.result())
             except Exception:
                 continue
+            results[pid] = provider_hits
+            if ttl > 0:
+                _SEARCH_CACHE.put(key, provider_hits)
+        # Stragglers keep running on their daemon threads; their results are dropped.
+        self.last_incomplete = tuple(sorted(pending[f][0] for f in not_done))
 
-        hits.sort(key=lambda h: (h.score is not None, h.score or 0.0), reverse=True)
-        return hits[:effective_limit]
+        order = [str(getattr(p, "id", "")) for p in providers]
+        return {pid: results[pid] for pid in order if pid in results}
 
     def save(self, session_summary: str, *, session_id: Optional[str] = None) -> None:
         if not self.enabled:
             return
+        _SEARCH_CACHE.invalidate(self.project_root)
         for provider in self._providers:
             try:
                 provider.save(session_summary, session_id=session_id)
@@ -97,6 +241,7 @@ class MemoryManager:
     def save_structured(self, record: dict[str, Any], *, session_id: Optional[str] = None) -> None:
         if not self.enabled:
             return
+        _SEARCH_CACHE.invalidate(self.project_root)
         for provider in self._providers:
             fn = getattr(provider, "save_structured", None)
             if not callable(fn):
@@ -109,6 +254,7 @@ class MemoryManager:
     def index(self, *, event: str, session_id: Optional[str] = None) -> None:
         if not self.enabled:
             return
+        _SEARCH_CACHE.invalidate(self.project_root)
         for provider in self._providers:
             fn = getattr(provider, "index", None)
             if not callable(fn):
@@ -122,4 +268,5 @@ class MemoryManager:
 __all__ = [
     "MemoryManager",
     "MemoryConfig",
+    "clear_memory_caches",
 ]
@@ -3,20 +3,38 @@
 This is intentionally small and synchronous:
 - Memory providers call MCP tools as a boundary integration.
 - Calls are best-effort and fail-open in providers.
+
+Servers are expensive to start (process spawn + `initialize` handshake), so
+`call_tool` goes through a process-wide `McpSessionPool` that keeps one
+initialized session per server alive for the rest of the invocation:
+
+- requests are multiplexed by JSON-RPC id (concurrent callers share a session)
+- reads are selector-based with real deadlines (no sleep polling)
+- sessions idle for `idle_timeout_seconds` are shut down by a reaper thread
+- a crashed/exited server is restarted transparently on the next call
 """
 
 from __future__ import annotations
 
+import atexit
+import itertools
 import json
 import os
+import re
+import selectors
 import subprocess
-import time
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from time import monotonic
+from typing import Any, Dict, Optional, Tuple
 
 from edison.core.mcp.config import McpServerConfig, build_mcp_servers
 
+DEFAULT_IDLE_TIMEOUT_SECONDS = 120.0
+
+_HEADER_END = re.compile(rb"\r?\n\r?\n")
+
 
 @dataclass(frozen=True)
 class McpToolResult:
@@ -29,83 +47,302 @@ def _encode_message(obj: dict[str, Any]) -> bytes:
     return header + body
 
 
-def _readline_with_timeout(stream, *, deadline: float) -> bytes:  # type: ignore[no-untyped-def]
-    while True:
-        if time.time() > deadline:
-            raise TimeoutError("Timed out waiting for MCP header line")
-        line = stream.readline()
-        if line:
-            return line
-        time.sleep(0.01)
-
-
-def _read_exact(stream, n: int, *, deadline: float) -> bytes:  # type: ignore[no-untyped-def]
-    buf = bytearray()
-    while len(buf) < n:
-        if time.time() > deadline:
-            raise TimeoutError("Timed out waiting for MCP message body")
-        chunk = stream.read(n - len(buf))
-        if not chunk:
-            time.sleep(0.01)
-            continue
-        buf.extend(chunk)
-    return bytes(buf)
-
-
-def _read_message(stdout, *, timeout_seconds: int) -> dict[str, Any]:  # type: ignore[no-untyped-def]
-    deadline = time.time() + max(0.1, float(timeout_seconds))
-    headers: dict[str, str] = {}
-    while True:
-        line = _readline_with_timeout(stdout, deadline=deadline)
-        if line in (b"\n", b"\r\n", b""):
-            break
+class _FrameReader:
+    """Content-Length framed message reader over a pipe, with deadlines."""
+
+    def __init__(self, stream: Any) -> None:
+        self._fd = stream.fileno()
+        self._buf = bytearray()
+        self._sel = selectors.DefaultSelector()
+        self._sel.register(self._fd, selectors.EVENT_READ)
+
+    def _try_parse(self) -> Optional[dict[str, Any]]:
+        m = _HEADER_END.search(self._buf)
+        if m is None:
+            return None
+        headers: dict[str, str] = {}
+        for line in bytes(self._buf[: m.start()]).decode("ascii", errors="ignore").splitlines():
+            if ":" in line:
+                k, v = line.split(":", 1)
+                headers[k.strip().lower()] = v.strip()
+        length_raw = headers.get("content-length")
+        if not length_raw:
+            raise ValueError("MCP message missing Content-Length header")
+        end = m.end() + int(length_raw)
+        if len(self._buf) < end:
+            return None
+        body = bytes(self._buf[m.end() : end])
+        del self._buf[:end]
+        return json.loads(body.decode("utf-8", errors="strict"))
+
+    def read_message(self, *, deadline: float) -> dict[str, Any]:
+        while True:
+            msg = self._try_parse()
+            if msg is not None:
+                return msg
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Timed out waiting for MCP message")
+            if not self._sel.select(remaining):
+                continue
+            chunk = os.read(self._fd, 65536)
+            if not chunk:
+                raise EOFError("MCP server closed its stdout")
+            self._buf += chunk
+
+    def close(self) -> None:
+        self._sel.close()
+
+
+class McpSession:
+    """One initialized MCP server process."""
+
+    def __init__(self, server: McpServerConfig) -> None:
+        self.server = server
+        self._proc: Optional[subprocess.Popen[bytes]] = None
+        self._reader: Optional[_FrameReader] = None
+        self._ids = itertools.count(1)
+        self._write_lock = threading.Lock()
+        self._cond = threading.Condition()
+        self._reading = False
+        self._pending: set[int] = set()
+        self._responses: Dict[int, dict[str, Any]] = {}
+        self.last_used = monotonic()
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def start(self, *, timeout_seconds: float) -> None:
+        env = os.environ.copy()
+        env.update(self.server.env or {})
+        self._proc = subprocess.Popen(
+            [self.server.command] + list(self.server.args),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            # Never PIPE without draining: a chatty server would block on stderr.
+            stderr=subprocess.DEVNULL,
+            env=env,
+        )
+        self._reader = _FrameReader(self._proc.stdout)
+        self.request(
+            "initialize",
+            {
+                "protocolVersion": "2024-11-05",
+                "clientInfo": {"name": "edison", "version": "0"},
+                "capabilities": {},
+            },
+            timeout_seconds=timeout_seconds,
+        )
+        self.notify("initialized", {})
+
+    def _send(self, obj: dict[str, Any]) -> None:
+        proc = self._proc
+        if proc is None or proc.stdin is None:
+            raise BrokenPipeError("MCP session is not started")
+        with self._write_lock:
+            proc.stdin.write(_encode_message(obj))
+            proc.stdin.flush()
+
+    def notify(self, method: str, params: dict[str, Any]) -> None:
+        self._send({"jsonrpc": "2.0", "method": method, "params": params})
+
+    def request(self, method: str, params: dict[str, Any], *, timeout_seconds: float) -> dict[str, Any]:
+        """Send a request and wait for the response with the same id."""
+        rid = next(self._ids)
+        deadline = monotonic() + max(0.1, float(timeout_seconds))
+        with self._cond:
+            self._pending.add(rid)
         try:
-            k, v = line.decode("ascii", errors="ignore").split(":", 1)
-            headers[k.strip().lower()] = v.strip()
+            self._send({"jsonrpc": "2.0", "id": rid, "method": method, "params": params})
+            with self._cond:
+                while True:
+                    if rid in self._responses:
+                        return self._responses.pop(rid)
+                    if self._reading:
+                        # Another caller is reading; it routes our response to us.
+                        remaining = deadline - monotonic()
+                        if remaining <= 0:
+                            raise TimeoutError(f"Timed out waiting for MCP response to {method}")
+                        self._cond.wait(remaining)
+                        continue
+                    self._reading = True
+                    self._cond.release()
+                    try:
+                        assert self._reader is not None
+                        msg = self._reader.read_message(deadline=deadline)
+                    finally:
+                        self._cond.acquire()
+                        self._reading = False
+                        self._cond.notify_all()
+                    mid = msg.get("id")
+                    if isinstance(mid, int) and mid in self._pending and ("result" in msg or "error" in msg):
+                        self._responses[mid] = msg
+                    # Server-initiated requests/notifications and stale responses are ignored.
+        finally:
+            with self._cond:
+                self._pending.discard(rid)
+                self._responses.pop(rid, None)
+            self.last_used = monotonic()
+
+    def call_tool(
+        self, tool_name: str, arguments: dict[str, Any], *, timeout_seconds: float
+    ) -> Optional[McpToolResult]:
+        msg = self.request(
+            "tools/call",
+            {"name": tool_name, "arguments": arguments},
+            timeout_seconds=timeout_seconds,
+        )
+        res = msg.get("result")
+        if not isinstance(res, dict):
+            return None
+        content = res.get("content")
+        if not isinstance(content, list):
+            return None
+        return McpToolResult(content=[c for c in content if isinstance(c, dict)])
+
+    def close(self) -> None:
+        proc, self._proc = self._proc, None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        if proc is None:
+            return
+        for stream in (proc.stdin, proc.stdout):
+            try:
+                if stream is not None:
+                    stream.close()
+            except Exception:
+                pass
+        try:
+            proc.terminate()
+            proc.wait(timeout=1)
         except Exception:
-            continue
-
-    length_raw = headers.get("content-length")
-    if not length_raw:
-        raise ValueError("MCP message missing Content-Length header")
-    length = int(length_raw)
-    body = _read_exact(stdout, length, deadline=deadline)
-    return json.loads(body.decode("utf-8", errors="strict"))
-
-
-def _start_server(server: McpServerConfig, *, timeout_seconds: int) -> subprocess.Popen[bytes]:
-    env = os.environ.copy()
-    env.update(server.env or {})
-    return subprocess.Popen(
-        [server.command] + list(server.args),
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        env=env,
-    )
-
-
-def _initialize(proc: subprocess.Popen[bytes], *, timeout_seconds: int) -> None:
-    assert proc.stdin is not None
-    assert proc.stdout is not None
-
-    init_req = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "initialize",
-        "params": {
-            "protocolVersion": "2024-11-05",
-            "clientInfo": {"name": "edison", "version": "0"},
-            "capabilities": {},
-        },
-    }
-    proc.stdin.write(_encode_message(init_req))
-    proc.stdin.flush()
-    _ = _read_message(proc.stdout, timeout_seconds=timeout_seconds)
-
-    notif = {"jsonrpc": "2.0", "method": "initialized", "params": {}}
-    proc.stdin.write(_encode_message(notif))
-    proc.stdin.flush()
+            try:
+                proc.kill()
+                proc.wait(timeout=1)
+            except Exception:
+                pass
+
+
+_SessionKey = Tuple[str, str, Tuple[str, ...], Tuple[Tuple[str, str], ...]]
+
+
+class McpSessionPool:
+    """Keeps one initialized session per configured server alive."""
+
+    def __init__(self, *, idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS) -> None:
+        self.idle_timeout_seconds = float(idle_timeout_seconds)
+        self._sessions: Dict[_SessionKey, McpSession] = {}
+        self._lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.starts = 0
+
+    @staticmethod
+    def _key(server_id: str, server: McpServerConfig) -> _SessionKey:
+        return (
+            server_id,
+            server.command,
+            tuple(server.args),
+            tuple(sorted((server.env or {}).items())),
+        )
+
+    def _ensure_reaper(self) -> None:
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+        self._stop.clear()
+        interval = max(0.05, self.idle_timeout_seconds / 2)
+
+        def _loop() -> None:
+            while not self._stop.wait(interval):
+                self.reap_idle()
+                with self._lock:
+                    if not self._sessions:
+                        return
+
+        self._reaper = threading.Thread(target=_loop, name="edison-mcp-reaper", daemon=True)
+        self._reaper.start()
+
+    def session(self, server_id: str, server: McpServerConfig, *, timeout_seconds: float) -> McpSession:
+        key = self._key(server_id, server)
+        with self._lock:
+            sess = self._sessions.get(key)
+            if sess is not None and sess.alive:
+                return sess
+            if sess is not None:
+                sess.close()
+            sess = McpSession(server)
+            try:
+                sess.start(timeout_seconds=timeout_seconds)
+            except BaseException:
+                sess.close()
+                self._sessions.pop(key, None)
+                raise
+            self.starts += 1
+            self._sessions[key] = sess
+        self._ensure_reaper()
+        return sess
+
+    def discard(self, server_id: str, server: McpServerConfig) -> None:
+        with self._lock:
+            sess = self._sessions.pop(self._key(server_id, server), None)
+        if sess is not None:
+            sess.close()
+
+    def call_tool(
+        self,
+        server_id: str,
+        server: McpServerConfig,
+        tool_name: str,
+        arguments: dict[str, Any],
+        *,
+        timeout_seconds: float,
+    ) -> Optional[McpToolResult]:
+        """Call a tool, restarting the server once if it crashed or exited."""
+        for attempt in (0, 1):
+            sess = self.session(server_id, server, timeout_seconds=timeout_seconds)
+            try:
+                return sess.call_tool(tool_name, arguments, timeout_seconds=timeout_seconds)
+            except (EOFError, OSError):
+                self.discard(server_id, server)
+                if attempt:
+                    raise
+            except TimeoutError:
+                # A wedged server may answer late; never reuse it.
+                self.discard(server_id, server)
+                raise
+        return None
+
+    def reap_idle(self) -> int:
+        """Close sessions idle for longer than the idle timeout (or dead)."""
+        cutoff = monotonic() - self.idle_timeout_seconds
+        with self._lock:
+            stale = [k for k, s in self._sessions.items() if s.last_used < cutoff or not s.alive]
+            sessions = [self._sessions.pop(k) for k in stale]
+        for sess in sessions:
+            sess.close()
+        return len(sessions)
+
+    def close_all(self) -> None:
+        self._stop.set()
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for sess in sessions:
+            sess.close()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+
+_POOL = McpSessionPool()
+atexit.register(_POOL.close_all)
+
+
+def get_mcp_session_pool() -> McpSessionPool:
+    """Return the process-wide MCP session pool."""
+    return _POOL
 
 
 def call_tool(
@@ -115,8 +352,9 @@ def call_tool(
     tool_name: str,
     arguments: dict[str, Any],
     timeout_seconds: int = 10,
+    pool: Optional[McpSessionPool] = None,
 ) -> Optional[McpToolResult]:
-    """Call an MCP tool by spawning the configured server and making one request."""
+    """Call an MCP tool on a pooled, already-initialized server session."""
     try:
         _, servers, _ = build_mcp_servers(project_root)
         server = servers.get(server_id)
@@ -125,42 +363,12 @@ def call_tool(
     except Exception:
         return None
 
-    proc: subprocess.Popen[bytes] | None = None
     try:
-        proc = _start_server(server, timeout_seconds=timeout_seconds)
-        if proc.stdin is None or proc.stdout is None:
-            return None
-
-        _initialize(proc, timeout_seconds=timeout_seconds)
-
-        req = {
-            "jsonrpc": "2.0",
-            "id": 2,
-            "method": "tools/call",
-            "params": {"name": tool_name, "arguments": arguments},
-        }
-        proc.stdin.write(_encode_message(req))
-        proc.stdin.flush()
-        msg = _read_message(proc.stdout, timeout_seconds=timeout_seconds)
-        res = msg.get("result")
-        if not isinstance(res, dict):
-            return None
-        content = res.get("content")
-        if not isinstance(content, list):
-            return None
-        return McpToolResult(content=[c for c in content if isinstance(c, dict)])
+        return (pool or _POOL).call_tool(
+            server_id, server, tool_name, arguments, timeout_seconds=timeout_seconds
+        )
     except Exception:
         return None
-    finally:
-        if proc is not None:
-            try:
-                proc.terminate()
-            except Exception:
-                pass
-            try:
-                proc.wait(timeout=1)
-            except Exception:
-                pass
 
 
-__all__ = ["call_tool", "McpToolResult"]
+__all__ = ["call_tool", "get_mcp_session_pool", "McpSession", "McpSessionPool", "McpToolResult"]
@@ -8,16 +8,20 @@ fail-open and never break core workflows.
 from __future__ import annotations
 
 import asyncio
+import atexit
 import importlib
 import inspect
 import json
 import shutil
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional, Protocol
 
+from edison.core.memory.file_index import FileStoreIndex, open_index
 from edison.core.memory.models import MemoryHit
+from edison.core.utils.profiling import count
 
 
 class MemoryProvider(Protocol):
@@ -231,17 +235,84 @@ class ExternalCliTextMemoryProvider:
             return
 
 
+class _SharedEventLoop:
+    """One background event loop per process for async provider APIs.
+
+    `asyncio.run()` per call creates and tears down a loop every time, and
+    async clients bound to one loop cannot be reused from another. Running all
+    provider coroutines on a single long-lived loop lets provider instances
+    (and their connections) be reused for the whole invocation, and lets
+    concurrent searches submit coroutines from worker threads.
+    """
+
+    def __init__(self) -> None:
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._thread is None or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="edison-memory-loop", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def run(self, awaitable: Any) -> Any:
+        async def _await() -> Any:
+            return await awaitable
+
+        return asyncio.run_coroutine_threadsafe(_await(), self._ensure()).result()
+
+    def close(self) -> None:
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None:
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=2)
+        if not loop.is_running():
+            loop.close()
+
+
+_SHARED_LOOP = _SharedEventLoop()
+
+
 def _run_awaitable(value: Any) -> Any:
     if not inspect.isawaitable(value):
         return value
     try:
         asyncio.get_running_loop()
     except RuntimeError:
-        return asyncio.run(value)
+        return _SHARED_LOOP.run(value)
     # Fail-open: Edison memory provider interface is sync; avoid blocking in an active loop.
     return None
 
 
+# Provider instances keyed by (class, spec_dir, project_root, group_id_mode).
+_GRAPHITI_INSTANCES: dict[tuple[Any, ...], Any] = {}
+_GRAPHITI_LOCK = threading.Lock()
+
+
+def close_provider_instances() -> None:
+    """Close reused async provider instances and the shared event loop."""
+    with _GRAPHITI_LOCK:
+        instances = list(_GRAPHITI_INSTANCES.values())
+        _GRAPHITI_INSTANCES.clear()
+    for memory in instances:
+        try:
+            _run_awaitable(getattr(memory, "close")())  # type: ignore[misc]
+        except Exception:
+            pass
+    _SHARED_LOOP.close()
+
+
+atexit.register(close_provider_instances)
+
+
 @dataclass(frozen=True)
 class GraphitiPythonMemoryProvider:
     """Provider backed by a Python GraphitiMemory class (async API).
@@ -267,8 +338,15 @@ class GraphitiPythonMemoryProvider:
         return getattr(mod, self.class_name)
 
     def _instantiate(self) -> Any:
+        """Return the shared instance for this configuration (created on first use)."""
         cls = self._load_class()
-        return cls(self.spec_dir, self.project_root, group_id_mode=self.group_id_mode)
+        key = (cls, str(self.spec_dir), str(self.project_root), self.group_id_mode)
+        with _GRAPHITI_LOCK:
+            memory = _GRAPHITI_INSTANCES.get(key)
+            if memory is None:
+                memory = cls(self.spec_dir, self.project_root, group_id_mode=self.group_id_mode)
+                _GRAPHITI_INSTANCES[key] = memory
+            return memory
 
     def search(self, query: str, *, limit: int) -> list[MemoryHit]:
         if not self.module or not self.class_name:
@@ -321,11 +399,6 @@ class GraphitiPythonMemoryProvider:
                         hits.append(MemoryHit(provider_id=self.id, text=text, score=None, meta={"type": "session"}))
         except Exception:
             return []
-        finally:
-            try:
-                _run_awaitable(getattr(memory, "close")())  # type: ignore[misc]
-            except Exception:
-                pass
 
         hits.sort(key=lambda h: (h.score is not None, h.score or 0.0), reverse=True)
         return hits[: max(0, int(limit))]
@@ -355,11 +428,6 @@ class GraphitiPythonMemoryProvider:
             _run_awaitable(fn(text))
         except Exception:
             return
-        finally:
-            try:
-                _run_awaitable(getattr(memory, "close")())  # type: ignore[misc]
-            except Exception:
-                pass
 
     def save_structured(self, record: dict[str, Any], *, session_id: Optional[str] = None) -> None:
         if not self.module or not self.class_name:
@@ -380,11 +448,6 @@ class GraphitiPythonMemoryProvider:
             _run_awaitable(fn(payload))
         except Exception:
             return
-        finally:
-            try:
-                _run_awaitable(getattr(memory, "close")())  # type: ignore[misc]
-            except Exception:
-                pass
 
 
 @dataclass(frozen=True)
@@ -484,12 +547,38 @@ class McpToolsMemoryProvider:
         return
 
 
+# Session insight fields indexed by the file store (one entry per list item).
+_INSIGHT_FIELDS = ("whatWorked", "whatFailed", "recommendationsForNextSession")
+
+
+def _session_insight_items(session_id: str, record: dict[str, Any]) -> list[tuple[str, str]]:
+    items: list[tuple[str, str]] = []
+    for field in _INSIGHT_FIELDS:
+        values = record.get(field)
+        if not isinstance(values, list):
+            continue
+        for i, value in enumerate(values):
+            text = value.strip() if isinstance(value, str) else ""
+            if text:
+                items.append((f"{session_id}:{field}:{i}", text))
+    return items
+
+
 @dataclass(frozen=True)
 class FileStoreMemoryProvider:
     """File-based structured memory fallback provider.
 
     Persists memory artifacts under a project-managed directory so memory survives
-    even when external providers are unavailable.
+    even when external providers are unavailable. Artifacts are indexed in a
+    local SQLite FTS5 index (`index.sqlite3`, BM25 ranking) that is updated
+    incrementally on save and rebuilt from the artifacts when missing or when
+    their signature no longer matches the one recorded at the last sync.
+
+    The signature stats the three shared artifacts and the session-insights
+    directory itself (not each insight file), so validating the index is O(1):
+    adding, removing or renaming an insight file changes the directory's
+    mtime, while rewriting one in place goes through `save_structured`, which
+    updates the index itself.
     """
 
     id: str
@@ -499,8 +588,76 @@ class FileStoreMemoryProvider:
     gotchas_path: Path
     session_insights_dir: Path
 
+    @property
+    def index_path(self) -> Path:
+        return self.memory_root / "index.sqlite3"
+
+    def _artifact_signature(self) -> str:
+        """(mtime_ns, ctime_ns, size) of the shared artifacts and the insights dir."""
+        sig: dict[str, Any] = {}
+        for path in (self.patterns_path, self.gotchas_path, self.codebase_map_path, self.session_insights_dir):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            sig[str(path)] = [st.st_mtime_ns, st.st_ctime_ns, st.st_size]
+        return json.dumps(sig, sort_keys=True)
+
+    def _mark_synced(self, index: FileStoreIndex) -> None:
+        """Record that the index now reflects the artifacts on disk."""
+        try:
+            index.set_meta("artifacts", self._artifact_signature())
+        except Exception:
+            pass
+
+    def _index(self) -> Optional[FileStoreIndex]:
+        try:
+            index = open_index(self.index_path)
+            if index.created or index.get_meta("artifacts") != self._artifact_signature():
+                index.created = False
+                self._rebuild_index(index)
+            return index
+        except Exception:
+            return None
+
+    def _rebuild_index(self, index: FileStoreIndex) -> None:
+        """Re-derive the index from the artifacts currently on disk."""
+        count("memory.file_store.rebuild")
+        with index.transaction():
+            index.clear()
+            for kind, path in (("pattern", self.patterns_path), ("gotcha", self.gotchas_path)):
+                for line in self._read_lines_set(path):
+                    if line.startswith("- ") and line[2:].strip():
+                        index.add_unique(kind, line[2:].strip())
+            for key, value in self._read_codebase_map().items():
+                index.upsert("file", str(key), f"{key}: {value}")
+            if self.session_insights_dir.is_dir():
+                for path in sorted(self.session_insights_dir.glob("*.json")):
+                    try:
+                        record = json.loads(path.read_text(encoding="utf-8"))
+                    except Exception:
+                        continue
+                    if isinstance(record, dict):
+                        sid = str(record.get("sessionId") or path.stem)
+                        index.replace_session(sid, "insight", _session_insight_items(sid, record))
+            index.set_meta("artifacts", self._artifact_signature())
+
     def search(self, query: str, *, limit: int) -> list[MemoryHit]:
-        return []
+        index = self._index()
+        if index is None:
+            return []
+        try:
+            entries = index.search(query, limit=max(0, int(limit)))
+        except Exception:
+            return []
+        hits: list[MemoryHit] = []
+        for e in entries:
+            meta: dict[str, Any] = {"kind": e.kind, "bm25": e.score}
+            if e.session_id:
+                meta["sessionId"] = e.session_id
+            # Squash unbounded BM25 into [0, 1) so it sorts alongside other providers.
+            hits.append(MemoryHit(provider_id=self.id, text=e.text, score=e.score / (1.0 + e.score), meta=meta))
+        return hits
 
     def save(self, session_summary: str, *, session_id: Optional[str] = None) -> None:
         return
@@ -517,61 +674,79 @@ class FileStoreMemoryProvider:
         except Exception:
             return set()
 
-    def _append_deduped_bullets(self, path: Path, items: list[str]) -> None:
+    def _read_codebase_map(self) -> dict[str, Any]:
+        if not self.codebase_map_path.exists():
+            return {}
+        try:
+            base_raw = json.loads(self.codebase_map_path.read_text(encoding="utf-8") or "{}")
+        except Exception:
+            return {}
+        return base_raw if isinstance(base_raw, dict) else {}
+
+    def _append_deduped_bullets(
+        self, path: Path, items: list[str], *, kind: str, index: Optional[FileStoreIndex] = None
+    ) -> bool:
+        """Append new bullets; return False when the file or the index could not be updated."""
         try:
-            existing = self._read_lines_set(path)
+            # The index is the persisted dedupe set; without it, fall back to rereading the file.
+            existing = self._read_lines_set(path) if index is None else set()
             to_add: list[str] = []
             for it in items:
                 s = str(it).strip()
-                if not s:
-                    continue
                 line = f"- {s}"
-                if line in existing:
+                if not s or line in existing:
+                    continue
+                if index is not None and index.contains(kind, s):
                     continue
                 to_add.append(line)
                 existing.add(line)
             if not to_add:
-                return
+                return True
             path.parent.mkdir(parents=True, exist_ok=True)
             with path.open("a", encoding="utf-8") as f:
-                if path.stat().st_size == 0:
-                    f.write("")  # no-op (keeps file present)
                 for ln in to_add:
                     f.write(ln + "\n")
+            # Index only what actually reached the file.
+            if index is not None:
+                for ln in to_add:
+                    index.add_unique(kind, ln[2:])
         except Exception:
-            return
+            return False
+        return True
 
-    def _merge_codebase_map(self, updates: dict[str, str]) -> None:
+    def _merge_codebase_map(self, updates: dict[str, str], *, index: Optional[FileStoreIndex] = None) -> bool:
         try:
             self.codebase_map_path.parent.mkdir(parents=True, exist_ok=True)
-            base: dict[str, Any] = {}
-            if self.codebase_map_path.exists():
-                try:
-                    base_raw = json.loads(self.codebase_map_path.read_text(encoding="utf-8") or "{}")
-                    if isinstance(base_raw, dict):
-                        base = base_raw
-                except Exception:
-                    base = {}
+            base = self._read_codebase_map()
 
+            changed: dict[str, str] = {}
             for k, v in updates.items():
                 ks = str(k).strip()
                 vs = str(v).strip()
                 if not ks or not vs:
                     continue
+                if base.get(ks) != vs:
+                    changed[ks] = vs
                 base[ks] = vs
 
             self.codebase_map_path.write_text(
                 json.dumps(base, indent=2, sort_keys=True, ensure_ascii=False) + "\n",
                 encoding="utf-8",
             )
+            if index is not None:
+                for ks, vs in changed.items():
+                    index.upsert("file", ks, f"{ks}: {vs}")
         except Exception:
-            return
+            return False
+        return True
 
     def save_structured(self, record: dict[str, Any], *, session_id: Optional[str] = None) -> None:
         self._ensure_dirs()
         sid = str(session_id or record.get("sessionId") or "").strip()
         if not sid:
             return
+        # Validate the index against the artifacts before this save touches them.
+        index = self._index()
         out_path = self.session_insights_dir / f"{sid}.json"
         try:
             out_path.write_text(
@@ -586,13 +761,28 @@ class FileStoreMemoryProvider:
         gotchas = discoveries.get("gotchas_encountered", []) if isinstance(discoveries, dict) else []
         files_understood = discoveries.get("files_understood", {}) if isinstance(discoveries, dict) else {}
 
+        try:
+            if index is not None:
+                with index.transaction():
+                    index.replace_session(sid, "insight", _session_insight_items(sid, record))
+        except Exception:
+            index = None
+
+        synced = True
         if isinstance(patterns, list):
-            self._append_deduped_bullets(self.patterns_path, [p for p in patterns if isinstance(p, str)])
+            synced &= self._append_deduped_bullets(
+                self.patterns_path, [p for p in patterns if isinstance(p, str)], kind="pattern", index=index
+            )
         if isinstance(gotchas, list):
-            self._append_deduped_bullets(self.gotchas_path, [g for g in gotchas if isinstance(g, str)])
+            synced &= self._append_deduped_bullets(
+                self.gotchas_path, [g for g in gotchas if isinstance(g, str)], kind="gotcha", index=index
+            )
         if isinstance(files_understood, dict):
             updates = {str(k): str(v) for k, v in files_understood.items() if isinstance(k, str)}
-            self._merge_codebase_map(updates)
+            synced &= self._merge_codebase_map(updates, index=index)
+        # A partial failure leaves the signature stale, so the next open rebuilds.
+        if index is not None and synced:
+            self._mark_synced(index)
 
 
 __all__ = [
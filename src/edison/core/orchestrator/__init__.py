@@ -12,6 +12,7 @@ from .launcher import (
     OrchestratorConfigError,
     OrchestratorLaunchError,
 )
+from .pty_pump import OutputTail, get_output_tail, read_log_tail
 from .utils import SafeDict
 
 __all__ = [
@@ -21,5 +22,8 @@ __all__ = [
     "OrchestratorNotFoundError",
     "OrchestratorConfigError",
     "OrchestratorLaunchError",
+    "OutputTail",
+    "get_output_tail",
+    "read_log_tail",
     "SafeDict",
 ]
@@ -18,7 +18,6 @@ import socket
 import string
 import subprocess
 import tempfile
-import threading
 from pathlib import Path
 from typing import Any
 
@@ -31,6 +30,7 @@ from edison.core.tracking.process_events import append_process_event
 from edison.core.utils.io import ensure_directory
 from edison.core.utils.time import utc_timestamp
 
+from .pty_pump import OutputTail, PtyPump, RotatingLogSink
 from .utils import SafeDict
 
 
@@ -56,6 +56,8 @@ class OrchestratorLauncher:
         self.config = config
         self.session_context = session_context
         self._temp_files: list[Path] = []
+        self.pty_pump: PtyPump | None = None
+        self.output_tail: OutputTail | None = None
         self._project_root: Path = Path(
             getattr(session_context, "project_root", None) or config.repo_root
         ).resolve()
@@ -311,39 +313,6 @@ class OrchestratorLauncher:
                     # For interactive mode without prompt via stdin, inherit stdin from terminal
                     # (stdin_target stays None to inherit)
 
-            def _start_pty_pump(master_fd: int, sink_path: Path | None) -> None:
-                def _pump() -> None:
-                    sink = None
-                    try:
-                        if sink_path is not None:
-                            sink = sink_path.open("a", encoding="utf-8")
-                        while True:
-                            try:
-                                data = os.read(master_fd, 4096)
-                            except OSError:
-                                break
-                            if not data:
-                                break
-                            if sink is not None:
-                                try:
-                                    sink.write(data.decode("utf-8", errors="replace"))
-                                    sink.flush()
-                                except Exception:
-                                    pass
-                    finally:
-                        if sink is not None:
-                            try:
-                                sink.flush()
-                                sink.close()
-                            except Exception:
-                                pass
-                        try:
-                            os.close(master_fd)
-                        except Exception:
-                            pass
-
-                threading.Thread(target=_pump, name="edison-orchestrator-pty-pump", daemon=True).start()
-
             process = subprocess.Popen(
                 [resolved_command, *args_list],
                 cwd=str(cwd_path) if cwd_path else None,
@@ -359,7 +328,12 @@ class OrchestratorLauncher:
                 except Exception:
                     pass
                 if pty_master is not None:
-                    _start_pty_pump(pty_master, pty_log_path)
+                    session_id = tokens.get("session_id")
+                    self._start_pty_pump(
+                        pty_master,
+                        pty_log_path,
+                        tail_key=(str(session_id), int(process.pid)) if session_id else None,
+                    )
             # Process events are the source of truth for the live process index (fail-open).
             try:
                 append_process_event(
@@ -375,6 +349,7 @@ class OrchestratorLauncher:
                     launcherKind="edison-orchestrator-launcher",
                     launcherPid=int(os.getpid()),
                     parentPid=int(os.getppid()),
+                    logPath=str(log_path) if log_path else None,
                 )
             except Exception:
                 pass
@@ -459,6 +434,33 @@ class OrchestratorLauncher:
                 except Exception:
                     pass
 
+    def _start_pty_pump(
+        self, master_fd: int, sink_path: Path | None, *, tail_key: tuple[str, int] | None = None
+    ) -> PtyPump:
+        """Start the background pump copying PTY output to the log and tail buffer."""
+        max_bytes, backups, tail_bytes = 0, 3, 0
+        try:
+            log_cfg = LoggingConfig(repo_root=self._project_root)
+            max_bytes = log_cfg.orchestrator_output_max_bytes
+            backups = log_cfg.orchestrator_output_backups
+            tail_bytes = log_cfg.orchestrator_output_tail_bytes
+        except Exception:
+            pass
+
+        sink: RotatingLogSink | None = None
+        if sink_path is not None:
+            try:
+                sink = RotatingLogSink(sink_path, max_bytes=max_bytes, backups=backups)
+            except Exception:
+                # Keep draining the PTY even when the log cannot be opened.
+                sink = None
+        tail = OutputTail(tail_bytes) if tail_bytes > 0 else None
+
+        self.output_tail = tail
+        # The pump registers the tail under (session id, pid) and drops it at EOF.
+        self.pty_pump = PtyPump(master_fd, sink=sink, tail=tail, tail_key=tail_key).start()
+        return self.pty_pump
+
     def _apply_shims_to_env(self, env: dict[str, str]) -> dict[str, str]:
         """Apply configured shims to the orchestrator subprocess env (fail-open)."""
         try:
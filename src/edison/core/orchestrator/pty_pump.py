@@ -0,0 +1,306 @@
+"""PTY output pump for launched orchestrators.
+
+When an orchestrator runs under a PTY, its output has to be copied from the
+PTY master into the session log. `PtyPump` does this from a single thread
+driven by a `selectors` loop:
+
+- the master fd is non-blocking and drained in large reads per wake-up
+- log writes go through a large userspace buffer that is flushed when the
+  producer goes idle (so `tail -f` stays live) rather than after every read
+- `RotatingLogSink` rotates the log by size (`orchestrator.log.1`, `.2`, ...)
+- an optional `OutputTail` ring buffer keeps the most recent output in memory
+
+A pump given a `tail_key` (session id, orchestrator pid) registers its tail
+while it runs, so in-process callers can show recent output without touching
+the log, and unregisters it when the PTY closes. Everyone else falls back to
+`read_log_tail`, which seeks to the end of the file instead of reading it (and
+continues into `<log>.1` when the current file was just rotated).
+"""
+from __future__ import annotations
+
+import errno
+import os
+import selectors
+import threading
+from collections import deque
+from pathlib import Path
+from typing import BinaryIO, Deque, Dict, Optional, Tuple
+
+from edison.core.utils.profiling import count
+
+_READ_SIZE = 1 << 16
+_DEFAULT_BUFFER_BYTES = 1 << 20
+_IDLE_FLUSH_SECONDS = 0.25
+
+TailKey = Tuple[str, int]
+
+
+class OutputTail:
+    """Thread-safe ring buffer holding the last `max_bytes` of output."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max(1, int(max_bytes))
+        self._chunks: Deque[bytes] = deque()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def append(self, data: bytes) -> None:
+        if not data:
+            return
+        with self._lock:
+            if len(data) >= self.max_bytes:
+                self._chunks.clear()
+                self._chunks.append(data[-self.max_bytes:])
+                self._size = self.max_bytes
+                return
+            self._chunks.append(data)
+            self._size += len(data)
+            while self._size - len(self._chunks[0]) >= self.max_bytes:
+                self._size -= len(self._chunks.popleft())
+
+    def getvalue(self) -> bytes:
+        with self._lock:
+            return b"".join(self._chunks)[-self.max_bytes:]
+
+    def text(self, lines: Optional[int] = None) -> str:
+        """Return the buffered output as text (optionally only the last `lines`)."""
+        return _last_lines(self.getvalue().decode("utf-8", errors="replace"), lines)
+
+
+class RotatingLogSink:
+    """Buffered binary log writer with size-based rotation.
+
+    `max_bytes <= 0` disables rotation. On rotation `path` becomes `path.1`,
+    older backups shift up, and anything beyond `backups` is deleted.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int = 0,
+        backups: int = 3,
+        buffer_bytes: int = _DEFAULT_BUFFER_BYTES,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = int(max_bytes)
+        self.backups = max(0, int(backups))
+        self.buffer_bytes = max(_READ_SIZE, int(buffer_bytes))
+        self._fh: Optional[BinaryIO] = None
+        self._size = 0
+        self._open()
+
+    def _open(self) -> None:
+        self._fh = open(self.path, "ab", buffering=self.buffer_bytes)
+        self._size = self._fh.tell()
+
+    def _rotate(self) -> None:
+        assert self._fh is not None
+        self._fh.close()
+        if self.backups:
+            for n in range(self.backups - 1, 0, -1):
+                src = self.path.with_name(f"{self.path.name}.{n}")
+                if src.exists():
+                    os.replace(src, self.path.with_name(f"{self.path.name}.{n + 1}"))
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink(missing_ok=True)
+        count("orchestrator.pty.rotate")
+        self._open()
+
+    def write(self, data: bytes) -> None:
+        if self._fh is None:
+            return
+        view = memoryview(data)
+        while view:
+            if self.max_bytes > 0 and self._size >= self.max_bytes:
+                self._rotate()
+            room = len(view) if self.max_bytes <= 0 else max(1, self.max_bytes - self._size)
+            part = view[:room]
+            self._fh.write(part)
+            self._size += len(part)
+            view = view[len(part):]
+
+    def flush(self) -> None:
+        if self._fh is not None:
+            self._fh.flush()
+
+    def close(self) -> None:
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            finally:
+                self._fh = None
+
+
+class PtyPump:
+    """Copy a PTY master's output into a log sink and/or tail buffer."""
+
+    def __init__(
+        self,
+        master_fd: int,
+        *,
+        sink: Optional[RotatingLogSink] = None,
+        tail: Optional[OutputTail] = None,
+        tail_key: Optional[TailKey] = None,
+        idle_flush_seconds: float = _IDLE_FLUSH_SECONDS,
+    ) -> None:
+        self.master_fd = master_fd
+        self.sink = sink
+        self.tail = tail
+        self.tail_key = tail_key
+        self.idle_flush_seconds = float(idle_flush_seconds)
+        self.bytes_read = 0
+        self.reads = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "PtyPump":
+        if self.tail is not None and self.tail_key is not None:
+            register_output_tail(self.tail_key, self.tail)
+        self._thread = threading.Thread(target=self._run, name="edison-orchestrator-pty-pump", daemon=True)
+        self._thread.start()
+        return self
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _drain(self) -> bool:
+        """Read everything currently available; return False on EOF."""
+        while True:
+            try:
+                data = os.read(self.master_fd, _READ_SIZE)
+            except BlockingIOError:
+                return True
+            except OSError as e:
+                # Linux reports EIO on the master once the child side is closed.
+                if e.errno not in (errno.EIO, errno.EBADF):
+                    count("orchestrator.pty.read_error")
+                return False
+            if not data:
+                return False
+            self.reads += 1
+            self.bytes_read += len(data)
+            if self.sink is not None:
+                try:
+                    self.sink.write(data)
+                except Exception:
+                    pass
+            if self.tail is not None:
+                self.tail.append(data)
+
+    def _run(self) -> None:
+        selector = selectors.DefaultSelector()
+        try:
+            os.set_blocking(self.master_fd, False)
+            selector.register(self.master_fd, selectors.EVENT_READ)
+            dirty = False
+            while True:
+                events = selector.select(timeout=self.idle_flush_seconds if dirty else None)
+                if not events:
+                    # Producer went quiet: make buffered output visible.
+                    self._flush()
+                    dirty = False
+                    continue
+                if not self._drain():
+                    break
+                dirty = True
+        except Exception:
+            count("orchestrator.pty.pump_error")
+        finally:
+            selector.close()
+            self._flush()
+            if self.tail is not None and self.tail_key is not None:
+                unregister_output_tail(self.tail_key, self.tail)
+            if self.sink is not None:
+                self.sink.close()
+            try:
+                os.close(self.master_fd)
+            except OSError:
+                pass
+
+    def _flush(self) -> None:
+        if self.sink is not None:
+            try:
+                self.sink.flush()
+            except Exception:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Tail lookup
+# ---------------------------------------------------------------------------
+
+_TAILS: Dict[TailKey, OutputTail] = {}
+_TAILS_LOCK = threading.Lock()
+
+
+def register_output_tail(key: TailKey, tail: OutputTail) -> None:
+    session_id, pid = key
+    with _TAILS_LOCK:
+        _TAILS[(str(session_id), int(pid))] = tail
+
+
+def unregister_output_tail(key: TailKey, tail: Optional[OutputTail] = None) -> None:
+    """Drop the tail registered for `key` (only if it is still `tail`, when given)."""
+    session_id, pid = key
+    k = (str(session_id), int(pid))
+    with _TAILS_LOCK:
+        if tail is None or _TAILS.get(k) is tail:
+            _TAILS.pop(k, None)
+
+
+def get_output_tail(session_id: str, pid: Optional[int] = None) -> Optional[OutputTail]:
+    """Return the live in-memory tail for a session's orchestrator in this process.
+
+    Without `pid` the most recently started orchestrator of the session wins.
+    """
+    with _TAILS_LOCK:
+        if pid is not None:
+            return _TAILS.get((str(session_id), int(pid)))
+        matches = [t for (sid, _pid), t in _TAILS.items() if sid == str(session_id)]
+    return matches[-1] if matches else None
+
+
+def _last_lines(text: str, lines: Optional[int]) -> str:
+    if lines is None:
+        return text
+    if lines <= 0:
+        return ""
+    return "\n".join(text.splitlines()[-lines:])
+
+
+def _read_end(path: Path, max_bytes: int) -> bytes:
+    try:
+        with open(path, "rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            size = fh.tell()
+            fh.seek(max(0, size - max_bytes))
+            return fh.read()
+    except OSError:
+        return b""
+
+
+def read_log_tail(path: Path, *, max_bytes: int = 64 * 1024, lines: Optional[int] = None) -> str:
+    """Return the end of a log file, reading at most `max_bytes` from its tail.
+
+    When the current file holds fewer than `lines` lines (it was just rotated),
+    the end of the newest backup `<path>.1` is prepended.
+    """
+    path = Path(path)
+    max_bytes = int(max_bytes)
+    data = _read_end(path, max_bytes)
+    if lines is not None and data.count(b"\n") < lines and len(data) < max_bytes:
+        data = _read_end(path.with_name(f"{path.name}.1"), max_bytes - len(data)) + data
+    return _last_lines(data.decode("utf-8", errors="replace"), lines)
+
+
+__all__ = [
+    "OutputTail",
+    "PtyPump",
+    "RotatingLogSink",
+    "get_output_tail",
+    "read_log_tail",
+    "register_output_tail",
+    "unregister_output_tail",
+]
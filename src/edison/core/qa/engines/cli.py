@@ -19,6 +19,7 @@ import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
+from edison.core.utils.stream_capture import StreamCapture, StreamCaptureOptions
 from edison.core.utils.subprocess import run_ci_command_from_string
 
 from .base import EngineConfig, ValidationResult
@@ -76,6 +77,9 @@ class CLIEngine:
         """
         self.config = config
         self.project_root = project_root
+        # can_execute_details() memo keyed by PATH; engines are created once per
+        # registry, so availability is probed once per engine per invocation.
+        self._availability: tuple[str | None, tuple[bool, CanExecuteReason, str]] | None = None
 
         # Ensure parsers are loaded
         ensure_parsers_loaded(project_root)
@@ -96,9 +100,19 @@ class CLIEngine:
         This is intended for operator-facing UX (avoid misleading "CLI missing"
         when execution is disabled by config).
 
+        The result is memoized on the engine until PATH changes.
+
         Returns:
             (can_execute, reason, detail)
         """
+        path_env = os.environ.get("PATH")
+        if self._availability is not None and self._availability[0] == path_env:
+            return self._availability[1]
+        details = self._probe_availability()
+        self._availability = (path_env, details)
+        return details
+
+    def _probe_availability(self) -> tuple[bool, CanExecuteReason, str]:
         # Config-driven safety: external CLI validators are disabled unless explicitly enabled.
         try:
             from edison.core.config.domains.qa import QAConfig
@@ -256,6 +270,7 @@ class CLIEngine:
         )
         logger.debug(f"Full command: {' '.join(cmd_parts[:5])}...")
 
+        scratch: Path | None = None
         try:
             # Determine cwd: use project_root when run_from_project_root is set.
             # This allows the sandbox to include all worktrees (main + _meta).
@@ -265,7 +280,11 @@ class CLIEngine:
             else:
                 exec_cwd = worktree_path
 
-            # Execute subprocess
+            # Execute subprocess. Output is teed to scratch files and kept in
+            # memory only as bounded head/tail excerpts.
+            scratch = Path(tempfile.mkdtemp(prefix="edison-validator-"))
+            stdout_path = scratch / "stdout"
+            stderr_path = scratch / "stderr"
             result = run_ci_command_from_string(
                 cmd_parts[0],
                 extra_args=cmd_parts[1:],
@@ -276,12 +295,14 @@ class CLIEngine:
                 text=True,
                 check=False,
                 input=prompt_input,
+                stream_capture=StreamCaptureOptions(stdout_path=stdout_path, stderr_path=stderr_path),
             )
 
             duration = time.time() - start_time
             stdout = result.stdout or ""
             stderr = result.stderr or ""
             exit_code = result.returncode
+            stdout_capture = getattr(result, "stdout_capture", None)
 
             logger.info(
                 f"CLI validator '{validator.id}' completed: "
@@ -291,6 +312,8 @@ class CLIEngine:
         except Exception as e:
             duration = time.time() - start_time
             logger.error(f"CLI validator '{validator.id}' failed: {e}", exc_info=True)
+            if scratch is not None:
+                shutil.rmtree(scratch, ignore_errors=True)
 
             return ValidationResult(
                 validator_id=validator.id,
@@ -302,19 +325,28 @@ class CLIEngine:
                 error=str(e),
             )
 
-        # Parse output
-        parsed = self._parse_output(stdout)
-
-        # Save evidence if service provided
-        if evidence_service:
-            self._save_evidence(
-                evidence_service=evidence_service,
-                validator_id=validator.id,
-                stdout=stdout,
-                stderr=stderr,
-                exit_code=exit_code,
-                round_num=round_num,
-            )
+        try:
+            # Parsers need the whole response; only re-read it when it was truncated.
+            full_stdout = stdout
+            if isinstance(stdout_capture, StreamCapture) and stdout_capture.truncated:
+                full_stdout = stdout_path.read_text(encoding="utf-8", errors="replace")
+            parsed = self._parse_output(full_stdout)
+            del full_stdout
+
+            # Save evidence if service provided
+            if evidence_service:
+                self._save_evidence(
+                    evidence_service=evidence_service,
+                    validator_id=validator.id,
+                    stdout=stdout,
+                    stderr=stderr,
+                    exit_code=exit_code,
+                    round_num=round_num,
+                    stdout_path=stdout_path,
+                    stderr_path=stderr_path,
+                )
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
 
         # Build result
         return self._to_validation_result(
@@ -628,6 +660,8 @@ class CLIEngine:
         stderr: str,
         exit_code: int,
         round_num: int | None,
+        stdout_path: Path | None = None,
+        stderr_path: Path | None = None,
     ) -> Path:
         """Save command output to evidence directory.
 
@@ -638,6 +672,8 @@ class CLIEngine:
             stderr: Command stderr
             exit_code: Process exit code
             round_num: Validation round number
+            stdout_path: Full stdout on disk (streamed instead of `stdout`)
+            stderr_path: Full stderr on disk (streamed instead of `stderr`)
 
         Returns:
             Path where evidence was saved
@@ -646,24 +682,32 @@ class CLIEngine:
         evidence_filename = f"command-{validator_id}.txt"
         evidence_path = round_dir / evidence_filename
 
-        content_lines = [
-            f"=== CLI Validator: {validator_id} ===",
-            f"Engine: {self.config.id}",
-            f"Command: {self.command}",
-            f"Exit Code: {exit_code}",
-            "",
-            "=== STDOUT ===",
-            stdout,
-            "",
-            "=== STDERR ===",
-            stderr,
-            "",
-        ]
+        header = "\n".join(
+            [
+                f"=== CLI Validator: {validator_id} ===",
+                f"Engine: {self.config.id}",
+                f"Command: {self.command}",
+                f"Exit Code: {exit_code}",
+                "",
+                "=== STDOUT ===",
+                "",
+            ]
+        )
 
-        content = "\n".join(content_lines)
+        def _copy(out: Any, text: str, source: Path | None) -> None:
+            if source is not None and source.is_file():
+                with source.open("r", encoding="utf-8", errors="replace", newline="") as fh:
+                    shutil.copyfileobj(fh, out)
+            else:
+                out.write(text)
 
         try:
-            evidence_path.write_text(content, encoding="utf-8")
+            with evidence_path.open("w", encoding="utf-8") as out:
+                out.write(header)
+                _copy(out, stdout, stdout_path)
+                out.write("\n\n=== STDERR ===\n")
+                _copy(out, stderr, stderr_path)
+                out.write("\n")
             logger.debug(f"Saved evidence to {evidence_path}")
         except Exception as e:
             logger.error(f"Failed to save evidence: {e}")
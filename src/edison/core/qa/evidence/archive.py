@@ -0,0 +1,235 @@
+"""Packed archive for old evidence rounds.
+
+Completed tasks accumulate many `round-N/` directories full of small report and
+command-output files, and every directory walk over the evidence tree pays for
+all of them. Rounds that will not change any more can be packed into a single
+per-task archive:
+
+    <evidence_root>/rounds.zip      members: round-N/<relative path>
+
+A zip is used because its central directory is an offset index: members are
+read directly without scanning the archive. The parsed index is cached per
+process and revalidated by the archive's stat signature (the archive is only
+ever replaced atomically, so a new inode means a new index). Packing appends
+to the archive; only unpacking, which drops a round, rewrites the remaining
+members.
+
+`EvidenceService` reads archived rounds transparently and unpacks a round on
+demand when a caller needs real paths (listing reports) or writes into it.
+Unpacking restores each member's recorded mtime (zip timestamps round down to
+two seconds), so mtime-based freshness checks never see an unpacked report as
+newer than it was.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from edison.core.utils.io.locking import acquire_file_lock
+from edison.core.utils.profiling import count
+
+from .exceptions import EvidenceError
+from .rounds import get_round_number
+
+ARCHIVE_FILENAME = "rounds.zip"
+
+_Signature = Tuple[int, int, int]
+_Index = Dict[int, Dict[str, zipfile.ZipInfo]]
+
+_INDEX_CACHE: Dict[Path, Tuple[_Signature, _Index]] = {}
+_INDEX_LOCK = threading.Lock()
+
+
+def _round_prefix(round_num: int) -> str:
+    return f"round-{round_num}/"
+
+
+def _build_index(zf: zipfile.ZipFile) -> _Index:
+    index: _Index = {}
+    for info in zf.infolist():
+        head, _, rel = info.filename.partition("/")
+        try:
+            num = get_round_number(Path(head))
+        except EvidenceError:
+            continue
+        members = index.setdefault(num, {})
+        if rel and not info.is_dir():
+            members[rel] = info
+    return index
+
+
+def clear_archive_index_cache() -> None:
+    """Drop cached archive indexes (tests)."""
+    with _INDEX_LOCK:
+        _INDEX_CACHE.clear()
+
+
+class RoundArchive:
+    """Per-task archive of packed evidence rounds."""
+
+    def __init__(self, evidence_root: Path, *, project_root: Optional[Path] = None) -> None:
+        self.evidence_root = Path(evidence_root)
+        self.path = self.evidence_root / ARCHIVE_FILENAME
+        self.project_root = project_root
+
+    # ---------- Index ----------
+
+    def _index(self) -> _Index:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return {}
+        sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+        with _INDEX_LOCK:
+            cached = _INDEX_CACHE.get(self.path)
+            if cached is not None and cached[0] == sig:
+                count("qa.evidence.archive.index.hit")
+                return cached[1]
+        count("qa.evidence.archive.index.miss")
+        try:
+            with zipfile.ZipFile(self.path) as zf:
+                index = _build_index(zf)
+        except (OSError, zipfile.BadZipFile) as e:
+            raise EvidenceError(f"Unreadable evidence archive {self.path}: {e}") from e
+        with _INDEX_LOCK:
+            _INDEX_CACHE[self.path] = (sig, index)
+        return index
+
+    def rounds(self) -> List[int]:
+        """Return archived round numbers, ascending."""
+        return sorted(self._index())
+
+    def has_round(self, round_num: int) -> bool:
+        return round_num in self._index()
+
+    def members(self, round_num: int) -> List[str]:
+        """Return the relative file names stored for an archived round."""
+        return sorted(self._index().get(round_num, {}))
+
+    def read_text(self, round_num: int, name: str) -> Optional[str]:
+        """Return a member's text, or None when the round/file is not archived."""
+        info = self._index().get(round_num, {}).get(name)
+        if info is None:
+            return None
+        count("qa.evidence.archive.read")
+        with zipfile.ZipFile(self.path) as zf:
+            return zf.read(info).decode("utf-8")
+
+    # ---------- Pack / unpack ----------
+
+    def _lock(self):
+        return acquire_file_lock(self.path, repo_root=self.project_root)
+
+    def _add_rounds(self, out: zipfile.ZipFile, round_dirs: Iterable[Path]) -> None:
+        for round_dir in round_dirs:
+            prefix = _round_prefix(get_round_number(round_dir))
+            out.writestr(prefix, b"")  # keeps empty rounds visible
+            for f in sorted(round_dir.rglob("*")):
+                if f.is_file():
+                    out.write(f, prefix + f.relative_to(round_dir).as_posix())
+
+    def _append(self, round_dirs: Iterable[Path]) -> None:
+        """Append rounds to a copy of the archive and swap it in.
+
+        Existing members are never recompressed: the archive is byte-copied and
+        the new members are appended (zipfile mode "a"). Appending to the live
+        file would leave it without a central directory if interrupted.
+        """
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        try:
+            mode = "w"
+            if self.path.exists():
+                shutil.copyfile(self.path, tmp)
+                mode = "a"
+            with zipfile.ZipFile(tmp, mode, compression=zipfile.ZIP_DEFLATED) as out:
+                self._add_rounds(out, round_dirs)
+            os.replace(tmp, self.path)
+        except Exception:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def _rewrite(self, drop: Iterable[int]) -> None:
+        """Write a new archive without the `drop` rounds and swap it in.
+
+        Zip members cannot be removed in place, so dropping rounds is the one
+        operation that copies the remaining members into a new archive.
+        """
+        dropped = {_round_prefix(n) for n in drop}
+        tmp = self.path.with_name(f".{self.path.name}.tmp")
+        kept = 0
+        count("qa.evidence.archive.rewrite")
+        try:
+            with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as out:
+                with zipfile.ZipFile(self.path) as src:
+                    for info in src.infolist():
+                        if info.filename.split("/", 1)[0] + "/" in dropped:
+                            continue
+                        out.writestr(info, src.read(info))
+                        kept += 1
+            if kept:
+                os.replace(tmp, self.path)
+            else:
+                tmp.unlink()
+                self.path.unlink(missing_ok=True)
+        except Exception:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def pack(self, round_dirs: Iterable[Path]) -> List[int]:
+        """Move round directories into the archive; return the packed round numbers.
+
+        The archive is replaced atomically before any directory is removed, so a
+        crash leaves the round readable from at least one place (disk wins).
+        """
+        dirs = [Path(d) for d in round_dirs if Path(d).is_dir()]
+        if not dirs:
+            return []
+        with self._lock():
+            archived = set(self._index())
+            nums = [get_round_number(d) for d in dirs]
+            clash = sorted(set(nums) & archived)
+            if clash:
+                raise EvidenceError(
+                    f"Rounds already archived in {self.path}: {', '.join(map(str, clash))}"
+                )
+            self._append(dirs)
+            for d in dirs:
+                # Rename first so readers never observe a half-deleted round.
+                doomed = d.with_name(f".{d.name}.packed")
+                d.rename(doomed)
+                shutil.rmtree(doomed, ignore_errors=True)
+        return sorted(nums)
+
+    def unpack(self, round_num: int) -> Path:
+        """Restore an archived round to `round-N/` and drop it from the archive."""
+        round_dir = self.evidence_root / f"round-{round_num}"
+        with self._lock():
+            members = self._index().get(round_num)
+            if members is None:
+                if round_dir.is_dir():
+                    return round_dir
+                raise EvidenceError(f"Round {round_num} is not archived in {self.path}")
+            if round_dir.exists():
+                raise EvidenceError(f"Cannot unpack round {round_num}: {round_dir} already exists")
+            staging = round_dir.with_name(f".{round_dir.name}.unpacking")
+            shutil.rmtree(staging, ignore_errors=True)
+            staging.mkdir(parents=True)
+            with zipfile.ZipFile(self.path) as zf:
+                for rel, info in members.items():
+                    target = staging / rel
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    target.write_bytes(zf.read(info))
+                    mtime = time.mktime((*info.date_time, 0, 0, -1))
+                    os.utime(target, (mtime, mtime))
+            staging.rename(round_dir)
+            self._rewrite([round_num])
+        count("qa.evidence.archive.unpack")
+        return round_dir
+
+
+__all__ = ["ARCHIVE_FILENAME", "RoundArchive", "clear_archive_index_cache"]
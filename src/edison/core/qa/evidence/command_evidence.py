@@ -3,6 +3,10 @@
 Edison uses command evidence files as *proof* that automation was run and passed.
 The evidence format is intentionally machine-parseable so guards can fail-closed
 on real command outcomes (exit code), not merely “file exists”.
+
+Large outputs can be moved into the content-addressed `CommandOutputStore`;
+the evidence file then references the blob from its frontmatter and readers
+expand it transparently. The HMAC always covers the expanded output.
 """
 
 from __future__ import annotations
@@ -11,13 +15,17 @@ import hashlib
 import hmac
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import yaml
 
 from edison.core.utils.text.frontmatter import format_frontmatter, parse_frontmatter
 
+from .exceptions import EvidenceError
+from .output_store import BlobRef, CommandOutputStore
+
 
 @dataclass(frozen=True, slots=True)
 class CommandEvidenceV1:
@@ -59,24 +67,63 @@ def _utc_iso_now() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-def _canonicalize_for_hmac(text: str) -> bytes:
-    """Return canonical bytes for HMAC validation.
+def _canonical_chunks(frontmatter: dict[str, Any], body: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield canonical bytes for HMAC validation.
 
     Canonicalization rule: remove `hmacSha256` from YAML frontmatter if present,
-    then re-serialize frontmatter and append the remaining body unchanged.
+    then re-serialize frontmatter and append the body unchanged, with trailing
+    newlines collapsed to exactly one. Trailing newlines are held back per chunk
+    so the body can be streamed.
     """
-    doc = parse_frontmatter(text or "")
-    fm = dict(doc.frontmatter or {})
+    fm = dict(frontmatter or {})
     fm.pop("hmacSha256", None)
     fm_block = format_frontmatter(fm, exclude_none=True) if fm else ""
-    body = doc.content or ""
-    payload = (fm_block + body).rstrip("\n") + "\n"
-    return payload.encode("utf-8")
+    pending = b""
+    for chunk in chain((fm_block.encode("utf-8"),), body):
+        stripped = chunk.rstrip(b"\n")
+        if stripped:
+            yield pending + stripped
+            pending = chunk[len(stripped):]
+        else:
+            pending += chunk
+    yield b"\n"
+
+
+def compute_hmac_sha256_stream(key: str, frontmatter: dict[str, Any], body: Iterable[bytes]) -> str:
+    """HMAC over frontmatter plus a body streamed in chunks (same digest as the whole text)."""
+    mac = hmac.new(key.encode("utf-8"), digestmod=hashlib.sha256)
+    for chunk in _canonical_chunks(frontmatter, body):
+        mac.update(chunk)
+    return mac.hexdigest()
 
 
 def compute_hmac_sha256(key: str, text: str) -> str:
-    payload = _canonicalize_for_hmac(text)
-    return hmac.new(key.encode("utf-8"), payload, hashlib.sha256).hexdigest()
+    doc = parse_frontmatter(text or "")
+    return compute_hmac_sha256_stream(key, doc.frontmatter or {}, [(doc.content or "").encode("utf-8")])
+
+
+def _output_chunks(path: Path, fm: dict[str, Any], content: str) -> Iterator[bytes]:
+    """Yield the evidence body, expanding a referenced output blob.
+
+    Raises:
+        EvidenceError: If the blob cannot be located or verified
+    """
+    yield content.encode("utf-8")
+    reference = fm.get("outputBlob")
+    if reference:
+        store = CommandOutputStore.for_evidence_file(path)
+        if store is None:
+            raise EvidenceError(f"No evidence output store found for {path}")
+        yield from store.iter_chunks(str(reference), str(fm.get("outputEncoding") or "none"))
+
+
+def _file_chunks(path: Path, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
 
 
 def parse_exit_code(text: str) -> int | None:
@@ -113,9 +160,14 @@ def parse_exit_code(text: str) -> int | None:
     return None
 
 
-def parse_command_evidence(path: Path) -> dict[str, Any] | None:
+def parse_command_evidence(path: Path, *, include_output: bool = True) -> dict[str, Any] | None:
     """Parse a command evidence file (v1) into a dict.
 
+    With `include_output=False` only the frontmatter is returned (no `output`
+    key): a referenced output blob is checked for presence but not decompressed
+    or hash-verified. Status checks that only read `exitCode` or the git
+    fingerprint use this; `evidence show` and HMAC verification expand in full.
+
     Returns None when the file cannot be parsed as v1 command evidence.
     """
     try:
@@ -134,9 +186,22 @@ def parse_command_evidence(path: Path) -> dict[str, Any] | None:
     if fm.get("evidenceKind") != "command":
         return None
 
+    if not include_output:
+        reference = fm.get("outputBlob")
+        if reference:
+            store = CommandOutputStore.for_evidence_file(path)
+            if store is None or not store.has(str(reference), str(fm.get("outputEncoding") or "none")):
+                return None
+        return dict(fm)
+
+    try:
+        output = b"".join(_output_chunks(path, fm, doc.content or "")).decode("utf-8")
+    except (EvidenceError, UnicodeDecodeError):
+        return None
+
     return {
         **fm,
-        "output": doc.content or "",
+        "output": output,
     }
 
 
@@ -157,8 +222,18 @@ def write_command_evidence(
     runner: str = "edison evidence capture",
     hmac_key: str | None = None,
     fingerprint: dict[str, Any] | None = None,
-) -> None:
-    """Write command evidence v1 with optional HMAC."""
+    output_store: CommandOutputStore | None = None,
+    output_path: Path | None = None,
+) -> BlobRef | None:
+    """Write command evidence v1 with optional HMAC.
+
+    When `output_store` is given and the output is large enough, the output is
+    stored as a blob and referenced from the frontmatter. Returns that blob
+    reference, or None when the output was written inline.
+
+    `output_path` (UTF-8 text on disk) replaces `output`; a large file is
+    streamed into the store without being loaded into memory.
+    """
     started_s: str
     completed_s: str
     if isinstance(started_at, datetime):
@@ -191,15 +266,40 @@ def write_command_evidence(
     fm["gitDirty"] = bool(fp.get("gitDirty", False))
     fm["diffHash"] = str(fp.get("diffHash") or "")
     fm.pop("hmacSha256", None)
-    content = format_frontmatter(fm, exclude_none=True) + (output or "")
 
+    ref: BlobRef | None = None
+    data = b""
+    streamed = (
+        output_path is not None
+        and output_store is not None
+        and Path(output_path).stat().st_size >= output_store.min_bytes
+    )
+    if streamed:
+        ref = output_store.put_file(Path(output_path))  # type: ignore[union-attr, arg-type]
+        body = ""
+    else:
+        if output_path is not None:
+            output = Path(output_path).read_text(encoding="utf-8", errors="replace")
+        body = output or ""
+        data = body.encode("utf-8")
+        if output_store is not None and output_store.wants(data):
+            ref = output_store.put(data)
+            body = ""
+    if ref is not None:
+        fm.update(ref.frontmatter())
+
+    content = format_frontmatter(fm, exclude_none=True) + body
     if hmac_key:
-        digest = compute_hmac_sha256(hmac_key, content)
-        fm["hmacSha256"] = digest
-        content = format_frontmatter(fm, exclude_none=True) + (output or "")
+        if ref is not None:
+            chunks = _file_chunks(Path(output_path)) if streamed else [data]  # type: ignore[arg-type]
+            fm["hmacSha256"] = compute_hmac_sha256_stream(hmac_key, fm, chunks)
+        else:
+            fm["hmacSha256"] = compute_hmac_sha256(hmac_key, content)
+        content = format_frontmatter(fm, exclude_none=True) + body
 
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(content, encoding="utf-8")
+    return ref
 
 
 def verify_command_evidence_hmac(path: Path, *, hmac_key: str) -> tuple[bool, str]:
@@ -219,7 +319,10 @@ def verify_command_evidence_hmac(path: Path, *, hmac_key: str) -> tuple[bool, st
     if not isinstance(expected, str) or not expected.strip():
         return False, f"HMAC validation failed: missing hmacSha256 in {path}"
 
-    actual = compute_hmac_sha256(hmac_key, text)
+    try:
+        actual = compute_hmac_sha256_stream(hmac_key, fm, _output_chunks(path, fm, doc.content or ""))
+    except EvidenceError as e:
+        return False, f"HMAC validation failed: {e}"
     if not hmac.compare_digest(expected.strip(), actual):
         return False, f"HMAC validation failed: signature mismatch for {path}"
 
@@ -229,6 +332,7 @@ def verify_command_evidence_hmac(path: Path, *, hmac_key: str) -> tuple[bool, st
 __all__ = [
     "CommandEvidenceV1",
     "compute_hmac_sha256",
+    "compute_hmac_sha256_stream",
     "parse_command_evidence",
     "parse_exit_code",
     "write_command_evidence",
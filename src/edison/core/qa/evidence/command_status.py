@@ -78,7 +78,7 @@ def get_command_evidence_status(
             continue
 
         present.append(name)
-        parsed = parse_command_evidence(file_path)
+        parsed = parse_command_evidence(file_path, include_output=False)
         if parsed is None:
             invalid.append({"file": name, "reason": "unparseable"})
             continue
@@ -0,0 +1,291 @@
+"""Content-addressed blob store for command evidence output.
+
+CI command output (test/build logs, review tool output) is usually the bulk of
+an evidence file, and identical output is captured again for every snapshot,
+round and task. Large outputs are therefore stored once, keyed by the SHA-256
+of the raw bytes, and the evidence file keeps only a reference in its
+frontmatter:
+
+    outputBlob: sha256:<hex>
+    outputEncoding: gzip | zstd | none
+    outputBytes: <raw size>
+
+Blobs live next to the snapshot store (`<qa-root>/evidence-blobs/ab/<hex>.gz`)
+and are written atomically, so a reference never points at a partial blob.
+gzip is the default; zstd needs the `zstd` extra (`pip install edison[zstd]`).
+The savings counters are machine-local and live under the management `cache/`
+directory, outside the git-tracked evidence tree.
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import tempfile
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, ContextManager, Dict, Iterator, Optional
+
+from edison.core.utils.io import read_json, write_json_atomic
+from edison.core.utils.io.locking import acquire_file_lock
+from edison.core.utils.paths.management import get_management_paths
+from edison.core.utils.profiling import count
+
+from .exceptions import EvidenceError
+
+try:
+    import zstandard
+
+    HAS_ZSTD = True
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+    HAS_ZSTD = False
+
+BLOB_DIRNAME = "evidence-blobs"
+BLOB_PREFIX = "sha256:"
+_STATS_FILENAME = "evidence-output-stats.json"
+_SUFFIXES = {"zstd": ".zst", "gzip": ".gz", "none": ".txt"}
+_CHUNK_SIZE = 1 << 16
+
+
+def resolve_compression(name: Optional[str]) -> str:
+    """Normalize a configured compression name.
+
+    Raises:
+        EvidenceError: For unknown names, or zstd without the `zstd` extra
+    """
+    value = str(name or "none").strip().lower()
+    if value in {"zst", "zstd"}:
+        if not HAS_ZSTD:
+            raise EvidenceError(
+                "Evidence output compression 'zstd' requires the zstd extra: pip install 'edison[zstd]'"
+            )
+        return "zstd"
+    if value in {"gz", "gzip"}:
+        return "gzip"
+    if value in {"none", "off", "false", ""}:
+        return "none"
+    raise EvidenceError(f"Unsupported evidence output compression: {name}")
+
+
+@dataclass(frozen=True, slots=True)
+class BlobRef:
+    """A stored command output and what writing it cost."""
+
+    digest: str
+    encoding: str
+    size: int
+    stored_size: int
+    deduplicated: bool
+
+    def frontmatter(self) -> Dict[str, Any]:
+        return {
+            "outputBlob": f"{BLOB_PREFIX}{self.digest}",
+            "outputEncoding": self.encoding,
+            "outputBytes": self.size,
+        }
+
+
+class CommandOutputStore:
+    """Content-addressed, optionally compressed storage for command output."""
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        compression: str = "gzip",
+        min_bytes: int = 0,
+        stats_path: Optional[Path] = None,
+    ) -> None:
+        self.root = Path(root)
+        self.compression = resolve_compression(compression)
+        self.min_bytes = max(0, int(min_bytes))
+        self.stats_path = Path(stats_path) if stats_path is not None else None
+
+    @classmethod
+    def for_project(cls, project_root: Path, **kwargs: Any) -> "CommandOutputStore":
+        paths = get_management_paths(project_root)
+        kwargs.setdefault("stats_path", paths.get_management_root() / "cache" / _STATS_FILENAME)
+        return cls(paths.get_qa_root() / BLOB_DIRNAME, **kwargs)
+
+    @classmethod
+    def for_evidence_file(cls, path: Path) -> Optional["CommandOutputStore"]:
+        """Locate the store serving an evidence file (nearest ancestor holding one)."""
+        for parent in Path(path).parents:
+            candidate = parent / BLOB_DIRNAME
+            if candidate.is_dir():
+                return cls(candidate)
+        return None
+
+    def wants(self, data: bytes) -> bool:
+        """True when `data` is large enough to be moved out of the evidence file."""
+        return len(data) >= self.min_bytes
+
+    def blob_path(self, digest: str, encoding: str) -> Path:
+        return self.root / digest[:2] / f"{digest}{_SUFFIXES[encoding]}"
+
+    # ---------- Write ----------
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=10).compress(data)  # type: ignore[union-attr]
+        if self.compression == "gzip":
+            return gzip.compress(data, compresslevel=6, mtime=0)
+        return data
+
+    def _writer(self, raw: BinaryIO) -> ContextManager[Any]:
+        """Wrap `raw` in a streaming compressor for the configured encoding."""
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=10).stream_writer(raw, closefd=False)  # type: ignore[union-attr]
+        if self.compression == "gzip":
+            return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, mtime=0)
+        return nullcontext(raw)
+
+    def put(self, data: bytes) -> BlobRef:
+        """Store `data` (no-op when the same content is already stored)."""
+        digest = hashlib.sha256(data).hexdigest()
+        return self._store(digest, len(data), lambda: iter((data,)))
+
+    def put_file(self, path: Path) -> BlobRef:
+        """Store the contents of `path`, streaming it in chunks (bounded memory)."""
+        hasher = hashlib.sha256()
+        size = 0
+        for chunk in _iter_file(path):
+            hasher.update(chunk)
+            size += len(chunk)
+        return self._store(hasher.hexdigest(), size, lambda: _iter_file(path))
+
+    def _store(self, digest: str, size: int, chunks: Callable[[], Iterator[bytes]]) -> BlobRef:
+        existing = self._existing(digest)
+        if existing is not None:
+            encoding, path = existing
+            ref = BlobRef(digest, encoding, size, path.stat().st_size, deduplicated=True)
+            count("qa.evidence.output_store.dedup")
+        else:
+            path = self.blob_path(digest, self.compression)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per writer: threads storing the same digest must not share one.
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+            tmp = Path(tmp_name)
+            try:
+                with os.fdopen(fd, "wb") as raw, self._writer(raw) as out:
+                    for chunk in chunks():
+                        out.write(chunk)
+                stored = tmp.stat().st_size
+                os.replace(tmp, path)
+            finally:
+                tmp.unlink(missing_ok=True)
+            ref = BlobRef(digest, self.compression, size, stored, deduplicated=False)
+            count("qa.evidence.output_store.write")
+        self._record(ref)
+        return ref
+
+    def _existing(self, digest: str) -> Optional[tuple[str, Path]]:
+        for encoding in _SUFFIXES:
+            path = self.blob_path(digest, encoding)
+            if path.is_file():
+                return encoding, path
+        return None
+
+    # ---------- Read ----------
+
+    def has(self, reference: str, encoding: str) -> bool:
+        """True when the referenced blob exists (a stat; the content is not verified)."""
+        try:
+            digest = parse_reference(reference)
+        except EvidenceError:
+            return False
+        return encoding in _SUFFIXES and self.blob_path(digest, encoding).is_file()
+
+    def _open(self, digest: str, encoding: str) -> BinaryIO:
+        path = self.blob_path(digest, encoding)
+        if encoding == "zstd":
+            if not HAS_ZSTD:
+                raise EvidenceError(f"Reading {path} requires the 'zstandard' package")
+            raw = path.open("rb")
+            return zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)  # type: ignore[union-attr]
+        if encoding == "gzip":
+            return gzip.open(path, "rb")  # type: ignore[return-value]
+        return path.open("rb")
+
+    def iter_chunks(self, reference: str, encoding: str) -> Iterator[bytes]:
+        """Stream a blob's raw bytes, verifying its digest at the end.
+
+        Raises:
+            EvidenceError: If the blob is missing, unreadable or does not match its hash
+        """
+        digest = parse_reference(reference)
+        if encoding not in _SUFFIXES:
+            raise EvidenceError(f"Unknown evidence output encoding: {encoding}")
+        hasher = hashlib.sha256()
+        try:
+            with self._open(digest, encoding) as fh:
+                while True:
+                    chunk = fh.read(_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    hasher.update(chunk)
+                    yield chunk
+        except (OSError, EOFError, ValueError) as e:
+            raise EvidenceError(f"Unreadable evidence output blob {digest}: {e}") from e
+        if hasher.hexdigest() != digest:
+            raise EvidenceError(f"Evidence output blob {digest} does not match its hash")
+
+    def read_text(self, reference: str, encoding: str) -> str:
+        return b"".join(self.iter_chunks(reference, encoding)).decode("utf-8")
+
+    # ---------- Savings report ----------
+
+    def _record(self, ref: BlobRef) -> None:
+        """Accumulate logical vs stored bytes (best-effort; needs `stats_path`)."""
+        stats_path = self.stats_path
+        if stats_path is None:
+            return
+        try:
+            stats_path.parent.mkdir(parents=True, exist_ok=True)
+            with acquire_file_lock(stats_path, timeout=5):
+                stats = read_json(stats_path, default={}) or {}
+                stats["outputs"] = int(stats.get("outputs", 0)) + 1
+                stats["logicalBytes"] = int(stats.get("logicalBytes", 0)) + ref.size
+                if not ref.deduplicated:
+                    stats["blobs"] = int(stats.get("blobs", 0)) + 1
+                    stats["storedBytes"] = int(stats.get("storedBytes", 0)) + ref.stored_size
+                write_json_atomic(stats_path, stats, acquire_lock=False)
+        except Exception:
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        """Return cumulative output/blob counts and the bytes saved on disk."""
+        raw = (read_json(self.stats_path, default={}) if self.stats_path is not None else None) or {}
+        stats = {k: int(raw.get(k, 0)) for k in ("outputs", "blobs", "logicalBytes", "storedBytes")}
+        stats["savedBytes"] = stats["logicalBytes"] - stats["storedBytes"]
+        return stats
+
+
+def _iter_file(path: Path) -> Iterator[bytes]:
+    with open(path, "rb") as fh:
+        while True:
+            chunk = fh.read(_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+
+def parse_reference(reference: str) -> str:
+    """Return the hex digest from an `outputBlob` value."""
+    value = str(reference or "").strip()
+    digest = value[len(BLOB_PREFIX):] if value.startswith(BLOB_PREFIX) else ""
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        raise EvidenceError(f"Invalid evidence output reference: {reference!r}")
+    return digest
+
+
+__all__ = [
+    "BLOB_DIRNAME",
+    "BlobRef",
+    "CommandOutputStore",
+    "HAS_ZSTD",
+    "parse_reference",
+    "resolve_compression",
+]
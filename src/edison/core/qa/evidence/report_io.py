@@ -14,7 +14,12 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from edison.core.utils.io import read_text, write_text
-from edison.core.utils.text import ParsedDocument, format_frontmatter, parse_frontmatter
+from edison.core.utils.text import (
+    ParsedDocument,
+    format_frontmatter,
+    parse_frontmatter,
+    read_frontmatter,
+)
 
 
 def _as_mapping(obj: Any) -> Dict[str, Any]:
@@ -34,9 +39,22 @@ def read_structured_report(path: Path) -> Dict[str, Any]:
             return {}
         if path.suffix.lower() not in {".md", ".markdown"}:
             return {}
-        content = read_text(path)
-        doc = parse_frontmatter(content)
-        return _as_mapping(doc.frontmatter) if doc.frontmatter else {}
+        frontmatter = read_frontmatter(path)
+        return _as_mapping(frontmatter) if frontmatter else {}
+    except Exception:
+        return {}
+
+
+def parse_structured_report(name: str, text: Optional[str]) -> Dict[str, Any]:
+    """Parse structured report content already in memory (e.g. from an archive).
+
+    Same contract as `read_structured_report`: `name` selects the format and an
+    empty dict is returned for missing, non-Markdown or invalid content.
+    """
+    try:
+        if text is None or Path(name).suffix.lower() not in {".md", ".markdown"}:
+            return {}
+        return _as_mapping(parse_frontmatter(text).frontmatter)
     except Exception:
         return {}
 
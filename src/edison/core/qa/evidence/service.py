@@ -7,6 +7,8 @@ Architecture:
 - EvidenceService is the ONLY entry point for evidence I/O
 - Filenames are resolved from configuration (validation.artifactPaths)
 - Round management is delegated to the rounds module
+- Rounds packed into the per-task archive (see `archive`) are read in place
+  and unpacked on demand
 """
 from __future__ import annotations
 
@@ -17,11 +19,12 @@ from typing import Any, Dict, List, Optional
 from edison.core.utils.io import write_json_atomic
 from edison.core.utils.text import parse_frontmatter, strip_frontmatter_block
 from edison.data import get_data_path
-from .._utils import get_qa_root_path
+from .._utils import get_qa_root_path, sort_round_dirs
 from .exceptions import EvidenceError
 from . import rounds
 from . import reports
-from .report_io import read_structured_report, write_structured_report
+from .archive import RoundArchive
+from .report_io import parse_structured_report, read_structured_report, write_structured_report
 
 
 class EvidenceService:
@@ -126,7 +129,10 @@ class EvidenceService:
 
         If round_num is None, returns the latest round or creates round-1.
         If round_num is provided and matches next/current, ensures it exists.
+        An archived round is unpacked back to its directory.
         """
+        if self._is_archived(round_num):
+            return self.unpack_round(int(round_num))  # type: ignore[arg-type]
         return rounds.ensure_round_dir(self.evidence_root, round_num)
 
     def ensure_required_evidence_files(self, round_dir: Path) -> list[Path]:
@@ -166,8 +172,54 @@ class EvidenceService:
         return rounds.create_next_round_dir(self.evidence_root)
 
     def list_rounds(self) -> List[Path]:
-        """List all round directories."""
-        return rounds.list_round_dirs(self.evidence_root)
+        """List all round directories, oldest first, including packed rounds.
+
+        A packed round is listed at its `round-N` path, which does not exist
+        until it is unpacked; read it through this service.
+        """
+        on_disk = rounds.list_round_dirs(self.evidence_root)
+        present = {rounds.get_round_number(p) for p in on_disk}
+        packed = [self.get_round_dir(n) for n in self.archived_rounds() if n not in present]
+        return sort_round_dirs(on_disk + packed) if packed else on_disk
+
+    # -------------------------------------------------------------------------
+    # Round archive
+    # -------------------------------------------------------------------------
+
+    @cached_property
+    def _archive(self) -> RoundArchive:
+        return RoundArchive(self.evidence_root, project_root=self.project_root)
+
+    def _is_archived(self, round_num: Optional[int]) -> bool:
+        """True when `round_num` lives only in the archive (never the latest round)."""
+        if round_num is None or self.get_round_dir(round_num).is_dir():
+            return False
+        return self._archive.has_round(int(round_num))
+
+    def archived_rounds(self) -> List[int]:
+        """List round numbers packed into the task's archive."""
+        return self._archive.rounds()
+
+    def archive_rounds(self) -> List[int]:
+        """Pack every round except the latest into the archive.
+
+        The latest round stays on disk so round numbering and writes are
+        unaffected. Returns the packed round numbers.
+        """
+        on_disk = rounds.list_round_dirs(self.evidence_root)
+        return self._archive.pack(on_disk[:-1])
+
+    def unpack_round(self, round_num: int) -> Path:
+        """Restore an archived round directory and return its path."""
+        return self._archive.unpack(round_num)
+
+    def _read_archived_report(self, round_num: int, *names: str) -> Dict[str, Any]:
+        """Read the first of `names` present in an archived round."""
+        members = set(self._archive.members(round_num))
+        for name in names:
+            if name in members:
+                return parse_structured_report(name, self._archive.read_text(round_num, name))
+        return {}
 
     # -------------------------------------------------------------------------
     # Bundle I/O (SINGLE SOURCE)
@@ -206,6 +258,13 @@ class EvidenceService:
 
         This is the SINGLE SOURCE for reading bundle summaries.
         """
+        if self._is_archived(round_num):
+            return self._read_archived_report(
+                int(round_num),  # type: ignore[arg-type]
+                self._CANONICAL_VALIDATION_SUMMARY,
+                self.bundle_filename,
+                self._LEGACY_BUNDLE_SUMMARY,
+            )
         round_dir = self.ensure_round(round_num)
         bundle_path = self._resolve_bundle_read_path(round_dir)
         return read_structured_report(bundle_path)
@@ -241,6 +300,8 @@ class EvidenceService:
 
         This is the SINGLE SOURCE for reading implementation reports.
         """
+        if self._is_archived(round_num):
+            return self._read_archived_report(int(round_num), self.implementation_filename)  # type: ignore[arg-type]
         round_dir = self.ensure_round(round_num)
         report_path = round_dir / self.implementation_filename
 
@@ -327,6 +388,9 @@ class EvidenceService:
 
         This is the SINGLE SOURCE for reading validator reports.
         """
+        if self._is_archived(round_num):
+            name = reports.validator_report_path(Path(), validator_name).name
+            return self._read_archived_report(int(round_num), name)  # type: ignore[arg-type]
         round_dir = self.ensure_round(round_num)
         return reports.read_validator_report(round_dir, validator_name)
 
@@ -356,7 +420,8 @@ class EvidenceService:
     def list_validator_reports(self, round_num: Optional[int] = None) -> List[Path]:
         """List all validator report files in a round.
 
-        This is the SINGLE SOURCE for listing validator reports.
+        This is the SINGLE SOURCE for listing validator reports. Callers get
+        real paths, so an archived round is unpacked first.
         """
         round_dir = self.ensure_round(round_num)
         return reports.list_validator_reports(round_dir)
@@ -80,7 +80,7 @@ def snapshot_file(*, project_root: Path, key: SnapshotKey, filename: str) -> Pat
 
 def is_snapshot_file_passed(path: Path) -> tuple[bool, str]:
     """Return (passed, reason) for a command evidence file."""
-    parsed = parse_command_evidence(path)
+    parsed = parse_command_evidence(path, include_output=False)
     if parsed is None:
         return False, "unparseable"
     try:
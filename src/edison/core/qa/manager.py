@@ -109,7 +109,8 @@ class QAManager:
             task_id: Task identifier
 
         Returns:
-            Sorted list of round directories (oldest to newest)
+            Sorted list of round directories (oldest to newest), including
+            packed rounds (see `EvidenceService.list_rounds`)
 
         Examples:
             >>> mgr = QAManager()
@@ -6,7 +6,7 @@ from typing import Iterable, List, Optional
 
 from ..legacy_guard import enforce_no_legacy_project_root
 from .evidence import EvidenceService
-from .evidence import reports as reportlib
+from .evidence.rounds import get_round_number
 
 
 enforce_no_legacy_project_root("lib.qa.promoter")
@@ -42,9 +42,9 @@ def collect_validator_reports(task_ids: Iterable[str]) -> List[Path]:
         ev_svc = EvidenceService(tid)
         if not ev_svc.get_evidence_root().exists():
             continue
-        # Use EvidenceService.list_rounds() instead of importing from rounds.py
+        # Packed rounds are unpacked (keeping report mtimes) so every report is a real path.
         for rd in ev_svc.list_rounds():
-            reports.extend(reportlib.list_validator_reports(rd))
+            reports.extend(ev_svc.list_validator_reports(round_num=get_round_number(rd)))
     return reports
 
 
@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 from edison.data import get_data_path
 from edison.core.entity import (
     BaseRepository,
+    BulkSaveMixin,
     FileRepositoryMixin,
     SessionScopedMixin,
     EntityId,
@@ -36,6 +37,7 @@ class QARepository(
     BaseRepository[QARecord],
     FileRepositoryMixin[QARecord],
     SessionScopedMixin[QARecord],
+    BulkSaveMixin[QARecord],
 ):
     """File-based repository for QA record entities.
 
@@ -46,7 +48,8 @@ class QARepository(
     - <project-management-dir>/qa/done/
     - <project-management-dir>/qa/validated/
 
-    Supports session-scoped storage via SessionScopedMixin.
+    Supports session-scoped storage via SessionScopedMixin and batched
+    saves via BulkSaveMixin.save_many.
     """
 
     entity_type: str = "qa"
@@ -115,20 +118,23 @@ class QARepository(
         Uses SessionScopedMixin for session path resolution.
         """
         return self._resolve_session_record_path(qa_id, session_id, state)
+
+    def _target_path(self, entity: QARecord) -> Path:
+        """Path a QA record is written to for its current session and state."""
+        if entity.session_id:
+            return self._resolve_session_qa_path(entity.id, entity.session_id, entity.state)
+        return self._resolve_entity_path(entity.id, entity.state)
     
     # ---------- CRUD Implementation ----------
     
     def _do_create(self, entity: QARecord) -> QARecord:
         """Create a new QA record file."""
-        if entity.session_id:
-            path = self._resolve_session_qa_path(entity.id, entity.session_id, entity.state)
-        else:
-            path = self._resolve_entity_path(entity.id, entity.state)
+        path = self._target_path(entity)
             
         path.parent.mkdir(parents=True, exist_ok=True)
-        extra, body = self._render_qa_template(entity)
-        content = self._qa_to_markdown(entity, body=body, extra_frontmatter=extra)
+        content = self._render_for_save(entity, None)
         path.write_text(content, encoding="utf-8")
+        self._invalidate_cached(path)
         return entity
     
     def _do_get(self, entity_id: EntityId) -> Optional[QARecord]:
@@ -136,7 +142,10 @@ class QARepository(
         path = self._find_entity_path(entity_id)
         if path is None:
             return None
+        return self._load_cached(path, self._read_qa_strict)
 
+    def _read_qa_strict(self, path: Path) -> QARecord:
+        """Read and parse a QA file, raising on legacy/unparseable content."""
         # Strict load for direct lookup: if a file exists but is legacy/unparseable,
         # surface an actionable error instead of pretending the QA doesn't exist.
         content = path.read_text(encoding="utf-8", errors="strict")
@@ -156,37 +165,28 @@ class QARepository(
         """Save a QA record."""
         current_path = self._find_entity_path(entity.id)
         
-        if entity.session_id:
-            target_path = self._resolve_session_qa_path(entity.id, entity.session_id, entity.state)
-        else:
-            target_path = self._resolve_entity_path(entity.id, entity.state)
+        target_path = self._target_path(entity)
         
         if current_path is None:
             self._do_create(entity)
             return
 
-        # Preserve existing body (QA briefs are human/LLM-edited documents).
-        content_existing = current_path.read_text(encoding="utf-8", errors="strict")
-        if not has_frontmatter(content_existing):
-            raise PersistenceError(
-                f"QA file at {current_path} is missing YAML frontmatter. "
-                "Restore the file from the composed template or recreate the QA via `edison qa new <task-id>`."
-            )
-        doc = parse_frontmatter(content_existing)
-        body = doc.content
-        extra = self._extract_extra_frontmatter(doc.frontmatter)
+        content = self._render_for_save(entity, current_path)
 
         cleanup_old = False
-        if current_path.resolve() != target_path.resolve():
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                current_path.rename(target_path)
-            except OSError:
-                cleanup_old = True
-
-        target_path.write_text(self._qa_to_markdown(entity, body=body, extra_frontmatter=extra), encoding="utf-8")
-        if cleanup_old and current_path.exists():
-            current_path.unlink()
+        try:
+            if current_path.resolve() != target_path.resolve():
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    current_path.rename(target_path)
+                except OSError:
+                    cleanup_old = True
+
+            target_path.write_text(content, encoding="utf-8")
+            if cleanup_old and current_path.exists():
+                current_path.unlink()
+        finally:
+            self._invalidate_cached(current_path, target_path)
     
     def _do_delete(self, entity_id: EntityId) -> bool:
         """Delete a QA record."""
@@ -194,6 +194,7 @@ class QARepository(
         if path is None:
             return False
         path.unlink()
+        self._invalidate_cached(path)
         return True
     
     def _do_exists(self, entity_id: EntityId) -> bool:
@@ -416,11 +417,41 @@ class QARepository(
         reserved = self._reserved_frontmatter_keys()
         return {k: v for k, v in fm.items() if isinstance(k, str) and k not in reserved}
 
-    def _render_qa_template(self, qa: QARecord) -> tuple[Dict[str, Any], str]:
+    def _render_for_save(
+        self,
+        qa: QARecord,
+        current_path: Optional[Path],
+        template: Optional[str] = None,
+    ) -> str:
+        """Render the file content `save()` writes for `qa`.
+
+        Existing records keep their body and extra frontmatter keys (QA briefs
+        are human/LLM-edited documents); new records use the template.
+        """
+        if current_path is None:
+            extra, body = self._render_qa_template(qa, template)
+            return self._qa_to_markdown(qa, body=body, extra_frontmatter=extra)
+
+        content_existing = current_path.read_text(encoding="utf-8", errors="strict")
+        if not has_frontmatter(content_existing):
+            raise PersistenceError(
+                f"QA file at {current_path} is missing YAML frontmatter. "
+                "Restore the file from the composed template or recreate the QA via `edison qa new <task-id>`."
+            )
+        doc = parse_frontmatter(content_existing)
+        extra = self._extract_extra_frontmatter(doc.frontmatter)
+        return self._qa_to_markdown(qa, body=doc.content, extra_frontmatter=extra)
+
+    def _load_template_text(self) -> str:
+        """Read the composed QA template (falling back to the bundled one)."""
         tpl_path = self._config.qa_template_path()
         if not tpl_path.exists():
             tpl_path = get_data_path("templates") / "artifacts" / "QA.md"
-        raw = tpl_path.read_text(encoding="utf-8")
+        return tpl_path.read_text(encoding="utf-8")
+
+    def _render_qa_template(self, qa: QARecord, raw: Optional[str] = None) -> tuple[Dict[str, Any], str]:
+        if raw is None:
+            raw = self._load_template_text()
 
         rendered = render_template_text(
             raw,
@@ -507,17 +538,21 @@ class QARepository(
         # Tolerant load for directory scans/listings: ignore non-QA files and
         # skip legacy/unparseable content without failing the whole listing.
         try:
-            with path.open("r", encoding="utf-8", errors="ignore") as f:
-                prefix = f.read(3)
-                if prefix != "---":
-                    return None
-                content = prefix + f.read()
+            return self._load_cached(path, self._read_qa_file)
+        except Exception:
+            return None
 
-            if not has_frontmatter(content):
+    def _read_qa_file(self, path: Path) -> Optional[QARecord]:
+        """Parse a QA file, returning None for files that are not QA records."""
+        with path.open("r", encoding="utf-8", errors="ignore") as f:
+            prefix = f.read(3)
+            if prefix != "---":
                 return None
-            return self._parse_qa_markdown(path.stem, content, path)
-        except Exception:
+            content = prefix + f.read()
+
+        if not has_frontmatter(content):
             return None
+        return self._parse_qa_markdown(path.stem, content, path)
 
     def _parse_qa_markdown(
         self,
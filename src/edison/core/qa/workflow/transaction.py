@@ -119,7 +119,8 @@ class ValidationTransaction:
             raise RuntimeError("ValidationTransaction has not been started")
         # Delegate to core transaction implementation; it will:
         # - pre-check disk space and permissions
-        # - copy+replace staged files into `<project-management-dir>/qa/<evidence-subdir>/...`
+        # - journal the touched paths, hardlink-backup existing files and rename
+        #   staged files into `<project-management-dir>/qa/<evidence-subdir>/...`
         # - update meta.json finalizedAt and clean up staging/snapshot
         self._tx.commit()
 
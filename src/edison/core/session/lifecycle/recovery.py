@@ -542,7 +542,7 @@ def recover_incomplete_validation_transactions(session_id: str, *, dry_run: bool
 
     Returns the number of recovered transactions.
     """
-    from .transaction import _tx_dir, _find_tx_session, finalize_tx, abort_tx, _get_tx_root, TX_VALIDATION_SUBDIR
+    from .transaction import _get_tx_root, TX_VALIDATION_SUBDIR, replay_validation_intent
     from edison.core.utils.io import read_json as io_read_json
 
     sid = validate_session_id(session_id)
@@ -613,7 +613,14 @@ def recover_incomplete_validation_transactions(session_id: str, *, dry_run: bool
 
         logger.info("Recovering incomplete validation transaction %s for session %s", tx_id, sid)
 
-        # 1. Clean up staging/snapshot
+        # 1. Undo a commit that crashed after journaling its intent (needs the snapshot).
+        try:
+            replay_validation_intent(tx_dir)
+        except Exception as e:
+            logger.error("Failed to roll back partial commit of tx %s: %s", tx_id, e)
+            continue
+
+        # 2. Clean up staging/snapshot
         staging = tx_dir / "staging"
         snapshot = tx_dir / "snapshot"
         if staging.exists():
@@ -621,7 +628,7 @@ def recover_incomplete_validation_transactions(session_id: str, *, dry_run: bool
         if snapshot.exists():
             shutil.rmtree(snapshot, ignore_errors=True)
 
-        # 2. Mark as aborted in meta.json (validation transactions store metadata differently)
+        # 3. Mark as aborted in meta.json (validation transactions store metadata differently)
         try:
             from edison.core.utils.io.locking import acquire_file_lock
             from edison.core.utils.io import write_json_atomic as io_write_json_atomic
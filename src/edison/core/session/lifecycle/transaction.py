@@ -210,15 +210,81 @@ def _ensure_disk_space(final_root: Path, required_bytes: int) -> None:
     if free_bytes < required_bytes + headroom:
         raise OSError(errno.ENOSPC, f"Insufficient disk space: need {required_bytes}, free {free_bytes}")
 
-def _iter_staging_files(staging_root: Path) -> Iterator[Path]:
+def _scan_staging(staging_root: Path) -> list[tuple[Path, Path, int]]:
+    """Return (relative path, staged path, size) for every staged file in one walk."""
+    out: list[tuple[Path, Path, int]] = []
     if not staging_root.exists():
-        return
-    for p in staging_root.rglob("*"):
-        if p.is_file():
-            yield p
+        return out
+    stack = [staging_root]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    path = Path(entry.path)
+                    out.append((path.relative_to(staging_root), path, entry.stat().st_size))
+    out.sort(key=lambda item: item[0])
+    return out
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink ``src`` to ``dst`` (zero-copy backup); copy across filesystems."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+def _publish(src: Path, dst: Path) -> None:
+    """Atomically put ``src`` at ``dst`` (rename; copy to a sibling temp across filesystems)."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        fd, tmp = tempfile.mkstemp(dir=str(dst.parent), prefix=f".{dst.name}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copy2(src, tmp)
+            os.replace(tmp, dst)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+INTENT_FILENAME = "intent.json"
 
-def _relative_to_staging(staging_root: Path, p: Path) -> Path:
-    return p.relative_to(staging_root)
+def replay_validation_intent(tx_dir: Path) -> int:
+    """Roll back a validation commit interrupted after its intent was journaled.
+
+    Destinations that existed are restored from their snapshot links; files that
+    the commit created are removed. Returns the number of restored paths.
+    Safe to run repeatedly.
+    """
+    intent_path = Path(tx_dir) / INTENT_FILENAME
+    if not intent_path.exists():
+        return 0
+    intent = io_read_json(intent_path)
+    if intent.get("state") == "done":
+        return 0
+    final_root = Path(str(intent.get("finalRoot") or ""))
+    snapshot_root = Path(tx_dir) / "snapshot"
+    restored = 0
+    for entry in reversed(intent.get("entries") or []):
+        rel = Path(str(entry.get("path") or ""))
+        if not str(rel) or rel.is_absolute() or ".." in rel.parts:
+            continue
+        dst = final_root / rel
+        backup = snapshot_root / rel
+        if entry.get("existed"):
+            if backup.exists():
+                os.replace(backup, dst)
+                restored += 1
+        elif dst.exists():
+            dst.unlink()
+            restored += 1
+    intent["state"] = "rolled-back"
+    io_write_json_atomic(intent_path, intent)
+    return restored
 
 class ValidationTransaction:
     def __init__(self, session_id: str, wave: str):
@@ -266,22 +332,19 @@ class ValidationTransaction:
     def env(self) -> dict:
         return {"AGENTS_PROJECT_ROOT": str(self.staging_root)}
 
-    def _snapshot_manifest(self) -> None:
-        from edison.core.qa._utils import get_evidence_base_path
+    def _snapshot_manifest(self, existing: Optional[Dict[Path, os.stat_result]] = None) -> None:
+        """Record the pre-commit state of the destinations this commit touches.
+
+        Scoped to staged paths: the evidence tree grows without bound, and a
+        manifest of untouched files says nothing about this commit.
+        """
         manifest: list[dict] = []
-        base = get_evidence_base_path(self.final_root)
-        if base.exists():
-            for p in base.rglob("*"):
-                if p.is_file():
-                    try:
-                        st = p.stat()
-                        manifest.append({
-                            "path": str(p.relative_to(self.final_root)),
-                            "size": st.st_size,
-                            "mtime": int(st.st_mtime),
-                        })
-                    except (OSError, ValueError) as e:
-                        logger.debug("Failed to stat file %s: %s", p, e)
+        for rel, st in sorted((existing or {}).items()):
+            manifest.append({
+                "path": str(rel),
+                "size": st.st_size,
+                "mtime": int(st.st_mtime),
+            })
         try:
             meta = io_read_json(self.meta_path)
         except (FileNotFoundError, OSError) as e:
@@ -299,37 +362,51 @@ class ValidationTransaction:
         if os.environ.get("EDISON_FORCE_PERMISSION_ERROR") or os.environ.get("project_FORCE_PERMISSION_ERROR"):
             _append_tx_log(self.session_id, self.tx_id, "commit-permission-error", "forced via env", wave=self.wave)
             raise PermissionError("Forced permission error for test")
-        
-        staged_files = list(_iter_staging_files(self.staging_root))
-        staged_bytes = sum(p.stat().st_size for p in staged_files if p.exists())
-        
-        to_backup: list[Path] = []
-        for sf in staged_files:
-            rel = _relative_to_staging(self.staging_root, sf)
-            dst = self.final_root / rel
-            if dst.exists():
-                to_backup.append(dst)
-        backup_bytes = sum(d.stat().st_size for d in to_backup if d.exists())
-        _ensure_disk_space(self.final_root, staged_bytes + backup_bytes)
-        
-        # Snapshot
-        self._snapshot_manifest()
-        
+
+        staged = _scan_staging(self.staging_root)
+        existing: Dict[Path, os.stat_result] = {}
+        for rel, _src, _size in staged:
+            try:
+                existing[rel] = os.stat(self.final_root / rel)
+            except FileNotFoundError:
+                continue
+        # Backups are hardlinks and staged files are renamed into place, so only a
+        # cross-filesystem fallback copy can consume space.
+        _ensure_disk_space(self.final_root, sum(size for _rel, _src, size in staged))
+
+        self._snapshot_manifest(existing)
+
+        # Write-ahead intent: everything recovery needs to undo a partial commit.
+        intent_path = self.tx_dir / INTENT_FILENAME
+        intent: Dict[str, Any] = {
+            "txId": self.tx_id,
+            "finalRoot": str(self.final_root),
+            "state": "applying",
+            "entries": [{"path": str(rel), "existed": rel in existing} for rel, _src, _size in staged],
+        }
+        io_write_json_atomic(intent_path, intent)
+
         # Apply changes
-        for sf in staged_files:
-            rel = _relative_to_staging(self.staging_root, sf)
-            dst = self.final_root / rel
-            ensure_directory(dst.parent)
-            if dst.exists():
-                backup_path = self.snapshot_root / rel
-                ensure_directory(backup_path.parent)
-                shutil.copy2(dst, backup_path)
-            shutil.copy2(sf, dst)
-            
+        try:
+            for rel, src, _size in staged:
+                dst = self.final_root / rel
+                ensure_directory(dst.parent)
+                if rel in existing:
+                    backup_path = self.snapshot_root / rel
+                    ensure_directory(backup_path.parent)
+                    backup_path.unlink(missing_ok=True)
+                    _link_or_copy(dst, backup_path)
+                _publish(src, dst)
+        except BaseException as exc:
+            self._undo_partial_commit(exc)
+            raise
+
         self._committed = True
         meta = io_read_json(self.meta_path)
         meta["finalizedAt"] = io_utc_timestamp()
         io_write_json_atomic(self.meta_path, meta)
+        intent["state"] = "done"
+        io_write_json_atomic(intent_path, intent)
         _append_tx_log(self.session_id, self.tx_id, "committed", wave=self.wave)
         # Release lock
         try:
@@ -337,10 +414,49 @@ class ValidationTransaction:
         except (OSError, RuntimeError) as e:
             logger.warning("Failed to release validation transaction lock after commit: %s", e)
 
+    def _undo_partial_commit(self, exc: BaseException) -> None:
+        """Roll back the destinations a failed commit already replaced."""
+        try:
+            restored = replay_validation_intent(self.tx_dir)
+        except Exception as e:
+            # The intent stays "applying": recovery replays it from the snapshot.
+            logger.error("Failed to roll back partial commit of tx %s: %s", self.tx_id, e)
+            _append_tx_log(self.session_id, self.tx_id, "commit-rollback-failed", f"error={e}", wave=self.wave)
+            return
+        _append_tx_log(
+            self.session_id,
+            self.tx_id,
+            "commit-rolled-back",
+            f"restored={restored} error={exc}",
+            wave=self.wave,
+        )
+
+    def _intent_pending(self) -> bool:
+        """True when a commit journaled its intent but neither finished nor rolled back."""
+        intent_path = self.tx_dir / INTENT_FILENAME
+        if not intent_path.exists():
+            return False
+        try:
+            state = io_read_json(intent_path).get("state")
+        except (OSError, ValueError):
+            return True
+        return state not in ("done", "rolled-back")
+
     def abort(self, reason: str = "") -> None:
         if self._committed or self._aborted:
             return
         self._aborted = True
+        if self._intent_pending():
+            # The snapshot is the only copy of what the partial commit replaced.
+            # Keep it (and leave abortedAt unset) so recovery replays the intent.
+            _append_tx_log(
+                self.session_id, self.tx_id, "abort-deferred", f"reason={reason} intent=pending", wave=self.wave
+            )
+            try:
+                self._lock_cm.__exit__(None, None, None)
+            except (OSError, RuntimeError) as e:
+                logger.warning("Failed to release validation transaction lock during abort: %s", e)
+            return
         # Cleanup staging
         if self.staging_root.exists():
             shutil.rmtree(self.staging_root, ignore_errors=True)
@@ -404,9 +404,10 @@ def compute_next(session_id: str, scope: str | None, limit: int) -> dict[str, An
             if not created_raw or not last_raw:
                 return True
 
-            created = parse_iso8601(created_raw, repo_root=PathResolver.resolve_project_root())
-            last = parse_iso8601(last_raw, repo_root=PathResolver.resolve_project_root())
-            now = utc_now(repo_root=PathResolver.resolve_project_root())
+            repo_root = PathResolver.resolve_project_root()
+            created = parse_iso8601(created_raw, repo_root=repo_root)
+            last = parse_iso8601(last_raw, repo_root=repo_root)
+            now = utc_now(repo_root=repo_root)
 
             # New sessions often have lastActive ~= createdAt.
             if abs((last - created).total_seconds()) <= 120:
@@ -1062,8 +1063,13 @@ def compute_next(session_id: str, scope: str | None, limit: int) -> dict[str, An
         rules_engine_summary = {}
         engine = None
 
-    # Guard previews for key task transitions (best-effort; non-fatal).
+    # Transition matrix for the session's tasks (and tasks referenced by actions),
+    # evaluated in one pass under a shared guard cache; guard previews on
+    # actions are read from it (best-effort; non-fatal).
+    transitions: dict[str, dict[str, Any]] = {}
     if engine is not None:
+        sess_ctx: dict[str, Any] = {"id": session.get("id") or session_id}
+        previews: list[tuple[dict[str, Any], str, str, str]] = []
         for a in actions:
             entity = a.get("entity")
             aid = a.get("id")
@@ -1078,21 +1084,58 @@ def compute_next(session_id: str, scope: str | None, limit: int) -> dict[str, An
 
             if not from_state or not to_state or not record_id:
                 continue
+            previews.append((a, record_id, from_state, to_state))
 
-            task_ctx = {"id": record_id}
-            sess_ctx: dict[str, Any] = {"id": session.get("id") or session_id}
-            allowed, msg = engine.check_transition_guards(
-                from_state, to_state, task_ctx, sess_ctx, validation_results=None
-            )
-            guard_status = "allowed" if allowed else "blocked"
-            guard_obj: dict[str, Any] = {
-                "from": from_state,
-                "to": to_state,
-                "status": guard_status,
+        def _guard_ctx(task_id: str) -> dict[str, Any]:
+            return {"task": {"id": task_id}, "session": dict(sess_ctx), "validation_results": {}}
+
+        subjects: dict[str, tuple[str, dict[str, Any]]] = {
+            str(t.id): (str(t.state), _guard_ctx(str(t.id)))
+            for t in session_tasks
+            if t is not None and t.id and getattr(t, "state", None)
+        }
+        for _a, record_id, from_state, _to in previews:
+            subjects.setdefault(record_id, (from_state, _guard_ctx(record_id)))
+
+        from edison.core.state import enable_guard_cache, transition_matrix
+
+        with enable_guard_cache():
+            try:
+                matrix = transition_matrix("task", subjects)
+            except Exception:
+                matrix = {}
+
+            for a, record_id, from_state, to_state in previews:
+                verdict = None
+                if subjects[record_id][0] == from_state:
+                    verdict = matrix.get(record_id, {}).get(to_state)
+                if verdict is None:
+                    allowed, msg = engine.check_transition_guards(
+                        from_state, to_state, {"id": record_id}, dict(sess_ctx), validation_results=None
+                    )
+                else:
+                    allowed, msg = verdict[0], (verdict[1] or None)
+                guard_status = "allowed" if allowed else "blocked"
+                guard_obj: dict[str, Any] = {
+                    "from": from_state,
+                    "to": to_state,
+                    "status": guard_status,
+                }
+                if msg:
+                    guard_obj["message"] = msg
+                a["guard"] = guard_obj
+
+        in_session = {str(t.id) for t in session_tasks if t is not None}
+        for task_id, verdicts in matrix.items():
+            if task_id not in in_session:
+                continue
+            transitions[task_id] = {
+                "from": subjects[task_id][0],
+                "to": {
+                    target: ({"allowed": ok, "message": msg} if msg else {"allowed": ok})
+                    for target, (ok, msg) in verdicts.items()
+                },
             }
-            if msg:
-                guard_obj["message"] = msg
-            a["guard"] = guard_obj
 
     # Session-close evidence (surface early; do not wait until close-time failure).
     session_close_evidence: dict[str, Any] = {"required": [], "missing": []}
@@ -1120,7 +1163,7 @@ def compute_next(session_id: str, scope: str | None, limit: int) -> dict[str, An
                     p = rd / filename
                     if not p.exists():
                         continue
-                    parsed = parse_command_evidence(p)
+                    parsed = parse_command_evidence(p, include_output=False)
                     if parsed is None:
                         continue
                     try:
@@ -1183,6 +1226,7 @@ def compute_next(session_id: str, scope: str | None, limit: int) -> dict[str, An
         "reportsMissing": reports_missing,
         "followUpsPlan": followups_plan,
         "rulesEngine": rules_engine_summary,  # Context-aware rules (git diff + config)
+        "transitions": transitions,  # Legal next states per session task
         "sessionCloseEvidence": session_close_evidence,
         "rules": [
             "Use bundle-first validation; keep one QA per task.",
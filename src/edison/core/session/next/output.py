@@ -104,6 +104,19 @@ def format_human_readable(payload: dict[str, Any]) -> str:
                 lines.append(f"    - {r['id']}{blocking}: {r.get('description','')}")
         lines.append("")
 
+    # Legal next states per session task (from the transition matrix)
+    if _section_enabled(output_cfg, "transitions", default=True) and payload.get("transitions"):
+        lines.append("🚦 LEGAL TRANSITIONS:")
+        for task_id, info in sorted((payload.get("transitions") or {}).items()):
+            targets = (info or {}).get("to") or {}
+            allowed = [t for t, v in targets.items() if (v or {}).get("allowed")]
+            blocked = [t for t, v in targets.items() if not (v or {}).get("allowed")]
+            line = f"  - {task_id} ({info.get('from', '?')}): → {', '.join(allowed) if allowed else 'none'}"
+            if blocked:
+                line += f" (blocked: {', '.join(blocked)})"
+            lines.append(line)
+        lines.append("")
+
     # Show actions with enhanced details
     if _section_enabled(output_cfg, "actions", default=True):
         actions = payload.get("actions", [])
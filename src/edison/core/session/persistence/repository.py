@@ -118,6 +118,7 @@ class SessionRepository(BaseRepository[Session], FileRepositoryMixin[Session]):
         # Write session JSON
         data = entity.to_dict()
         write_json_atomic(path, data, acquire_lock=False)
+        self._invalidate_cached(path)
 
         return entity
     
@@ -128,10 +129,13 @@ class SessionRepository(BaseRepository[Session], FileRepositoryMixin[Session]):
             return None
         
         try:
-            data = read_json(path)
-            return Session.from_dict(data)
+            return self._load_cached(path, self._read_session_file)
         except Exception:
             return None
+
+    def _read_session_file(self, path: Path) -> Session:
+        """Read and parse a session.json file."""
+        return Session.from_dict(read_json(path))
     
     def _do_save(self, entity: Session) -> None:
         """Save a session."""
@@ -158,6 +162,8 @@ class SessionRepository(BaseRepository[Session], FileRepositoryMixin[Session]):
             target_session_dir.parent.mkdir(parents=True, exist_ok=True)
 
             # Move entire session directory (preserves tasks, qa, etc.)
+            # Cached session-scoped tasks/QA under the old directory go stale too.
+            self._entity_cache().invalidate_tree(current_session_dir)
             current_session_dir.rename(target_session_dir)
 
             # Update path for writing
@@ -165,7 +171,10 @@ class SessionRepository(BaseRepository[Session], FileRepositoryMixin[Session]):
 
         # Write updated content
         data = entity.to_dict()
-        write_json_atomic(current_path, data, acquire_lock=False)
+        try:
+            write_json_atomic(current_path, data, acquire_lock=False)
+        finally:
+            self._invalidate_cached(current_path)
     
     def _do_delete(self, entity_id: EntityId) -> bool:
         """Delete a session."""
@@ -175,6 +184,7 @@ class SessionRepository(BaseRepository[Session], FileRepositoryMixin[Session]):
 
         # Delete session file
         path.unlink()
+        self._invalidate_cached(path)
         return True
     
     def _do_exists(self, entity_id: EntityId) -> bool:
@@ -216,11 +226,11 @@ class SessionRepository(BaseRepository[Session], FileRepositoryMixin[Session]):
                 continue
 
             try:
-                data = read_json(json_path)
-                session = Session.from_dict(data)
-                sessions.append(session)
+                session = self._load_cached(json_path, self._read_session_file)
             except Exception:
                 continue
+            if session is not None:
+                sessions.append(session)
 
         return sessions
     
@@ -40,6 +40,9 @@ from .manager import (
     get_meta_worktree_status,
     prepare_session_git_metadata,
     resolve_worktree_base_ref,
+    fill_worktree_pool,
+    check_worktree_pool,
+    list_pool_entries,
 )
 
 # Import config helpers
@@ -110,6 +113,9 @@ __all__ = [
     "update_worktree_env",
     "prepare_session_git_metadata",
     "resolve_worktree_base_ref",
+    "fill_worktree_pool",
+    "check_worktree_pool",
+    "list_pool_entries",
     # Git operations
     "get_existing_worktree_path",
     "list_worktrees",
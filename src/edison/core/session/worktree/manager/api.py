@@ -23,6 +23,13 @@ from .meta import (
     prepare_session_git_metadata,
     recreate_meta_shared_state,
 )
+from .pool import (
+    check_worktree_pool,
+    claim_pooled_worktree,
+    fill_worktree_pool,
+    list_pool_entries,
+    schedule_pool_replenish,
+)
 from .post_install import _run_post_install_commands
 from .refs import resolve_worktree_base_ref
 from .session_id import (
@@ -47,6 +54,11 @@ __all__ = [
     "get_meta_worktree_status",
     "prepare_session_git_metadata",
     "resolve_worktree_base_ref",
+    "fill_worktree_pool",
+    "check_worktree_pool",
+    "claim_pooled_worktree",
+    "list_pool_entries",
+    "schedule_pool_replenish",
     "WorktreeManager",
 ]
 
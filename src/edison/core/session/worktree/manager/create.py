@@ -18,10 +18,10 @@ from ..config_helpers import _config, _resolve_archive_directory, _resolve_workt
 from .meta_setup import ensure_checkout_git_excludes
 from .refs import _primary_head_marker, _resolve_start_ref, resolve_worktree_base_ref
 from .session_id import _ensure_worktree_session_id_file
-from .shared_config import shared_state_cfg
-from .shared_paths import ensure_shared_paths_in_checkout
+from .shared_paths import align_primary_shared_state, ensure_shared_paths_in_checkout
 from .deps import maybe_install_deps_and_post_install
 from .health import validate_worktree_checkout
+from .pool import acquire_pooled_worktree
 from .progress import WorktreeProgress
 
 __all__ = [
@@ -54,23 +54,6 @@ def create_worktree(
 
     progress = WorktreeProgress()
 
-    def _maybe_align_primary_shared_state() -> None:
-        try:
-            ss = shared_state_cfg(config)
-            mode = str(ss.get("mode") or "meta").strip().lower()
-            if mode != "meta":
-                return
-            primary_repo_dir = get_worktree_parent(repo_dir) or repo_dir
-            ensure_shared_paths_in_checkout(
-                checkout_path=primary_repo_dir,
-                repo_dir=primary_repo_dir,
-                cfg=config,
-                scope="primary",
-            )
-            ensure_checkout_git_excludes(checkout_path=primary_repo_dir, cfg=config, scope="primary")
-        except Exception:
-            return
-
     worktree_path, branch_name = _resolve_worktree_target(session_id, config)
     if worktree_path_override:
         override = Path(str(worktree_path_override))
@@ -89,7 +72,7 @@ def create_worktree(
             )
             _ensure_worktree_session_id_file(worktree_path=resolved, session_id=session_id)
             ensure_checkout_git_excludes(checkout_path=resolved, cfg=config, scope="session")
-            _maybe_align_primary_shared_state()
+            align_primary_shared_state(repo_dir=repo_dir, cfg=config)
         return (resolved, branch_name)
 
     # Fail fast when repo has no commits (unborn HEAD).
@@ -170,7 +153,18 @@ def create_worktree(
             timeout=t_fetch,
         )
 
-    for _attempt in range(2):
+    claimed = acquire_pooled_worktree(
+        repo_dir=repo_dir,
+        cfg=config,
+        worktree_path=worktree_path,
+        branch_name=branch_name,
+        start_ref=start_ref,
+        install_deps=install_deps,
+        fetch_mode=fetch_mode,
+        progress=progress,
+    )
+
+    for _attempt in range(0 if claimed is not None else 2):
         try:
             # Common case: baseBranchMode=current points at a local ref, so a fetch
             # is unnecessary and can hang when remotes are unreachable. Default to
@@ -220,23 +214,24 @@ def create_worktree(
     if last_err is not None:
         raise RuntimeError(f"Failed to create worktree after retries: {last_err}")
 
-    maybe_install_deps_and_post_install(
-        worktree_path=worktree_path,
-        config=config,
-        install_deps_override=install_deps,
-        timeout=t_install,
-    )
+    if claimed is None:
+        maybe_install_deps_and_post_install(
+            worktree_path=worktree_path,
+            config=config,
+            install_deps_override=install_deps,
+            timeout=t_install,
+        )
 
-    try:
-        validate_worktree_checkout(worktree_path=worktree_path, branch_name=branch_name, timeout=t_health)
-    except Exception as e:
-        raise RuntimeError(f"Worktree health checks failed: {e}")
+        try:
+            validate_worktree_checkout(worktree_path=worktree_path, branch_name=branch_name, timeout=t_health)
+        except Exception as e:
+            raise RuntimeError(f"Worktree health checks failed: {e}")
 
     progress.emit("Linking shared paths + git excludes...")
     ensure_shared_paths_in_checkout(checkout_path=worktree_path, repo_dir=repo_dir, cfg=config, scope="session")
     _ensure_worktree_session_id_file(worktree_path=worktree_path, session_id=session_id)
     ensure_checkout_git_excludes(checkout_path=worktree_path, cfg=config, scope="session")
-    _maybe_align_primary_shared_state()
+    align_primary_shared_state(repo_dir=repo_dir, cfg=config)
 
     primary_after = _primary_head_marker(repo_dir)
     if primary_before != primary_after:
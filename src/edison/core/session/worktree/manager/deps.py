@@ -6,12 +6,20 @@ preserving the existing "no-mock" behavior (real subprocess calls by default).
 
 from __future__ import annotations
 
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional, cast
 
 from edison.core.utils.subprocess import run_with_timeout
 
+from .deps_cache import (
+    dependency_dirs,
+    deps_cache_config,
+    has_cached_dependencies,
+    restore_cached_dependencies,
+    store_cached_dependencies,
+)
 from .post_install import _run_post_install_commands
 
 
@@ -94,6 +102,27 @@ def _ensure_install_ok(
     )
 
 
+def warm_dependency_cache(*, worktree_path: Path, config: dict, timeout: int) -> bool:
+    """Populate the dependency cache from `worktree_path` without leaving an install behind.
+
+    Used for pool entries: the frozen install runs at the pool path, its dependency
+    dirs are stored in the cache and then removed, so the session claiming the entry
+    restores them from the cache at its own path instead of running the package
+    manager. Returns True when the cache holds the entry afterwards.
+    """
+    if not config.get("installDeps", False) or not deps_cache_config(config)["enabled"]:
+        return False
+    install_cmd = _resolve_install_cmd(worktree_path)
+    if has_cached_dependencies(worktree_path=worktree_path, cmd=install_cmd, config=config):
+        return True
+    result = _run_install(worktree_path=worktree_path, cmd=install_cmd, timeout=timeout)
+    _ensure_install_ok(result, worktree_path=worktree_path, cmd=install_cmd)
+    stored = store_cached_dependencies(worktree_path=worktree_path, cmd=install_cmd, config=config)
+    for d in dependency_dirs(worktree_path, config):
+        shutil.rmtree(d, ignore_errors=True)
+    return stored is not None
+
+
 def maybe_install_deps_and_post_install(
     *,
     worktree_path: Path,
@@ -107,13 +136,16 @@ def maybe_install_deps_and_post_install(
 
     if install_flag:
         install_cmd = _resolve_install_cmd(worktree_path)
-        result = _run_install(worktree_path=worktree_path, cmd=install_cmd, timeout=timeout)
-        if result.returncode != 0 and fallback_cmd:
-            used_fallback = True
-            fallback_result = _run_install(worktree_path=worktree_path, cmd=fallback_cmd, timeout=timeout)
-            _ensure_install_ok(fallback_result, worktree_path=worktree_path, cmd=fallback_cmd)
-        else:
-            _ensure_install_ok(result, worktree_path=worktree_path, cmd=install_cmd)
+        if not restore_cached_dependencies(worktree_path=worktree_path, cmd=install_cmd, config=config):
+            result = _run_install(worktree_path=worktree_path, cmd=install_cmd, timeout=timeout)
+            if result.returncode != 0 and fallback_cmd:
+                used_fallback = True
+                fallback_result = _run_install(worktree_path=worktree_path, cmd=fallback_cmd, timeout=timeout)
+                _ensure_install_ok(fallback_result, worktree_path=worktree_path, cmd=fallback_cmd)
+            else:
+                _ensure_install_ok(result, worktree_path=worktree_path, cmd=install_cmd)
+                # Only frozen installs are reproducible from the lockfile alone.
+                store_cached_dependencies(worktree_path=worktree_path, cmd=install_cmd, config=config)
 
     post_install = config.get("postInstallCommands", []) or []
     if isinstance(post_install, list) and post_install:
@@ -0,0 +1,287 @@
+"""Lockfile-keyed dependency cache for worktree installs.
+
+Session worktrees of one repository usually share a lockfile, so a frozen install
+produces the same dependency tree every time. With `worktrees.depsCache.enabled`
+the first install populates a cache entry keyed by the lockfile bytes, the install
+command and the platform; later worktrees materialize the cached dependency dirs
+instead of running the package manager.
+
+- materialization prefers a reflink (copy-on-write clone), then a plain copy;
+  a hardlink farm is used only when `mode: hardlink` opts in, since a package
+  manager writing through a hardlink would corrupt the shared entry; symlinks
+  (pnpm's store layout) are recreated as-is
+- entries are published by renaming a fully written temp dir, so concurrent
+  installs never observe a partial entry
+- the entry's `entry.json` mtime is its LRU clock; after each store the cache is
+  trimmed to `maxBytes`
+"""
+
+from __future__ import annotations
+
+import errno
+import hashlib
+import os
+import platform
+import shutil
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from edison.core.utils.io import ensure_directory, read_json, write_json_atomic
+from edison.core.utils.profiling import count
+
+from ..._utils import get_repo_dir
+from ..config_helpers import _worktree_base_dir
+
+__all__ = [
+    "deps_cache_config",
+    "deps_cache_key",
+    "has_cached_dependencies",
+    "dependency_dirs",
+    "restore_cached_dependencies",
+    "store_cached_dependencies",
+    "evict_dependency_cache",
+]
+
+LOCKFILES = ("pnpm-lock.yaml", "package-lock.json", "yarn.lock", "bun.lockb", "bun.lock")
+ENTRY_FILE = "entry.json"
+TREE_DIR = "tree"
+MODES = ("reflink", "hardlink", "copy")
+
+# Linux FICLONE ioctl (_IOW(0x94, 9, int)): clone a whole file's extents.
+_FICLONE = 0x40049409
+_REFLINK_UNSUPPORTED = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EPERM}
+
+
+def deps_cache_config(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    raw = cfg.get("depsCache") if isinstance(cfg.get("depsCache"), dict) else {}
+    paths = raw.get("paths") or ["node_modules"]
+    mode = str(raw.get("mode") or "auto").strip().lower()
+    try:
+        max_bytes = max(0, int(raw.get("maxBytes", 5 * 1024**3)))
+    except (TypeError, ValueError):
+        max_bytes = 5 * 1024**3
+    return {
+        "enabled": bool(raw.get("enabled", False)),
+        "directory": str(raw.get("directory") or "").strip() or None,
+        "paths": [str(p) for p in paths if str(p).strip()],
+        "mode": mode if mode in {"auto", *MODES} else "auto",
+        "maxBytes": max_bytes,
+    }
+
+
+def _cache_root(cfg: Dict[str, Any]) -> Path:
+    directory = deps_cache_config(cfg)["directory"]
+    if directory:
+        p = Path(directory).expanduser()
+        return p if p.is_absolute() else (get_repo_dir() / p).resolve()
+    return _worktree_base_dir(cfg, get_repo_dir()) / "_deps_cache"
+
+
+def deps_cache_key(worktree_path: Path, cmd: List[str]) -> Optional[str]:
+    """Hash of lockfile bytes + install command + platform, or None without a lockfile."""
+    h = hashlib.sha256()
+    found = False
+    for name in LOCKFILES:
+        lockfile = worktree_path / name
+        if lockfile.is_file():
+            found = True
+            h.update(name.encode("utf-8") + b"\0")
+            with lockfile.open("rb") as fh:
+                for chunk in iter(lambda: fh.read(1 << 20), b""):
+                    h.update(chunk)
+            h.update(b"\0")
+    if not found:
+        return None
+    h.update("\0".join(cmd).encode("utf-8"))
+    h.update(f"\0{sys.platform}\0{platform.machine()}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def has_cached_dependencies(*, worktree_path: Path, cmd: List[str], config: Dict[str, Any]) -> bool:
+    """True when the cache holds an entry for this checkout's lockfile and `cmd`."""
+    if not deps_cache_config(config)["enabled"]:
+        return False
+    key = deps_cache_key(worktree_path, cmd)
+    return key is not None and (_cache_root(config) / key / ENTRY_FILE).is_file()
+
+
+def dependency_dirs(worktree_path: Path, config: Dict[str, Any]) -> List[Path]:
+    """The configured dependency dirs (`depsCache.paths`) present in `worktree_path`."""
+    return _dependency_dirs(worktree_path, deps_cache_config(config)["paths"])
+
+
+def _dependency_dirs(worktree_path: Path, patterns: List[str]) -> List[Path]:
+    found: List[Path] = []
+    for pattern in patterns:
+        if any(ch in pattern for ch in "*?["):
+            found.extend(p for p in sorted(worktree_path.glob(pattern)) if p.is_dir() and not p.is_symlink())
+        else:
+            p = worktree_path / pattern
+            if p.is_dir() and not p.is_symlink():
+                found.append(p)
+    return found
+
+
+class _Cloner:
+    """Clone files with the cheapest mechanism that works, degrading once per instance."""
+
+    def __init__(self, mode: str, *, hardlink: bool = True) -> None:
+        modes = list(MODES) if mode == "auto" else [mode]
+        self.modes = [m for m in modes if hardlink or m != "hardlink"] or ["copy"]
+
+    def file(self, src: Path, dst: Path) -> None:
+        while True:
+            mode = self.modes[0]
+            try:
+                if mode == "reflink":
+                    self._reflink(src, dst)
+                elif mode == "hardlink":
+                    os.link(src, dst)
+                else:
+                    shutil.copy2(src, dst)
+                return
+            except OSError as exc:
+                unsupported = exc.errno in _REFLINK_UNSUPPORTED if mode == "reflink" else exc.errno in {
+                    errno.EXDEV,
+                    errno.EPERM,
+                    errno.EMLINK,
+                }
+                if mode == "copy" or len(self.modes) == 1 or not unsupported:
+                    raise
+                dst.unlink(missing_ok=True)
+                self.modes.pop(0)
+
+    @staticmethod
+    def _reflink(src: Path, dst: Path) -> None:
+        import fcntl
+
+        with src.open("rb") as s, dst.open("wb") as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        shutil.copystat(src, dst)
+
+    def tree(self, src: Path, dst: Path) -> int:
+        """Clone `src` into `dst` (which must not exist); return the bytes covered."""
+        total = 0
+        for dirpath, dirnames, filenames in os.walk(src):
+            rel = Path(dirpath).relative_to(src)
+            out_dir = dst / rel
+            out_dir.mkdir(parents=True, exist_ok=True)
+            for name in list(dirnames):
+                s = Path(dirpath) / name
+                if s.is_symlink():
+                    os.symlink(os.readlink(s), out_dir / name)
+                    dirnames.remove(name)
+            for name in filenames:
+                s = Path(dirpath) / name
+                if s.is_symlink():
+                    os.symlink(os.readlink(s), out_dir / name)
+                    continue
+                self.file(s, out_dir / name)
+                total += s.stat().st_size
+        return total
+
+
+def restore_cached_dependencies(*, worktree_path: Path, cmd: List[str], config: Dict[str, Any]) -> bool:
+    """Materialize a cached dependency tree into `worktree_path`; True on a hit."""
+    dcfg = deps_cache_config(config)
+    if not dcfg["enabled"]:
+        return False
+    key = deps_cache_key(worktree_path, cmd)
+    if key is None:
+        return False
+    entry = _cache_root(config) / key
+    try:
+        meta = read_json(entry / ENTRY_FILE, default=None)
+    except (OSError, ValueError):
+        meta = None
+    if not isinstance(meta, dict):
+        count("worktree.deps_cache.miss")
+        return False
+
+    rels = [str(r) for r in meta.get("paths") or []]
+    if not rels or any((worktree_path / rel).exists() for rel in rels):
+        return False  # Never overwrite a dependency dir the checkout already has.
+    cloner = _Cloner(dcfg["mode"], hardlink=dcfg["mode"] == "hardlink")
+    try:
+        for rel in rels:
+            cloner.tree(entry / TREE_DIR / rel, worktree_path / rel)
+    except OSError:
+        for rel in rels:
+            shutil.rmtree(worktree_path / rel, ignore_errors=True)
+        count("worktree.deps_cache.miss")
+        return False
+    os.utime(entry / ENTRY_FILE)
+    count("worktree.deps_cache.hit")
+    return True
+
+
+def store_cached_dependencies(*, worktree_path: Path, cmd: List[str], config: Dict[str, Any]) -> Optional[Path]:
+    """Copy the freshly installed dependency dirs into the cache (best-effort)."""
+    dcfg = deps_cache_config(config)
+    if not dcfg["enabled"]:
+        return None
+    key = deps_cache_key(worktree_path, cmd)
+    dirs = _dependency_dirs(worktree_path, dcfg["paths"])
+    if key is None or not dirs:
+        return None
+    root = _cache_root(config)
+    entry = root / key
+    if (entry / ENTRY_FILE).exists():
+        return entry
+
+    ensure_directory(root)
+    tmp = root / f".tmp-{uuid.uuid4().hex}"
+    # Cache contents are copied (or reflinked), never hardlinked: a worktree that
+    # edits a file in place must not corrupt the shared entry.
+    cloner = _Cloner(dcfg["mode"], hardlink=False)
+    try:
+        total = 0
+        rels = [str(d.relative_to(worktree_path)) for d in dirs]
+        for d, rel in zip(dirs, rels, strict=True):
+            total += cloner.tree(d, tmp / TREE_DIR / rel)
+        write_json_atomic(
+            tmp / ENTRY_FILE,
+            {"key": key, "cmd": list(cmd), "paths": rels, "bytes": total, "createdAt": time.time()},
+        )
+        os.rename(tmp, entry)
+    except OSError:
+        # Lost a publish race (entry exists) or ran out of space: the install itself succeeded.
+        shutil.rmtree(tmp, ignore_errors=True)
+        return entry if (entry / ENTRY_FILE).exists() else None
+    count("worktree.deps_cache.store")
+    evict_dependency_cache(config, keep=key)
+    return entry
+
+
+def evict_dependency_cache(config: Dict[str, Any], *, keep: Optional[str] = None) -> List[str]:
+    """Drop least-recently-used entries until the cache fits `maxBytes`."""
+    root = _cache_root(config)
+    if not root.exists():
+        return []
+    budget = deps_cache_config(config)["maxBytes"]
+    entries = []
+    for entry in root.iterdir():
+        meta_path = entry / ENTRY_FILE
+        if entry.name.startswith(".") or not meta_path.is_file():
+            continue
+        try:
+            meta = read_json(meta_path, default={})
+        except (OSError, ValueError):
+            meta = {}
+        size = int(meta.get("bytes") or 0) if isinstance(meta, dict) else 0
+        entries.append((meta_path.stat().st_mtime, entry, size))
+    entries.sort()
+    total = sum(size for _, _, size in entries)
+    evicted: List[str] = []
+    for _, entry, size in entries:
+        if total <= budget:
+            break
+        if entry.name == keep:
+            continue
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
+        evicted.append(entry.name)
+    return evicted
@@ -0,0 +1,342 @@
+"""Pre-warmed worktree pool.
+
+Creating a session worktree runs `git worktree add`, an optional fetch and the
+dependency install synchronously. With `worktrees.pool.enabled` Edison keeps
+`worktrees.pool.size` spare checkouts ready under the pool directory:
+
+- each entry is a detached worktree at the resolved base ref, validated via
+  `validate_worktree_checkout`
+- a `<name>.ready.json` marker next to the entry publishes it; claiming renames the
+  marker, so two session starts never receive the same entry
+- filling an entry runs the frozen dependency install once per lockfile to warm
+  the `worktrees.depsCache` entry, then removes the installed dirs again:
+  installs embed absolute paths (venv shebangs, `node_modules/.bin` shims,
+  editable installs), so an install never travels with the entry
+- a claim moves the entry to the session path, fast-forwards it to the session's
+  start ref on a new session branch, restores dependencies from the warm cache
+  (a reflink/copy, no package manager), runs the post-install commands there and
+  validates the checkout again; without `depsCache` the claim installs in full
+- after a claim the pool is refilled by a detached `edison git worktree-pool --fill`
+  process, so session start never waits for the install
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, cast
+
+from edison.core.utils.git.worktree import get_worktree_parent
+from edison.core.utils.io import ensure_directory, read_json, write_json_atomic
+from edison.core.utils.io.locking import LockTimeoutError, acquire_file_lock
+from edison.core.utils.profiling import count
+from edison.core.utils.subprocess import run_with_timeout
+
+from ..._utils import get_repo_dir
+from ..config_helpers import _config, _worktree_base_dir
+from .deps import maybe_install_deps_and_post_install, warm_dependency_cache
+from .health import validate_worktree_checkout
+from .progress import WorktreeProgress
+from .refs import _resolve_start_ref, resolve_worktree_base_ref
+
+__all__ = [
+    "pool_config",
+    "pool_directory",
+    "list_pool_entries",
+    "fill_worktree_pool",
+    "check_worktree_pool",
+    "claim_pooled_worktree",
+    "acquire_pooled_worktree",
+    "schedule_pool_replenish",
+]
+
+READY_SUFFIX = ".ready.json"
+CLAIMED_SUFFIX = ".claimed.json"
+
+
+def pool_config(cfg: Dict[str, Any]) -> Dict[str, Any]:
+    raw = cfg.get("pool") if isinstance(cfg.get("pool"), dict) else {}
+    try:
+        size = max(0, int(raw.get("size", 2)))
+    except (TypeError, ValueError):
+        size = 2
+    return {
+        "enabled": bool(raw.get("enabled", False)),
+        "size": size,
+        "directory": str(raw.get("directory") or "").strip() or None,
+    }
+
+
+def pool_directory(cfg: Dict[str, Any], repo_dir: Path) -> Path:
+    directory = pool_config(cfg)["directory"]
+    if directory:
+        p = Path(directory)
+        if p.is_absolute():
+            return p
+        return ((get_worktree_parent(repo_dir) or repo_dir) / p).resolve()
+    return _worktree_base_dir(cfg, repo_dir) / "_pool"
+
+
+def _git(args: List[str], *, cwd: Path, timeout: int, check: bool = True) -> subprocess.CompletedProcess[str]:
+    return cast(
+        subprocess.CompletedProcess[str],
+        run_with_timeout(["git", *args], cwd=cwd, capture_output=True, text=True, check=check, timeout=timeout),
+    )
+
+
+def _marker(entry: Path, suffix: str) -> Path:
+    return entry.parent / f"{entry.name}{suffix}"
+
+
+def list_pool_entries(*, repo_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """Return the ready (unclaimed) pool entries, oldest first."""
+    repo = repo_dir or get_repo_dir()
+    root = pool_directory(_config().get_worktree_config(), repo)
+    if not root.exists():
+        return []
+    entries: List[Dict[str, Any]] = []
+    for marker in sorted(root.glob(f"*{READY_SUFFIX}")):
+        data = read_json(marker, default={})
+        if isinstance(data, dict) and data.get("path"):
+            entries.append(data)
+    entries.sort(key=lambda e: float(e.get("createdAt") or 0))
+    return entries
+
+
+def _remove_entry(entry: Path, *, repo_dir: Path, timeout: int) -> None:
+    try:
+        _git(["worktree", "remove", "--force", str(entry)], cwd=repo_dir, timeout=timeout, check=False)
+    except Exception:
+        pass
+    shutil.rmtree(entry, ignore_errors=True)
+    for suffix in (READY_SUFFIX, CLAIMED_SUFFIX):
+        _marker(entry, suffix).unlink(missing_ok=True)
+
+
+def _create_entry(*, repo_dir: Path, root: Path, start_ref: str, cfg: Dict[str, Any]) -> Path:
+    config_obj = _config()
+    t_add = config_obj.get_worktree_timeout("worktree_add", 30)
+    t_health = config_obj.get_worktree_timeout("health_check", 10)
+    t_install = config_obj.get_worktree_timeout("install", 300)
+
+    entry = root / f"wt-{uuid.uuid4().hex[:12]}"
+    try:
+        _git(["worktree", "add", "--detach", "--", str(entry), start_ref], cwd=repo_dir, timeout=t_add)
+        commit = _git(["rev-parse", "HEAD"], cwd=entry, timeout=t_health).stdout.strip()
+        # A detached checkout reports an empty current branch.
+        validate_worktree_checkout(worktree_path=entry, branch_name="", timeout=t_health)
+    except Exception:
+        _remove_entry(entry, repo_dir=repo_dir, timeout=t_add)
+        raise
+    try:
+        warm_dependency_cache(worktree_path=entry, config=cfg, timeout=t_install)
+    except Exception:
+        # A failed warm-up only costs the claimer a full install; keep the entry.
+        count("worktree.pool.warm_failed")
+    write_json_atomic(
+        _marker(entry, READY_SUFFIX),
+        {"path": str(entry), "commit": commit, "baseRef": start_ref, "createdAt": time.time()},
+    )
+    return entry
+
+
+@contextmanager
+def _pool_lock(root: Path, *, timeout: float) -> Iterator[None]:
+    with acquire_file_lock(root / "pool", timeout=timeout, fail_open=False):
+        yield
+
+
+def _check_entries(*, repo_dir: Path, root: Path) -> Dict[str, List[str]]:
+    config_obj = _config()
+    t_health = config_obj.get_worktree_timeout("health_check", 10)
+    healthy: List[str] = []
+    removed: List[str] = []
+    ready = {Path(str(e["path"])).name for e in list_pool_entries(repo_dir=repo_dir)}
+    for entry in sorted(p for p in root.iterdir() if p.is_dir()):
+        if entry.name in ready:
+            try:
+                validate_worktree_checkout(worktree_path=entry, branch_name="", timeout=t_health)
+                healthy.append(str(entry))
+                continue
+            except Exception:
+                if not _claim_marker(entry):
+                    continue  # Claimed meanwhile; the claimer owns it now.
+        elif _marker(entry, CLAIMED_SUFFIX).exists():
+            continue  # Being claimed right now; the claimer moves or removes it.
+        _remove_entry(entry, repo_dir=repo_dir, timeout=t_health)
+        removed.append(str(entry))
+    for marker in root.glob(f"*{READY_SUFFIX}"):
+        if not (root / marker.name[: -len(READY_SUFFIX)]).is_dir():
+            marker.unlink(missing_ok=True)
+    _git(["worktree", "prune"], cwd=repo_dir, timeout=config_obj.get_worktree_timeout("prune", 10), check=False)
+    return {"healthy": healthy, "removed": removed}
+
+
+def check_worktree_pool(*, repo_dir: Optional[Path] = None) -> Dict[str, List[str]]:
+    """Validate ready entries, removing unhealthy ones and orphaned directories."""
+    repo = repo_dir or get_repo_dir()
+    root = pool_directory(_config().get_worktree_config(), repo)
+    if not root.exists():
+        return {"healthy": [], "removed": []}
+    with _pool_lock(root, timeout=float(_config().get_worktree_timeout("install", 300))):
+        return _check_entries(repo_dir=repo, root=root)
+
+
+def fill_worktree_pool(*, repo_dir: Optional[Path] = None, base_branch: Optional[str] = None) -> List[Path]:
+    """Top the pool up to `worktrees.pool.size` ready entries.
+
+    Entries whose commit no longer matches the resolved base ref are recycled so the
+    pool tracks the branch sessions start from. Returns the created entry paths.
+    """
+    repo = repo_dir or get_repo_dir()
+    config_obj = _config()
+    cfg = config_obj.get_worktree_config()
+    pcfg = pool_config(cfg)
+    if not cfg.get("enabled", False) or not pcfg["enabled"] or pcfg["size"] <= 0:
+        return []
+    root = pool_directory(cfg, repo)
+    ensure_directory(root)
+
+    try:
+        with _pool_lock(root, timeout=1.0):
+            _check_entries(repo_dir=repo, root=root)
+            t_branch = config_obj.get_worktree_timeout("branch_check", 10)
+            base_ref = resolve_worktree_base_ref(repo_dir=repo, cfg=cfg, override=base_branch)
+            start_ref = _resolve_start_ref(repo, base_ref, timeout=t_branch)
+            head = _git(["rev-parse", f"{start_ref}^{{commit}}"], cwd=repo, timeout=t_branch).stdout.strip()
+
+            for stale in list_pool_entries(repo_dir=repo):
+                entry = Path(str(stale["path"]))
+                if stale.get("commit") != head and _claim_marker(entry):
+                    _remove_entry(entry, repo_dir=repo, timeout=t_branch)
+            missing = pcfg["size"] - len(list_pool_entries(repo_dir=repo))
+            return [_create_entry(repo_dir=repo, root=root, start_ref=start_ref, cfg=cfg) for _ in range(max(0, missing))]
+    except LockTimeoutError:
+        return []  # Another process is already filling the pool.
+
+
+def _claim_marker(entry: Path) -> bool:
+    try:
+        os.rename(_marker(entry, READY_SUFFIX), _marker(entry, CLAIMED_SUFFIX))
+        return True
+    except OSError:
+        return False
+
+
+def claim_pooled_worktree(
+    *,
+    repo_dir: Path,
+    cfg: Dict[str, Any],
+    worktree_path: Path,
+    branch_name: str,
+    start_ref: str,
+    install_deps: Optional[bool] = None,
+) -> Optional[Path]:
+    """Turn a ready pool entry into the session worktree, or return None.
+
+    The entry must be an ancestor of `start_ref` (the checkout is a fast-forward);
+    otherwise it is discarded and the caller falls back to a fresh worktree.
+    """
+    if not pool_config(cfg)["enabled"]:
+        return None
+    config_obj = _config()
+    t_add = config_obj.get_worktree_timeout("worktree_add", 30)
+    t_health = config_obj.get_worktree_timeout("health_check", 10)
+    t_install = config_obj.get_worktree_timeout("install", 300)
+
+    for data in list_pool_entries(repo_dir=repo_dir):
+        entry = Path(str(data["path"]))
+        if not _claim_marker(entry):
+            continue
+        commit = str(data.get("commit") or "")
+        try:
+            ff = _git(["merge-base", "--is-ancestor", commit, start_ref], cwd=repo_dir, timeout=t_health, check=False)
+            if ff.returncode != 0:
+                raise RuntimeError(f"pool entry {entry.name} is not an ancestor of {start_ref}")
+            ensure_directory(worktree_path.parent)
+            if worktree_path.is_dir() and not any(worktree_path.iterdir()):
+                worktree_path.rmdir()  # `git worktree move` would nest the entry inside it.
+            _git(["worktree", "move", str(entry), str(worktree_path)], cwd=repo_dir, timeout=t_add)
+        except Exception:
+            _remove_entry(entry, repo_dir=repo_dir, timeout=t_add)
+            continue
+        _marker(entry, CLAIMED_SUFFIX).unlink(missing_ok=True)
+
+        try:
+            _git(["checkout", "-b", branch_name, start_ref], cwd=worktree_path, timeout=t_add)
+            maybe_install_deps_and_post_install(
+                worktree_path=worktree_path, config=cfg, install_deps_override=install_deps, timeout=t_install
+            )
+            validate_worktree_checkout(worktree_path=worktree_path, branch_name=branch_name, timeout=t_health)
+        except Exception:
+            _remove_entry(worktree_path, repo_dir=repo_dir, timeout=t_add)
+            _git(["branch", "-D", branch_name], cwd=repo_dir, timeout=t_health, check=False)
+            return None
+        return worktree_path
+    return None
+
+
+def acquire_pooled_worktree(
+    *,
+    repo_dir: Path,
+    cfg: Dict[str, Any],
+    worktree_path: Path,
+    branch_name: str,
+    start_ref: str,
+    install_deps: Optional[bool],
+    fetch_mode: str,
+    progress: WorktreeProgress,
+) -> Optional[Path]:
+    """Claim a pool entry for a new session branch and schedule a refill.
+
+    Returns None (the caller runs `git worktree add`) when the pool is disabled, the
+    session branch already exists, fetching is forced, or no entry could be claimed.
+    """
+    if not pool_config(cfg)["enabled"] or fetch_mode == "always":
+        return None
+    t_branch = _config().get_worktree_timeout("branch_check", 10)
+    branch = _git(["show-ref", "--verify", f"refs/heads/{branch_name}"], cwd=repo_dir, timeout=t_branch, check=False)
+    if branch.returncode == 0:
+        return None
+    t0 = time.perf_counter()
+    claimed = claim_pooled_worktree(
+        repo_dir=repo_dir,
+        cfg=cfg,
+        worktree_path=worktree_path,
+        branch_name=branch_name,
+        start_ref=start_ref,
+        install_deps=install_deps,
+    )
+    if claimed is not None:
+        progress.emit(f"Claimed pre-warmed worktree in {time.perf_counter() - t0:0.2f}s")
+    schedule_pool_replenish(repo_dir=repo_dir)
+    return claimed
+
+
+def schedule_pool_replenish(*, repo_dir: Optional[Path] = None) -> bool:
+    """Refill the pool in a detached background process (best-effort)."""
+    repo = repo_dir or get_repo_dir()
+    cfg = _config().get_worktree_config()
+    if not cfg.get("enabled", False) or not pool_config(cfg)["enabled"]:
+        return False
+    kwargs: Dict[str, Any] = {}
+    if os.name == "posix":
+        kwargs["start_new_session"] = True
+    try:
+        subprocess.Popen(  # noqa: S603
+            [sys.executable, "-m", "edison", "git", "worktree-pool", "--fill"],
+            cwd=str(repo),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            **kwargs,
+        )
+    except Exception:
+        return False
+    return True
@@ -6,6 +6,7 @@ import subprocess
 from pathlib import Path
 from typing import Any, Dict, Optional, cast
 
+from edison.core.utils.git.service import get_git_service
 from edison.core.utils.subprocess import run_with_timeout
 
 from ..config_helpers import _config
@@ -17,6 +18,15 @@ def _primary_head_marker(repo_dir: Path) -> str:
     Worktree operations must never switch the branch (or detached HEAD) of the
     primary worktree. This marker is used to assert that invariant.
     """
+    service = get_git_service()
+    if service is not None:
+        facts = service.facts(repo_dir)
+        if facts is None:
+            return "UNKNOWN"
+        if facts.branch and facts.branch != "HEAD":
+            return facts.branch
+        return f"DETACHED@{facts.head}" if facts.head else "DETACHED"
+
     timeout = _config().get_worktree_timeout("branch_check", 10)
     try:
         cp = run_with_timeout(
@@ -60,7 +70,11 @@ def _resolve_current_base_ref(repo_dir: Path) -> str:
 def _resolve_start_ref(repo_dir: Path, base_ref: str, *, timeout: int) -> str:
     """Resolve a start ref that can be passed to `git worktree add`."""
 
+    service = get_git_service()
+
     def _rev_parse_ok(ref: str) -> bool:
+        if service is not None:
+            return service.objects(repo_dir).info(f"{ref}^{{commit}}") is not None
         rr = cast(
             subprocess.CompletedProcess[str],
             run_with_timeout(
@@ -11,7 +11,8 @@ from edison.core.utils.io import ensure_directory
 from edison.core.utils.subprocess import run_with_timeout
 
 from ..config_helpers import _config
-from .shared_config import parse_shared_paths
+from .meta_setup import ensure_checkout_git_excludes
+from .shared_config import parse_shared_paths, shared_state_cfg
 from .shared_root import resolve_shared_root
 
 
@@ -158,4 +159,22 @@ def ensure_shared_paths_in_checkout(
     return updated, skipped_tracked
 
 
-__all__ = ["ensure_shared_paths_in_checkout"]
+def align_primary_shared_state(*, repo_dir: Path, cfg: Dict[str, Any]) -> None:
+    """Best-effort: link meta-mode shared paths into the primary checkout too."""
+    try:
+        mode = str(shared_state_cfg(cfg).get("mode") or "meta").strip().lower()
+        if mode != "meta":
+            return
+        primary_repo_dir = get_worktree_parent(repo_dir) or repo_dir
+        ensure_shared_paths_in_checkout(
+            checkout_path=primary_repo_dir,
+            repo_dir=primary_repo_dir,
+            cfg=cfg,
+            scope="primary",
+        )
+        ensure_checkout_git_excludes(checkout_path=primary_repo_dir, cfg=cfg, scope="primary")
+    except Exception:
+        return
+
+
+__all__ = ["ensure_shared_paths_in_checkout", "align_primary_shared_state"]
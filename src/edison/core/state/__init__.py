@@ -12,9 +12,11 @@ from .handlers.registries import (
 from .guards import GuardRegistry, registry as guard_registry
 from .conditions import ConditionRegistry, registry as condition_registry
 from .actions import ActionRegistry, registry as action_registry
+from .evaluation import GuardCache, enable_guard_cache, get_active_guard_cache
 from .transitions import (
     EntityTransitionError,
     validate_transition,
+    transition_matrix,
     transition_entity,
 )
 from .loader import load_handlers, load_guards, load_actions, load_conditions
@@ -61,7 +63,12 @@ __all__ = [
     # Unified transitions
     "EntityTransitionError",
     "validate_transition",
+    "transition_matrix",
     "transition_entity",
+    # Guard evaluation cache
+    "GuardCache",
+    "enable_guard_cache",
+    "get_active_guard_cache",
     # Registration decorators
     "register_guard",
     "register_action",
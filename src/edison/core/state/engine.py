@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Iterable, Mapping
 from typing import Any
 
 from ..exceptions import EdisonError
 from .actions import ActionRegistry
 from .conditions import ConditionRegistry
+from .evaluation import get_active_guard_cache
 from .guards import GuardRegistry
 
 
@@ -118,24 +119,18 @@ class RichStateMachine:
             f"Invalid transition {current!r} -> {target!r}: not allowed.{allowed_part}{path_part}"
         )
 
-    def _check_guard(self, transition: Mapping[str, Any], ctx: Mapping[str, Any]) -> None:
-        guard_name = transition.get("guard")
-        if not guard_name:
-            return
-        try:
-            result = self.guards.check(str(guard_name), ctx)
-            try:
-                from edison.core.audit.logger import audit_event
+    def _evaluate(self, kind: str, name: str, ctx: Mapping[str, Any], fn: Callable[[], Any]) -> Any:
+        """Run a guard/condition evaluation through the active guard cache, if any."""
+        cache = get_active_guard_cache()
+        if cache is None:
+            return fn()
+        result, _cached = cache.evaluate(self.name, kind, name, ctx, fn)
+        return result
 
-                audit_event(
-                    "guard.check",
-                    domain=self.name,
-                    guard=str(guard_name),
-                    to=transition.get("to"),
-                    result=bool(result),
-                )
-            except Exception:
-                pass
+    def _run_guard(self, guard_name: str, to_state: Any, ctx: Mapping[str, Any]) -> bool:
+        """Evaluate a guard once and audit the outcome."""
+        try:
+            result = bool(self.guards.check(guard_name, ctx))
         except Exception as exc:
             try:
                 from edison.core.audit.logger import audit_event
@@ -143,42 +138,67 @@ class RichStateMachine:
                 audit_event(
                     "guard.error",
                     domain=self.name,
-                    guard=str(guard_name),
-                    to=transition.get("to"),
+                    guard=guard_name,
+                    to=to_state,
                     error=str(exc),
                 )
             except Exception:
                 pass
+            raise
+        try:
+            from edison.core.audit.logger import audit_event
+
+            audit_event(
+                "guard.check",
+                domain=self.name,
+                guard=guard_name,
+                to=to_state,
+                result=result,
+            )
+            if not result:
+                audit_event(
+                    "guard.blocked",
+                    domain=self.name,
+                    guard=guard_name,
+                    to=to_state,
+                )
+        except Exception:
+            pass
+        return result
+
+    def _check_guard(self, transition: Mapping[str, Any], ctx: Mapping[str, Any]) -> None:
+        guard_name = transition.get("guard")
+        if not guard_name:
+            return
+        name = str(guard_name)
+        # Audit events are emitted per evaluation; cache hits replay the outcome silently.
+        try:
+            result = self._evaluate(
+                "guard", name, ctx, lambda: self._run_guard(name, transition.get("to"), ctx)
+            )
+        except Exception as exc:
             raise StateTransitionError(
                 str(exc),
                 context={"domain": self.name, "guard": guard_name},
             ) from exc
         if not result:
-            try:
-                from edison.core.audit.logger import audit_event
-
-                audit_event(
-                    "guard.blocked",
-                    domain=self.name,
-                    guard=str(guard_name),
-                    to=transition.get("to"),
-                )
-            except Exception:
-                pass
             raise StateTransitionError(
                 f"Guard '{guard_name}' blocked transition",
                 context={"domain": self.name, "guard": guard_name},
             )
 
+    def _condition_passes(self, name: str, ctx: Mapping[str, Any]) -> bool:
+        return bool(self._evaluate("condition", name, ctx, lambda: self.conditions.check(name, ctx)))
+
     def _check_condition(self, cond: Mapping[str, Any], ctx: Mapping[str, Any]) -> None:
         name = cond.get("name")
         if not name:
             return
-        passed = bool(self.conditions.check(str(name), ctx))
+        passed = self._condition_passes(str(name), ctx)
         if not passed:
             for alt in cond.get("or", []) or []:
                 alt_name = alt.get("name")
-                if alt_name and self.conditions.check(str(alt_name), ctx):
+                if alt_name and self._condition_passes(str(alt_name), ctx):
                     passed = True
                     break
         if not passed:
@@ -236,11 +256,15 @@ class RichStateMachine:
     ) -> None:
         """Run actions for a transition filtered by timing.
 
+        Actions change entity state, so cached guard outcomes are dropped once
+        any action has run.
+
         Args:
             transition: Transition spec from state machine config
             ctx: Context dict for action execution
             timing: 'before' or 'after' - only actions with matching timing are executed
         """
+        executed = False
         for action in transition.get("actions", []) or []:
             if not isinstance(action, Mapping):
                 continue
@@ -259,6 +283,11 @@ class RichStateMachine:
                 continue
 
             self.actions.execute(str(name), ctx)
+            executed = True
+
+        cache = get_active_guard_cache()
+        if executed and cache is not None:
+            cache.invalidate()
 
     def validate(
         self,
@@ -315,6 +344,41 @@ class RichStateMachine:
 
         return True
 
+    def evaluate_transitions(
+        self,
+        current: str,
+        *,
+        context: Mapping[str, Any] | None = None,
+        targets: Iterable[str] | None = None,
+    ) -> dict[str, tuple[bool, str]]:
+        """Evaluate guards and conditions for every allowed transition from `current`.
+
+        Actions are never executed. Each target is checked with a copy of
+        `context` that also carries `from_state`/`to_state`.
+
+        Args:
+            current: Current state
+            context: Base context for guard/condition evaluation
+            targets: Restrict evaluation to these targets (default: all allowed)
+
+        Returns:
+            Mapping of target state to (allowed, error_message)
+        """
+        base = dict(context or {})
+        wanted = None if targets is None else {str(t) for t in targets}
+        verdicts: dict[str, tuple[bool, str]] = {}
+        for target in self.allowed_targets(current):
+            target = str(target)
+            if target in verdicts or (wanted is not None and target not in wanted):
+                continue
+            ctx = {**base, "from_state": str(current), "to_state": target}
+            try:
+                self.validate(current, target, context=ctx, execute_actions=False)
+                verdicts[target] = (True, "")
+            except StateTransitionError as exc:
+                verdicts[target] = (False, str(exc))
+        return verdicts
+
     def transitions_map(self) -> dict[str, list[str]]:
         return _flatten_transitions(self.states)
 
@@ -0,0 +1,194 @@
+"""Per-invocation cache for guard and condition evaluations.
+
+Guards such as `can_finish_task` or `can_validate_qa` reread evidence, Context7
+markers, implementation reports and task files on every call. Within one CLI
+invocation (`session next`, preflight checklists, transition matrices) the same
+guard is often evaluated for the same entity with the same inputs many times.
+
+While a `GuardCache` is active, `RichStateMachine` memoizes each guard and
+condition outcome (the boolean result, or the exception it raised) keyed by
+(domain, kind, name, entity id, inputs fingerprint). The fingerprint is a hash
+of the evaluation context minus the per-target `to_state`: guards and
+conditions depend on the entity and its current state, not on which edge is
+being probed, so a transition matrix shares one evaluation across all targets
+of an entity. Contexts that cannot be fingerprinted are never cached. Outside
+an active cache nothing is memoized. A cached failure is re-raised as a fresh
+copy of the original exception so tracebacks do not pile up across hits.
+
+Executing transition actions changes on-disk state, so `RichStateMachine`
+clears the active cache after running actions.
+
+Usage:
+    with enable_guard_cache():
+        ... evaluate many transitions ...
+
+Under `--profile` the `guard.cache.hit` counter is the number of guard and
+condition evaluations avoided.
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Mapping, Optional, Tuple
+
+from edison.core.utils.profiling import count
+
+
+_ACTIVE_GUARD_CACHE: ContextVar["GuardCache | None"] = ContextVar(
+    "_ACTIVE_GUARD_CACHE", default=None
+)
+
+CacheKey = Tuple[str, str, str, str, str]
+
+# Context keys that vary per probed target rather than per entity/state.
+_TARGET_KEYS = frozenset({"to_state"})
+
+
+@dataclass(frozen=True)
+class _Outcome:
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    to_dict = getattr(value, "to_dict", None)
+    if callable(to_dict):
+        return to_dict()
+    # Anything else (live objects, callables) has no stable identity.
+    raise TypeError(f"unfingerprintable {type(value).__name__}")
+
+
+def context_fingerprint(ctx: Mapping[str, Any]) -> Optional[str]:
+    """Return a stable hash of an evaluation context, or None if it has none.
+
+    Keys starting with an underscore are private scratch space for actions and
+    are not part of the inputs; neither is the per-target `to_state`.
+    """
+    try:
+        public = {
+            str(k): v
+            for k, v in ctx.items()
+            if not str(k).startswith("_") and str(k) not in _TARGET_KEYS
+        }
+        raw = json.dumps(public, sort_keys=True, default=_default, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def context_entity_id(ctx: Mapping[str, Any]) -> str:
+    """Best-effort id of the entity a context is about."""
+    explicit = ctx.get("entity_id")
+    if explicit:
+        return str(explicit)
+    for key in (str(ctx.get("entity_type") or ""), "task", "qa", "session"):
+        obj = ctx.get(key) if key else None
+        if isinstance(obj, Mapping) and obj.get("id"):
+            return str(obj["id"])
+    return ""
+
+
+class GuardCache:
+    """Memoized guard/condition outcomes for one invocation."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[CacheKey, _Outcome] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def evaluate(
+        self,
+        domain: str,
+        kind: str,
+        name: str,
+        ctx: Mapping[str, Any],
+        fn: Callable[[], Any],
+    ) -> Tuple[Any, bool]:
+        """Return `(result, cached)` for `fn()`, re-raising a cached exception.
+
+        Args:
+            domain: State machine name ("task", "qa", "session")
+            kind: "guard" or "condition"
+            name: Handler name
+            ctx: Evaluation context (fingerprinted as the inputs)
+            fn: Performs the evaluation on a miss
+        """
+        fingerprint = context_fingerprint(ctx)
+        if fingerprint is None:
+            self.misses += 1
+            count("guard.cache.miss")
+            return fn(), False
+
+        key = (domain, kind, name, context_entity_id(ctx), fingerprint)
+        outcome = self._entries.get(key)
+        if outcome is not None:
+            self.hits += 1
+            count("guard.cache.hit")
+            if outcome.error is not None:
+                raise copy.copy(outcome.error)
+            return outcome.result, True
+
+        self.misses += 1
+        count("guard.cache.miss")
+        try:
+            result = fn()
+        except Exception as exc:
+            try:
+                # A traceback-free copy; each hit raises its own copy of it.
+                self._entries[key] = _Outcome(error=copy.copy(exc))
+            except Exception:
+                pass  # not copyable: leave uncached
+            raise
+        self._entries[key] = _Outcome(result=result)
+        return result, False
+
+    def invalidate(self, entity_id: Optional[str] = None) -> None:
+        """Drop cached outcomes for `entity_id` (or everything when omitted)."""
+        if entity_id is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[3] == str(entity_id)]:
+            del self._entries[key]
+
+
+@contextmanager
+def enable_guard_cache(cache: Optional[GuardCache] = None) -> Iterator[GuardCache]:
+    """Activate a guard cache for this context.
+
+    Without an explicit `cache`, an already active cache is reused so nested
+    scopes (e.g. a checklist inside `session next`) share outcomes.
+    """
+    active = _ACTIVE_GUARD_CACHE.get()
+    if cache is None and active is not None:
+        yield active
+        return
+    token = _ACTIVE_GUARD_CACHE.set(cache or GuardCache())
+    try:
+        yield _ACTIVE_GUARD_CACHE.get()  # type: ignore[misc]
+    finally:
+        _ACTIVE_GUARD_CACHE.reset(token)
+
+
+def get_active_guard_cache() -> Optional[GuardCache]:
+    return _ACTIVE_GUARD_CACHE.get()
+
+
+__all__ = [
+    "GuardCache",
+    "context_entity_id",
+    "context_fingerprint",
+    "enable_guard_cache",
+    "get_active_guard_cache",
+]
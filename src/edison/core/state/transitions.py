@@ -8,6 +8,7 @@ stateful entity through the repository pattern. It handles:
 - Condition evaluation via DomainRegistry  
 - Action execution via DomainRegistry
 - State history tracking
+- Transition matrices (every legal transition for many entities in one pass)
 
 Usage:
     from edison.core.state.transitions import transition_entity
@@ -22,9 +23,11 @@ Usage:
 """
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any, Dict, Mapping, Optional, Protocol, TYPE_CHECKING
 
 from .engine import RichStateMachine, StateTransitionError
+from .evaluation import enable_guard_cache, get_active_guard_cache
 
 if TYPE_CHECKING:
     from edison.core.entity.protocols import StatefulEntity
@@ -68,7 +71,7 @@ def validate_transition(
     to_state: str,
     *,
     context: Optional[Mapping[str, Any]] = None,
-    repo_root: Optional["Path"] = None,
+    repo_root: Optional[Path] = None,
 ) -> tuple[bool, str]:
     """Validate a state transition without executing it.
 
@@ -130,6 +133,48 @@ def validate_transition(
         return False, str(e)
 
 
+def transition_matrix(
+    entity_type: str,
+    subjects: Mapping[str, tuple[str, Mapping[str, Any]]],
+    *,
+    repo_root: Optional[Path] = None,
+) -> Dict[str, Dict[str, tuple[bool, str]]]:
+    """Evaluate every allowed transition for a set of entities in one pass.
+
+    The state machine is built once and all guard/condition evaluations run
+    under one guard cache, so guards shared between entities (or repeated by
+    later checks in the same invocation) are evaluated once. No actions run.
+
+    Args:
+        entity_type: Entity type ("task", "session", "qa")
+        subjects: Mapping of entity id to (current_state, context)
+        repo_root: Optional repository root for config resolution
+
+    Returns:
+        Mapping of entity id to {target_state: (allowed, error_message)};
+        entities without a current state map to an empty dict.
+
+    Raises:
+        MissingStateMachine: If no state machine is configured for entity_type
+    """
+    from edison.core.state.validator import StateValidator
+
+    machine = StateValidator(repo_root=repo_root).get_state_machine(entity_type)
+    matrix: Dict[str, Dict[str, tuple[bool, str]]] = {}
+    with enable_guard_cache():
+        for entity_id, (current, context) in subjects.items():
+            if not current or not str(current).strip():
+                matrix[entity_id] = {}
+                continue
+            ctx = dict(context or {})
+            ctx.setdefault("entity_type", entity_type)
+            ctx.setdefault("entity_id", entity_id)
+            if repo_root:
+                ctx.setdefault("project_root", repo_root)
+            matrix[entity_id] = machine.evaluate_transitions(str(current), context=ctx)
+    return matrix
+
+
 def transition_entity(
     entity_type: str,
     entity_id: str,
@@ -138,7 +183,7 @@ def transition_entity(
     current_state: Optional[str] = None,
     context: Optional[Dict[str, Any]] = None,
     record_history: bool = True,
-    repo_root: Optional["Path"] = None,
+    repo_root: Optional[Path] = None,
 ) -> Dict[str, Any]:
     """Execute a state transition for any entity type.
     
@@ -163,7 +208,6 @@ def transition_entity(
     Raises:
         EntityTransitionError: If transition is not allowed
     """
-    from pathlib import Path
     from edison.core.config.domains.workflow import WorkflowConfig
     # Only consult workflow config when caller does not provide a current state.
     # This allows unit tests and non-workflow entity types to use transition_entity
@@ -225,7 +269,7 @@ def transition_entity(
     # Execute actions for the target state (if machine exists)
     try:
         validator = StateValidator(repo_root=repo_root)
-        machine = validator._machine(entity_type)
+        machine = validator.get_state_machine(entity_type)
         # Execute actions (validation already done above)
         machine.validate(from_state, to_state, context=ctx, execute_actions=True)
     except MissingStateMachine:
@@ -238,6 +282,12 @@ def transition_entity(
     # Record any executed actions in result
     if "_actions" in ctx:
         result["actions_executed"] = ctx["_actions"]
+
+    # The caller persists the new state next; guard outcomes computed against
+    # the old state (for this or related entities) no longer hold.
+    cache = get_active_guard_cache()
+    if cache is not None:
+        cache.invalidate()
     
     return result
 
@@ -245,5 +295,6 @@ def transition_entity(
 __all__ = [
     "EntityTransitionError",
     "validate_transition",
+    "transition_matrix",
     "transition_entity",
 ]
@@ -22,7 +22,12 @@ class StateValidator:
     def __init__(self, repo_root: Optional[Path] = None) -> None:
         self.repo_root = Path(repo_root).resolve() if repo_root else None
 
-    def _machine(self, entity: str) -> RichStateMachine:
+    def get_state_machine(self, entity: str) -> RichStateMachine:
+        """Build the configured state machine for `entity`.
+
+        Raises:
+            MissingStateMachine: If no state machine is configured for `entity`
+        """
         # Use WorkflowConfig as the canonical source for state machine config
         # Note: Cannot use lru_cache since repo_root affects the result
         from edison.core.config.domains.workflow import WorkflowConfig
@@ -47,7 +52,7 @@ class StateValidator:
         *,
         context: Optional[Mapping[str, Any]] = None,
     ) -> None:
-        machine = self._machine(entity)
+        machine = self.get_state_machine(entity)
         machine.validate(current, target, context=context or {}, execute_actions=False)
 
 
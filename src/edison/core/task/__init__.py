@@ -19,6 +19,7 @@ from .repository import TaskRepository
 from .workflow import TaskQAWorkflow
 from .paths import safe_relative
 from .index import TaskIndex, TaskSummary, QASummary, TaskGraph
+from .graph import CompactTaskGraph
 
 # Compatibility layer removed - use TaskRepository directly
 
@@ -110,4 +111,5 @@ __all__ = [
     "TaskSummary",
     "QASummary",
     "TaskGraph",
+    "CompactTaskGraph",
 ]
@@ -0,0 +1,195 @@
+"""Compact adjacency-array view of a task graph.
+
+`CompactTaskGraph` interns task ids to dense integers and stores each relation
+as CSR (compressed sparse row) arrays: `offsets[i]:offsets[i+1]` is the slice of
+`targets` holding node i's neighbours. Every traversal is iterative with a
+`bytearray` visited set, so deep hierarchies cannot hit the recursion limit and
+cycles (which hand-edited frontmatter can contain) terminate.
+
+Relations:
+- children (parent -> child) and the single-parent array
+- dependencies (task -> prerequisite) and dependents (the reverse), built
+  from both `depends_on` and `blocks_tasks` (`A blocks B` is `B depends on A`)
+
+Ids that are referenced but have no task file (a missing parent or dependency)
+are still nodes, so closures report them exactly like the dict-based walks did.
+"""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+if TYPE_CHECKING:
+    from .index import TaskGraph
+
+
+def _csr(n: int, edges: Sequence[Tuple[int, int]]) -> Tuple[array, array]:
+    """Pack (src, dst) pairs into CSR arrays, keeping per-source insertion order."""
+    offsets = array("i", bytes(4 * (n + 1)))
+    for src, _dst in edges:
+        offsets[src + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    targets = array("i", bytes(4 * len(edges)))
+    fill = offsets[:-1]
+    for src, dst in edges:
+        targets[fill[src]] = dst
+        fill[src] += 1
+    return offsets, targets
+
+
+class CompactTaskGraph:
+    """Immutable CSR task graph with cycle-safe traversals."""
+
+    __slots__ = (
+        "ids",
+        "_index",
+        "_parent",
+        "_child_off",
+        "_child_tgt",
+        "_dep_off",
+        "_dep_tgt",
+        "_rdep_off",
+        "_rdep_tgt",
+    )
+
+    def __init__(
+        self,
+        task_ids: Iterable[str],
+        parent_of: Dict[str, str],
+        children: Dict[str, List[str]],
+        dependencies: Dict[str, List[str]],
+        blockers: Optional[Dict[str, List[str]]] = None,
+    ) -> None:
+        ids: List[str] = []
+        index: Dict[str, int] = {}
+
+        def intern(task_id: str) -> int:
+            i = index.get(task_id)
+            if i is None:
+                i = index[task_id] = len(ids)
+                ids.append(task_id)
+            return i
+
+        for task_id in task_ids:
+            intern(task_id)
+        child_edges = [(intern(p), intern(c)) for p, kids in children.items() for c in kids]
+        dep_edges: List[Tuple[int, int]] = []
+        seen: Set[Tuple[int, int]] = set()
+
+        def depend(task_id: str, dep: str) -> None:
+            edge = (intern(task_id), intern(dep))
+            if edge[0] != edge[1] and edge not in seen:
+                seen.add(edge)
+                dep_edges.append(edge)
+
+        for task_id, deps in dependencies.items():
+            for dep in deps:
+                depend(task_id, str(dep))
+        for task_id, blocked in (blockers or {}).items():
+            for other in blocked:
+                depend(str(other), task_id)
+        parent_edges = [(intern(c), intern(p)) for c, p in parent_of.items()]
+
+        n = len(ids)
+        parent = array("i", [-1]) * n
+        for c, p in parent_edges:
+            parent[c] = p
+        self.ids = ids
+        self._index = index
+        self._parent = parent
+        self._child_off, self._child_tgt = _csr(n, child_edges)
+        self._dep_off, self._dep_tgt = _csr(n, dep_edges)
+        self._rdep_off, self._rdep_tgt = _csr(n, [(d, t) for t, d in dep_edges])
+
+    @classmethod
+    def from_graph(cls, graph: "TaskGraph") -> "CompactTaskGraph":
+        parent_of = {tid: t.parent_id for tid, t in graph.tasks.items() if t.parent_id}
+        return cls(graph.tasks, parent_of, graph.parent_children, graph.dependencies, graph.blockers)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._index
+
+    # ---------- Traversals ----------
+
+    def _reach(self, task_ids: Iterable[str], offsets: array, targets: array) -> List[str]:
+        """Breadth-first closure from `task_ids`, excluding the start nodes."""
+        seen = bytearray(len(self.ids))
+        queue: deque[int] = deque()
+        for task_id in task_ids:
+            i = self._index.get(task_id)
+            if i is not None and not seen[i]:
+                seen[i] = 1
+                queue.append(i)
+        out: List[str] = []
+        while queue:
+            i = queue.popleft()
+            for j in targets[offsets[i] : offsets[i + 1]]:
+                if not seen[j]:
+                    seen[j] = 1
+                    out.append(self.ids[j])
+                    queue.append(j)
+        return out
+
+    def children(self, task_id: str) -> List[str]:
+        i = self._index.get(task_id)
+        if i is None:
+            return []
+        return [self.ids[j] for j in self._child_tgt[self._child_off[i] : self._child_off[i + 1]]]
+
+    def descendants(self, *task_ids: str) -> List[str]:
+        """All tasks below any of `task_ids` in the parent/child hierarchy."""
+        return self._reach(task_ids, self._child_off, self._child_tgt)
+
+    def ancestors(self, task_id: str) -> List[str]:
+        """Parent chain of `task_id`, nearest first; stops at a cycle."""
+        i = self._index.get(task_id)
+        if i is None:
+            return []
+        seen = bytearray(len(self.ids))
+        seen[i] = 1
+        out: List[str] = []
+        p = self._parent[i]
+        while p != -1 and not seen[p]:
+            seen[p] = 1
+            out.append(self.ids[p])
+            p = self._parent[p]
+        return out
+
+    def dependency_closure(self, *task_ids: str) -> List[str]:
+        """Everything `task_ids` transitively depend on."""
+        return self._reach(task_ids, self._dep_off, self._dep_tgt)
+
+    def dependent_closure(self, *task_ids: str) -> List[str]:
+        """Everything that transitively depends on `task_ids`."""
+        return self._reach(task_ids, self._rdep_off, self._rdep_tgt)
+
+    def topological_order(self) -> Tuple[List[str], List[str]]:
+        """Order tasks so dependencies come first (Kahn's algorithm).
+
+        Returns:
+            (ordered, cyclic): `cyclic` holds tasks on, or downstream of, a
+            dependency cycle; they cannot be ordered.
+        """
+        n = len(self.ids)
+        dep_off = self._dep_off
+        indegree = array("i", (dep_off[i + 1] - dep_off[i] for i in range(n)))
+        queue: deque[int] = deque(i for i in range(n) if indegree[i] == 0)
+        ordered: List[str] = []
+        rdep_off, rdep_tgt = self._rdep_off, self._rdep_tgt
+        while queue:
+            i = queue.popleft()
+            ordered.append(self.ids[i])
+            for j in rdep_tgt[rdep_off[i] : rdep_off[i + 1]]:
+                indegree[j] -= 1
+                if indegree[j] == 0:
+                    queue.append(j)
+        cyclic = [self.ids[i] for i in range(n) if indegree[i] > 0]
+        return ordered, cyclic
+
+
+__all__ = ["CompactTaskGraph"]
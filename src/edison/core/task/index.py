@@ -17,10 +17,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from edison.core.utils.paths import PathResolver
-from edison.core.utils.text import parse_frontmatter, has_frontmatter
+from edison.core.utils.text import read_frontmatter
 from edison.core.config.domains import TaskConfig
 from edison.core.task.relationships.codec import decode_frontmatter_relationships
 
+from .graph import CompactTaskGraph
+
 
 @dataclass
 class TaskSummary:
@@ -62,11 +64,33 @@ class TaskGraph:
     """Graph of task relationships.
     
     Represents parent/child and dependency relationships between tasks.
+    Closure queries run on a `CompactTaskGraph` snapshot built on first use.
     """
     tasks: Dict[str, TaskSummary] = field(default_factory=dict)
     parent_children: Dict[str, List[str]] = field(default_factory=dict)
     dependencies: Dict[str, List[str]] = field(default_factory=dict)  # task_id -> depends_on
     blockers: Dict[str, List[str]] = field(default_factory=dict)  # task_id -> blocks_tasks
+    _compact: Optional[CompactTaskGraph] = field(default=None, init=False, repr=False, compare=False)
+
+    def add_task(self, summary: TaskSummary) -> None:
+        """Add a task and index its parent and dependency edges."""
+        task_id = summary.id
+        self._compact = None
+        self.tasks[task_id] = summary
+        if summary.parent_id:
+            children = self.parent_children.setdefault(summary.parent_id, [])
+            if task_id not in children:
+                children.append(task_id)
+        if summary.depends_on:
+            self.dependencies[task_id] = summary.depends_on
+        if summary.blocks_tasks:
+            self.blockers[task_id] = summary.blocks_tasks
+
+    def compact(self) -> CompactTaskGraph:
+        """Return the CSR view of this graph, rebuilt after any `add_task`."""
+        if self._compact is None:
+            self._compact = CompactTaskGraph.from_graph(self)
+        return self._compact
     
     def get_children(self, task_id: str) -> List[str]:
         """Get direct children of a task."""
@@ -81,21 +105,20 @@ class TaskGraph:
         return self.blockers.get(task_id, [])
     
     def get_all_ancestors(self, task_id: str) -> Set[str]:
-        """Get all ancestor task IDs (recursive parents)."""
-        ancestors: Set[str] = set()
-        task = self.tasks.get(task_id)
-        if task and task.parent_id:
-            ancestors.add(task.parent_id)
-            ancestors.update(self.get_all_ancestors(task.parent_id))
-        return ancestors
+        """Get all ancestor task IDs (transitive parents; cycle-safe)."""
+        return set(self.compact().ancestors(task_id))
     
     def get_all_descendants(self, task_id: str) -> Set[str]:
-        """Get all descendant task IDs (recursive children)."""
-        descendants: Set[str] = set()
-        for child_id in self.get_children(task_id):
-            descendants.add(child_id)
-            descendants.update(self.get_all_descendants(child_id))
-        return descendants
+        """Get all descendant task IDs (transitive children; cycle-safe)."""
+        return set(self.compact().descendants(task_id))
+
+    def get_all_dependencies(self, task_id: str) -> Set[str]:
+        """Get every task this one transitively waits on (depends_on/blocks; cycle-safe)."""
+        return set(self.compact().dependency_closure(task_id))
+
+    def get_all_dependents(self, task_id: str) -> Set[str]:
+        """Get every task transitively waiting on this one (cycle-safe)."""
+        return set(self.compact().dependent_closure(task_id))
 
 
 class TaskIndex:
@@ -213,11 +236,7 @@ class TaskIndex:
             Frontmatter dict or None if parsing failed
         """
         try:
-            content = path.read_text(encoding="utf-8")
-            if has_frontmatter(content):
-                doc = parse_frontmatter(content)
-                return doc.frontmatter
-            return {}
+            return read_frontmatter(path)
         except Exception:
             return None
     
@@ -386,43 +405,81 @@ class TaskIndex:
             # Filter by session if specified
             if session_id and fm.get("session_id") != session_id:
                 continue
-            
-            state = path.parent.name
-            task_id = fm.get("id", path.stem)
-
-            _rels, derived = decode_frontmatter_relationships(fm)
-            summary = TaskSummary(
-                id=task_id,
-                path=path,
-                state=state,
-                session_id=fm.get("session_id"),
-                parent_id=derived.get("parent_id"),
-                child_ids=derived.get("child_ids", []) or [],
-                depends_on=derived.get("depends_on", []) or [],
-                blocks_tasks=derived.get("blocks_tasks", []) or [],
-                related=derived.get("related", []) or [],
-                owner=fm.get("owner"),
-                title=fm.get("title"),
-            )
-            
-            graph.tasks[task_id] = summary
-            
-            # Build parent->children mapping
-            if summary.parent_id:
-                if summary.parent_id not in graph.parent_children:
-                    graph.parent_children[summary.parent_id] = []
-                if task_id not in graph.parent_children[summary.parent_id]:
-                    graph.parent_children[summary.parent_id].append(task_id)
-            
-            # Build dependencies
-            if summary.depends_on:
-                graph.dependencies[task_id] = summary.depends_on
-            
-            # Build blockers
-            if summary.blocks_tasks:
-                graph.blockers[task_id] = summary.blocks_tasks
+            graph.add_task(self._summary_from_frontmatter(path, fm))
         
         return graph
+
+    def get_task_subgraph(
+        self,
+        root_task_ids: List[str],
+        *,
+        include_session_tasks: bool = True,
+    ) -> TaskGraph:
+        """Build the graph of `root_task_ids` and their hierarchy below them.
+
+        Unlike `get_task_graph`, only the subtree's task files are read: task
+        files are located by name from a directory listing, and children are
+        followed through each parent's `child` edges (kept symmetric with the
+        children's `parent` edges by the relationship service).
+
+        Args:
+            root_task_ids: Subtree roots
+            include_session_tasks: Also look in session task directories
+
+        Returns:
+            TaskGraph restricted to the subtree(s)
+        """
+        files = self._task_files_by_id(include_session_tasks=include_session_tasks)
+        graph = TaskGraph()
+        pending = list(dict.fromkeys(str(t) for t in root_task_ids))
+        seen: Set[str] = set(pending)
+        while pending:
+            task_id = pending.pop()
+            path = files.get(task_id)
+            fm = self._extract_frontmatter(path) if path is not None else None
+            if not fm:
+                continue
+            summary = self._summary_from_frontmatter(path, fm)
+            graph.add_task(summary)
+            for child_id in summary.child_ids:
+                if child_id not in seen:
+                    seen.add(child_id)
+                    pending.append(child_id)
+        return graph
+
+    def _task_files_by_id(self, *, include_session_tasks: bool = True) -> Dict[str, Path]:
+        """Map task file stems to paths without reading any file."""
+        files: Dict[str, Path] = {}
+        tasks_root = self._get_tasks_root()
+        if tasks_root.exists():
+            for md_file in tasks_root.rglob("*.md"):
+                if md_file.name != "TEMPLATE.md":
+                    files.setdefault(md_file.stem, md_file)
+        if include_session_tasks:
+            sessions_root = self._get_sessions_root()
+            if sessions_root.exists():
+                for session_dir in sessions_root.rglob("tasks"):
+                    if session_dir.is_dir():
+                        for md_file in session_dir.rglob("*.md"):
+                            files.setdefault(md_file.stem, md_file)
+        return files
+
+    def _summary_from_frontmatter(self, path: Path, fm: Dict[str, Any]) -> TaskSummary:
+        """Build a TaskSummary from a task file's frontmatter (state from directory)."""
+        _rels, derived = decode_frontmatter_relationships(fm)
+        return TaskSummary(
+            id=fm.get("id", path.stem),
+            path=path,
+            state=path.parent.name,
+            session_id=fm.get("session_id"),
+            parent_id=derived.get("parent_id"),
+            child_ids=derived.get("child_ids", []) or [],
+            depends_on=derived.get("depends_on", []) or [],
+            blocks_tasks=derived.get("blocks_tasks", []) or [],
+            related=derived.get("related", []) or [],
+            owner=fm.get("owner"),
+            title=fm.get("title"),
+        )
     
     def find_unclaimed_tasks(self) -> List[TaskSummary]:
         """Find all tasks that are not claimed by any session.
@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Optional
 
-from edison.core.task.index import TaskIndex, TaskSummary
+from edison.core.task.index import TaskSummary
 from edison.core.task.readiness import BlockedByDependency, TaskReadinessEvaluator
 
 
@@ -135,17 +135,19 @@ class TaskPlanner:
     def build_plan(self, *, session_id: Optional[str] = None) -> TaskPlan:
         # By default, compute waves from the global backlog (tasks root). Session-scoped
         # tasks are only included when an explicit session filter is requested.
-        include_session_tasks = bool(session_id)
-        graph = TaskIndex(project_root=self.project_root).get_task_graph(
-            session_id=session_id,
-            include_session_tasks=include_session_tasks,
-        )
+        index = self._readiness.readiness_index()
+        if session_id:
+            tasks: Mapping[str, TaskSummary] = {
+                tid: t for tid, t in index.tasks.items() if t.session_id == session_id
+            }
+        else:
+            tasks = index.global_tasks
 
         todo_state = self._readiness.todo_state()
         satisfied_states = self._readiness.dependency_satisfied_states()
 
         todo_tasks: dict[str, TaskSummary] = {
-            tid: t for tid, t in graph.tasks.items() if t.state == todo_state
+            tid: t for tid, t in tasks.items() if t.state == todo_state
         }
         todo_ids = set(todo_tasks.keys())
 
@@ -156,7 +158,7 @@ class TaskPlanner:
                 dep_id = str(dep)
                 if dep_id in todo_ids:
                     continue
-                dep_task = graph.tasks.get(dep_id)
+                dep_task = tasks.get(dep_id)
                 if dep_task is None:
                     blocked_by.setdefault(tid, []).append(
                         BlockedByDependency(
@@ -6,7 +6,9 @@ This module derives:
 - blocked: task is in semantic "todo" but has unmet dependencies (with "why")
 
 These semantics are computed from the graph (frontmatter), not just a static
-"todo/wip/done" state.
+"todo/wip/done" state. Task summaries and unmet-dependency counters come from
+the persisted `TaskReadinessIndex`, so repeated queries only re-read task files
+that changed since the last one.
 """
 
 from __future__ import annotations
@@ -17,7 +19,8 @@ from typing import Any, Optional
 
 from edison.core.config.domains.task import TaskConfig
 from edison.core.config.domains.workflow import WorkflowConfig
-from edison.core.task.index import TaskGraph, TaskIndex, TaskSummary
+from edison.core.task.index import TaskGraph, TaskSummary
+from edison.core.task.readiness_index import TaskReadinessIndex, get_readiness_index
 
 
 @dataclass(frozen=True)
@@ -122,12 +125,17 @@ class TaskReadinessEvaluator:
         val = cfg.get("treatMissingDependencyAsBlocked")
         return True if val is None else bool(val)
 
+    def readiness_index(self) -> TaskReadinessIndex:
+        """Return the refreshed readiness index for the configured states."""
+        return get_readiness_index(
+            project_root=self.project_root,
+            todo_state=self.todo_state(),
+            satisfied_states=self.dependency_satisfied_states(),
+        )
+
     def _full_graph(self) -> TaskGraph:
         """Return full graph including all session tasks (for diagnostics)."""
-        return TaskIndex(project_root=self.project_root).get_task_graph(
-            session_id=None,
-            include_session_tasks=True,
-        )
+        return self.readiness_index().graph()
 
     def _scoped_graph(self, *, full: TaskGraph, session_id: Optional[str]) -> TaskGraph:
         """Return a graph view scoped to global + (optional) one session.
@@ -157,37 +165,34 @@ class TaskReadinessEvaluator:
             scoped_task = task
         return self._evaluate_summary(scoped_task, scoped, full)
 
-    def list_ready_tasks(self, *, session_id: Optional[str] = None) -> list[TaskReadiness]:
-        full = self._full_graph()
+    def _evaluate_todo(self, *, session_id: Optional[str]) -> list[TaskReadiness]:
+        """Evaluate every todo task in scope, sorted by id.
+
+        Tasks whose dependencies all exist and are satisfied (the index's ready
+        candidates) are ready without re-checking, unless a dependency falls
+        outside the scope; everything else gets a full evaluation.
+        """
+        index = self.readiness_index()
+        full = index.graph()
         graph = self._scoped_graph(full=full, session_id=session_id)
-        todo_state = self.todo_state()
         out: list[TaskReadiness] = []
-        for t in graph.tasks.values():
-            if t.state != todo_state:
+        for tid in sorted(index.todo_ids()):
+            t = graph.tasks.get(tid)
+            if t is None:
                 continue
             if session_id is not None and t.session_id != session_id:
                 continue
-            r = self._evaluate_summary(t, graph, full)
-            if r.ready:
-                out.append(r)
-        out.sort(key=lambda r: r.task.id)
+            if tid in index.ready_candidates and all(str(d) in graph.tasks for d in t.depends_on or []):
+                out.append(TaskReadiness(task=t, ready=True))
+            else:
+                out.append(self._evaluate_summary(t, graph, full))
         return out
 
+    def list_ready_tasks(self, *, session_id: Optional[str] = None) -> list[TaskReadiness]:
+        return [r for r in self._evaluate_todo(session_id=session_id) if r.ready]
+
     def list_blocked_tasks(self, *, session_id: Optional[str] = None) -> list[TaskReadiness]:
-        full = self._full_graph()
-        graph = self._scoped_graph(full=full, session_id=session_id)
-        todo_state = self.todo_state()
-        out: list[TaskReadiness] = []
-        for t in graph.tasks.values():
-            if t.state != todo_state:
-                continue
-            if session_id is not None and t.session_id != session_id:
-                continue
-            r = self._evaluate_summary(t, graph, full)
-            if not r.ready and r.blocked_by:
-                out.append(r)
-        out.sort(key=lambda r: r.task.id)
-        return out
+        return [r for r in self._evaluate_todo(session_id=session_id) if not r.ready and r.blocked_by]
 
     def _evaluate_summary(self, task: TaskSummary, graph: TaskGraph, full: TaskGraph) -> TaskReadiness:
         todo_state = self.todo_state()
@@ -0,0 +1,422 @@
+"""Persisted, incrementally maintained task readiness index.
+
+Orchestrators ask "what's ready?" after every task completes. Instead of
+re-reading every task file and re-evaluating every dependency on each call,
+this index keeps, per task file, its stat signature and `TaskSummary`, and per
+task two unmet-dependency counters over the `depends_on` DAG:
+
+- unsatisfied: dependencies that exist but are not in a satisfied state
+- missing: dependencies with no task file
+
+A todo task with both counters at zero is a ready candidate; any other todo
+task is a blocked candidate. `refresh()` stats the task directories, re-reads
+only files whose (mtime_ns, size, inode) changed, and recomputes counters only
+for changed tasks and their direct dependents, so the work after a task moves
+is O(changed). The index is persisted as JSON under
+`<management-root>/cache/` and shared by all readers in one process.
+
+Files modified within `RACY_WINDOW_NS` of a scan are re-read on the next
+refresh, since a same-size rewrite inside one mtime tick is otherwise
+invisible. Changing the todo/satisfied state configuration recomputes every
+counter (without re-reading files).
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from edison.core.config.cache import register_cache_clearer
+from edison.core.utils.io import read_json, write_json_atomic
+from edison.core.utils.io.file_cache import RACY_WINDOW_NS
+from edison.core.utils.profiling import count
+
+from .index import TaskGraph, TaskIndex, TaskSummary
+
+INDEX_VERSION = 1
+
+Signature = Tuple[int, int, int]  # (mtime_ns, size, inode)
+
+GLOBAL = "global"
+SESSION = "session"
+
+
+def _walk_md(root: Path, *, skip_template: bool) -> Iterable[Tuple[Path, os.stat_result]]:
+    """Yield (path, stat) for every markdown file below `root`, in sorted order."""
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+        subdirs: List[Path] = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(Path(entry.path))
+            elif entry.name.endswith(".md") and not (skip_template and entry.name == "TEMPLATE.md"):
+                try:
+                    yield Path(entry.path), entry.stat()
+                except OSError:
+                    continue
+        stack.extend(reversed(subdirs))
+
+
+def _session_task_dirs(sessions_root: Path) -> List[Path]:
+    """Every directory named `tasks` below the sessions root."""
+    found: List[Path] = []
+    stack = [sessions_root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                dirs = sorted((e for e in it if e.is_dir(follow_symlinks=False)), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in dirs:
+            if entry.name == "tasks":
+                found.append(Path(entry.path))
+            else:
+                stack.append(Path(entry.path))
+    return sorted(found)
+
+
+def _summary_to_dict(summary: TaskSummary, project_root: Path) -> Dict[str, Any]:
+    try:
+        path = str(summary.path.relative_to(project_root))
+    except ValueError:
+        path = str(summary.path)
+    return {
+        "id": summary.id,
+        "path": path,
+        "state": summary.state,
+        "session_id": summary.session_id,
+        "parent_id": summary.parent_id,
+        "child_ids": list(summary.child_ids),
+        "depends_on": list(summary.depends_on),
+        "blocks_tasks": list(summary.blocks_tasks),
+        "related": list(summary.related),
+        "owner": summary.owner,
+        "title": summary.title,
+    }
+
+
+def _summary_from_dict(data: Dict[str, Any], project_root: Path) -> TaskSummary:
+    return TaskSummary(
+        id=str(data["id"]),
+        path=project_root / str(data["path"]),
+        state=str(data["state"]),
+        session_id=data.get("session_id"),
+        parent_id=data.get("parent_id"),
+        child_ids=list(data.get("child_ids") or []),
+        depends_on=list(data.get("depends_on") or []),
+        blocks_tasks=list(data.get("blocks_tasks") or []),
+        related=list(data.get("related") or []),
+        owner=data.get("owner"),
+        title=data.get("title"),
+    )
+
+
+class _FileEntry:
+    __slots__ = ("signature", "source", "summary")
+
+    def __init__(self, signature: Signature, source: str, summary: Optional[TaskSummary]) -> None:
+        self.signature = signature
+        self.source = source
+        self.summary = summary
+
+
+class TaskReadinessIndex:
+    """Task summaries plus unmet-dependency counters, refreshed incrementally."""
+
+    def __init__(
+        self,
+        *,
+        project_root: Path,
+        todo_state: str,
+        satisfied_states: Iterable[str],
+        path: Optional[Path] = None,
+    ) -> None:
+        self.project_root = Path(project_root)
+        self.todo_state = str(todo_state)
+        self.satisfied_states: FrozenSet[str] = frozenset(str(s) for s in satisfied_states)
+        if path is None:
+            from edison.core.utils.paths.management import ProjectManagementPaths
+
+            path = ProjectManagementPaths(self.project_root).get_management_root() / "cache" / "task-readiness.json"
+        self.path = path
+        self._task_index = TaskIndex(project_root=self.project_root)
+        self._lock = threading.RLock()
+
+        self._files: Dict[str, _FileEntry] = {}
+        self.tasks: Dict[str, TaskSummary] = {}
+        self.global_tasks: Dict[str, TaskSummary] = {}
+        self.dependents: Dict[str, Set[str]] = {}
+        self.unsatisfied: Dict[str, int] = {}
+        self.missing: Dict[str, int] = {}
+        self.ready_candidates: Set[str] = set()
+        self.blocked_candidates: Set[str] = set()
+        self._graph: Optional[TaskGraph] = None
+        self._loaded = False
+        self._dirty = False
+
+    # ---------- Persistence ----------
+
+    def _policy(self) -> Dict[str, Any]:
+        return {"todo": self.todo_state, "satisfied": sorted(self.satisfied_states)}
+
+    def _load(self) -> None:
+        try:
+            data = read_json(self.path, default={})
+        except Exception:
+            data = {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return
+        try:
+            for rel, raw in (data.get("files") or {}).items():
+                task = raw.get("task")
+                self._files[rel] = _FileEntry(
+                    tuple(raw["sig"]),  # type: ignore[arg-type]
+                    str(raw.get("source") or GLOBAL),
+                    _summary_from_dict(task, self.project_root) if task else None,
+                )
+            self._rebuild_tasks()
+            if data.get("policy") == self._policy():
+                self.unsatisfied = {k: int(v) for k, v in (data.get("unsatisfied") or {}).items()}
+                self.missing = {k: int(v) for k, v in (data.get("missing") or {}).items()}
+                self.dependents = {k: set(v) for k, v in (data.get("dependents") or {}).items()}
+                self.ready_candidates = set(data.get("ready") or [])
+                self.blocked_candidates = set(data.get("blocked") or [])
+            else:
+                self._recompute_all()
+                self._dirty = True
+        except (KeyError, TypeError, ValueError):
+            self._files.clear()
+            self._rebuild_tasks()
+            self._recompute_all()
+
+    def save(self) -> None:
+        """Persist the index (best-effort; the index is a cache)."""
+        with self._lock:
+            data = {
+                "version": INDEX_VERSION,
+                "policy": self._policy(),
+                "files": {
+                    rel: {
+                        "sig": list(entry.signature),
+                        "source": entry.source,
+                        "task": _summary_to_dict(entry.summary, self.project_root) if entry.summary else None,
+                    }
+                    for rel, entry in self._files.items()
+                },
+                "unsatisfied": {k: v for k, v in self.unsatisfied.items() if v},
+                "missing": {k: v for k, v in self.missing.items() if v},
+                "dependents": {k: sorted(v) for k, v in self.dependents.items() if v},
+                "ready": sorted(self.ready_candidates),
+                "blocked": sorted(self.blocked_candidates),
+            }
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                write_json_atomic(self.path, data, indent=0, acquire_lock=False)
+                self._dirty = False
+            except Exception:
+                pass
+
+    # ---------- Refresh ----------
+
+    def _scan(self) -> List[Tuple[str, str, Path, os.stat_result]]:
+        """Stat every task file, in the same roots as `TaskIndex.scan_all_task_files`."""
+        found: List[Tuple[str, str, Path, os.stat_result]] = []
+        tasks_root = self._task_index._get_tasks_root()
+        for path, st in _walk_md(tasks_root, skip_template=True):
+            found.append((self._rel(path), GLOBAL, path, st))
+        sessions_root = self._task_index._get_sessions_root()
+        for tasks_dir in _session_task_dirs(sessions_root):
+            for path, st in _walk_md(tasks_dir, skip_template=False):
+                found.append((self._rel(path), SESSION, path, st))
+        return found
+
+    def _rel(self, path: Path) -> str:
+        try:
+            return str(path.relative_to(self.project_root))
+        except ValueError:
+            return str(path)
+
+    def refresh(self) -> Set[str]:
+        """Bring the index up to date with the task files.
+
+        Returns:
+            Ids of tasks whose summary or counters changed
+        """
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                self._load()
+
+            old_tasks = dict(self.tasks)
+            now = time.time_ns()
+            seen: Set[str] = set()
+            changed_files = False
+            files: Dict[str, _FileEntry] = {}
+            for rel, source, path, st in self._scan():
+                seen.add(rel)
+                signature: Signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+                entry = self._files.get(rel)
+                if entry is None or entry.signature != signature or entry.source != source:
+                    changed_files = True
+                    count("task.readiness.parse")
+                    fm = self._task_index._extract_frontmatter(path)
+                    summary = self._task_index._summary_from_frontmatter(path, fm) if fm is not None else None
+                    if now - st.st_mtime_ns < RACY_WINDOW_NS:
+                        # Re-read next time: a same-size rewrite in this tick would look unchanged.
+                        signature = (0, 0, 0)
+                    entry = _FileEntry(signature, source, summary)
+                files[rel] = entry
+            if set(self._files) - seen:
+                changed_files = True
+            self._files = files
+
+            if not changed_files:
+                if self._dirty:
+                    self.save()
+                return set()
+
+            self._rebuild_tasks()
+            changed = {
+                tid
+                for tid in set(old_tasks) | set(self.tasks)
+                if old_tasks.get(tid) != self.tasks.get(tid)
+            }
+            self._apply_changes(old_tasks, changed)
+            self.save()
+            return changed
+
+    def _rebuild_tasks(self) -> None:
+        tasks: Dict[str, TaskSummary] = {}
+        global_tasks: Dict[str, TaskSummary] = {}
+        for entry in sorted(self._files.values(), key=lambda e: e.source != GLOBAL):
+            if entry.summary is not None:
+                # Later files win (session over global), matching TaskGraph.add_task.
+                tasks[entry.summary.id] = entry.summary
+                if entry.source == GLOBAL:
+                    global_tasks[entry.summary.id] = entry.summary
+        self.tasks = tasks
+        self.global_tasks = global_tasks
+        self._graph = None
+
+    # ---------- Counters ----------
+
+    def _satisfied(self, summary: Optional[TaskSummary]) -> bool:
+        return summary is not None and summary.state in self.satisfied_states
+
+    def _recount(self, task_id: str) -> None:
+        task = self.tasks.get(task_id)
+        self.ready_candidates.discard(task_id)
+        self.blocked_candidates.discard(task_id)
+        if task is None:
+            self.unsatisfied.pop(task_id, None)
+            self.missing.pop(task_id, None)
+            return
+        unsatisfied = missing = 0
+        for dep_id in dict.fromkeys(str(d) for d in task.depends_on or []):
+            dep = self.tasks.get(dep_id)
+            if dep is None:
+                missing += 1
+            elif dep.state not in self.satisfied_states:
+                unsatisfied += 1
+        self.unsatisfied[task_id] = unsatisfied
+        self.missing[task_id] = missing
+        if task.state == self.todo_state:
+            if unsatisfied or missing:
+                self.blocked_candidates.add(task_id)
+            else:
+                self.ready_candidates.add(task_id)
+
+    def _recompute_all(self) -> None:
+        self.dependents = {}
+        for task_id, task in self.tasks.items():
+            for dep_id in task.depends_on or []:
+                self.dependents.setdefault(str(dep_id), set()).add(task_id)
+        self.unsatisfied, self.missing = {}, {}
+        self.ready_candidates, self.blocked_candidates = set(), set()
+        for task_id in self.tasks:
+            self._recount(task_id)
+
+    def _apply_changes(self, old_tasks: Dict[str, TaskSummary], changed: Set[str]) -> None:
+        affected: Set[str] = set()
+        for task_id in changed:
+            old, new = old_tasks.get(task_id), self.tasks.get(task_id)
+            old_deps = {str(d) for d in (old.depends_on if old else [])}
+            new_deps = {str(d) for d in (new.depends_on if new else [])}
+            for dep_id in old_deps - new_deps:
+                users = self.dependents.get(dep_id)
+                if users is not None:
+                    users.discard(task_id)
+                    if not users:
+                        del self.dependents[dep_id]
+            for dep_id in new_deps - old_deps:
+                self.dependents.setdefault(dep_id, set()).add(task_id)
+            affected.add(task_id)
+            if (old is None) != (new is None) or self._satisfied(old) != self._satisfied(new):
+                affected |= self.dependents.get(task_id, set())
+        for task_id in affected:
+            self._recount(task_id)
+
+    # ---------- Views ----------
+
+    def todo_ids(self) -> Set[str]:
+        """Ids of all tasks in the todo state (ready or blocked candidates)."""
+        with self._lock:
+            return self.ready_candidates | self.blocked_candidates
+
+    def graph(self) -> TaskGraph:
+        """Full task graph (global and session tasks) built from the index."""
+        with self._lock:
+            if self._graph is None:
+                graph = TaskGraph()
+                for task in self.tasks.values():
+                    graph.add_task(task)
+                self._graph = graph
+            return self._graph
+
+
+_INDEXES: Dict[Tuple[str, str, FrozenSet[str]], TaskReadinessIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_readiness_index(
+    *,
+    project_root: Path,
+    todo_state: str,
+    satisfied_states: Iterable[str],
+) -> TaskReadinessIndex:
+    """Return the refreshed readiness index shared by this process."""
+    satisfied = frozenset(str(s) for s in satisfied_states)
+    key = (os.path.abspath(project_root), str(todo_state), satisfied)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _INDEXES[key] = TaskReadinessIndex(
+                project_root=Path(project_root), todo_state=todo_state, satisfied_states=satisfied
+            )
+    index.refresh()
+    return index
+
+
+def clear_readiness_indexes() -> None:
+    """Drop in-memory readiness indexes (the persisted files are kept)."""
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
+
+
+register_cache_clearer("task.readiness_index", clear_readiness_indexes)
+
+
+__all__ = [
+    "TaskReadinessIndex",
+    "clear_readiness_indexes",
+    "get_readiness_index",
+]
@@ -197,3 +197,83 @@ class TaskRelationshipService:
 
         self.repo.save(a)
         self.repo.save(b)
+
+    def replace_depends_on(self, depends_on: Dict[str, List[str]], *, staged: bool = False) -> List[str]:
+        """Replace the `depends_on` edges of many tasks in one batched write.
+
+        Equivalent to calling `remove()` for each existing `depends_on` edge and
+        `add()` for each desired one (inverse `blocks` edges are maintained on old
+        and new dependencies), but loads each task once and persists the changed
+        tasks with a single `save_many`. Validation happens before any write.
+
+        Args:
+            depends_on: Desired dependency ids per task id
+            staged: Publish all changed task files or none
+
+        Returns:
+            Ids of tasks whose relationships changed
+
+        Raises:
+            PersistenceError: If a task or dependency does not exist, or a task
+                would depend on itself
+        """
+        changed = self.plan_depends_on(depends_on)
+        self.repo.save_many(changed, staged=staged)
+        return [t.id for t in changed]
+
+    def plan_depends_on(
+        self,
+        depends_on: Dict[str, List[str]],
+        *,
+        pending: Optional[Dict[str, Task]] = None,
+        skip_missing: bool = False,
+    ) -> List[Task]:
+        """Apply `replace_depends_on` edits in memory and return the changed tasks.
+
+        Tasks in `pending` (e.g. an import batch not yet written) are edited in
+        place instead of being loaded from disk; nothing is saved. With
+        `skip_missing`, task ids in `depends_on` that do not exist are skipped
+        (as importers did before batching) instead of raising.
+
+        Raises:
+            PersistenceError: If a task or dependency does not exist, or a task
+                would depend on itself
+        """
+        tasks: Dict[str, Task] = {}
+        edges: Dict[str, List[RelationshipEdge]] = {}
+
+        def _edges_of(task_id: str) -> List[RelationshipEdge]:
+            if task_id not in edges:
+                task = (pending or {}).get(task_id) or self.repo.get(task_id)
+                if not task:
+                    raise PersistenceError(f"Task not found: {task_id}")
+                tasks[task_id] = task
+                edges[task_id] = encode_task_relationships(task)
+            return edges[task_id]
+
+        for raw_id, desired in depends_on.items():
+            a_id = str(raw_id).strip()
+            if skip_missing and a_id not in (pending or {}) and not self.repo.exists(a_id):
+                continue
+            current = _edges_of(a_id)
+            for e in current:
+                if str(e.get("type") or "").strip() == "depends_on":
+                    old = str(e.get("target") or "").strip()
+                    edges[old] = _remove_edges(_edges_of(old), "blocks", targets={a_id})
+            edges[a_id] = _remove_edges(edges[a_id], "depends_on")
+            for raw_dep in desired:
+                b_id = str(raw_dep).strip()
+                if b_id == a_id:
+                    raise PersistenceError("Cannot add relationship to self")
+                dep_edges = _edges_of(b_id)
+                edges[a_id].append(_edge("depends_on", b_id))
+                dep_edges.append(_edge("blocks", a_id))
+
+        changed: List[Task] = []
+        for task_id, task_edges in edges.items():
+            normalized = normalize_relationships(task_edges)
+            task = tasks[task_id]
+            if normalized != normalize_relationships(encode_task_relationships(task)):
+                _apply_edges_to_task(task, normalized)
+                changed.append(task)
+        return changed
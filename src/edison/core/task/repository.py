@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional
 from edison.data import get_data_path
 from edison.core.entity import (
     BaseRepository,
+    BulkSaveMixin,
     FileRepositoryMixin,
     SessionScopedMixin,
     EntityId,
@@ -37,6 +38,7 @@ class TaskRepository(
     BaseRepository[Task],
     FileRepositoryMixin[Task],
     SessionScopedMixin[Task],
+    BulkSaveMixin[Task],
 ):
     """File-based repository for task entities.
 
@@ -46,7 +48,8 @@ class TaskRepository(
     - <project-management-dir>/tasks/done/
     - <project-management-dir>/tasks/validated/
 
-    Supports session-scoped storage via SessionScopedMixin.
+    Supports session-scoped storage via SessionScopedMixin and batched
+    saves via BulkSaveMixin.save_many.
     """
 
     entity_type: str = "task"
@@ -128,22 +131,25 @@ class TaskRepository(
         """
         return self._resolve_session_record_path(task_id, session_id, state)
 
+    def _target_path(self, entity: Task) -> Path:
+        """Path a task is written to for its current session and state."""
+        if entity.session_id:
+            return self._resolve_session_task_path(entity.id, entity.session_id, entity.state)
+        return self._resolve_entity_path(entity.id, entity.state)
+
     # ---------- CRUD Implementation ----------
     
     def _do_create(self, entity: Task) -> Task:
         """Create a new task file."""
-        if entity.session_id:
-            path = self._resolve_session_task_path(entity.id, entity.session_id, entity.state)
-        else:
-            path = self._resolve_entity_path(entity.id, entity.state)
+        path = self._target_path(entity)
         
         # Ensure directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
         
         # Write task as markdown (preserving any extra frontmatter keys from the template)
-        extra, body = self._render_task_template(entity)
-        content = self._task_to_markdown(entity, body=body, extra_frontmatter=extra)
+        content = self._render_for_save(entity, None)
         path.write_text(content, encoding="utf-8")
+        self._invalidate_cached(path)
         
         return entity
     
@@ -152,7 +158,10 @@ class TaskRepository(
         path = self._find_entity_path(entity_id)
         if path is None:
             return None
+        return self._load_cached(path, self._read_task_strict)
 
+    def _read_task_strict(self, path: Path) -> Task:
+        """Read and parse a task file, raising on legacy/unparseable content."""
         # Strict load for direct lookup: if a file exists but is legacy/unparseable,
         # surface an actionable error instead of pretending the task doesn't exist.
         content = path.read_text(encoding="utf-8", errors="strict")
@@ -175,39 +184,30 @@ class TaskRepository(
         current_path = self._find_entity_path(entity.id)
         
         # Determine target path
-        if entity.session_id:
-            target_path = self._resolve_session_task_path(entity.id, entity.session_id, entity.state)
-        else:
-            target_path = self._resolve_entity_path(entity.id, entity.state)
+        target_path = self._target_path(entity)
         
         if current_path is None:
             self._do_create(entity)
             return
 
-        # Preserve existing body (tasks are human/LLM-edited documents).
-        content_existing = current_path.read_text(encoding="utf-8", errors="strict")
-        if not has_frontmatter(content_existing):
-            raise PersistenceError(
-                f"Task file at {current_path} is missing YAML frontmatter. "
-                "Restore the file from the composed template or recreate the task via `edison task new`."
-            )
-        doc = parse_frontmatter(content_existing)
-        body = doc.content
-        extra = self._extract_extra_frontmatter(doc.frontmatter)
+        content = self._render_for_save(entity, current_path)
 
         # Check if state or location changed (need to move file)
         cleanup_old = False
-        if current_path.resolve() != target_path.resolve():
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            try:
-                current_path.rename(target_path)
-            except OSError:
-                cleanup_old = True
-
-        # Write updated frontmatter + preserved body + preserved extra frontmatter keys
-        target_path.write_text(self._task_to_markdown(entity, body=body, extra_frontmatter=extra), encoding="utf-8")
-        if cleanup_old and current_path.exists():
-            current_path.unlink()
+        try:
+            if current_path.resolve() != target_path.resolve():
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    current_path.rename(target_path)
+                except OSError:
+                    cleanup_old = True
+
+            # Write updated frontmatter + preserved body + preserved extra frontmatter keys
+            target_path.write_text(content, encoding="utf-8")
+            if cleanup_old and current_path.exists():
+                current_path.unlink()
+        finally:
+            self._invalidate_cached(current_path, target_path)
     
     def _do_delete(self, entity_id: EntityId) -> bool:
         """Delete a task."""
@@ -216,6 +216,7 @@ class TaskRepository(
             return False
         
         path.unlink()
+        self._invalidate_cached(path)
         return True
     
     def _do_exists(self, entity_id: EntityId) -> bool:
@@ -379,12 +380,42 @@ class TaskRepository(
         reserved = self._reserved_frontmatter_keys()
         return {k: v for k, v in fm.items() if isinstance(k, str) and k not in reserved}
 
-    def _render_task_template(self, task: Task) -> tuple[Dict[str, Any], str]:
-        """Render composed task template and return (extra_frontmatter, body)."""
+    def _render_for_save(
+        self,
+        task: Task,
+        current_path: Optional[Path],
+        template: Optional[str] = None,
+    ) -> str:
+        """Render the file content `save()` writes for `task`.
+
+        Existing tasks keep their body and extra frontmatter keys (tasks are
+        human/LLM-edited documents); new tasks are rendered from the template.
+        """
+        if current_path is None:
+            extra, body = self._render_task_template(task, template)
+            return self._task_to_markdown(task, body=body, extra_frontmatter=extra)
+
+        content_existing = current_path.read_text(encoding="utf-8", errors="strict")
+        if not has_frontmatter(content_existing):
+            raise PersistenceError(
+                f"Task file at {current_path} is missing YAML frontmatter. "
+                "Restore the file from the composed template or recreate the task via `edison task new`."
+            )
+        doc = parse_frontmatter(content_existing)
+        extra = self._extract_extra_frontmatter(doc.frontmatter)
+        return self._task_to_markdown(task, body=doc.content, extra_frontmatter=extra)
+
+    def _load_template_text(self) -> str:
+        """Read the composed task template (falling back to the bundled one)."""
         tpl_path = self._config.template_path()
         if not tpl_path.exists():
             tpl_path = get_data_path("templates") / "artifacts" / "TASK.md"
-        raw = tpl_path.read_text(encoding="utf-8")
+        return tpl_path.read_text(encoding="utf-8")
+
+    def _render_task_template(self, task: Task, raw: Optional[str] = None) -> tuple[Dict[str, Any], str]:
+        """Render composed task template and return (extra_frontmatter, body)."""
+        if raw is None:
+            raw = self._load_template_text()
 
         rendered = render_template_text(
             raw,
@@ -471,20 +502,24 @@ class TaskRepository(
         # Tolerant load for directory scans/listings: ignore non-task files and
         # skip legacy/unparseable content without failing the whole listing.
         try:
-            # Fast path: YAML frontmatter always starts with `---` at the very beginning.
-            # Avoid reading whole legacy files just to discover they aren't v2 tasks.
-            with path.open("r", encoding="utf-8", errors="ignore") as f:
-                prefix = f.read(3)
-                if prefix != "---":
-                    return None
-                content = prefix + f.read()
-
-            if not has_frontmatter(content):
-                return None
-            return self._parse_task_markdown(path.stem, content, path)
+            return self._load_cached(path, self._read_task_file)
         except Exception:
             return None
 
+    def _read_task_file(self, path: Path) -> Optional[Task]:
+        """Parse a task file, returning None for files that are not v2 tasks."""
+        # Fast path: YAML frontmatter always starts with `---` at the very beginning.
+        # Avoid reading whole legacy files just to discover they aren't v2 tasks.
+        with path.open("r", encoding="utf-8", errors="ignore") as f:
+            prefix = f.read(3)
+            if prefix != "---":
+                return None
+            content = prefix + f.read()
+
+        if not has_frontmatter(content):
+            return None
+        return self._parse_task_markdown(path.stem, content, path)
+
     def _parse_task_markdown(
         self,
         task_id: str,
@@ -175,6 +175,11 @@ class TaskSimilarityIndex:
             q_title_sh = set()
             q_body_sh = set()
 
+        try:
+            repo: Optional[TaskRepository] = TaskRepository(project_root=self.project_root)
+        except Exception:
+            repo = None
+
         scored: list[SimilarTaskMatch] = []
         for task, title_tokens, body_tokens, title_sh, body_sh in self._prepped:
             if task.id in excludes:
@@ -194,7 +199,7 @@ class TaskSimilarityIndex:
                 continue
 
             try:
-                path = TaskRepository(project_root=self.project_root).get_path(task.id)
+                path = repo.get_path(task.id) if repo is not None else Path(task.id)
             except Exception:
                 path = Path(task.id)
 
@@ -302,14 +307,19 @@ def _semantic_assisted_task_matches(
 
     max_hits = max(0, int(cfg.similarity_semantic_max_hits()))
     hits_text: list[str] = []
-    for p in providers:
-        try:
-            for h in p.search(semantic_query, limit=max_hits):
-                t = (h.text or "").strip()
-                if t:
-                    hits_text.append(t)
-        except Exception:
-            continue
+    seen: set[str] = set()
+    by_provider = mgr.search_by_provider(
+        semantic_query,
+        limit=max_hits,
+        provider_ids=[str(getattr(p, "id", "")) for p in providers],
+    )
+    for provider_hits in by_provider.values():
+        for h in provider_hits:
+            t = (h.text or "").strip()
+            # Providers often return the same snippet; expand each distinct text once.
+            if t and t not in seen:
+                seen.add(t)
+                hits_text.append(t)
 
     # Use memory hits as "query expansions": run the same deterministic index against them.
     # This keeps Edison search grounded in the actual task corpus while improving recall.
@@ -126,7 +126,14 @@ def validate_tdd_evidence(
 
     # Optional: verify commit message tags when git is available via a worktree.
     if worktree_path and worktree_path.exists():
+        from edison.core.utils.git.service import get_git_service, note_git_command
+
+        service = get_git_service()
+
         def _subject(commit: str) -> str:
+            if service is not None:
+                return service.objects(worktree_path).commit_subject(commit)
+            note_git_command(["git", "show", "-s", "--format=%s", commit])
             cp = subprocess.run(
                 ["git", "show", "-s", "--format=%s", commit],
                 cwd=worktree_path,
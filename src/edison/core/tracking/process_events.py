@@ -124,6 +124,7 @@ _INDEX_FIELDS = {
     "parentPid",
     "agentRole",
     "palRole",
+    "logPath",
 }
 
 
@@ -0,0 +1,260 @@
+"""Filesystem change watching (inotify with polling fallback).
+
+Used by long-running commands (e.g. `edison compose watch`) that must react to
+edits within milliseconds without external dependencies:
+
+- `InotifyWatcher`: Linux inotify via ctypes, recursive (new directories are
+  added to the watch set as they appear).
+- `PollingWatcher`: portable (mtime_ns, size) snapshot diffing.
+
+Both expose `wait(timeout)` which blocks until at least one change is seen (or
+the timeout expires) and returns the set of changed paths after a short
+debounce window, so editors that write via temp-file + rename produce a single
+batch.
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+IgnoreFn = Callable[[Path], bool]
+
+_DEFAULT_DEBOUNCE_S = 0.02
+
+
+def _never_ignore(_path: Path) -> bool:
+    return False
+
+
+class PollingWatcher:
+    """Detect changes by diffing (mtime_ns, size) snapshots of the watched trees."""
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        *,
+        ignore: Optional[IgnoreFn] = None,
+        interval: float = 0.25,
+        debounce: float = _DEFAULT_DEBOUNCE_S,
+    ) -> None:
+        self.roots = [Path(r) for r in roots]
+        self.ignore = ignore or _never_ignore
+        self.interval = max(0.01, float(interval))
+        self.debounce = max(0.0, float(debounce))
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snap: Dict[Path, Tuple[int, int]] = {}
+        stack = [r for r in self.roots if r.is_dir()]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        path = Path(entry.path)
+                        if self.ignore(path):
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(path)
+                            elif entry.is_file(follow_symlinks=False):
+                                st = entry.stat(follow_symlinks=False)
+                                snap[path] = (st.st_mtime_ns, st.st_size)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        return snap
+
+    def _diff(self) -> Set[Path]:
+        current = self._scan()
+        changed = {p for p, stamp in current.items() if self._snapshot.get(p) != stamp}
+        changed |= set(self._snapshot) - set(current)
+        self._snapshot = current
+        return changed
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = self._diff()
+            if changed:
+                if self.debounce:
+                    time.sleep(self.debounce)
+                    changed |= self._diff()
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            pause = self.interval
+            if deadline is not None:
+                pause = min(pause, max(0.0, deadline - time.monotonic()))
+            time.sleep(pause)
+
+    def close(self) -> None:
+        self._snapshot = {}
+
+
+# inotify constants (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_ISDIR = 0x40000000
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = 0o2000000
+
+_WATCH_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class InotifyWatcher:
+    """Recursive inotify watcher (Linux only)."""
+
+    def __init__(
+        self,
+        roots: Iterable[Path],
+        *,
+        ignore: Optional[IgnoreFn] = None,
+        debounce: float = _DEFAULT_DEBOUNCE_S,
+    ) -> None:
+        libc = _load_libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available on this platform")
+        self._libc = libc
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        self.ignore = ignore or _never_ignore
+        self.debounce = max(0.0, float(debounce))
+        self._wd_to_dir: Dict[int, Path] = {}
+        self._overflowed = False
+        for root in roots:
+            self._add_tree(Path(root))
+
+    def _add_watch(self, directory: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), _WATCH_MASK)
+        if wd >= 0:
+            self._wd_to_dir[wd] = directory
+
+    def _add_tree(self, root: Path) -> None:
+        if not root.is_dir() or self.ignore(root):
+            return
+        for dirpath, dirnames, _filenames in os.walk(root, followlinks=False):
+            base = Path(dirpath)
+            dirnames[:] = [d for d in dirnames if not self.ignore(base / d)]
+            self._add_watch(base)
+
+    def _drain(self) -> Set[Path]:
+        changed: Set[Path] = set()
+        while True:
+            try:
+                buf = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not buf:
+                break
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(buf):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size
+                raw_name = buf[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    self._overflowed = True
+                    continue
+                base = self._wd_to_dir.get(wd)
+                if base is None:
+                    continue
+                path = base / os.fsdecode(raw_name) if raw_name else base
+                if self.ignore(path):
+                    continue
+                if mask & _IN_ISDIR:
+                    if mask & (_IN_CREATE | _IN_MOVED_TO):
+                        self._add_tree(path)
+                    changed.add(path)
+                    continue
+                if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+                    self._wd_to_dir.pop(wd, None)
+                changed.add(path)
+        return changed
+
+    @property
+    def overflowed(self) -> bool:
+        """True when the kernel queue overflowed (callers should rescan fully)."""
+        return self._overflowed
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        self._overflowed = False
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = self._drain()
+        if self.debounce:
+            more, _, _ = select.select([self._fd], [], [], self.debounce)
+            if more:
+                changed |= self._drain()
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            try:
+                os.close(self._fd)
+            finally:
+                self._fd = -1
+
+
+def create_watcher(
+    roots: Iterable[Path],
+    *,
+    ignore: Optional[IgnoreFn] = None,
+    force_polling: bool = False,
+    poll_interval: float = 0.25,
+) -> "InotifyWatcher | PollingWatcher":
+    """Return an inotify watcher when available, otherwise a polling watcher."""
+    root_list: List[Path] = [Path(r) for r in roots]
+    if not force_polling:
+        try:
+            return InotifyWatcher(root_list, ignore=ignore)
+        except OSError:
+            pass
+    return PollingWatcher(root_list, ignore=ignore, interval=poll_interval)
+
+
+__all__ = ["InotifyWatcher", "PollingWatcher", "create_watcher"]
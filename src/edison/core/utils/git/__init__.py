@@ -4,6 +4,7 @@ This package provides git-related utilities:
 - Repository: detection and root resolution
 - Worktree: worktree detection and management
 - Diff: branch and diff operations
+- Service: per-invocation memoized repository facts and cat-file readers
 """
 from __future__ import annotations
 
@@ -28,6 +29,7 @@ from .worktree import (
 )
 from .status import get_status
 from .fingerprint import compute_repo_fingerprint
+from .service import GitObjectReader, GitService, RepoFacts, enable_git_service, get_git_service
 
 __all__ = [
     # repository
@@ -50,6 +52,12 @@ __all__ = [
     "get_status",
     # fingerprint
     "compute_repo_fingerprint",
+    # service
+    "GitObjectReader",
+    "GitService",
+    "RepoFacts",
+    "enable_git_service",
+    "get_git_service",
 ]
 
 
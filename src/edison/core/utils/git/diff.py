@@ -19,7 +19,13 @@ def get_current_branch(start_path: Optional[Path | str] = None) -> str:
     """
     from edison.core.utils.subprocess import run_with_timeout
 
+    from .service import get_git_service
+
     repo_root = get_repo_root(start_path)
+    service = get_git_service()
+    if service is not None:
+        facts = service.facts(repo_root)
+        return facts.branch if facts is not None else ""
     try:
         result = run_with_timeout(
             ["git", "rev-parse", "--abbrev-ref", "HEAD"],
@@ -51,6 +57,8 @@ def is_clean_working_tree(start_path: Optional[Path | str] = None) -> bool:
 
     from edison.core.utils.subprocess import configured_timeout
 
+    from .service import note_git_command
+
     repo_root = get_repo_root(start_path)
 
     # IMPORTANT: Avoid `run_with_timeout` here. Git status is a read-only probe,
@@ -60,6 +68,7 @@ def is_clean_working_tree(start_path: Optional[Path | str] = None) -> bool:
         timeout_type="git_operations",
         cwd=repo_root,
     )
+    note_git_command(["git", "status", "--porcelain"])
     result = subprocess.run(
         ["git", "status", "--porcelain"],
         cwd=repo_root,
@@ -14,6 +14,7 @@ from typing import Any
 from edison.core.utils.subprocess import run_git_command
 
 from .repository import get_git_root, get_repo_root, is_git_repository
+from .service import get_git_service
 from .status import get_status
 
 
@@ -36,6 +37,20 @@ def _filter_paths(paths: list[Any]) -> list[str]:
     return out
 
 
+def _rev_parse_head(root: Path) -> str:
+    try:
+        res = run_git_command(
+            ["git", "rev-parse", "HEAD"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return (res.stdout or "").strip()
+    except Exception:
+        return ""
+
+
 def compute_repo_fingerprint(repo_root: Path | str | None = None) -> dict[str, Any]:
     """Compute a lightweight fingerprint of the current repository state.
 
@@ -59,18 +74,12 @@ def compute_repo_fingerprint(repo_root: Path | str | None = None) -> dict[str, A
         # Deterministic empty fingerprint for non-git contexts.
         return {"gitHead": "", "gitDirty": False, "diffHash": hashlib.sha256(b"").hexdigest()}
 
-    head = ""
-    try:
-        res = run_git_command(
-            ["git", "rev-parse", "HEAD"],
-            cwd=root,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        head = (res.stdout or "").strip()
-    except Exception:
-        head = ""
+    service = get_git_service()
+    if service is not None:
+        facts = service.facts(root)
+        head = facts.head if facts is not None else ""
+    else:
+        head = _rev_parse_head(root)
 
     status = get_status(root)
 
@@ -0,0 +1,421 @@
+"""Per-invocation git service.
+
+Git utilities used to fork a fresh `git` process for every question (root, HEAD,
+branch, worktree list, "does this ref exist?"), and a single `session next` or
+`qa validate` asks the same questions dozens of times. `GitService` answers
+them once per CLI invocation:
+
+- repository facts (toplevel, git dir, common dir, HEAD, branch) come from a
+  single batched `git rev-parse` per checkout and are memoized
+- `git worktree list --porcelain` is memoized per repository
+- memoized entries are keyed on a stat signature of HEAD, the index, the
+  reflog and the branch ref, so long-lived commands (`compose watch`, an
+  orchestrator launch) notice commits and checkouts made by other processes
+- object lookups go through long-lived `git cat-file --batch-check` /
+  `--batch` processes (`GitObjectReader`) instead of one fork per lookup
+
+The service is activated with `enable_git_service()` (the CLI dispatcher does
+this for every command). Without an active service, helpers behave exactly as
+before. Every git command Edison runs through `run_with_timeout` is reported to
+`note_git_command()`, which counts forks in the active profiler
+(`git.forks`, `git.forks.<subcommand>`) and drops memoized facts whenever the
+command can mutate repository state. Non-git commands (test runners, hooks,
+build scripts) may run git themselves, so they invalidate as well.
+"""
+from __future__ import annotations
+
+import subprocess
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from edison.core.utils.profiling import count
+
+_ACTIVE_GIT_SERVICE: ContextVar["GitService | None"] = ContextVar("_ACTIVE_GIT_SERVICE", default=None)
+
+# Subcommands that never change refs, the index, worktrees or config.
+_READ_ONLY_SUBCOMMANDS = frozenset(
+    {
+        "blame",
+        "cat-file",
+        "check-ignore",
+        "describe",
+        "diff",
+        "diff-files",
+        "diff-index",
+        "diff-tree",
+        "for-each-ref",
+        "grep",
+        "log",
+        "ls-files",
+        "ls-remote",
+        "ls-tree",
+        "merge-base",
+        "name-rev",
+        "rev-list",
+        "rev-parse",
+        "shortlog",
+        "show",
+        "show-ref",
+        "status",
+        "var",
+        "version",
+    }
+)
+# Global options that take a separate value argument (`git -C <path> ...`).
+_GLOBAL_OPTS_WITH_VALUE = frozenset({"-C", "-c", "--git-dir", "--work-tree", "--namespace"})
+
+
+def git_subcommand(argv: Sequence[str]) -> Tuple[str, List[str]]:
+    """Return (subcommand, args) for a git argv, skipping global options."""
+    parts = [str(p) for p in argv]
+    i = 1
+    while i < len(parts):
+        token = parts[i]
+        if token in _GLOBAL_OPTS_WITH_VALUE:
+            i += 2
+            continue
+        if token.startswith("-"):
+            i += 1
+            continue
+        return token, parts[i + 1 :]
+    return "", []
+
+
+def is_mutating_git_command(argv: Sequence[str]) -> bool:
+    """Return True when a git argv may change refs, the index, worktrees or config."""
+    sub, args = git_subcommand(argv)
+    if not sub or sub in _READ_ONLY_SUBCOMMANDS:
+        return False
+    if sub == "worktree":
+        return not args or args[0] != "list"
+    if sub == "branch":
+        return not (args and all(a in {"--show-current", "--list", "-l", "-a", "-r", "-v", "-vv"} for a in args))
+    if sub == "symbolic-ref":
+        positional = [a for a in args if not a.startswith("-")]
+        return len(positional) > 1 or "-d" in args or "--delete" in args
+    if sub == "config":
+        return not any(a.startswith(("--get", "--list")) or a == "-l" for a in args)
+    return True
+
+
+def note_git_command(argv: Sequence[str]) -> None:
+    """Record a git fork and invalidate memoized facts for mutating commands."""
+    sub, _args = git_subcommand(argv)
+    count("git.forks")
+    if sub:
+        count(f"git.forks.{sub}")
+    if is_mutating_git_command(argv):
+        service = _ACTIVE_GIT_SERVICE.get()
+        if service is not None:
+            service.invalidate()
+
+
+def note_external_command() -> None:
+    """Invalidate memoized facts before a non-git command (it may run git itself)."""
+    service = _ACTIVE_GIT_SERVICE.get()
+    if service is not None:
+        service.invalidate()
+
+
+_Stat = Optional[Tuple[int, int, int]]
+
+
+def _stat(path: Path) -> _Stat:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _checkout_signature(git_dir: Path, common_dir: Path, branch: str) -> Tuple[_Stat, ...]:
+    """Cheap stat fingerprint of where a checkout's HEAD points."""
+    paths = [git_dir / "HEAD", git_dir / "index", git_dir / "logs" / "HEAD", common_dir / "packed-refs"]
+    if branch and branch != "HEAD":
+        paths.append(common_dir / "refs" / "heads" / branch)
+    return tuple(_stat(p) for p in paths)
+
+
+def _worktrees_signature(common_dir: Path) -> Tuple[_Stat, ...]:
+    """Stat fingerprint of every worktree's HEAD (plus the worktree registry)."""
+    admin = common_dir / "worktrees"
+    git_dirs = [common_dir]
+    try:
+        git_dirs.extend(sorted(p for p in admin.iterdir() if p.is_dir()))
+    except OSError:
+        pass
+    sig: List[_Stat] = [_stat(admin), _stat(common_dir / "packed-refs")]
+    for git_dir in git_dirs:
+        sig.extend((_stat(git_dir / "HEAD"), _stat(git_dir / "logs" / "HEAD")))
+    return tuple(sig)
+
+
+@dataclass(frozen=True)
+class RepoFacts:
+    """Facts about the checkout containing a path (one `git rev-parse`)."""
+
+    toplevel: Path
+    git_dir: Path
+    common_dir: Path
+    head: str  # "" when the branch is unborn
+    branch: str  # "HEAD" when detached, "" when unborn (as `rev-parse --abbrev-ref HEAD`)
+
+    @property
+    def is_linked_worktree(self) -> bool:
+        if self.git_dir == self.common_dir:
+            return False
+        return self.git_dir.is_relative_to(self.common_dir / "worktrees")
+
+
+class GitObjectReader:
+    """Long-lived `git cat-file --batch-check` / `--batch` processes for one checkout."""
+
+    def __init__(self, repo: Path) -> None:
+        self.repo = Path(repo)
+        self._procs: Dict[str, subprocess.Popen[bytes]] = {}
+        self._lock = threading.Lock()
+
+    def _proc(self, mode: str) -> subprocess.Popen[bytes]:
+        proc = self._procs.get(mode)
+        if proc is not None and proc.poll() is None:
+            return proc
+        argv = ["git", "cat-file", mode]
+        note_git_command(argv)
+        proc = subprocess.Popen(
+            argv,
+            cwd=str(self.repo),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        self._procs[mode] = proc
+        return proc
+
+    @staticmethod
+    def _request(proc: subprocess.Popen[bytes], spec: str) -> Optional[Tuple[str, str, int]]:
+        stdin: IO[bytes] = proc.stdin  # type: ignore[assignment]
+        stdout: IO[bytes] = proc.stdout  # type: ignore[assignment]
+        stdin.write(spec.encode("utf-8") + b"\n")
+        stdin.flush()
+        raw = stdout.readline()
+        if not raw:
+            raise BrokenPipeError("git cat-file exited")
+        header = raw.decode("utf-8", errors="replace").rstrip("\n")
+        parts = header.split(" ")
+        if len(parts) != 3 or not parts[2].isdigit():
+            # "<spec> missing" / "<spec> ambiguous"
+            return None
+        return parts[0], parts[1], int(parts[2])
+
+    def info(self, spec: str) -> Optional[Tuple[str, str, int]]:
+        """Return (sha, type, size) for an object name, or None when it does not resolve."""
+        if not spec or "\n" in spec:
+            return None
+        with self._lock:
+            for attempt in (0, 1):
+                proc = self._proc("--batch-check")
+                try:
+                    return self._request(proc, spec)
+                except (BrokenPipeError, OSError):
+                    self._procs.pop("--batch-check", None)
+                    if attempt:
+                        raise
+        return None
+
+    def read(self, spec: str) -> Optional[Tuple[str, str, bytes]]:
+        """Return (sha, type, content) for an object name, or None when it does not resolve."""
+        if not spec or "\n" in spec:
+            return None
+        with self._lock:
+            for attempt in (0, 1):
+                proc = self._proc("--batch")
+                try:
+                    header = self._request(proc, spec)
+                    if header is None:
+                        return None
+                    sha, kind, size = header
+                    stdout: IO[bytes] = proc.stdout  # type: ignore[assignment]
+                    data = stdout.read(size)
+                    stdout.read(1)  # trailing newline
+                    return sha, kind, data
+                except (BrokenPipeError, OSError):
+                    self._procs.pop("--batch", None)
+                    if attempt:
+                        raise
+        return None
+
+    def commit_subject(self, spec: str) -> str:
+        """Return the subject line of a commit (as `git show -s --format=%s`)."""
+        obj = self.read(f"{spec}^{{commit}}")
+        if obj is None:
+            return ""
+        text = obj[2].decode("utf-8", errors="replace")
+        _headers, _sep, message = text.partition("\n\n")
+        paragraph = message.split("\n\n", 1)[0]
+        return " ".join(line.strip() for line in paragraph.splitlines()).strip()
+
+    def close(self) -> None:
+        with self._lock:
+            for proc in self._procs.values():
+                try:
+                    if proc.stdin is not None:
+                        proc.stdin.close()
+                    proc.wait(timeout=2)
+                except Exception:
+                    proc.kill()
+                finally:
+                    if proc.stdout is not None:
+                        proc.stdout.close()
+            self._procs.clear()
+
+
+class GitService:
+    """Memoized repository facts and object readers for one invocation."""
+
+    def __init__(self) -> None:
+        self._facts: Dict[Path, Tuple[Optional[RepoFacts], Tuple[_Stat, ...]]] = {}
+        self._worktrees: Dict[Path, Tuple[List[Dict[str, Any]], Tuple[_Stat, ...]]] = {}
+        self._readers: Dict[Path, GitObjectReader] = {}
+        self._timeout: Optional[float] = None
+        self._lock = threading.RLock()
+
+    def _git_timeout(self, cwd: Path) -> float:
+        if self._timeout is None:
+            from edison.core.utils.subprocess import configured_timeout
+
+            try:
+                self._timeout = configured_timeout(["git"], timeout_type="git_operations", cwd=cwd)
+            except Exception:
+                self._timeout = 60.0
+        return self._timeout
+
+    @staticmethod
+    def _key(path: Path | str) -> Path:
+        p = Path(path).resolve()
+        return p.parent if p.is_file() else p
+
+    def facts(self, path: Path | str) -> Optional[RepoFacts]:
+        """Return facts for the checkout containing `path` (None outside git)."""
+        key = self._key(path)
+        with self._lock:
+            cached = self._facts.get(key)
+        if cached is not None:
+            facts, signature = cached
+            if facts is None or _checkout_signature(facts.git_dir, facts.common_dir, facts.branch) == signature:
+                count("git.service.hits")
+                return facts
+            count("git.service.stale")
+        argv = [
+            "git",
+            "rev-parse",
+            "--path-format=absolute",
+            "--show-toplevel",
+            "--git-dir",
+            "--git-common-dir",
+            "HEAD",
+            "--abbrev-ref",
+            "HEAD",
+        ]
+        note_git_command(argv)
+        facts: Optional[RepoFacts] = None
+        try:
+            cp = subprocess.run(
+                argv,
+                cwd=str(key),
+                capture_output=True,
+                text=True,
+                timeout=self._git_timeout(key),
+            )
+            lines = (cp.stdout or "").splitlines()
+            if len(lines) >= 3:
+                head, branch = "", ""
+                if cp.returncode == 0 and len(lines) >= 5:
+                    head, branch = lines[3].strip(), lines[4].strip()
+                facts = RepoFacts(
+                    toplevel=Path(lines[0].strip()),
+                    git_dir=Path(lines[1].strip()),
+                    common_dir=Path(lines[2].strip()),
+                    head=head,
+                    branch=branch,
+                )
+        except (OSError, subprocess.SubprocessError):
+            facts = None
+        signature = _checkout_signature(facts.git_dir, facts.common_dir, facts.branch) if facts else ()
+        with self._lock:
+            self._facts[key] = (facts, signature)
+        return facts
+
+    def worktrees(
+        self, repo_root: Path | str, loader: Callable[[], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Return the memoized worktree list for `repo_root` (computed by `loader`)."""
+        key = self._key(repo_root)
+        facts = self.facts(key)
+        signature = _worktrees_signature(facts.common_dir) if facts is not None else ()
+        with self._lock:
+            cached = self._worktrees.get(key)
+        if cached is not None and cached[1] == signature:
+            count("git.service.hits")
+            entries = cached[0]
+        else:
+            entries = loader()
+            with self._lock:
+                self._worktrees[key] = (entries, signature)
+        return [dict(entry) for entry in entries]
+
+    def objects(self, path: Path | str) -> GitObjectReader:
+        """Return the long-lived object reader for the checkout containing `path`."""
+        facts = self.facts(path)
+        key = facts.toplevel if facts is not None else self._key(path)
+        with self._lock:
+            reader = self._readers.get(key)
+            if reader is None:
+                reader = GitObjectReader(key)
+                self._readers[key] = reader
+            return reader
+
+    def invalidate(self) -> None:
+        """Forget memoized facts after a git write (refs/worktrees may have moved)."""
+        with self._lock:
+            self._facts.clear()
+            self._worktrees.clear()
+            readers = list(self._readers.values())
+            self._readers.clear()
+        for reader in readers:
+            reader.close()
+
+    def close(self) -> None:
+        self.invalidate()
+
+
+@contextmanager
+def enable_git_service(service: Optional[GitService] = None) -> Iterator[GitService]:
+    """Activate a git service for the current context; closes it on exit."""
+    active = service or GitService()
+    token = _ACTIVE_GIT_SERVICE.set(active)
+    try:
+        yield active
+    finally:
+        _ACTIVE_GIT_SERVICE.reset(token)
+        active.close()
+
+
+def get_git_service() -> Optional[GitService]:
+    return _ACTIVE_GIT_SERVICE.get()
+
+
+__all__ = [
+    "GitObjectReader",
+    "GitService",
+    "RepoFacts",
+    "enable_git_service",
+    "get_git_service",
+    "git_subcommand",
+    "is_mutating_git_command",
+    "note_external_command",
+    "note_git_command",
+]
@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from edison.core.utils.subprocess import run_with_timeout, run_git_command
 from .repository import get_repo_root
+from .service import get_git_service
 
 
 def _starting_path(start_path: Optional[Path | str]) -> Path:
@@ -22,6 +23,12 @@ def _git_dir_info(start_path: Path) -> tuple[Path, Path]:
     We intentionally run `git rev-parse` from the provided path (not the resolved
     repo root) so worktree detection honors the actual checkout we are inside.
     """
+    service = get_git_service()
+    if service is not None:
+        facts = service.facts(start_path)
+        if facts is None:
+            raise RuntimeError(f"Not a git checkout: {start_path}")
+        return facts.git_dir, facts.common_dir
     git_dir = run_with_timeout(
         ["git", "rev-parse", "--path-format=absolute", "--git-dir"],
         cwd=start_path,
@@ -139,18 +146,29 @@ def list_worktrees(repo_root: Optional[Path] = None) -> List[Dict[str, Any]]:
         List of dicts with keys: path, head, branch, branch_ref.
     """
     root = repo_root or get_repo_root()
-    result = run_git_command(
-        ["git", "worktree", "list", "--porcelain"],
-        cwd=root,
-        capture_output=True,
-        text=True,
-        check=True,
-    )
-    return _parse_worktree_list(result.stdout)
+
+    def _load() -> List[Dict[str, Any]]:
+        result = run_git_command(
+            ["git", "worktree", "list", "--porcelain"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return _parse_worktree_list(result.stdout)
+
+    service = get_git_service()
+    if service is not None:
+        return service.worktrees(root, _load)
+    return _load()
 
 
 def check_worktree_health(path: Path) -> bool:
     """Check if a worktree path is valid and healthy (inside git control)."""
+    service = get_git_service()
+    if service is not None:
+        # `--show-toplevel` fails exactly where `--is-inside-work-tree` is not "true".
+        return path.exists() and service.facts(path) is not None
     try:
         r = run_with_timeout(
             ["git", "rev-parse", "--is-inside-work-tree"],
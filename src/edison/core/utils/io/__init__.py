@@ -15,6 +15,7 @@ from .core import (
     ensure_parent_dir,
     read_text,
     write_text,
+    write_text_many,
     ensure_lines_present,
 )
 from .json import (
@@ -49,6 +50,7 @@ __all__ = [
     "atomic_write",
     "read_text",
     "write_text",
+    "write_text_many",
     "ensure_lines_present",
     # json
     "read_json",
@@ -2,6 +2,7 @@
 
 Single source of truth for safe file access patterns:
 - Atomic writes with fsync and advisory locks
+- Batched text writes (parallel, optionally all-or-nothing)
 - Text file read/write operations
 - Directory management utilities
 
@@ -11,10 +12,12 @@ from __future__ import annotations
 
 import fcntl
 import os
+import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
 from pathlib import Path
-from typing import Any, Callable, ContextManager, Optional, TextIO, Union, cast
+from typing import Any, Callable, ContextManager, List, Optional, Sequence, TextIO, Tuple, Union, cast
 
 PathLike = Union[str, Path]
 
@@ -157,6 +160,110 @@ def write_text(path: PathLike, content: str, *, encoding: str = "utf-8") -> None
     atomic_write(target, _writer, encoding=encoding)
 
 
+def _staging_path(target: Path) -> Path:
+    return target.with_name(f".{target.name}.{os.getpid()}.staged")
+
+
+def write_text_many(
+    files: Sequence[Tuple[Path, str]],
+    *,
+    staged: bool = False,
+    max_workers: Optional[int] = None,
+    encoding: str = "utf-8",
+) -> None:
+    """Write many text files using a thread pool.
+
+    Parent directories are created once per distinct directory. By default each
+    file is written in place and the first error is raised after every write
+    has been attempted.
+
+    With ``staged=True`` the batch is all-or-nothing: every file is first
+    written to a staging file next to its target, and only when all of them
+    succeeded are they renamed into place. Existing targets are hard-linked
+    aside before the renames so a failure during the rename phase restores them.
+
+    Args:
+        files: (path, content) pairs; paths must be distinct
+        staged: Publish all files or none
+        max_workers: Thread pool size (default: ThreadPoolExecutor's default)
+        encoding: Text encoding (default: utf-8)
+
+    Raises:
+        OSError: If any write fails (in staged mode nothing was published)
+    """
+    if not files:
+        return
+    for parent in {Path(p).parent for p, _ in files}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    def _write(item: Tuple[Path, str]) -> Optional[BaseException]:
+        path, content = item
+        try:
+            Path(path).write_text(content, encoding=encoding)
+        except BaseException as exc:
+            return exc
+        return None
+
+    if not staged:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            errors = [e for e in pool.map(_write, files) if e is not None]
+        if errors:
+            raise errors[0]
+        return
+
+    staging = [(_staging_path(Path(p)), c) for p, c in files]
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            errors = [e for e in pool.map(_write, staging) if e is not None]
+        if errors:
+            raise errors[0]
+        _publish_staged([Path(p) for p, _ in files], [s for s, _ in staging])
+    finally:
+        for tmp, _ in staging:
+            try:
+                tmp.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # Best-effort cleanup; never mask the original error
+                pass
+
+
+def _publish_staged(targets: List[Path], staged: List[Path]) -> None:
+    """Rename staged files into place, restoring the originals on failure."""
+    published: List[Tuple[Path, Optional[Path]]] = []
+    try:
+        for target, tmp in zip(targets, staged, strict=True):
+            backup: Optional[Path] = None
+            if target.exists():
+                backup = target.with_name(f".{target.name}.{os.getpid()}.orig")
+                try:
+                    os.link(target, backup)
+                except OSError:
+                    shutil.copy2(target, backup)
+            published.append((target, backup))
+            os.replace(tmp, target)
+    except BaseException:
+        for target, backup in reversed(published):
+            try:
+                if backup is not None:
+                    # rename() between two links to one inode is a no-op
+                    # (the target was never replaced), so drop the backup too.
+                    os.replace(backup, target)
+                    backup.unlink(missing_ok=True)
+                elif target.exists():
+                    target.unlink()
+            except OSError:
+                pass
+        raise
+    for _target, backup in published:
+        if backup is not None:
+            try:
+                backup.unlink()
+            except OSError:
+                pass
+
+
 def ensure_lines_present(
     path: PathLike,
     required_lines: list[str],
@@ -222,6 +329,7 @@ __all__ = [
     "atomic_write",
     "read_text",
     "write_text",
+    "write_text_many",
     "ensure_lines_present",
 ]
 
@@ -0,0 +1,105 @@
+"""Stat-validated cache of values parsed from files.
+
+A `StatCache` maps an absolute file path to the value a loader parsed from it:
+
+- an entry is valid while the file's (mtime_ns, size, inode) signature is
+  unchanged, so edits by other processes are always observed
+- files modified within the last `RACY_WINDOW_NS` are never cached: file
+  timestamps come from a coarse kernel clock, and a same-size rewrite within
+  one tick would otherwise be indistinguishable
+- callers always receive a deep copy, so mutating a returned value never leaks
+  into the cache
+
+With a `counter_prefix`, hits and misses are reported to the active profiler as
+`<prefix>.hit` / `<prefix>.miss` / `<prefix>.invalidate`.
+"""
+from __future__ import annotations
+
+import copy
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from edison.core.utils.profiling import count
+
+T = TypeVar("T")
+
+RACY_WINDOW_NS = 100_000_000
+
+_Signature = Tuple[int, int, int]
+
+
+def _signature(st: os.stat_result) -> _Signature:
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class StatCache:
+    """Parsed values keyed by absolute file path, validated by stat signature."""
+
+    def __init__(self, counter_prefix: str = "") -> None:
+        self._entries: Dict[str, Tuple[_Signature, Any]] = {}
+        self._lock = threading.Lock()
+        self._prefix = counter_prefix
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _count(self, event: str, n: int = 1) -> None:
+        if self._prefix:
+            count(f"{self._prefix}.{event}", n)
+
+    def get(self, path: Path, loader: Callable[[Path], Optional[T]]) -> Optional[T]:
+        """Return the value parsed from `path`, calling `loader` only on a miss.
+
+        Loader exceptions propagate and `None` results are not cached.
+        """
+        key = os.path.abspath(path)
+        now_ns = time.time_ns()
+        try:
+            st = os.stat(key)
+        except OSError:
+            self.invalidate(key)
+            return loader(path)
+        sig = _signature(st)
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == sig:
+            self._count("hit")
+            return copy.deepcopy(entry[1])
+
+        self._count("miss")
+        value = loader(path)
+        if value is None:
+            return None
+        if now_ns - st.st_mtime_ns < RACY_WINDOW_NS:
+            self.invalidate(key)
+            return value
+        with self._lock:
+            self._entries[key] = (sig, value)
+        return copy.deepcopy(value)
+
+    def invalidate(self, *paths: Path | str) -> None:
+        with self._lock:
+            for path in paths:
+                if self._entries.pop(os.path.abspath(path), None) is not None:
+                    self._count("invalidate")
+
+    def invalidate_tree(self, root: Path | str) -> None:
+        """Drop every entry at or below `root` (e.g. a moved directory)."""
+        prefix = os.path.abspath(root)
+        with self._lock:
+            stale = [k for k in self._entries if k == prefix or k.startswith(prefix + os.sep)]
+            for key in stale:
+                del self._entries[key]
+        if stale:
+            self._count("invalidate", len(stale))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+__all__ = ["RACY_WINDOW_NS", "StatCache"]
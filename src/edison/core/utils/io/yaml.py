@@ -1,4 +1,10 @@
-"""YAML I/O utilities with atomic writes and advisory locks."""
+"""YAML I/O utilities with atomic writes and advisory locks.
+
+Loading and dumping go through libyaml's `CSafeLoader`/`CSafeDumper` when PyYAML
+was built with it (several times faster than the pure-Python classes, same
+results), falling back to `SafeLoader`/`SafeDumper` otherwise. Use `safe_load`
+and `safe_dump` from this module instead of `yaml.safe_load`/`yaml.safe_dump`.
+"""
 from __future__ import annotations
 
 import fcntl
@@ -12,6 +18,9 @@ try:
 
     HAS_YAML = True
 
+    SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
     # Custom representer for multiline strings - use literal block style (|)
     def _str_representer(dumper: yaml.SafeDumper, data: str) -> yaml.ScalarNode:
         """Represent multiline strings with literal block style."""
@@ -21,11 +30,39 @@ try:
         return dumper.represent_scalar("tag:yaml.org,2002:str", data)
 
     yaml.add_representer(str, _str_representer, Dumper=yaml.SafeDumper)
+    if SafeDumper is not yaml.SafeDumper:
+        yaml.add_representer(str, _str_representer, Dumper=SafeDumper)
 
 except ImportError:
     HAS_YAML = False
 
 
+def safe_load(stream: Any) -> Any:
+    """`yaml.safe_load` using the libyaml loader when available.
+
+    Raises:
+        RuntimeError: If PyYAML is not installed
+    """
+    if not HAS_YAML:
+        raise RuntimeError(
+            "PyYAML is required for YAML operations. Install with: pip install pyyaml"
+        )
+    return yaml.load(stream, Loader=SafeLoader)  # type: ignore[no-untyped-call]
+
+
+def safe_dump(data: Any, stream: Any = None, **kwargs: Any) -> Any:
+    """`yaml.safe_dump` using the libyaml dumper when available.
+
+    Raises:
+        RuntimeError: If PyYAML is not installed
+    """
+    if not HAS_YAML:
+        raise RuntimeError(
+            "PyYAML is required for YAML operations. Install with: pip install pyyaml"
+        )
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)  # type: ignore[no-untyped-call]
+
+
 def read_yaml(
     path: Path, default: Any = None, raise_on_error: bool = False
 ) -> Any:
@@ -59,7 +96,7 @@ def read_yaml(
     try:
         with open(path, "r", encoding="utf-8") as f:
             fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-            data = yaml.safe_load(f)  # type: ignore[no-untyped-call]
+            data = safe_load(f)
             fcntl.flock(f.fileno(), fcntl.LOCK_UN)
         return data if data is not None else default
     except Exception:
@@ -87,7 +124,7 @@ def write_yaml(path: Path, data: Any) -> None:
         )
 
     def _writer(f) -> None:
-        yaml.safe_dump(  # type: ignore[no-untyped-call]
+        safe_dump(
             data,
             f,
             default_flow_style=False,
@@ -112,7 +149,7 @@ def parse_yaml_string(content: str, default: Any = None) -> Any:
         return default
 
     try:
-        data = yaml.safe_load(content)  # type: ignore[no-untyped-call]
+        data = safe_load(content)
         return data if data is not None else default
     except Exception:
         return default
@@ -136,7 +173,7 @@ def dump_yaml_string(data: Any, sort_keys: bool = True) -> str:
             "PyYAML is required for YAML operations. Install with: pip install pyyaml"
         )
 
-    return yaml.safe_dump(  # type: ignore[no-untyped-call]
+    return safe_dump(
         data,
         default_flow_style=False,
         sort_keys=sort_keys,
@@ -191,6 +228,8 @@ def resolve_yaml_path(path: Path) -> Path:
 
 __all__ = [
     "HAS_YAML",
+    "safe_load",
+    "safe_dump",
     "read_yaml",
     "write_yaml",
     "parse_yaml_string",
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from edison.core.utils.io import iter_yaml_files, read_yaml
 from edison.core.utils.merge import deep_merge
@@ -17,15 +17,15 @@ from edison.core.utils.merge import deep_merge
 logger = logging.getLogger(__name__)
 
 
-def merge_yaml_directory(base: Dict[str, Any], directory: Path) -> Dict[str, Any]:
-    """Merge all YAML files from ``directory`` into ``base``.
+def yaml_directory_layers(directory: Path) -> List[Dict[str, Any]]:
+    """Parse every YAML file in ``directory`` into a list of layers.
 
-    Files are merged in deterministic order. Missing directories are ignored.
-    YAML must be valid; invalid YAML raises.
+    Files are returned in deterministic (merge) order. Missing directories
+    yield no layers. YAML must be valid; invalid YAML raises.
     """
     d = Path(directory)
     if not d.exists():
-        return base
+        return []
 
     # Hygiene: when both <name>.yml and <name>.yaml exist, Edison prefers .yaml
     # and ignores the .yml file. This can surprise operators; surface it loudly.
@@ -42,9 +42,20 @@ def merge_yaml_directory(base: Dict[str, Any], directory: Path) -> Dict[str, Any
     except Exception:
         pass
 
+    return [read_yaml(path, default={}, raise_on_error=True) or {} for path in iter_yaml_files(d)]
+
+
+def merge_yaml_directory(base: Dict[str, Any], directory: Path) -> Dict[str, Any]:
+    """Merge all YAML files from ``directory`` into ``base``.
+
+    Files are merged in deterministic order. Missing directories are ignored.
+    YAML must be valid; invalid YAML raises.
+    """
+    if not Path(directory).exists():
+        return base
+
     cfg: Dict[str, Any] = dict(base)
-    for path in iter_yaml_files(d):
-        module_cfg = read_yaml(path, default={}, raise_on_error=True) or {}
+    for module_cfg in yaml_directory_layers(directory):
         cfg = deep_merge(cfg, module_cfg)
     return cfg
 
@@ -72,6 +83,7 @@ def merge_named_yaml(base: Dict[str, Any], directory: Path, name: str) -> Dict[s
 
 
 __all__ = [
+    "yaml_directory_layers",
     "merge_yaml_directory",
     "merge_named_yaml",
 ]
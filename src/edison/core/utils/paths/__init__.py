@@ -28,6 +28,7 @@ from .user import (
 from .resolver import (
     PathResolver,
     _PROJECT_ROOT_CACHE,
+    clear_path_resolution_cache,
     get_project_path,
     resolve_project_root,
 )
@@ -38,6 +39,7 @@ __all__ = [
     "EdisonPathError",
     "PathResolver",
     "resolve_project_root",
+    "clear_path_resolution_cache",
     "get_project_path",
     "_PROJECT_ROOT_CACHE",
     "safe_relpath",
@@ -72,7 +72,8 @@ def list_evidence_rounds(task_id: str) -> List[Path]:
         task_id: Task ID
 
     Returns:
-        List[Path]: Sorted list of round directories (oldest to newest)
+        List[Path]: Sorted list of round directories (oldest to newest); packed
+        rounds are included and do not exist on disk until unpacked
     """
     # Use EvidenceService for round listing
     ev_svc = _get_evidence_service(task_id)
@@ -19,6 +19,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from edison.core.utils.io.file_cache import StatCache
+
+# Parsed management config files, revalidated by stat on every lookup.
+_CONFIG_CACHE = StatCache(counter_prefix="paths.management_config.cache")
+
 
 class ProjectManagementPaths:
     """Resolve all project management directory paths from management root.
@@ -43,7 +48,7 @@ class ProjectManagementPaths:
     def _read_yaml(self, path: Path) -> Dict[str, Any]:
         from edison.core.utils.io import read_yaml
 
-        data = read_yaml(path, default={})
+        data = _CONFIG_CACHE.get(path, lambda p: read_yaml(p, default={}))
         return data if isinstance(data, dict) else {}
 
     def _load_config(self) -> dict:
@@ -133,6 +138,10 @@ class ProjectManagementPaths:
         return self.get_management_root() / "archive"
 
 
+def _clear_caches() -> None:
+    _CONFIG_CACHE.clear()
+
+
 # Global singleton for convenience
 _paths_instance: Optional[ProjectManagementPaths] = None
 
@@ -13,10 +13,12 @@ Configuration precedence (highest to lowest):
 from __future__ import annotations
 
 import os
+import time
 from pathlib import Path
-from typing import Iterable
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from edison.core.utils.io import iter_yaml_files
+from edison.core.utils.io.file_cache import RACY_WINDOW_NS, StatCache
 from edison.data import get_data_path
 
 try:
@@ -28,23 +30,59 @@ except Exception as err:  # pragma: no cover - surfaced in tests
 DEFAULT_PROJECT_CONFIG_PRIMARY = ".edison"
 
 
-def _load_project_dir_from_yaml(path: Path) -> str | None:
-    """Extract ``paths.project_config_dir`` from a YAML file when present."""
+# Extracted values per YAML file; resolution runs on almost every command, so
+# unchanged files are not re-parsed.
+_PROJECT_DIR_CACHE = StatCache(counter_prefix="paths.project_config_dir.cache")
+# Config directory listings, revalidated by the directory's (mtime_ns, inode).
+_LISTING_CACHE: Dict[str, Tuple[Tuple[int, int], List[Path]]] = {}
+_BUNDLED_PATHS_YAML: Optional[Path] = None
+
+
+def _clear_caches() -> None:
+    _PROJECT_DIR_CACHE.clear()
+    _LISTING_CACHE.clear()
+
+
+def _config_yaml_files(config_dir: Path) -> List[Path]:
+    """`iter_yaml_files(config_dir)`, re-listed only when the directory changes."""
+    key = str(config_dir)
+    try:
+        st = os.stat(key)
+    except OSError:
+        _LISTING_CACHE.pop(key, None)
+        return []
+    sig = (st.st_mtime_ns, st.st_ino)
+    entry = _LISTING_CACHE.get(key)
+    if entry is not None and entry[0] == sig:
+        return entry[1]
+    files = iter_yaml_files(config_dir)
+    if time.time_ns() - st.st_mtime_ns >= RACY_WINDOW_NS:
+        _LISTING_CACHE[key] = (sig, files)
+    return files
+
+
+def _parse_project_dir(path: Path) -> tuple[str | None]:
     from edison.core.utils.io import read_yaml
 
-    if not path.exists() or not path.is_file():
-        return None
+    if not path.is_file():
+        return (None,)
 
     data = read_yaml(path, default={})
     if not isinstance(data, dict):
-        return None
+        return (None,)
 
     paths_section = data.get("paths")
     if isinstance(paths_section, dict):
         value = paths_section.get("project_config_dir") or paths_section.get("config_dir")
         if isinstance(value, str) and value.strip():
-            return value.strip()
-    return None
+            return (value.strip(),)
+    return (None,)
+
+
+def _load_project_dir_from_yaml(path: Path) -> str | None:
+    """Extract ``paths.project_config_dir`` from a YAML file when present."""
+    found = _PROJECT_DIR_CACHE.get(path, _parse_project_dir)
+    return found[0] if found else None
 
 
 def _resolve_project_dir_from_configs(repo_root: Path) -> str:
@@ -66,22 +104,21 @@ def _resolve_project_dir_from_configs(repo_root: Path) -> str:
     value: str | None = None
 
     # Priority 2: Bundled defaults from edison.data package (paths.yaml)
+    global _BUNDLED_PATHS_YAML
     try:
-        bundled_paths = get_data_path("config", "paths.yaml")
-        if bundled_paths.exists():
-            value = _load_project_dir_from_yaml(bundled_paths) or value
+        if _BUNDLED_PATHS_YAML is None:
+            _BUNDLED_PATHS_YAML = get_data_path("config", "paths.yaml")
+        value = _load_project_dir_from_yaml(_BUNDLED_PATHS_YAML) or value
     except Exception:
         pass  # Bundled data not available, continue with project config
 
     # Priority 3: Project overrides (.edison/config/)
     # Note: Using DEFAULT_PROJECT_CONFIG_PRIMARY here is necessary to bootstrap config loading
     config_dir = repo_root / DEFAULT_PROJECT_CONFIG_PRIMARY / "config"
-    if config_dir.exists():
-        yaml_files = iter_yaml_files(config_dir)
-        for yaml_path in yaml_files:
-            found = _load_project_dir_from_yaml(yaml_path)
-            if found is not None:
-                value = found
+    for yaml_path in _config_yaml_files(config_dir):
+        found = _load_project_dir_from_yaml(yaml_path)
+        if found is not None:
+            value = found
 
     # Use constant as final bootstrap fallback - it matches the bundled defaults
     return value or DEFAULT_PROJECT_CONFIG_PRIMARY
@@ -14,14 +14,47 @@ from __future__ import annotations
 
 import os
 import subprocess
+import threading
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+from edison.core.utils.profiling import count
 
 from .errors import EdisonPathError
 
 # Cache for project root to avoid repeated filesystem/git calls
 _PROJECT_ROOT_CACHE: Optional[Path] = None
 
+# Environment variables that influence project root resolution.
+_RESOLUTION_ENV_VARS = (
+    "AGENTS_PROJECT_ROOT",
+    "EDISON_paths__project_config_dir",
+    "EDISON_paths__config_dir",
+    "EDISON_project_management_dir",
+    "EDISON_paths__management_dir",
+)
+
+_ResolutionKey = Tuple[str, Tuple[Optional[str], ...]]
+# (root, any-of paths that must still exist, path that must still be absent)
+_ResolutionEntry = Tuple[Path, Tuple[str, ...], Optional[str]]
+
+# Process-wide resolution cache keyed by (cwd, relevant env vars). Entries are
+# revalidated with one or two stats instead of re-walking markers or running git.
+_RESOLUTION_CACHE: Dict[_ResolutionKey, _ResolutionEntry] = {}
+_RESOLUTION_LOCK = threading.Lock()
+
+
+def clear_path_resolution_cache() -> None:
+    """Drop cached project roots and parsed path config (e.g. after creating markers)."""
+    global _PROJECT_ROOT_CACHE
+    from . import management, project
+
+    with _RESOLUTION_LOCK:
+        _RESOLUTION_CACHE.clear()
+    _PROJECT_ROOT_CACHE = None
+    project._clear_caches()
+    management._clear_caches()
+
 
 def _try_resolve_git_common_root(*, cwd: Path) -> Path | None:
     """Best-effort resolve the outer/common git root for worktrees.
@@ -58,6 +91,11 @@ def _try_resolve_git_common_root(*, cwd: Path) -> Path | None:
 def resolve_project_root() -> Path:
     """Resolve project root with fail-fast validation.
 
+    Results are cached per (cwd, relevant env vars) for the whole process.
+    Cached entries are revalidated cheaply (the root, or the `.project` marker
+    that selected it, must still exist), and resetting `_PROJECT_ROOT_CACHE`
+    to None or calling `clear_path_resolution_cache()` invalidates everything.
+
     Resolution priority:
     1. AGENTS_PROJECT_ROOT environment variable
     2. Git repository root via ``git rev-parse --show-toplevel``
@@ -74,6 +112,33 @@ def resolve_project_root() -> Path:
     """
     global _PROJECT_ROOT_CACHE
 
+    count("paths.project_root.resolve")
+    key: _ResolutionKey = (os.getcwd(), tuple(os.environ.get(v) for v in _RESOLUTION_ENV_VARS))
+    if _PROJECT_ROOT_CACHE is None:
+        # Callers (notably test helpers) reset the legacy global to force re-resolution.
+        with _RESOLUTION_LOCK:
+            _RESOLUTION_CACHE.clear()
+    else:
+        entry = _RESOLUTION_CACHE.get(key)
+        if entry is not None:
+            root, must_exist, must_be_absent = entry
+            if any(os.path.exists(p) for p in must_exist) and not (
+                must_be_absent and os.path.exists(must_be_absent)
+            ):
+                _PROJECT_ROOT_CACHE = root
+                return root
+
+    count("paths.project_root.miss")
+    root, must_exist, must_be_absent = _resolve_project_root_uncached()
+    with _RESOLUTION_LOCK:
+        _RESOLUTION_CACHE[key] = (root, must_exist, must_be_absent)
+    return root
+
+
+def _resolve_project_root_uncached() -> _ResolutionEntry:
+    """Resolve the project root and describe how to revalidate the result."""
+    global _PROJECT_ROOT_CACHE
+
     # Best-effort marker names for lightweight root validation without config loads.
     # These can be overridden via env vars (same paths as ConfigManager supports).
     project_config_dir_name = (
@@ -113,7 +178,7 @@ def resolve_project_root() -> Path:
             )
         if _PROJECT_ROOT_CACHE != env_path:
             _PROJECT_ROOT_CACHE = env_path
-        return env_path
+        return env_path, (str(env_path),), None
 
     # Local project root shortcut: honor a .project directory in CWD
     cwd = Path.cwd().resolve()
@@ -125,7 +190,10 @@ def resolve_project_root() -> Path:
             )
         if _PROJECT_ROOT_CACHE != cwd:
             _PROJECT_ROOT_CACHE = cwd
-        return cwd
+        return cwd, (str(cwd / project_management_dir_name),), None
+
+    # Any other result stays valid only while the CWD shortcut above does not apply.
+    cwd_marker = str(cwd / project_management_dir_name)
 
     # With no environment override, reuse cached value only when the caller is
     # still operating *inside* that project root. This keeps performance wins
@@ -133,10 +201,12 @@ def resolve_project_root() -> Path:
     # long-running processes) that chdir into other repositories.
     if _PROJECT_ROOT_CACHE is not None:
         if cwd == _PROJECT_ROOT_CACHE or _PROJECT_ROOT_CACHE in cwd.parents:
-            if (_PROJECT_ROOT_CACHE / project_management_dir_name).exists() or (
-                _PROJECT_ROOT_CACHE / project_config_dir_name
-            ).exists():
-                return _PROJECT_ROOT_CACHE
+            markers = (
+                str(_PROJECT_ROOT_CACHE / project_management_dir_name),
+                str(_PROJECT_ROOT_CACHE / project_config_dir_name),
+            )
+            if any(os.path.exists(m) for m in markers):
+                return _PROJECT_ROOT_CACHE, markers, cwd_marker
             # Stale cache from a temp env-root without markers; discard and
             # fall through to git-based detection.
             _PROJECT_ROOT_CACHE = None
@@ -199,7 +269,7 @@ def resolve_project_root() -> Path:
             )
 
     _PROJECT_ROOT_CACHE = path
-    return path
+    return path, (str(path),), cwd_marker
 
 
 def get_project_path(*parts: str) -> Path:
@@ -278,6 +348,7 @@ __all__ = [
     "EdisonPathError",
     "PathResolver",
     "resolve_project_root",
+    "clear_path_resolution_cache",
     "get_project_path",
     "_PROJECT_ROOT_CACHE",
 ]
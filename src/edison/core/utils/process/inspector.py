@@ -3,6 +3,11 @@
 Walks up the process tree to find the topmost Edison or LLM process,
 then generates a PID-based session identifier.
 
+On Linux the ancestor chain is read straight from ``/proc`` (stat + cmdline,
+one pass). The ancestor match is cached on disk per parent process and
+revalidated by comparing process start times, so repeated invocations from
+the same shell skip the walk entirely.
+
 IMPORTANT
 ---------
 psutil is a required dependency as of task 001-session-id-inference.
@@ -11,12 +16,22 @@ IDE wrappers (Claude, Codex, Cursor, etc.).
 """
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-
+import stat
+import sys
+import tempfile
+from contextlib import nullcontext
+from dataclasses import dataclass
 from functools import lru_cache
+from pathlib import Path
+from typing import Any, cast
+
 import psutil  # Required dependency - stable process tree inference
 
 HAS_PSUTIL = True  # Always True since psutil is now required
+_HAS_PROCFS = sys.platform.startswith("linux") and os.path.isdir("/proc/self")
 
 
 def _project_root_key() -> str:
@@ -167,6 +182,7 @@ def reset_process_detection_caches() -> None:
     _cached_llm_cmdline_excludes.cache_clear()
     _cached_edison_process_names.cache_clear()
     _cached_edison_script_markers.cache_clear()
+    _MEMO.clear()
 
 
 def _is_edison_script(cmdline: list[str]) -> bool:
@@ -234,6 +250,135 @@ def is_process_alive(pid: int) -> bool:
         return False
 
 
+@dataclass(frozen=True)
+class _Ancestor:
+    """One process of the ancestor chain, read once."""
+
+    pid: int
+    name: str
+    cmdline: tuple[str, ...]
+    start: str  # Opaque start-time token: identifies the process across pid reuse.
+
+
+def _normalize_name(raw: str) -> str:
+    name = (raw or "").lower()
+    return "python" if name.startswith("python") else name
+
+
+def _read_proc(pid: int) -> tuple[_Ancestor, int] | None:
+    """Read one process from /proc (stat + cmdline); returns (ancestor, ppid)."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as fh:
+            stat = fh.read().decode("utf-8", "replace")
+        with open(f"/proc/{pid}/cmdline", "rb") as fh:
+            raw_cmdline = fh.read()
+    except OSError:
+        return None
+    # comm may contain spaces/parens: it spans from the first "(" to the last ")".
+    lpar, rpar = stat.find("("), stat.rfind(")")
+    if lpar < 0 or rpar < 0:
+        return None
+    comm = stat[lpar + 1 : rpar]
+    fields = stat[rpar + 2 :].split()
+    if len(fields) < 20 or fields[0] == "Z":
+        return None
+    cmdline = tuple(a.decode("utf-8", "replace") for a in raw_cmdline.split(b"\0") if a)
+    # Like psutil: comm is truncated to 15 chars, so prefer the executable basename.
+    if len(comm) >= 15 and cmdline:
+        exe = os.path.basename(cmdline[0])
+        if exe.startswith(comm):
+            comm = exe
+    return _Ancestor(pid=pid, name=_normalize_name(comm), cmdline=cmdline, start=fields[19]), int(fields[1])
+
+
+def _proc_start(pid: int) -> str | None:
+    if _HAS_PROCFS:
+        info = _read_proc(pid)
+        return info[0].start if info else None
+    try:
+        return repr(psutil.Process(pid).create_time())
+    except Exception:
+        return None
+
+
+def _ancestor_chain_procfs(pid: int, *, limit: int | None = None) -> list[_Ancestor]:
+    chain: list[_Ancestor] = []
+    while pid > 0 and (limit is None or len(chain) < limit):
+        info = _read_proc(pid)
+        if info is None:
+            break
+        ancestor, ppid = info
+        chain.append(ancestor)
+        if ppid == pid:
+            break
+        pid = ppid
+    return chain
+
+
+def _ancestor_chain(pid: int, *, limit: int | None = None) -> list[_Ancestor]:
+    """Read `pid` and its ancestors: one /proc pass on Linux, psutil elsewhere."""
+    if _HAS_PROCFS:
+        return _ancestor_chain_procfs(pid, limit=limit)
+    return _ancestor_chain_from(psutil.Process(pid), limit=limit)
+
+
+def _ancestor_chain_from(start: Any, *, limit: int | None = None) -> list[_Ancestor]:
+    """Read the ancestor chain from psutil-like process objects."""
+    chain: list[_Ancestor] = []
+    current = start
+    while current and (limit is None or len(chain) < limit):
+        oneshot = getattr(current, "oneshot", None)
+        with oneshot() if oneshot is not None else nullcontext():
+            try:
+                name = _normalize_name(current.name())
+            except psutil.AccessDenied:
+                name = ""
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                break
+            try:
+                cmdline = tuple(current.cmdline())
+            except psutil.AccessDenied:
+                cmdline = ()
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                break
+            try:
+                started = repr(current.create_time())
+            except Exception:
+                started = ""
+        chain.append(_Ancestor(pid=current.pid, name=name, cmdline=cmdline, start=started))
+        try:
+            parent = current.parent()
+            if parent is None:
+                break
+        except (psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
+            break
+        current = parent
+    return chain
+
+
+def _match(ancestor: _Ancestor, edison_names: list[str]) -> str | None:
+    cmdline = list(ancestor.cmdline)
+    # LLM wrappers are detected by name OR cmdline markers.
+    llm_name = _match_llm_wrapper(ancestor.name, cmdline)
+    if llm_name:
+        return llm_name
+    if ancestor.name in edison_names:
+        if ancestor.name != "python" or _is_edison_script(cmdline):
+            # For python processes, verify it's actually running Edison.
+            return "edison"
+    return None
+
+
+def _topmost_match(chain: list[_Ancestor]) -> tuple[str, _Ancestor] | None:
+    """Return the highest (closest to the root) matching process of `chain`."""
+    edison_names = _load_edison_process_names()
+    for ancestor in reversed(chain):
+        label = _match(ancestor, edison_names)
+        if label:
+            return label, ancestor
+    return None
+
+
 def find_topmost_process() -> tuple[str, int]:
     """Walk up process tree to find the topmost Edison or LLM process.
 
@@ -243,72 +388,157 @@ def find_topmost_process() -> tuple[str, int]:
     - llm1 -> edison1 -> llm2 -> edison2: returns llm1
     - edison orchestrator launch -> claude: returns edison
 
+    The ancestor part of the answer (everything above the current process) is
+    cached per parent process and revalidated by comparing start times, so
+    repeated invocations from one shell do not re-walk the tree.
+
     Fallback: current process PID when nothing matches.
 
     Returns:
         Tuple[str, int]: (process_name, pid) of the topmost matching process
     """
     try:
-        return _find_topmost_process_from(psutil.Process(os.getpid()))
+        pid = os.getpid()
+        found = _cached_ancestor_match()
+        if found is _UNCACHED:
+            chain = _ancestor_chain(pid)
+            matched = _topmost_match(chain[1:])
+            found = (matched[0], matched[1].pid) if matched else None
+            _store_ancestor_match(chain, matched)
+        if found is not None:
+            return cast(tuple[str, int], found)
+        current = _ancestor_chain(pid, limit=1)
+        label = _match(current[0], _load_edison_process_names()) if current else None
+        return (label or "python", pid)
 
     except Exception:
         # Final fallback if anything unexpected occurs
         return ("python", os.getpid())
 
+
 def _find_topmost_process_from(start: psutil.Process) -> tuple[str, int]:
     """Internal helper to find the topmost-of-either match from an arbitrary start process.
 
     This is used for deterministic unit tests without relying on the real OS process tree.
     """
-    edison_names = _load_edison_process_names()
+    matched = _topmost_match(_ancestor_chain_from(start))
+    if matched:
+        return (matched[0], matched[1].pid)
 
-    current = start
-    highest_match: tuple[str, int] | None = None
+    # Fallback: default to current PID with generic python label
+    return ("python", os.getpid())
 
-    while current:
-        try:
-            name_raw = (current.name() or "").lower()
-            name = "python" if name_raw.startswith("python") else name_raw
-        except psutil.AccessDenied:
-            name = ""
-        except (psutil.NoSuchProcess, psutil.ZombieProcess):
-            break
 
-        try:
-            cmdline = current.cmdline()
-        except psutil.AccessDenied:
-            cmdline = []
-        except (psutil.NoSuchProcess, psutil.ZombieProcess):
-            break
+# --- ancestor match cache ----------------------------------------------------
 
-        # Check for LLM wrapper (by name OR cmdline markers). Always update highest_match.
-        llm_name = _match_llm_wrapper(name, cmdline)
-        if llm_name:
-            highest_match = (llm_name, current.pid)
+_UNCACHED = object()
+_MEMO: dict[tuple[int, int, str], tuple[str, int] | None] = {}
 
-        # Check for Edison process - always update highest_match when found
-        elif name in edison_names:
-            if name == "python":
-                # For python processes, verify it's actually running Edison
-                if _is_edison_script(cmdline):
-                    highest_match = ("edison", current.pid)
-            else:
-                highest_match = ("edison", current.pid)
 
-        try:
-            parent = current.parent()
-            if parent is None:
-                break
-        except (psutil.NoSuchProcess, psutil.ZombieProcess, psutil.AccessDenied):
-            break
+def _private_dir(path: Path) -> bool:
+    """Create `path` as 0o700 if missing; True only if it is a real dir we own, closed to others."""
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = os.lstat(path)
+        if not stat.S_ISDIR(st.st_mode):
+            return False  # A symlink (or file) planted in the shared temp dir.
+        if not hasattr(os, "getuid"):
+            return True
+        if st.st_uid != os.getuid() or st.st_mode & 0o022:
+            return False  # Someone else owns it, or could have written entries into it.
+        if st.st_mode & 0o077:
+            os.chmod(path, 0o700)  # Ours but readable by others (older Edison versions).
+    except OSError:
+        return False
+    return True
 
-        current = parent
 
-    if highest_match:
-        return highest_match
+def _inference_cache_dir() -> Path | None:
+    """Per-user cache dir under the temp dir, or None when it cannot be trusted.
 
-    # Fallback: default to current PID with generic python label
-    return ("python", os.getpid())
+    The path is predictable, so another local user could create it first and plant
+    entries; every level is created 0o700 and must be owned by us and closed to
+    group/other before any entry is read or written.
+    """
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    user_dir = Path(tempfile.gettempdir()) / f"edison-{uid}"
+    cache_dir = user_dir / "process-inference"
+    if not _private_dir(user_dir) or not _private_dir(cache_dir):
+        return None
+    return cache_dir
+
+
+def _detection_fingerprint() -> str:
+    payload = json.dumps(
+        [
+            _load_llm_process_names(),
+            _load_llm_script_markers(),
+            _load_llm_marker_map(),
+            _load_llm_cmdline_excludes(),
+            _load_edison_process_names(),
+            _load_edison_script_markers(),
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _cached_ancestor_match() -> Any:
+    """Return the cached ancestor match (or None), or `_UNCACHED` when invalid."""
+    ppid = os.getppid()
+    fingerprint = _detection_fingerprint()
+    memo_key = (os.getpid(), ppid, fingerprint)
+    if memo_key in _MEMO:
+        return _MEMO[memo_key]
+    cache_dir = _inference_cache_dir()
+    if cache_dir is None:
+        return _UNCACHED
+    try:
+        data = json.loads((cache_dir / f"{ppid}.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return _UNCACHED
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return _UNCACHED
+    if data.get("parentStart") != _proc_start(ppid):
+        return _UNCACHED
+    match = data.get("match")
+    found: tuple[str, int] | None = None
+    if match:
+        name, pid, started = str(match[0]), int(match[1]), str(match[2])
+        if _proc_start(pid) != started:
+            return _UNCACHED
+        found = (name, pid)
+    _MEMO[memo_key] = found
+    return found
+
+
+def _store_ancestor_match(chain: list[_Ancestor], matched: tuple[str, _Ancestor] | None) -> None:
+    if len(chain) < 2:
+        return
+    parent = chain[1]
+    fingerprint = _detection_fingerprint()
+    _MEMO[(os.getpid(), parent.pid, fingerprint)] = (matched[0], matched[1].pid) if matched else None
+    payload = {
+        "fingerprint": fingerprint,
+        "parentStart": parent.start,
+        "match": [matched[0], matched[1].pid, matched[1].start] if matched else None,
+    }
+    cache_dir = _inference_cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        fd, tmp = tempfile.mkstemp(dir=str(cache_dir), prefix=f".{parent.pid}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh)
+        os.replace(tmp, cache_dir / f"{parent.pid}.json")
+    except OSError:
+        pass
+
+
+def reset_process_inference_cache() -> None:
+    """Forget in-process ancestor matches (the on-disk cache self-validates)."""
+    _MEMO.clear()
 
 
 def infer_session_id() -> str:
@@ -345,4 +575,5 @@ __all__ = [
     "_find_topmost_process_from",
     "infer_session_id",
     "get_current_owner",
+    "reset_process_inference_cache",
 ]
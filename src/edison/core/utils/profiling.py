@@ -1,7 +1,7 @@
 """Lightweight hierarchical profiler for Edison.
 
 Goals:
-- Zero overhead when disabled (no-op span context manager).
+- Zero overhead when disabled (no-op span context manager / counters).
 - Works across the whole codebase without invasive plumbing (ContextVar-based).
 - Produces both human-readable summaries and machine-readable JSON.
 """
@@ -29,16 +29,24 @@ class SpanRecord:
 
 
 class Profiler:
-    """Collects spans in a hierarchical fashion."""
+    """Collects spans in a hierarchical fashion, plus named event counters."""
 
     def __init__(self) -> None:
         self._spans: List[SpanRecord] = []
         self._depth: int = 0
+        self._counters: Dict[str, int] = {}
 
     @property
     def spans(self) -> List[SpanRecord]:
         return list(self._spans)
 
+    @property
+    def counters(self) -> Dict[str, int]:
+        return dict(self._counters)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self._counters[name] = self._counters.get(name, 0) + n
+
     @contextmanager
     def span(self, name: str, **meta: Any) -> Iterator[None]:
         start = perf_counter()
@@ -70,6 +78,7 @@ class Profiler:
         return {
             "spans": [asdict(s) for s in self._spans],
             "summary_ms": self.summary_ms(),
+            "counters": self.counters,
         }
 
 
@@ -92,11 +101,18 @@ def span(name: str, **meta: Any) -> Iterator[None]:
         yield
 
 
+def count(name: str, n: int = 1) -> None:
+    """Increment a named counter on the active profiler (no-op when disabled)."""
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is not None:
+        profiler.count(name, n)
+
+
 def get_active_profiler() -> Optional[Profiler]:
     return _ACTIVE_PROFILER.get()
 
 
-__all__ = ["Profiler", "SpanRecord", "enable_profiler", "span", "get_active_profiler"]
+__all__ = ["Profiler", "SpanRecord", "count", "enable_profiler", "span", "get_active_profiler"]
 
 
 
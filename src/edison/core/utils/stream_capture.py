@@ -0,0 +1,265 @@
+"""Bounded-memory capture of subprocess output.
+
+`subprocess.communicate()` buffers a command's entire stdout/stderr in memory.
+Test runs and `git diff` on large changes can emit hundreds of MB, which is then
+copied again into audit events and parsers. `StreamCapture` consumes output in
+chunks instead:
+
+- tees every byte to an optional file (the full output stays available on disk)
+- keeps only a bounded head and a bounded tail (ring buffer) in memory
+- hashes incrementally (sha256) and counts bytes
+- exposes `iter_lines()` for parsers (streams from the tee file)
+
+`pump_process()` drives a Popen's stdout/stderr pipes into captures with a
+selector loop and a deadline, replacing `communicate()` for streamed runs.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import selectors
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+_CHUNK_SIZE = 64 * 1024
+DEFAULT_HEAD_BYTES = 64 * 1024
+DEFAULT_TAIL_BYTES = 64 * 1024
+
+
+class StreamCapture:
+    """Sink for one output stream: tee file + head/tail excerpt + running hash."""
+
+    def __init__(
+        self,
+        *,
+        tee_path: Optional[Path] = None,
+        head_bytes: int = DEFAULT_HEAD_BYTES,
+        tail_bytes: int = DEFAULT_TAIL_BYTES,
+    ) -> None:
+        self.tee_path = Path(tee_path) if tee_path is not None else None
+        self.head_bytes = max(0, int(head_bytes))
+        self.tail_bytes = max(0, int(tail_bytes))
+        self.total_bytes = 0
+        self._head = bytearray()
+        self._tail = bytearray()
+        self._hash = hashlib.sha256()
+        self._tee: Optional[IO[bytes]] = None
+        if self.tee_path is not None:
+            self.tee_path.parent.mkdir(parents=True, exist_ok=True)
+            self._tee = open(self.tee_path, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        self.total_bytes += len(chunk)
+        self._hash.update(chunk)
+        if self._tee is not None:
+            self._tee.write(chunk)
+        room = self.head_bytes - len(self._head)
+        if room > 0:
+            self._head += chunk[:room]
+            chunk = chunk[room:]
+        if chunk and self.tail_bytes:
+            if len(chunk) >= self.tail_bytes:
+                self._tail[:] = chunk[-self.tail_bytes :]
+            else:
+                self._tail += chunk
+                overflow = len(self._tail) - self.tail_bytes
+                if overflow > 0:
+                    del self._tail[:overflow]
+
+    def close(self) -> None:
+        if self._tee is not None:
+            self._tee.close()
+            self._tee = None
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    @property
+    def head(self) -> bytes:
+        return bytes(self._head)
+
+    @property
+    def tail(self) -> bytes:
+        return bytes(self._tail)
+
+    @property
+    def omitted_bytes(self) -> int:
+        return self.total_bytes - len(self._head) - len(self._tail)
+
+    @property
+    def truncated(self) -> bool:
+        return self.omitted_bytes > 0
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    def excerpt(self, max_bytes: Optional[int] = None, *, encoding: str = "utf-8") -> str:
+        """Head + tail as text, with a marker for the omitted middle.
+
+        With `max_bytes`, the excerpt is further limited to half head / half tail.
+        """
+        head, tail = bytes(self._head), bytes(self._tail)
+        if max_bytes is not None:
+            if max_bytes <= 0:
+                return ""
+            if len(head) + len(tail) > max_bytes:
+                keep_tail = min(len(tail), max_bytes // 2)
+                tail = tail[len(tail) - keep_tail :]
+                head = head[: max_bytes - keep_tail]
+        omitted = self.total_bytes - len(head) - len(tail)
+        if omitted <= 0:
+            return (head + tail).decode(encoding, errors="replace")
+        return (
+            head.decode(encoding, errors="replace")
+            + f"\n... [{omitted} bytes omitted] ...\n"
+            + tail.decode(encoding, errors="replace")
+        )
+
+    def iter_lines(self, *, encoding: str = "utf-8") -> Iterator[str]:
+        """Iterate output lines (with line endings) without loading it all.
+
+        Streams from the tee file; without one, only complete (untruncated)
+        output can be iterated.
+        """
+        if self.tee_path is not None:
+            if self._tee is not None:
+                self._tee.flush()
+            with open(self.tee_path, "r", encoding=encoding, errors="replace", newline="") as fh:
+                yield from fh
+            return
+        if self.truncated:
+            raise ValueError("Output was truncated and not teed to a file; lines are unavailable")
+        yield from (bytes(self._head) + bytes(self._tail)).decode(
+            encoding, errors="replace"
+        ).splitlines(keepends=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bytes": self.total_bytes,
+            "sha256": self.sha256,
+            "truncated": self.truncated,
+            "path": str(self.tee_path) if self.tee_path is not None else None,
+        }
+
+
+@dataclass(frozen=True)
+class StreamCaptureOptions:
+    """Opt-in streamed capture for `run_with_timeout(..., stream_capture=...)`."""
+
+    stdout_path: Optional[Path] = None
+    stderr_path: Optional[Path] = None
+    head_bytes: int = DEFAULT_HEAD_BYTES
+    tail_bytes: int = DEFAULT_TAIL_BYTES
+
+    def open(self) -> tuple[StreamCapture, StreamCapture]:
+        return (
+            StreamCapture(tee_path=self.stdout_path, head_bytes=self.head_bytes, tail_bytes=self.tail_bytes),
+            StreamCapture(tee_path=self.stderr_path, head_bytes=self.head_bytes, tail_bytes=self.tail_bytes),
+        )
+
+
+class StreamedCompletedProcess(subprocess.CompletedProcess):
+    """CompletedProcess whose stdout/stderr are excerpts backed by captures.
+
+    `stdout`/`stderr` hold `capture.excerpt()` (decoded text, or bytes when the
+    run was not in text mode); the full output is in the tee files, if any.
+    """
+
+    def __init__(
+        self,
+        args: Any,
+        returncode: int,
+        stdout_capture: StreamCapture,
+        stderr_capture: StreamCapture,
+        *,
+        text: bool = True,
+    ) -> None:
+        out: Any = stdout_capture.excerpt()
+        err: Any = stderr_capture.excerpt()
+        if not text:
+            out, err = out.encode("utf-8"), err.encode("utf-8")
+        super().__init__(args, returncode, stdout=out, stderr=err)
+        self.stdout_capture = stdout_capture
+        self.stderr_capture = stderr_capture
+
+
+def _feed_stdin(pipe: IO[bytes], data: bytes) -> None:
+    try:
+        pipe.write(data)
+    except (BrokenPipeError, OSError):
+        pass
+    finally:
+        try:
+            pipe.close()
+        except OSError:
+            pass
+
+
+def pump_process(
+    proc: subprocess.Popen[bytes],
+    stdout: StreamCapture,
+    stderr: StreamCapture,
+    *,
+    timeout: Optional[float],
+    input_data: Optional[bytes] = None,
+) -> bool:
+    """Drain `proc`'s pipes into captures until EOF or the deadline.
+
+    Returns False when the deadline expired (the caller terminates the process).
+    """
+    if input_data is not None and proc.stdin is not None:
+        threading.Thread(target=_feed_stdin, args=(proc.stdin, input_data), daemon=True).start()
+
+    deadline = None if timeout is None else monotonic() + timeout
+    sel = selectors.DefaultSelector()
+    open_pipes: List[IO[bytes]] = []
+    for pipe, sink in ((proc.stdout, stdout), (proc.stderr, stderr)):
+        if pipe is not None:
+            sel.register(pipe, selectors.EVENT_READ, sink)
+            open_pipes.append(pipe)
+    try:
+        while open_pipes:
+            remaining = None if deadline is None else deadline - monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            for key, _ in sel.select(remaining):
+                chunk = os.read(key.fd, _CHUNK_SIZE)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    open_pipes.remove(key.fileobj)  # type: ignore[arg-type]
+                    continue
+                key.data.write(chunk)
+        remaining = None if deadline is None else max(0.0, deadline - monotonic())
+        try:
+            proc.wait(timeout=remaining)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+    finally:
+        sel.close()
+        for pipe in (proc.stdout, proc.stderr):
+            if pipe is not None:
+                try:
+                    pipe.close()
+                except OSError:
+                    pass
+        stdout.close()
+        stderr.close()
+
+
+__all__ = [
+    "DEFAULT_HEAD_BYTES",
+    "DEFAULT_TAIL_BYTES",
+    "StreamCapture",
+    "StreamCaptureOptions",
+    "StreamedCompletedProcess",
+    "pump_process",
+]
@@ -9,6 +9,7 @@ This module provides safe subprocess execution with:
 - No shell=True by default (security)
 """
 
+import math
 import shlex
 import os
 import signal
@@ -18,6 +19,12 @@ from time import perf_counter
 from typing import Any, List, MutableMapping, Optional, Sequence
 
 from edison.core.config.domains.timeouts import TimeoutsConfig
+from edison.core.utils.stream_capture import (
+    StreamCapture,
+    StreamCaptureOptions,
+    StreamedCompletedProcess,
+    pump_process,
+)
 
 
 def _flatten_cmd(cmd: Any) -> Sequence[str]:
@@ -94,7 +101,13 @@ def _terminate_process_group(proc: subprocess.Popen[Any]) -> None:
         pass
 
 
-def _run_capture_output_nohang(cmd: Any, *, timeout: float, **kwargs: Any) -> subprocess.CompletedProcess:
+def _run_capture_output_nohang(
+    cmd: Any,
+    *,
+    timeout: float | None,
+    stream: StreamCaptureOptions | None = None,
+    **kwargs: Any,
+) -> subprocess.CompletedProcess:
     argv = list(_flatten_cmd(cmd))
     input_value = kwargs.pop("input", None)
     cwd = kwargs.pop("cwd", None)
@@ -103,6 +116,66 @@ def _run_capture_output_nohang(cmd: Any, *, timeout: float, **kwargs: Any) -> su
     check = bool(kwargs.pop("check", False))
     kwargs.pop("capture_output", None)
 
+    if stream is not None:
+        completed = _run_streamed(
+            argv, timeout=timeout, stream=stream, input_value=input_value, cwd=cwd, env=env, text=text
+        )
+    else:
+        proc = subprocess.Popen(
+            argv,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.PIPE if input_value is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=text,
+            **_popen_process_group_kwargs(),
+        )
+        try:
+            stdout, stderr = proc.communicate(input=input_value, timeout=timeout)
+        except subprocess.TimeoutExpired as exc:
+            _terminate_process_group(proc)
+            try:
+                stdout, stderr = proc.communicate(timeout=0.2)
+            except Exception:
+                stdout = getattr(exc, "output", None)
+                stderr = getattr(exc, "stderr", None)
+            raise subprocess.TimeoutExpired(argv, timeout, output=stdout, stderr=stderr) from None
+
+        completed = subprocess.CompletedProcess(
+            argv,
+            proc.returncode if proc.returncode is not None else 0,
+            stdout=stdout,
+            stderr=stderr,
+        )
+    if check and completed.returncode != 0:
+        error = subprocess.CalledProcessError(
+            completed.returncode,
+            argv,
+            output=completed.stdout,
+            stderr=completed.stderr,
+        )
+        if isinstance(completed, StreamedCompletedProcess):
+            error.stdout_capture = completed.stdout_capture  # type: ignore[attr-defined]
+            error.stderr_capture = completed.stderr_capture  # type: ignore[attr-defined]
+        raise error
+    return completed
+
+
+def _run_streamed(
+    argv: List[str],
+    *,
+    timeout: float | None,
+    stream: StreamCaptureOptions,
+    input_value: Any,
+    cwd: Any,
+    env: Any,
+    text: bool,
+) -> StreamedCompletedProcess:
+    """Run argv with stdout/stderr pumped into bounded `StreamCapture`s."""
+    if isinstance(input_value, str):
+        input_value = input_value.encode("utf-8")
+    stdout_cap, stderr_cap = stream.open()
     proc = subprocess.Popen(
         argv,
         cwd=cwd,
@@ -110,34 +183,43 @@ def _run_capture_output_nohang(cmd: Any, *, timeout: float, **kwargs: Any) -> su
         stdin=subprocess.PIPE if input_value is not None else None,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=text,
         **_popen_process_group_kwargs(),
     )
-    try:
-        stdout, stderr = proc.communicate(input=input_value, timeout=timeout)
-    except subprocess.TimeoutExpired as exc:
+    finished = pump_process(proc, stdout_cap, stderr_cap, timeout=timeout, input_data=input_value)
+    if not finished:
         _terminate_process_group(proc)
-        try:
-            stdout, stderr = proc.communicate(timeout=0.2)
-        except Exception:
-            stdout = getattr(exc, "output", None)
-            stderr = getattr(exc, "stderr", None)
-        raise subprocess.TimeoutExpired(argv, timeout, output=stdout, stderr=stderr) from None
-
-    completed = subprocess.CompletedProcess(
+        exc = subprocess.TimeoutExpired(
+            argv, timeout or 0.0, output=stdout_cap.excerpt(), stderr=stderr_cap.excerpt()
+        )
+        exc.stdout_capture = stdout_cap  # type: ignore[attr-defined]
+        exc.stderr_capture = stderr_cap  # type: ignore[attr-defined]
+        raise exc
+    return StreamedCompletedProcess(
         argv,
         proc.returncode if proc.returncode is not None else 0,
-        stdout=stdout,
-        stderr=stderr,
+        stdout_cap,
+        stderr_cap,
+        text=text,
     )
-    if check and completed.returncode != 0:
-        raise subprocess.CalledProcessError(
-            completed.returncode,
-            argv,
-            output=stdout,
-            stderr=stderr,
-        )
-    return completed
+
+
+def _output_audit_fields(source: Any, *, max_bytes: int) -> dict[str, Any]:
+    """Truncated stdout/stderr excerpts (plus byte counts/hashes when streamed)."""
+    from edison.core.audit.logger import truncate_text
+
+    fields: dict[str, Any] = {}
+    for name in ("stdout", "stderr"):
+        capture = getattr(source, f"{name}_capture", None)
+        if isinstance(capture, StreamCapture):
+            fields[name] = capture.excerpt(max_bytes)
+            fields[f"{name}_bytes"] = capture.total_bytes
+            fields[f"{name}_sha256"] = capture.sha256
+            continue
+        value = getattr(source, name, None)
+        if name == "stdout" and value is None:
+            value = getattr(source, "output", None)
+        fields[name] = truncate_text(value, max_bytes=max_bytes) if isinstance(value, str) else ""
+    return fields
 
 
 def configured_timeout(cmd: Any, timeout_type: str | None = None, cwd: Path | str | None = None) -> float:
@@ -193,6 +275,11 @@ def run_with_timeout(cmd, timeout_type: str | None = None, **kwargs):
         cmd: Command list/str passed through to ``subprocess.run``.
         timeout_type: Key inside ``subprocess_timeouts`` (e.g., ``git_operations``).
         **kwargs: Additional arguments forwarded to ``subprocess.run``.
+            ``stream_capture`` (``True`` or a ``StreamCaptureOptions``) captures
+            stdout/stderr in bounded memory instead: output is teed to the
+            configured files, hashed incrementally, and ``stdout``/``stderr``
+            hold head/tail excerpts (see ``StreamedCompletedProcess``).
+            An explicit ``timeout=math.inf`` runs without a deadline.
 
     Returns:
         CompletedProcess from ``subprocess.run``.
@@ -205,9 +292,26 @@ def run_with_timeout(cmd, timeout_type: str | None = None, **kwargs):
     # Allow callers to override the timeout explicitly while still honouring
     # configured defaults when none is supplied.
     explicit_timeout = kwargs.pop("timeout", None)
+    stream_capture = kwargs.pop("stream_capture", None)
+    if stream_capture is True:
+        stream_capture = StreamCaptureOptions()
+    elif not stream_capture:
+        stream_capture = None
     timeout = explicit_timeout if explicit_timeout is not None else configured_timeout(
         cmd, timeout_type=timeout_type, cwd=kwargs.get("cwd")
     )
+    if timeout is not None and math.isinf(float(timeout)):
+        timeout = None
+
+    argv_parts = _flatten_cmd(cmd)
+    if argv_parts:
+        # Lazy import: edison.core.utils.git imports this module.
+        from edison.core.utils.git.service import note_external_command, note_git_command
+
+        if os.path.basename(argv_parts[0]) == "git":
+            note_git_command(argv_parts)
+        else:
+            note_external_command()
 
     # Best-effort structured audit logging (fail-open).
     start = perf_counter()
@@ -244,7 +348,7 @@ def run_with_timeout(cmd, timeout_type: str | None = None, **kwargs):
                 argv=_flatten_cmd(cmd),
                 cwd=kwargs.get("cwd"),
                 timeout=timeout,
-                capture_output=bool(kwargs.get("capture_output", False)),
+                capture_output=bool(kwargs.get("capture_output", False) or stream_capture),
                 check=bool(kwargs.get("check", False)),
             )
         except Exception:
@@ -252,19 +356,21 @@ def run_with_timeout(cmd, timeout_type: str | None = None, **kwargs):
 
     try:
         capture_output = bool(kwargs.get("capture_output", False))
-        if capture_output and timeout is not None and "stdout" not in kwargs and "stderr" not in kwargs:
+        if stream_capture is not None:
+            result = _run_capture_output_nohang(
+                cmd,
+                timeout=float(timeout) if timeout is not None else None,
+                stream=stream_capture,
+                **kwargs,
+            )
+        elif capture_output and timeout is not None and "stdout" not in kwargs and "stderr" not in kwargs:
             result = _run_capture_output_nohang(cmd, timeout=float(timeout), **kwargs)
         else:
             result = subprocess.run(cmd, timeout=timeout, **kwargs)
     except subprocess.TimeoutExpired as exc:
         if subprocess_audit_enabled:
             try:
-                from edison.core.audit.logger import audit_event, truncate_text
-
-                stdout = getattr(exc, "output", None)
-                stderr = getattr(exc, "stderr", None)
-                stdout_s = stdout if isinstance(stdout, str) else ""
-                stderr_s = stderr if isinstance(stderr, str) else ""
+                from edison.core.audit.logger import audit_event
 
                 audit_event(
                     "subprocess.timeout",
@@ -274,8 +380,7 @@ def run_with_timeout(cmd, timeout_type: str | None = None, **kwargs):
                     timeout=timeout,
                     duration_ms=(perf_counter() - start) * 1000.0,
                     error=str(exc),
-                    stdout=truncate_text(stdout_s, max_bytes=max_out_bytes),
-                    stderr=truncate_text(stderr_s, max_bytes=max_out_bytes),
+                    **_output_audit_fields(exc, max_bytes=max_out_bytes),
                 )
             except Exception:
                 pass
@@ -283,12 +388,7 @@ def run_with_timeout(cmd, timeout_type: str | None = None, **kwargs):
     except subprocess.CalledProcessError as exc:
         if subprocess_audit_enabled:
             try:
-                from edison.core.audit.logger import audit_event, truncate_text
-
-                stdout = getattr(exc, "stdout", None) or getattr(exc, "output", None)
-                stderr = getattr(exc, "stderr", None)
-                stdout_s = stdout if isinstance(stdout, str) else ""
-                stderr_s = stderr if isinstance(stderr, str) else ""
+                from edison.core.audit.logger import audit_event
 
                 audit_event(
                     "subprocess.end",
@@ -300,8 +400,7 @@ def run_with_timeout(cmd, timeout_type: str | None = None, **kwargs):
                     returncode=getattr(exc, "returncode", None),
                     ok=False,
                     check=True,
-                    stdout=truncate_text(stdout_s, max_bytes=max_out_bytes),
-                    stderr=truncate_text(stderr_s, max_bytes=max_out_bytes),
+                    **_output_audit_fields(exc, max_bytes=max_out_bytes),
                 )
             except Exception:
                 pass
@@ -326,12 +425,7 @@ def run_with_timeout(cmd, timeout_type: str | None = None, **kwargs):
 
     if subprocess_audit_enabled:
         try:
-            from edison.core.audit.logger import audit_event, truncate_text
-
-            stdout = getattr(result, "stdout", None)
-            stderr = getattr(result, "stderr", None)
-            stdout_s = stdout if isinstance(stdout, str) else ""
-            stderr_s = stderr if isinstance(stderr, str) else ""
+            from edison.core.audit.logger import audit_event
 
             audit_event(
                 "subprocess.end",
@@ -343,8 +437,7 @@ def run_with_timeout(cmd, timeout_type: str | None = None, **kwargs):
                 returncode=getattr(result, "returncode", None),
                 ok=(getattr(result, "returncode", 1) == 0),
                 check=bool(kwargs.get("check", False)),
-                stdout=truncate_text(stdout_s, max_bytes=max_out_bytes),
-                stderr=truncate_text(stderr_s, max_bytes=max_out_bytes),
+                **_output_audit_fields(result, max_bytes=max_out_bytes),
             )
         except Exception:
             pass
@@ -384,6 +477,7 @@ def run_command(
     text: bool = True,
     check: bool = False,
     input: Any = None,
+    stream_capture: StreamCaptureOptions | bool | None = None,
 ) -> subprocess.CompletedProcess:
     """
     Thin wrapper around subprocess.run with safe defaults.
@@ -400,6 +494,7 @@ def run_command(
         capture_output: Capture stdout/stderr
         text: Return output as text instead of bytes
         check: Raise CalledProcessError on non-zero exit
+        stream_capture: Capture output in bounded memory (see run_with_timeout)
 
     Returns:
         CompletedProcess from subprocess.run
@@ -413,6 +508,7 @@ def run_command(
         text=text,
         check=check,
         input=input,
+        stream_capture=stream_capture,
     )
 
 
@@ -516,6 +612,7 @@ def run_ci_command_from_string(
     text: bool = True,
     check: bool = False,
     input: Any = None,
+    stream_capture: StreamCaptureOptions | bool | None = None,
 ) -> subprocess.CompletedProcess:
     """
     Execute a CI command defined as a shell-style string plus extra args.
@@ -532,6 +629,7 @@ def run_ci_command_from_string(
         capture_output: Capture stdout/stderr
         text: Return output as text instead of bytes
         check: Raise CalledProcessError on non-zero exit
+        stream_capture: Capture output in bounded memory (see run_with_timeout)
 
     Returns:
         CompletedProcess from subprocess.run
@@ -547,6 +645,7 @@ def run_ci_command_from_string(
         text=text,
         check=check,
         input=input,
+        stream_capture=stream_capture,
     )
 
 
@@ -589,6 +688,8 @@ def expand_shell_pipeline(
 
 
 __all__ = [
+    "StreamCaptureOptions",
+    "StreamedCompletedProcess",
     "run_with_timeout",
     "configured_timeout",
     "check_output_with_timeout",
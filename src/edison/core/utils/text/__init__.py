@@ -34,6 +34,8 @@ from .markdown import (
 from .frontmatter import (
     ParsedDocument,
     parse_frontmatter,
+    read_frontmatter,
+    clear_frontmatter_cache,
     format_frontmatter,
     extract_frontmatter_batch,
     has_frontmatter,
@@ -69,6 +71,8 @@ __all__ = [
     # Frontmatter
     "ParsedDocument",
     "parse_frontmatter",
+    "read_frontmatter",
+    "clear_frontmatter_cache",
     "format_frontmatter",
     "extract_frontmatter_batch",
     "has_frontmatter",
@@ -14,15 +14,25 @@ Example:
 
     # Task Title
     ```
+
+YAML goes through the libyaml-backed `safe_load`/`safe_dump` from
+`edison.core.utils.io.yaml`. `read_frontmatter` reads a file only up to its
+closing delimiter and caches the parsed header by file identity, for scans that
+never look at the body.
 """
 from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+from edison.core.config.cache import register_cache_clearer
+from edison.core.utils.io.file_cache import StatCache
+from edison.core.utils.io.yaml import safe_dump, safe_load
+
 
 # Regex pattern to match YAML frontmatter at the start of a file
 # Matches content between the first pair of '---' markers
@@ -89,7 +99,7 @@ def parse_frontmatter(content: str) -> ParsedDocument:
     remaining_content = content[match.end():]
     
     try:
-        parsed = yaml.safe_load(raw_yaml)
+        parsed = safe_load(raw_yaml)
         if parsed is None:
             parsed = {}
         if not isinstance(parsed, dict):
@@ -104,6 +114,67 @@ def parse_frontmatter(content: str) -> ParsedDocument:
     )
 
 
+_HEADER_CHUNK = 4096
+_HEADER_CACHE = StatCache(counter_prefix="frontmatter.cache")
+
+
+def read_frontmatter_header(path: Path) -> str:
+    """Read just enough of `path` to parse its frontmatter.
+
+    Reads in growing chunks until `FRONTMATTER_PATTERN` matches with text left
+    after the match (so the match, including any whitespace it swallows after
+    the closing delimiter, equals the match on the full file), or until EOF.
+
+    Returns:
+        A prefix of the file; "" when the file does not start with '---'.
+
+    Raises:
+        OSError, UnicodeDecodeError: If the file cannot be read
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        buf = f.read(_HEADER_CHUNK)
+        if not buf.startswith("---"):
+            return ""
+        size = _HEADER_CHUNK
+        while True:
+            match = FRONTMATTER_PATTERN.match(buf)
+            if match is not None and match.end() < len(buf):
+                return buf
+            more = f.read(size)
+            if not more:
+                return buf
+            buf += more
+            size = min(size * 2, 1 << 20)
+
+
+def _parse_header(path: Path) -> Dict[str, Any]:
+    return parse_frontmatter(read_frontmatter_header(path)).frontmatter
+
+
+def read_frontmatter(path: Path) -> Dict[str, Any]:
+    """Return the frontmatter of a markdown file without reading its body.
+
+    Results are cached by file identity (path, mtime, size, inode) for the
+    life of the process; each call returns a private copy.
+
+    Returns:
+        The frontmatter mapping, or {} when the file has none
+
+    Raises:
+        ValueError: If the frontmatter is not a valid YAML mapping
+        OSError, UnicodeDecodeError: If the file cannot be read
+    """
+    return _HEADER_CACHE.get(Path(path), _parse_header) or {}
+
+
+def clear_frontmatter_cache() -> None:
+    """Drop all cached `read_frontmatter` results."""
+    _HEADER_CACHE.clear()
+
+
+register_cache_clearer("utils.text.frontmatter", clear_frontmatter_cache)
+
+
 def format_frontmatter(data: Dict[str, Any], *, exclude_none: bool = True) -> str:
     """Format a dictionary as YAML frontmatter.
     
@@ -129,7 +200,7 @@ def format_frontmatter(data: Dict[str, Any], *, exclude_none: bool = True) -> st
         data = {k: v for k, v in data.items() if v is not None}
     
     # Use safe_dump with settings for readable output
-    yaml_content = yaml.safe_dump(
+    yaml_content = safe_dump(
         data,
         default_flow_style=False,
         allow_unicode=True,
@@ -229,6 +300,9 @@ def update_frontmatter(
 __all__ = [
     "ParsedDocument",
     "parse_frontmatter",
+    "read_frontmatter",
+    "read_frontmatter_header",
+    "clear_frontmatter_cache",
     "format_frontmatter",
     "extract_frontmatter_batch",
     "has_frontmatter",
@@ -6,11 +6,14 @@ Goals:
 - Keep templates readable in Markdown
 - Prefer Jinja2 when available (optional dependency)
 - Provide a safe regex fallback when Jinja2 is unavailable
+- Compile each distinct template text once per process (batch imports render
+  the same TASK/QA template thousands of times)
 """
 
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Dict
 
 try:  # Optional dependency; fallback rendering when missing
@@ -29,14 +32,19 @@ def strip_frontmatter_block(text: str) -> str:
     return _FRONTMATTER_BLOCK_RE.sub("", text, count=1)
 
 
+@lru_cache(maxsize=128)
+def _compile_template(text: str) -> Any:
+    # Many Edison templates use control blocks on their own lines.
+    # Without trimming, those tag-only lines become empty lines.
+    env = Environment(trim_blocks=True, lstrip_blocks=True)
+    return env.from_string(text)
+
+
 def render_template_text(text: str, context: Dict[str, Any]) -> str:
     """Render ``text`` using Jinja2 if available, else a simple {{var}} replacer."""
     if Environment is not None:
         try:
-            # Many Edison templates use control blocks on their own lines.
-            # Without trimming, those tag-only lines become empty lines.
-            env = Environment(trim_blocks=True, lstrip_blocks=True)
-            return env.from_string(text).render(**context)
+            return _compile_template(text).render(**context)
         except Exception:
             pass
 
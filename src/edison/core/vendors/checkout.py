@@ -10,6 +10,7 @@ import os
 import subprocess
 from pathlib import Path
 
+from edison.core.utils.git.service import note_git_command
 from edison.core.vendors.cache import VendorMirrorCache
 from edison.core.vendors.exceptions import VendorCheckoutError
 from edison.core.vendors.models import SyncResult, VendorSource
@@ -247,6 +248,7 @@ class VendorCheckout:
             env = os.environ.copy()
             env["EDISON_ALLOW_DESTRUCTIVE_GIT"] = "1"
 
+            note_git_command(["git"] + args)
             result = subprocess.run(
                 ["git"] + args,
                 cwd=cwd,
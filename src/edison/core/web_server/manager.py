@@ -1,24 +1,28 @@
 from __future__ import annotations
 
 import os
+import random
 import shlex
 import signal
 import subprocess
+import threading
 import time
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from dataclasses import dataclass
+from http.client import HTTPConnection, HTTPSConnection
 from pathlib import Path
 from typing import Any
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlparse
-from urllib.request import Request, urlopen
+from urllib.parse import urlparse, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
 from edison.core.utils.git.worktree import get_worktree_parent
 from edison.core.utils.io.locking import acquire_file_lock
 from edison.core.utils.locks import LockScope, named_lock_path, resolve_lock_enabled
 
-from .models import WebServerConfig, WebServerHandle
+from .models import WebServerConfig, WebServerHandle, WebServerVerifyStep
 
 
 def _is_http_responsive(url: str, *, timeout_seconds: float) -> bool:
@@ -35,6 +39,94 @@ def _is_http_responsive(url: str, *, timeout_seconds: float) -> bool:
         return False
 
 
+class _HttpProber:
+    """HTTP probes that reuse keep-alive connections across polls.
+
+    Idle connections are pooled per (scheme, host, port). A pooled connection the
+    server has meanwhile closed is retried once on a fresh connection. URLs routed
+    through a configured proxy fall back to `_is_http_responsive` (urllib honours
+    proxies; http.client does not).
+    """
+
+    _MAX_BODY = 1 << 20
+
+    def __init__(self) -> None:
+        self._idle: dict[tuple[str, str, int | None], list[HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def probe(self, url: str, *, timeout_seconds: float) -> bool:
+        parts = urlsplit(url)
+        host = parts.hostname
+        if parts.scheme not in {"http", "https"} or not host or self._proxied(parts.scheme, host):
+            return _is_http_responsive(url, timeout_seconds=timeout_seconds)
+        try:
+            port = parts.port
+        except ValueError:
+            return False
+        key = (parts.scheme, host, port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        for _attempt in range(2):
+            conn = self._take(key)
+            fresh = conn is None
+            if conn is None:
+                factory = HTTPSConnection if parts.scheme == "https" else HTTPConnection
+                conn = factory(host, port, timeout=timeout_seconds)
+            else:
+                conn.timeout = timeout_seconds
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout_seconds)
+            try:
+                conn.request("GET", path, headers={"Connection": "keep-alive"})
+                resp = conn.getresponse()
+                resp.read(self._MAX_BODY)
+            except Exception:
+                conn.close()
+                if fresh:
+                    return False
+                continue  # Stale keep-alive connection: retry on a new one.
+            # Any HTTP response implies a server is listening.
+            if resp.will_close or not resp.isclosed():
+                conn.close()
+            else:
+                self._put(key, conn)
+            return True
+        return False
+
+    @staticmethod
+    def _proxied(scheme: str, host: str) -> bool:
+        try:
+            return scheme in getproxies() and not proxy_bypass(host)
+        except Exception:
+            return False
+
+    def _take(self, key: tuple[str, str, int | None]) -> HTTPConnection | None:
+        with self._lock:
+            idle = self._idle.get(key)
+            return idle.pop() if idle else None
+
+    def _put(self, key: tuple[str, str, int | None], conn: HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for conn in conns:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+def _backoff_delay(attempt: int, *, base_seconds: float, max_seconds: float) -> float:
+    """Exponential backoff with jitter: uniform in [d/2, d], d = min(max, base * 2**attempt)."""
+    base = max(0.05, float(base_seconds))
+    ceiling = max(base, min(max(base, float(max_seconds)), base * (2 ** min(attempt, 16))))
+    return random.uniform(ceiling / 2, ceiling)
+
+
 def _popen_kwargs() -> dict[str, Any]:
     if os.name == "posix":
         return {"start_new_session": True}
@@ -209,161 +301,230 @@ class VerifyFailure:
     message: str
 
 
-def _verify_once(
+def _effective_steps(config: WebServerConfig) -> list[WebServerVerifyStep]:
+    steps = list(config.verify.steps)
+    if not steps:
+        # Default implicit http step.
+        steps = [WebServerVerifyStep(kind="http", url="{probe_url}")]
+    return steps
+
+
+def _verify_step(
+    idx: int,
+    step: WebServerVerifyStep,
     config: WebServerConfig,
     *,
     worktree_path: Path,
     session_id: str | None,
     base_cwd: Path,
     env: dict[str, str],
-) -> list[VerifyFailure]:
-    failures: list[VerifyFailure] = []
-
-    effective_steps = list(config.verify.steps)
-    if not effective_steps:
-        # Default implicit http step.
-        from .models import WebServerVerifyStep
-
-        effective_steps = [WebServerVerifyStep(kind="http", url="{probe_url}")]
+    prober: _HttpProber | None = None,
+    deadline: float | None = None,
+) -> VerifyFailure | None:
+    kind = step.kind
+    timeout = step.timeout_seconds
+    timeout_seconds = float(timeout) if timeout is not None else float(config.probe_timeout_seconds)
+    if deadline is not None:
+        timeout_seconds = max(0.1, min(timeout_seconds, deadline - time.time()))
+    fmt = _format_map(config, worktree_path=worktree_path, session_id=session_id, pid=None)
 
-    for idx, step in enumerate(effective_steps):
-        kind = step.kind
-        timeout = step.timeout_seconds
-        timeout_seconds = float(timeout) if timeout is not None else float(config.probe_timeout_seconds)
+    if kind == "http":
+        raw_url = (step.url or "{probe_url}").format(**fmt)
+        responsive = (
+            prober.probe(raw_url, timeout_seconds=timeout_seconds)
+            if prober is not None
+            else _is_http_responsive(raw_url, timeout_seconds=timeout_seconds)
+        )
+        if not responsive:
+            return VerifyFailure(idx, kind, f"HTTP not responsive: {raw_url}")
+        return None
+
+    if kind == "command":
+        cmd = step.command or ""
+        if not cmd.strip():
+            return VerifyFailure(idx, kind, "verify.command is empty")
+        rendered = cmd.format(**fmt)
+        try:
+            result = _run_command(
+                rendered,
+                cwd=base_cwd,
+                env=env,
+                timeout_seconds=timeout_seconds,
+            )
+        except Exception as exc:
+            return VerifyFailure(idx, kind, f"verify.command failed: {exc}")
+        if result.returncode != 0:
+            msg = (result.stderr or result.stdout or "").strip()
+            return VerifyFailure(idx, kind, f"verify.command exit={result.returncode}: {msg}")
+        return None
+
+    if kind == "docker_source":
+        container = (step.container or "").strip()
+        mount_dest = (step.mount_dest or "").strip()
+        if not container or not mount_dest:
+            return VerifyFailure(idx, kind, "docker_source requires container and mount_dest")
         fmt = _format_map(config, worktree_path=worktree_path, session_id=session_id, pid=None)
-
-        if kind == "http":
-            raw_url = (step.url or "{probe_url}").format(**fmt)
-            if not _is_http_responsive(raw_url, timeout_seconds=timeout_seconds):
-                failures.append(VerifyFailure(idx, kind, f"HTTP not responsive: {raw_url}"))
-            continue
-
-        if kind == "command":
-            cmd = step.command or ""
-            if not cmd.strip():
-                failures.append(VerifyFailure(idx, kind, "verify.command is empty"))
-                continue
-            rendered = cmd.format(**fmt)
-            try:
-                result = _run_command(
-                    rendered,
-                    cwd=base_cwd,
-                    env=env,
-                    timeout_seconds=timeout_seconds,
-                )
-            except Exception as exc:
-                failures.append(VerifyFailure(idx, kind, f"verify.command failed: {exc}"))
-                continue
-            if result.returncode != 0:
-                msg = (result.stderr or result.stdout or "").strip()
-                failures.append(VerifyFailure(idx, kind, f"verify.command exit={result.returncode}: {msg}"))
-            continue
-
-        if kind == "docker_source":
-            container = (step.container or "").strip()
-            mount_dest = (step.mount_dest or "").strip()
-            if not container or not mount_dest:
-                failures.append(VerifyFailure(idx, kind, "docker_source requires container and mount_dest"))
-                continue
-            fmt = _format_map(config, worktree_path=worktree_path, session_id=session_id, pid=None)
-            expected_root = Path(env.get("AGENTS_PROJECT_ROOT") or str(worktree_path)).resolve()
+        expected_root = Path(env.get("AGENTS_PROJECT_ROOT") or str(worktree_path)).resolve()
+        try:
+            cmd = [
+                "docker",
+                "inspect",
+                container,
+                "--format",
+                f"{{{{range .Mounts}}}}{{{{if eq .Destination \"{mount_dest}\"}}}}{{{{.Source}}}}{{{{end}}}}{{{{end}}}}",
+            ]
+            result = subprocess.run(  # noqa: S603
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=max(0.1, timeout_seconds),
+                check=False,
+            )
+            source = (result.stdout or "").strip()
+            if result.returncode != 0 or not source:
+                return VerifyFailure(idx, kind, f"docker inspect failed for {container}:{mount_dest}")
             try:
-                cmd = [
-                    "docker",
-                    "inspect",
-                    container,
-                    "--format",
-                    f"{{{{range .Mounts}}}}{{{{if eq .Destination \"{mount_dest}\"}}}}{{{{.Source}}}}{{{{end}}}}{{{{end}}}}",
-                ]
-                result = subprocess.run(  # noqa: S603
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=max(0.1, timeout_seconds),
-                    check=False,
+                Path(source).resolve().relative_to(expected_root)
+            except Exception:
+                return VerifyFailure(
+                    idx,
+                    kind,
+                    f"wrong docker source: {source} (expected under {expected_root})",
                 )
-                source = (result.stdout or "").strip()
-                if result.returncode != 0 or not source:
-                    failures.append(VerifyFailure(idx, kind, f"docker inspect failed for {container}:{mount_dest}"))
-                    continue
+        except FileNotFoundError:
+            return VerifyFailure(idx, kind, "docker not found")
+        except Exception as exc:
+            return VerifyFailure(idx, kind, f"docker_source error: {exc}")
+        return None
+
+    if kind == "process_cwd":
+        pattern = (step.pattern or "").strip()
+        if not pattern:
+            return VerifyFailure(idx, kind, "process_cwd requires pattern")
+        expected_root = Path(env.get("AGENTS_PROJECT_ROOT") or str(worktree_path)).resolve()
+        try:
+            pgrep = subprocess.run(  # noqa: S603
+                ["pgrep", "-f", pattern],
+                capture_output=True,
+                text=True,
+                timeout=max(0.1, timeout_seconds),
+                check=False,
+            )
+            if pgrep.returncode != 0:
+                return VerifyFailure(idx, kind, f"no process matching '{pattern}'")
+            pid = int(pgrep.stdout.strip().split()[0])
+            cwd_path: str | None = None
+            proc_cwd = Path(f"/proc/{pid}/cwd")
+            if proc_cwd.exists():
                 try:
-                    Path(source).resolve().relative_to(expected_root)
+                    cwd_path = str(proc_cwd.resolve())
                 except Exception:
-                    failures.append(
-                        VerifyFailure(
-                            idx,
-                            kind,
-                            f"wrong docker source: {source} (expected under {expected_root})",
-                        )
-                    )
-            except FileNotFoundError:
-                failures.append(VerifyFailure(idx, kind, "docker not found"))
-            except Exception as exc:
-                failures.append(VerifyFailure(idx, kind, f"docker_source error: {exc}"))
-            continue
-
-        if kind == "process_cwd":
-            pattern = (step.pattern or "").strip()
-            if not pattern:
-                failures.append(VerifyFailure(idx, kind, "process_cwd requires pattern"))
-                continue
-            expected_root = Path(env.get("AGENTS_PROJECT_ROOT") or str(worktree_path)).resolve()
-            try:
-                pgrep = subprocess.run(  # noqa: S603
-                    ["pgrep", "-f", pattern],
+                    cwd_path = None
+            if cwd_path is None:
+                # macOS fallback
+                lsof = subprocess.run(  # noqa: S603
+                    ["lsof", "-p", str(pid)],
                     capture_output=True,
                     text=True,
                     timeout=max(0.1, timeout_seconds),
                     check=False,
                 )
-                if pgrep.returncode != 0:
-                    failures.append(VerifyFailure(idx, kind, f"no process matching '{pattern}'"))
-                    continue
-                pid = int(pgrep.stdout.strip().split()[0])
-                cwd_path: str | None = None
-                proc_cwd = Path(f"/proc/{pid}/cwd")
-                if proc_cwd.exists():
-                    try:
-                        cwd_path = str(proc_cwd.resolve())
-                    except Exception:
-                        cwd_path = None
-                if cwd_path is None:
-                    # macOS fallback
-                    lsof = subprocess.run(  # noqa: S603
-                        ["lsof", "-p", str(pid)],
-                        capture_output=True,
-                        text=True,
-                        timeout=max(0.1, timeout_seconds),
-                        check=False,
-                    )
-                    for line in (lsof.stdout or "").splitlines():
-                        if " cwd " in f" {line} ":
-                            parts = line.split()
-                            if parts:
-                                cwd_path = parts[-1]
-                                break
-                if not cwd_path:
-                    failures.append(VerifyFailure(idx, kind, f"could not determine cwd for pid={pid}"))
-                    continue
-                try:
-                    Path(cwd_path).resolve().relative_to(expected_root)
-                except Exception:
-                    failures.append(
-                        VerifyFailure(
-                            idx,
-                            kind,
-                            f"wrong process cwd: {cwd_path} (expected under {expected_root})",
-                        )
-                    )
-            except FileNotFoundError as exc:
-                failures.append(VerifyFailure(idx, kind, f"process_cwd tool missing: {exc.filename}"))
-            except Exception as exc:
-                failures.append(VerifyFailure(idx, kind, f"process_cwd error: {exc}"))
-            continue
+                for line in (lsof.stdout or "").splitlines():
+                    if " cwd " in f" {line} ":
+                        parts = line.split()
+                        if parts:
+                            cwd_path = parts[-1]
+                            break
+            if not cwd_path:
+                return VerifyFailure(idx, kind, f"could not determine cwd for pid={pid}")
+            try:
+                Path(cwd_path).resolve().relative_to(expected_root)
+            except Exception:
+                return VerifyFailure(
+                    idx,
+                    kind,
+                    f"wrong process cwd: {cwd_path} (expected under {expected_root})",
+                )
+        except FileNotFoundError as exc:
+            return VerifyFailure(idx, kind, f"process_cwd tool missing: {exc.filename}")
+        except Exception as exc:
+            return VerifyFailure(idx, kind, f"process_cwd error: {exc}")
+        return None
+
+    return VerifyFailure(idx, kind, "unsupported verify step")
+
+
+class _Verifier:
+    """Runs verify steps concurrently, remembering which passed since the last start.
+
+    Each round runs only the steps that have not passed yet, side by side, bounded
+    by the shared deadline; HTTP steps reuse keep-alive connections across rounds.
+    """
+
+    def __init__(
+        self,
+        config: WebServerConfig,
+        *,
+        worktree_path: Path,
+        session_id: str | None,
+        base_cwd: Path,
+        env: dict[str, str],
+    ) -> None:
+        self._config = config
+        self._kwargs: dict[str, Any] = {
+            "worktree_path": worktree_path,
+            "session_id": session_id,
+            "base_cwd": base_cwd,
+            "env": env,
+        }
+        self._steps = _effective_steps(config)
+        self._prober = _HttpProber()
+        self._executor = (
+            ThreadPoolExecutor(max_workers=min(8, len(self._steps)), thread_name_prefix="edison-web-verify")
+            if len(self._steps) > 1
+            else None
+        )
+        self._passed: set[int] = set()
+
+    def reset(self) -> None:
+        """Forget earlier passes (the stack was (re)started)."""
+        self._passed.clear()
 
-        failures.append(VerifyFailure(idx, kind, "unsupported verify step"))
+    def _run(self, idx: int, deadline: float) -> VerifyFailure | None:
+        return _verify_step(
+            idx, self._steps[idx], self._config, prober=self._prober, deadline=deadline, **self._kwargs
+        )
 
-    return failures
+    def run_round(self, deadline: float) -> list[VerifyFailure]:
+        pending = [i for i in range(len(self._steps)) if i not in self._passed]
+        results: dict[int, VerifyFailure | None] = {}
+        if self._executor is None or len(pending) == 1:
+            for idx in pending:
+                results[idx] = self._run(idx, deadline)
+        else:
+            futures = {self._executor.submit(self._run, idx, deadline): idx for idx in pending}
+            done, _ = wait(futures, timeout=max(0.0, deadline - time.time()) + 0.5)
+            for fut, idx in futures.items():
+                if fut not in done:
+                    results[idx] = VerifyFailure(idx, self._steps[idx].kind, "verify step timed out")
+                    continue
+                try:
+                    results[idx] = fut.result()
+                except Exception as exc:
+                    results[idx] = VerifyFailure(idx, self._steps[idx].kind, f"verify step error: {exc}")
+        failures = []
+        for idx in pending:
+            failure = results.get(idx)
+            if failure is None:
+                self._passed.add(idx)
+            else:
+                failures.append(failure)
+        return failures
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._prober.close()
 
 
 def ensure_web_server(
@@ -381,6 +542,9 @@ def ensure_web_server(
       stop/start cycle, then re-verifies until timeout.
     - If verification fails and no start.command is configured, Edison fails only when
       ensure_running is true.
+    - Verify steps run concurrently under one deadline. After a start, the stack is
+      ready once every step has passed at least once; polls back off exponentially
+      (with jitter) from poll_interval_seconds up to poll_max_interval_seconds.
     """
     worktree_path = Path(worktree_path).expanduser().resolve()
 
@@ -399,30 +563,34 @@ def ensure_web_server(
     if config.stop.cwd:
         stop_cwd = (worktree_path / config.stop.cwd).resolve() if not Path(config.stop.cwd).is_absolute() else Path(config.stop.cwd).expanduser().resolve()
 
-    def _verify_until(deadline: float) -> list[VerifyFailure]:
-        last: list[VerifyFailure] = []
-        while time.time() < deadline:
-            last = _verify_once(
-                config,
-                worktree_path=worktree_path,
-                session_id=session_id,
-                base_cwd=base_cwd,
-                env=env,
-            )
-            if not last:
-                return []
-            time.sleep(max(0.05, float(config.poll_interval_seconds)))
-        return last
+    verifier = _Verifier(config, worktree_path=worktree_path, session_id=session_id, base_cwd=base_cwd, env=env)
+    try:
+        return _ensure_with_verifier(
+            config,
+            verifier,
+            worktree_path=worktree_path,
+            session_id=session_id,
+            env=env,
+            start_cwd=start_cwd,
+            stop_cwd=stop_cwd,
+        )
+    finally:
+        verifier.close()
 
+
+def _ensure_with_verifier(
+    config: WebServerConfig,
+    verifier: _Verifier,
+    *,
+    worktree_path: Path,
+    session_id: str | None,
+    env: dict[str, str],
+    start_cwd: Path,
+    stop_cwd: Path,
+) -> WebServerHandle:
     deadline = time.time() + max(0.1, float(config.startup_timeout_seconds))
 
-    failures = _verify_once(
-        config,
-        worktree_path=worktree_path,
-        session_id=session_id,
-        base_cwd=base_cwd,
-        env=env,
-    )
+    failures = verifier.run_round(deadline)
     if not failures:
         return WebServerHandle(config=config, process_pid=None, started_by_us=False)
 
@@ -445,19 +613,28 @@ def ensure_web_server(
     fmt = _format_map(config, worktree_path=worktree_path, session_id=session_id, pid=None)
     start_cmd = config.start.command.format(**fmt)
     proc = _start_process(start_cmd, cwd=start_cwd, env=env)
+    # Only passes observed after the (re)start count towards readiness.
+    verifier.reset()
 
+    attempt = 0
     while time.time() < deadline:
         exit_code = proc.poll()
         if exit_code is not None and exit_code not in set(config.start.success_exit_codes or [0]):
             raise RuntimeError(f"web_server.start.command exited with code {exit_code}")
 
-        failures = _verify_until(deadline)
+        failures = verifier.run_round(deadline)
         if not failures:
             pid = proc.pid if proc.poll() is None else None
             return WebServerHandle(config=config, process_pid=pid, started_by_us=True)
 
         # Continue polling until timeout; do not restart again.
-        time.sleep(max(0.05, float(config.poll_interval_seconds)))
+        delay = _backoff_delay(
+            attempt,
+            base_seconds=float(config.poll_interval_seconds),
+            max_seconds=float(config.poll_max_interval_seconds),
+        )
+        attempt += 1
+        time.sleep(max(0.0, min(delay, deadline - time.time())))
 
     # Cleanup best-effort.
     try:
@@ -100,6 +100,7 @@ class WebServerConfig:
     shutdown_timeout_seconds: float = 10.0
     probe_timeout_seconds: float = 0.75
     poll_interval_seconds: float = 0.25
+    poll_max_interval_seconds: float = 2.0
     stop_after: bool = True
 
     start: WebServerStartConfig = field(default_factory=WebServerStartConfig)
@@ -168,6 +169,9 @@ class WebServerConfig:
             poll_interval_seconds=_as_float(
                 raw.get("poll_interval_seconds"), 0.25
             ),
+            poll_max_interval_seconds=_as_float(
+                raw.get("poll_max_interval_seconds"), 2.0
+            ),
             stop_after=stop_after,
             start=start_cfg,
             stop=stop_cfg,
@@ -0,0 +1,45 @@
+"""Bounded, order-preserving fan-out for checklist engines.
+
+Checklist items are independent reads over a snapshot the engine loaded up
+front (session tasks, resolved evidence rounds), so they can be evaluated on
+a small thread pool. Results are returned in input order so checklist output
+stays deterministic regardless of completion order.
+
+Each worker runs in a copy of the caller's context, so ContextVar-scoped
+state (the active profiler, guard cache) is visible inside items.
+"""
+from __future__ import annotations
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Items are I/O bound (stat/read of small files); more threads than this only
+# adds contention on the GIL and the filesystem.
+DEFAULT_MAX_WORKERS = 8
+
+
+def map_ordered(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_workers: Optional[int] = None,
+) -> List[R]:
+    """Apply `fn` to every item concurrently and return results in input order.
+
+    The first exception (in input order) is re-raised after all items finish.
+    """
+    work = list(items)
+    workers = min(max_workers or DEFAULT_MAX_WORKERS, len(work))
+    if workers <= 1:
+        return [fn(item) for item in work]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="edison-checklist") as pool:
+        futures = [pool.submit(contextvars.copy_context().run, fn, item) for item in work]
+    return [f.result() for f in futures]
+
+
+__all__ = ["DEFAULT_MAX_WORKERS", "map_ordered"]
@@ -8,6 +8,9 @@ It focuses on:
 - evidence round selection / availability
 - preset-driven required evidence patterns (policy resolver)
 - Context7 marker status for the roster being validated
+
+The evidence round is resolved once per `compute()`; the items then read that
+snapshot concurrently and are reported in a fixed order.
 """
 
 from __future__ import annotations
@@ -16,8 +19,12 @@ from pathlib import Path
 from typing import Any
 
 from edison.core.utils.paths import PathResolver
+from edison.core.workflow.checklists._concurrency import map_ordered
 from edison.core.workflow.checklists.task_start import ChecklistItem
 
+# (target_round, target_round_dir, current_round) as returned by _resolve_target_round.
+RoundSnapshot = tuple[int | None, Path | None, int | None]
+
 
 class QAValidatePreflightChecklistEngine:
     kind: str = "qa_validate_preflight"
@@ -44,8 +51,6 @@ class QAValidatePreflightChecklistEngine:
         scope_used: str | None = None,
         cluster_task_ids: list[str] | None = None,
     ) -> dict[str, Any]:
-        items: list[ChecklistItem] = []
-
         requested_task_id = str(task_id)
         root = str(root_task_id or task_id)
 
@@ -71,46 +76,45 @@ class QAValidatePreflightChecklistEngine:
         scope = scope or "hierarchy"
         cluster_size = int(cluster_size or 1)
 
-        items.append(
-            self._build_scope_preset_item(
+        rounds = self._resolve_target_round(task_id=root, round_num=round_num)
+        preset_name = str(roster.get("preset") or "").strip() or None
+        builders = [
+            lambda: self._build_scope_preset_item(
                 requested_task_id=requested_task_id,
                 root_task_id=root,
                 scope_used=scope,
                 cluster_size=cluster_size,
                 roster=roster,
-            )
-        )
-        items.append(self._build_engine_availability_item(roster=roster))
-        items.append(
-            self._build_evidence_round_item(
+            ),
+            lambda: self._build_engine_availability_item(roster=roster),
+            lambda: self._build_evidence_round_item(
                 task_id=root,
                 round_num=round_num,
                 will_execute=will_execute,
-            )
-        )
-        items.append(
-            self._build_required_evidence_item(
+                rounds=rounds,
+            ),
+            lambda: self._build_required_evidence_item(
                 task_id=root,
                 round_num=round_num,
                 will_execute=will_execute,
-                preset_name=str(roster.get("preset") or "").strip() or None,
-            )
-        )
-        items.append(
-            self._build_implementation_report_item(
+                preset_name=preset_name,
+                rounds=rounds,
+            ),
+            lambda: self._build_implementation_report_item(
                 task_id=root,
                 round_num=round_num,
-            )
-        )
-        items.append(
-            self._build_context7_item(
+                rounds=rounds,
+            ),
+            lambda: self._build_context7_item(
                 task_id=root,
                 session_id=session_id,
                 roster=roster,
                 round_num=round_num,
                 will_execute=will_execute,
-            )
-        )
+                rounds=rounds,
+            ),
+        ]
+        items = map_ordered(lambda build: build(), builders)
 
         has_blockers = any(i.severity == "blocker" and i.status != "ok" for i in items)
         return {
@@ -128,13 +132,14 @@ class QAValidatePreflightChecklistEngine:
         *,
         task_id: str,
         round_num: int | None,
+        rounds: RoundSnapshot | None = None,
     ) -> ChecklistItem:
         """Warn-only checks for the round-scoped implementation report."""
         from edison.core.qa.evidence import EvidenceService
         from edison.core.utils.git.fingerprint import compute_repo_fingerprint
         from edison.core.utils.text import parse_frontmatter
 
-        target, target_dir, _current = self._resolve_target_round(task_id=task_id, round_num=round_num)
+        target, target_dir, _current = rounds or self._resolve_target_round(task_id=task_id, round_num=round_num)
         if target is None or target_dir is None:
             return ChecklistItem(
                 id="implementation-report",
@@ -231,8 +236,9 @@ class QAValidatePreflightChecklistEngine:
         task_id: str,
         round_num: int | None,
         will_execute: bool,
+        rounds: RoundSnapshot | None = None,
     ) -> ChecklistItem:
-        target, target_dir, _current = self._resolve_target_round(task_id=task_id, round_num=round_num)
+        target, target_dir, _current = rounds or self._resolve_target_round(task_id=task_id, round_num=round_num)
 
         if target is None:
             sev = "blocker" if will_execute else "info"
@@ -281,10 +287,11 @@ class QAValidatePreflightChecklistEngine:
         round_num: int | None,
         will_execute: bool,
         preset_name: str | None,
+        rounds: RoundSnapshot | None = None,
     ) -> ChecklistItem:
         from edison.core.qa.policy.resolver import ValidationPolicyResolver
 
-        target, target_dir, _current = self._resolve_target_round(task_id=task_id, round_num=round_num)
+        target, target_dir, _current = rounds or self._resolve_target_round(task_id=task_id, round_num=round_num)
         policy = ValidationPolicyResolver(project_root=self.project_root).resolve_for_task(task_id, preset_name=preset_name)
         required = [str(x).strip() for x in (policy.required_evidence or []) if str(x).strip()]
 
@@ -384,6 +391,7 @@ class QAValidatePreflightChecklistEngine:
         roster: dict[str, Any],
         round_num: int | None,
         will_execute: bool,
+        rounds: RoundSnapshot | None = None,
     ) -> ChecklistItem:
         _ = session_id  # reserved for future (task-scoped detection work)
 
@@ -414,7 +422,7 @@ class QAValidatePreflightChecklistEngine:
                 suggested_commands=[],
             )
 
-        target, target_dir, _current = self._resolve_target_round(task_id=task_id, round_num=round_num)
+        target, target_dir, _current = rounds or self._resolve_target_round(task_id=task_id, round_num=round_num)
         if target is None:
             return ChecklistItem(
                 id="context7",
@@ -4,17 +4,33 @@ This checklist is designed to answer "Can I close this session?" deterministical
 with actionable remediation commands. It is reused by:
 - `edison session next` (when approaching close),
 - `edison session verify --phase closing` (human output).
+
+Session tasks are loaded once; per-task reads (QA location, bundle summary,
+current evidence round) are evaluated concurrently over that snapshot and
+aggregated in task order.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from edison.core.utils.paths import PathResolver
+from edison.core.workflow.checklists._concurrency import map_ordered
 from edison.core.workflow.checklists.task_start import ChecklistItem
 
 
+@dataclass(frozen=True)
+class _DoneTaskFacts:
+    """Per-task inputs for the closing-set items."""
+
+    task_id: str
+    qa_ready: bool
+    bundle: str  # ok | missing | not_approved | wrong_preset
+    cluster_root: str | None
+
+
 class SessionClosePreflightChecklistEngine:
     kind: str = "session_close_preflight"
 
@@ -77,18 +93,15 @@ class SessionClosePreflightChecklistEngine:
             )
         )
 
+        facts = map_ordered(
+            lambda t: self._done_task_facts(str(t.id), preset_name=preset_name, qa_repo=qa_repo, qa_ready=qa_ready),
+            done_tasks,
+        )
+
         # ------------------------------------------------------------------
         # QA readiness for done tasks
         # ------------------------------------------------------------------
-        missing_qa: list[str] = []
-        for t in done_tasks:
-            qa_id = f"{t.id}-qa"
-            try:
-                p = qa_repo.get_path(qa_id)
-                if p.parent.name not in qa_ready:
-                    missing_qa.append(t.id)
-            except FileNotFoundError:
-                missing_qa.append(t.id)
+        missing_qa: list[str] = [f.task_id for f in facts if not f.qa_ready]
 
         if missing_qa:
             items.append(
@@ -119,29 +132,13 @@ class SessionClosePreflightChecklistEngine:
         # ------------------------------------------------------------------
         # Bundle summary approval + preset match
         # ------------------------------------------------------------------
-        from edison.core.qa.evidence.service import EvidenceService
-        from edison.core.qa.bundler.cluster import select_cluster
-
-        missing_bundle: list[str] = []
-        not_approved: list[str] = []
-        wrong_preset: list[str] = []
+        missing_bundle = [f.task_id for f in facts if f.bundle == "missing"]
+        not_approved = [f.task_id for f in facts if f.bundle == "not_approved"]
+        wrong_preset = [f.task_id for f in facts if f.bundle == "wrong_preset"]
         roots_to_fix: dict[str, set[str]] = {}
-
-        for t in done_tasks:
-            ev = EvidenceService(t.id, project_root=self.project_root)
-            bundle = ev.read_bundle() or {}
-            if not bundle:
-                missing_bundle.append(t.id)
-            elif not bool(bundle.get("approved")):
-                not_approved.append(t.id)
-            elif preset_name:
-                found = str(bundle.get("preset") or "").strip()
-                if found != preset_name:
-                    wrong_preset.append(t.id)
-
-            if preset_name and (t.id in set(missing_bundle + not_approved + wrong_preset)):
-                cluster = select_cluster(str(t.id), scope="bundle", project_root=self.project_root)
-                roots_to_fix.setdefault(cluster.root_task_id, set()).add(t.id)
+        for f in facts:
+            if f.cluster_root is not None:
+                roots_to_fix.setdefault(f.cluster_root, set()).add(f.task_id)
 
         if missing_bundle or not_approved or wrong_preset:
             problems: list[str] = []
@@ -188,7 +185,7 @@ class SessionClosePreflightChecklistEngine:
         # ------------------------------------------------------------------
         # Session-close evidence commands (preset-driven)
         # ------------------------------------------------------------------
-        items.append(self._build_session_close_evidence_item(session_id=session_id))
+        items.append(self._build_session_close_evidence_item(session_id=session_id, tasks=session_tasks))
 
         has_blockers = any(i.severity == "blocker" and i.status != "ok" for i in items)
         return {
@@ -199,6 +196,37 @@ class SessionClosePreflightChecklistEngine:
             "hasBlockers": has_blockers,
         }
 
+    def _done_task_facts(
+        self,
+        task_id: str,
+        *,
+        preset_name: str | None,
+        qa_repo: Any,
+        qa_ready: set[str],
+    ) -> _DoneTaskFacts:
+        from edison.core.qa.bundler.cluster import select_cluster
+        from edison.core.qa.evidence.service import EvidenceService
+
+        try:
+            ready = qa_repo.get_path(f"{task_id}-qa").parent.name in qa_ready
+        except FileNotFoundError:
+            ready = False
+
+        bundle = EvidenceService(task_id, project_root=self.project_root).read_bundle() or {}
+        if not bundle:
+            state = "missing"
+        elif not bool(bundle.get("approved")):
+            state = "not_approved"
+        elif preset_name and str(bundle.get("preset") or "").strip() != preset_name:
+            state = "wrong_preset"
+        else:
+            state = "ok"
+
+        cluster_root = None
+        if preset_name and state != "ok":
+            cluster_root = select_cluster(task_id, scope="bundle", project_root=self.project_root).root_task_id
+        return _DoneTaskFacts(task_id=task_id, qa_ready=ready, bundle=state, cluster_root=cluster_root)
+
     def _build_session_close_preset_item(self) -> tuple[str | None, ChecklistItem]:
         try:
             from edison.core.qa.policy.session_close import get_session_close_policy
@@ -235,7 +263,7 @@ class SessionClosePreflightChecklistEngine:
                 ),
             )
 
-    def _build_session_close_evidence_item(self, *, session_id: str) -> ChecklistItem:
+    def _build_session_close_evidence_item(self, *, session_id: str, tasks: list[Any] | None = None) -> ChecklistItem:
         try:
             from edison.core.qa.evidence.command_evidence import parse_command_evidence
             from edison.core.qa.evidence.service import EvidenceService
@@ -255,18 +283,22 @@ class SessionClosePreflightChecklistEngine:
                     suggested_commands=[],
                 )
 
-            tasks = TaskRepository(project_root=self.project_root).find_by_session(session_id)
+            if tasks is None:
+                tasks = TaskRepository(project_root=self.project_root).find_by_session(session_id)
+            round_dirs = map_ordered(
+                lambda t: EvidenceService(t.id, project_root=self.project_root).get_current_round_dir(),
+                tasks,
+            )
             missing: list[str] = []
             for filename in required:
                 ok = False
-                for t in tasks:
-                    rd = EvidenceService(t.id, project_root=self.project_root).get_current_round_dir()
+                for rd in round_dirs:
                     if not rd:
                         continue
                     p = rd / filename
                     if not p.exists():
                         continue
-                    parsed = parse_command_evidence(p)
+                    parsed = parse_command_evidence(p, include_output=False)
                     if parsed is None:
                         continue
                     try:
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+
+import pytest
+
+
+def _promote_after_packing(project_root: Path, *, touch_packed_report: bool) -> int:
+    """Two evidence rounds, round 1 packed, then `qa promote` to validated."""
+    task_id = "201-qa-promote-archived"
+
+    from edison.core.config.domains.workflow import WorkflowConfig
+    from edison.core.qa.evidence import EvidenceService
+    from edison.core.qa.models import QARecord
+    from edison.core.qa.workflow.repository import QARepository
+    from edison.core.registries.validators import ValidatorRegistry
+    from edison.core.task import TaskRepository
+    from edison.core.task.models import Task
+
+    wf = WorkflowConfig(repo_root=project_root)
+    TaskRepository(project_root=project_root).create(
+        Task(id=task_id, state=wf.get_semantic_state("task", "done"), title="Task")
+    )
+    QARepository(project_root=project_root).create(
+        QARecord(id=f"{task_id}-qa", task_id=task_id, state=wf.get_semantic_state("qa", "done"), title="QA")
+    )
+
+    roster = ValidatorRegistry(project_root=project_root).build_execution_roster(task_id=task_id, session_id=None)
+    blocking_ids = sorted(
+        {
+            str(v.get("id"))
+            for v in roster.get("alwaysRequired", []) + roster.get("triggeredBlocking", [])
+            if isinstance(v, dict) and v.get("blocking") and v.get("id")
+        }
+    )
+    assert blocking_ids, "test setup expects at least one blocking validator"
+
+    ev = EvidenceService(task_id, project_root=project_root)
+    for n in (1, 2):
+        ev.ensure_round(n)
+        ev.update_metadata(round_num=n)
+        ev.write_implementation_report(
+            {"taskId": task_id, "round": n, "completionStatus": "complete"}, round_num=n
+        )
+        for vid in blocking_ids:
+            ev.write_validator_report(
+                vid, {"taskId": task_id, "round": n, "validatorId": vid, "verdict": "approve"}, round_num=n
+            )
+    ev.write_bundle({"taskId": task_id, "round": 2, "approved": True}, round_num=2)
+
+    if touch_packed_report:
+        # A round-1 report rewritten after the bundle makes the bundle stale.
+        report = ev.list_validator_reports(round_num=1)[0]
+        later = ev.get_round_dir(2).joinpath("validation-summary.md").stat().st_mtime + 10
+        os.utime(report, (later, later))
+
+    assert ev.archive_rounds() == [1]
+    assert [p.name for p in ev.list_rounds()] == ["round-1", "round-2"]
+
+    from edison.cli.qa.promote import main, register_args
+
+    parser = argparse.ArgumentParser()
+    register_args(parser)
+    args = parser.parse_args(
+        [task_id, "--status", wf.get_semantic_state("qa", "validated"), "--repo-root", str(project_root)]
+    )
+    return main(args)
+
+
+def test_promote_after_packing_rounds_succeeds(isolated_project_env: Path, monkeypatch) -> None:
+    monkeypatch.chdir(isolated_project_env)
+    assert _promote_after_packing(isolated_project_env, touch_packed_report=False) == 0
+
+
+def test_promote_sees_reports_in_packed_rounds(
+    isolated_project_env: Path, monkeypatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.chdir(isolated_project_env)
+    assert _promote_after_packing(isolated_project_env, touch_packed_report=True) != 0
+    captured = capsys.readouterr()
+    assert "Bundle is stale" in captured.out + captured.err
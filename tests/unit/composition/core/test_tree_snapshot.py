@@ -0,0 +1,93 @@
+"""Tests for the shared layer tree snapshot used by LayerDiscovery."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from edison.core.composition.core.discovery import LayerDiscovery
+from edison.core.composition.core.tree_snapshot import TreeSnapshot
+
+
+def _age_dirs(root: Path, seconds: int = 60) -> None:
+    """Backdate directory mtimes so listings are outside the racy window."""
+    for dirpath, _dirnames, _filenames in os.walk(root):
+        st = os.stat(dirpath)
+        os.utime(dirpath, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _seed(root: Path) -> Path:
+    type_dir = root / "guidelines"
+    (type_dir / "shared").mkdir(parents=True)
+    (type_dir / "overlays").mkdir()
+    (type_dir / "a.md").write_text("a", encoding="utf-8")
+    (type_dir / "notes.txt").write_text("x", encoding="utf-8")
+    (type_dir / "shared" / "b.md").write_text("b", encoding="utf-8")
+    (type_dir / "overlays" / "a.md").write_text("o", encoding="utf-8")
+    return type_dir
+
+
+def test_files_match_rglob_semantics(tmp_path: Path) -> None:
+    type_dir = _seed(tmp_path)
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    (elsewhere / "linked.md").write_text("l", encoding="utf-8")
+    (type_dir / "linkdir").symlink_to(elsewhere, target_is_directory=True)
+    (type_dir / "alias.md").symlink_to(type_dir / "a.md")
+
+    tree = TreeSnapshot()
+    found = tree.files(type_dir, "*.md", exclude_dirnames={"overlays"})
+    expected = [p for p in type_dir.rglob("*.md") if "overlays" not in p.relative_to(type_dir).parts]
+
+    assert sorted(found) == sorted(expected)
+    assert type_dir / "alias.md" in found
+    assert type_dir / "alias.md" not in tree.files(type_dir, "*.md", include_symlinks=False)
+
+
+def test_unchanged_directories_are_reused(tmp_path: Path) -> None:
+    type_dir = _seed(tmp_path)
+    _age_dirs(type_dir)
+
+    tree = TreeSnapshot()
+    first = tree.files(type_dir, "*.md")
+    listings = tree.stats.listings
+    assert tree.files(type_dir, "*.md") == first
+    assert tree.stats.listings == listings
+    assert tree.stats.reused >= 3
+
+
+def test_added_and_removed_files_invalidate_by_mtime(tmp_path: Path) -> None:
+    type_dir = _seed(tmp_path)
+    _age_dirs(type_dir)
+
+    tree = TreeSnapshot()
+    tree.files(type_dir, "*.md")
+
+    (type_dir / "shared" / "c.md").write_text("c", encoding="utf-8")
+    (type_dir / "a.md").unlink()
+    found = set(tree.files(type_dir, "*.md"))
+
+    assert type_dir / "shared" / "c.md" in found
+    assert type_dir / "a.md" not in found
+
+
+def test_discoveries_share_one_snapshot(tmp_path: Path) -> None:
+    core_dir = tmp_path / "core"
+    _seed(core_dir)
+    _age_dirs(core_dir)
+    tree = TreeSnapshot()
+
+    def discover() -> dict:
+        return LayerDiscovery(
+            content_type="guidelines",
+            core_dir=core_dir,
+            pack_roots=[],
+            tree=tree,
+        ).discover_core()
+
+    first = discover()
+    listings = tree.stats.listings
+    second = discover()
+
+    assert set(first) == {"a", "shared/b"}
+    assert set(second) == set(first)
+    assert tree.stats.listings == listings
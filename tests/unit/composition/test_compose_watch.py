@@ -0,0 +1,185 @@
+"""Tests for incremental composition (`edison compose watch`)."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from edison.core.composition.watch import IncrementalComposer
+
+
+def _bump(path: Path, text: str) -> None:
+    path.write_text(text, encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def _project_guidelines(root: Path) -> Path:
+    guides = root / ".edison" / "guidelines"
+    (guides / "includes").mkdir(parents=True, exist_ok=True)
+    (guides / "includes" / "watch-snippet.md").write_text(
+        "<!-- SECTION: body -->\nSnippet v1\n<!-- /SECTION: body -->\n",
+        encoding="utf-8",
+    )
+    (guides / "watch-consumer.md").write_text(
+        "# Consumer\n\n{{include-section:guidelines/includes/watch-snippet.md#body}}\n",
+        encoding="utf-8",
+    )
+    (guides / "watch-standalone.md").write_text("# Standalone v1\n", encoding="utf-8")
+    return guides
+
+
+def test_edit_rewrites_only_affected_entity(isolated_project_env: Path) -> None:
+    guides = _project_guidelines(isolated_project_env)
+    composer = IncrementalComposer(isolated_project_env, types=["guidelines"])
+    full = composer.full_build()
+    assert full.full and full.written
+
+    out = composer.types_manager.resolve_entity_output("guidelines", "watch-standalone")
+    assert out is not None and "Standalone v1" in out.read_text(encoding="utf-8")
+
+    _bump(guides / "watch-standalone.md", "# Standalone v2\n")
+    result = composer.apply_changes({guides / "watch-standalone.md"})
+
+    assert result.entities == ["guidelines/watch-standalone"]
+    assert result.written == [out]
+    assert "Standalone v2" in out.read_text(encoding="utf-8")
+
+
+def test_include_change_recomposes_dependents(isolated_project_env: Path) -> None:
+    guides = _project_guidelines(isolated_project_env)
+    composer = IncrementalComposer(isolated_project_env, types=["guidelines"])
+    composer.full_build()
+
+    consumer_out = composer.types_manager.resolve_entity_output("guidelines", "watch-consumer")
+    assert consumer_out is not None
+    assert "Snippet v1" in consumer_out.read_text(encoding="utf-8")
+
+    _bump(
+        guides / "includes" / "watch-snippet.md",
+        "<!-- SECTION: body -->\nSnippet v2\n<!-- /SECTION: body -->\n",
+    )
+    result = composer.apply_changes({guides / "includes" / "watch-snippet.md"})
+
+    assert "guidelines/includes/watch-snippet" in result.entities
+    assert "guidelines/watch-consumer" in result.entities
+    assert "guidelines/watch-standalone" not in result.entities
+    assert "Snippet v2" in consumer_out.read_text(encoding="utf-8")
+
+
+def test_new_and_deleted_files_update_discovery(isolated_project_env: Path) -> None:
+    guides = _project_guidelines(isolated_project_env)
+    composer = IncrementalComposer(isolated_project_env, types=["guidelines"])
+    composer.full_build()
+
+    added = guides / "watch-added.md"
+    added.write_text("# Added\n", encoding="utf-8")
+    result = composer.apply_changes({added})
+    added_out = composer.types_manager.resolve_entity_output("guidelines", "watch-added")
+    assert result.entities == ["guidelines/watch-added"]
+    assert added_out is not None and added_out.exists()
+
+    added.unlink()
+    result = composer.apply_changes({added})
+    assert result.removed == [added_out]
+    assert not added_out.exists()
+
+
+def test_generated_outputs_and_swap_files_are_ignored(isolated_project_env: Path) -> None:
+    _project_guidelines(isolated_project_env)
+    composer = IncrementalComposer(isolated_project_env, types=["guidelines"])
+    full = composer.full_build()
+
+    assert composer.is_ignored(full.written[0])
+    assert composer.is_ignored(isolated_project_env / ".edison" / "guidelines" / ".x.md.swp")
+    assert composer.apply_changes({full.written[0]}).written == []
+
+
+def test_non_entity_include_change_recomposes_includers(isolated_project_env: Path) -> None:
+    guides = _project_guidelines(isolated_project_env)
+    partial = isolated_project_env / ".edison" / "snippets" / "watch-partial.md"
+    partial.parent.mkdir(parents=True, exist_ok=True)
+    partial.write_text("Partial v1\n", encoding="utf-8")
+    (guides / "watch-partial-user.md").write_text(
+        "# User\n\n{{include:.edison/snippets/watch-partial.md}}\n", encoding="utf-8"
+    )
+    composer = IncrementalComposer(isolated_project_env, types=["guidelines"])
+    composer.full_build()
+    out = composer.types_manager.resolve_entity_output("guidelines", "watch-partial-user")
+    assert out is not None and "Partial v1" in out.read_text(encoding="utf-8")
+    assert not composer.graph.entities_for(partial)
+
+    _bump(partial, "Partial v2\n")
+    result = composer.apply_changes({partial})
+
+    assert result.entities == ["guidelines/watch-partial-user"]
+    assert "Partial v2" in out.read_text(encoding="utf-8")
+
+
+def test_removed_entity_output_outside_generated_is_kept(isolated_project_env: Path, monkeypatch) -> None:
+    guides = _project_guidelines(isolated_project_env)
+    composer = IncrementalComposer(isolated_project_env, types=["guidelines"])
+    composer.full_build()
+
+    outside = isolated_project_env / "docs" / "watch-standalone.md"
+    outside.parent.mkdir(parents=True, exist_ok=True)
+    outside.write_text("user file\n", encoding="utf-8")
+    monkeypatch.setattr(composer.types_manager, "resolve_entity_output", lambda *_a: outside)
+
+    (guides / "watch-standalone.md").unlink()
+    result = composer.apply_changes({guides / "watch-standalone.md"})
+
+    assert result.removed == []
+    assert outside.read_text(encoding="utf-8") == "user file\n"
+
+
+def test_watch_cli_reports_failed_rebuild_and_keeps_watching(
+    isolated_project_env: Path, monkeypatch, capsys
+) -> None:
+    import argparse
+
+    from edison.cli.compose import watch as watch_cli
+    from edison.core.composition.watch import RebuildResult
+
+    calls: list[str] = []
+
+    class _Composer:
+        def __init__(self, *_args, **_kwargs) -> None:
+            pass
+
+        def full_build(self) -> RebuildResult:
+            return RebuildResult(full=True)
+
+        def watch_roots(self) -> list[Path]:
+            return [isolated_project_env]
+
+        def is_ignored(self, _path: Path) -> bool:
+            return False
+
+        def apply_changes(self, changed) -> RebuildResult:
+            calls.append("apply")
+            if len(calls) == 1:
+                raise ValueError("broken include")
+            return RebuildResult(written=[isolated_project_env / "out.md"])
+
+        def reload(self) -> RebuildResult:
+            calls.append("reload")
+            return RebuildResult(full=True)
+
+    class _Watcher:
+        overflowed = False
+
+        def wait(self, timeout: float) -> set[Path]:
+            return {isolated_project_env / "a.md"}
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr(watch_cli, "IncrementalComposer", _Composer)
+    monkeypatch.setattr(watch_cli, "create_watcher", lambda *a, **k: _Watcher())
+    args = argparse.Namespace(json=False, repo_root=str(isolated_project_env), max_rebuilds=3)
+
+    assert watch_cli.main(args) == 0
+    # The failure is reported, the next change resyncs with a full rebuild, then
+    # incremental rebuilds resume.
+    assert calls == ["apply", "reload", "apply"]
+    assert "broken include" in capsys.readouterr().err
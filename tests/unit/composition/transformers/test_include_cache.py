@@ -0,0 +1,118 @@
+"""Tests for the run-level include cache shared across composed entities."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from edison.core.composition.engine import TemplateEngine
+from edison.core.composition.includes.cache import (
+    IncludeCache,
+    enable_include_cache,
+    get_active_include_cache,
+)
+
+
+def _write_snippets(root: Path) -> Path:
+    snippet = root / "guidelines" / "includes" / "shared.md"
+    snippet.parent.mkdir(parents=True, exist_ok=True)
+    snippet.write_text(
+        "<!-- SECTION: intro -->\nIntro text\n<!-- /SECTION: intro -->\n"
+        "<!-- SECTION: outer -->\nOuter\n<!-- SECTION: inner -->\nInner text\n"
+        "<!-- /SECTION: inner -->\n<!-- /SECTION: outer -->\n",
+        encoding="utf-8",
+    )
+    return snippet
+
+
+def test_section_map_is_parsed_once_across_entities(tmp_path: Path) -> None:
+    _write_snippets(tmp_path)
+    cache = IncludeCache()
+
+    with enable_include_cache(cache):
+        for name in ("a", "b", "c"):
+            engine = TemplateEngine(source_dir=tmp_path)
+            out, _ = engine.process(
+                "{{include-section:guidelines/includes/shared.md#intro}}",
+                entity_name=name,
+                entity_type="agents",
+            )
+            assert out == "Intro text"
+
+    assert cache.stats.section_parses == 1
+    assert cache.stats.file_misses == 1
+    assert cache.stats.file_hits >= 2
+
+
+def test_nested_sections_match_section_parser(tmp_path: Path) -> None:
+    snippet = _write_snippets(tmp_path)
+    cache = IncludeCache()
+
+    assert cache.get_section(snippet, "inner") == "Inner text"
+    assert cache.get_section(snippet, "missing") is None
+    assert "Inner text" in (cache.get_section(snippet, "outer") or "")
+
+
+def test_file_change_is_detected_by_mtime(tmp_path: Path) -> None:
+    snippet = _write_snippets(tmp_path)
+    cache = IncludeCache()
+    assert cache.get_section(snippet, "intro") == "Intro text"
+
+    snippet.write_text(
+        "<!-- SECTION: intro -->\nChanged intro\n<!-- /SECTION: intro -->\n",
+        encoding="utf-8",
+    )
+    st = snippet.stat()
+    os.utime(snippet, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert cache.get_section(snippet, "intro") == "Changed intro"
+    assert cache.stats.section_parses == 2
+
+
+def test_include_graph_records_dependents(tmp_path: Path) -> None:
+    _write_snippets(tmp_path)
+    (tmp_path / "guidelines" / "includes" / "full.md").write_text("Full body", encoding="utf-8")
+    cache = IncludeCache()
+
+    with enable_include_cache(cache):
+        TemplateEngine(source_dir=tmp_path).process(
+            "{{include-section:guidelines/includes/shared.md#intro}}",
+            entity_name="api-builder",
+            entity_type="agents",
+        )
+        TemplateEngine(source_dir=tmp_path).process(
+            "{{include:guidelines/includes/full.md}}",
+            entity_name="reviewer",
+            entity_type="validators",
+        )
+
+    assert cache.dependencies_of("agents/api-builder") == {"guidelines/includes/shared"}
+    assert cache.dependents_of("guidelines/includes/shared.md") == {"agents/api-builder"}
+    assert cache.dependents_of("guidelines/includes/full.md") == {"validators/reviewer"}
+
+    cache.forget_dependent("agents/api-builder")
+    assert cache.dependents_of("guidelines/includes/shared.md") == set()
+
+
+def test_transitive_dependents_follow_include_fragments() -> None:
+    cache = IncludeCache()
+    # Fragment "guidelines/includes/wrapper" includes "guidelines/includes/base",
+    # and an agent includes the wrapper fragment.
+    cache.record_dependency("guidelines/includes/wrapper", "guidelines/includes/base.md")
+    cache.record_dependency("agents/api-builder", "guidelines/includes/wrapper.md")
+
+    assert cache.dependents_of("guidelines/includes/base.md") == {
+        "guidelines/includes/wrapper",
+        "agents/api-builder",
+    }
+    assert cache.dependents_of("guidelines/includes/base.md", transitive=False) == {
+        "guidelines/includes/wrapper",
+    }
+
+
+def test_cache_is_scoped_to_context() -> None:
+    assert get_active_include_cache() is None
+    cache = IncludeCache()
+    with enable_include_cache(cache):
+        assert get_active_include_cache() is cache
+        assert TemplateEngine().include_cache is cache
+    assert get_active_include_cache() is None
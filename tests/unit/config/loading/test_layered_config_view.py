@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+import random
+from functools import reduce
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from edison.core.config import ConfigManager, LayeredConfigView
+from edison.core.utils.merge import deep_merge
+
+_KEYS = ["a", "b", "c", "d", "e"]
+
+
+def _random_list(rng: random.Random) -> list[Any]:
+    kind = rng.choice(["scalars", "append", "replace", "remove", "ids", "empty"])
+    if kind == "empty":
+        return []
+    if kind == "ids":
+        return [
+            {"id": rng.choice("xyz"), "v": rng.randint(0, 3), **({"enabled": False} if rng.random() < 0.2 else {})}
+            for _ in range(rng.randint(1, 3))
+        ]
+    items = [rng.randint(0, 5) for _ in range(rng.randint(0, 3))]
+    marker = {"append": ["+"], "replace": ["="], "remove": ["-"]}.get(kind, [])
+    return [*marker, *items]
+
+
+def _random_value(rng: random.Random, depth: int) -> Any:
+    roll = rng.random()
+    if depth < 3 and roll < 0.45:
+        return _random_tree(rng, depth + 1)
+    if roll < 0.7:
+        return _random_list(rng)
+    return rng.choice([None, True, 0, 1, "s", "t"])
+
+
+def _random_tree(rng: random.Random, depth: int = 0) -> dict[str, Any]:
+    return {k: _random_value(rng, depth) for k in rng.sample(_KEYS, rng.randint(0, 4))}
+
+
+@pytest.mark.parametrize("seed", range(300))
+def test_view_matches_deep_merge(seed: int) -> None:
+    rng = random.Random(seed)
+    layers = [_random_tree(rng) for _ in range(rng.randint(0, 6))]
+    snapshot = json.dumps(layers, sort_keys=True)
+
+    view = LayeredConfigView(layers)
+    try:
+        expected = reduce(deep_merge, layers, {})
+    except TypeError:  # "-" marker over a list of dicts fails the same way
+        with pytest.raises(TypeError):
+            view.materialize()
+        return
+
+    merged = view.materialize()
+    assert merged == expected
+    # Key order follows deep_merge (first-seen position) at every level.
+    assert json.dumps(merged) == json.dumps(expected)
+    for key in expected:
+        value = view[key]
+        plain = value.materialize() if isinstance(value, LayeredConfigView) else value
+        assert plain == expected[key]
+        assert view.materialize(key) == expected[key]
+    assert json.dumps(layers, sort_keys=True) == snapshot  # layers are never mutated
+
+
+def test_view_resolves_subtrees_lazily_and_caches_them() -> None:
+    core = {"packs": {"active": ["python"]}, "tasks": {"readiness": {"states": ["done"]}}}
+    pack = {"tasks": {"readiness": {"states": ["+", "validated"]}}, "validators": [{"id": "v1"}]}
+    project = {"packs": {"active": ["+", "react"]}, "tasks": "flat"}
+    view = LayeredConfigView([core, pack, project])
+
+    assert view.get_path("packs.active") == ["python", "react"]
+    assert view["tasks"] == "flat"  # a scalar replaces the merged dict
+    assert view.get_path("tasks.readiness.states", "missing") == "missing"
+    assert view["packs"] is view["packs"]
+    assert list(view) == ["packs", "tasks", "validators"]
+    assert "validators" in view and "nope" not in view
+    with pytest.raises(KeyError):
+        view.materialize("packs.inactive")
+
+    on_top = view.with_layer({"tasks": {"readiness": {"states": ["wip"]}}})
+    assert on_top.get_path("tasks.readiness.states") == ["wip"]
+    assert view["tasks"] == "flat"
+
+
+def test_config_manager_merges_layers_once(tmp_path: Path) -> None:
+    config_dir = tmp_path / ".edison" / "config"
+    config_dir.mkdir(parents=True)
+    (config_dir / "tasks.yaml").write_text(
+        "tasks:\n  readiness:\n    dependencySatisfiedStates: ['+', wip]\n", encoding="utf-8"
+    )
+
+    mgr = ConfigManager(tmp_path)
+    cfg = mgr._load_config_uncached(validate=False)
+
+    core = reduce(deep_merge, mgr._directory_layers(mgr.core_config_dir), {})
+    expected = core["tasks"]["readiness"]["dependencySatisfiedStates"] + ["wip"]
+    assert cfg["tasks"]["readiness"]["dependencySatisfiedStates"] == expected
@@ -0,0 +1,136 @@
+"""Tests for the batched import write path (save_many / sync_items_to_tasks)."""
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.helpers.fixtures import create_repo_with_git
+from tests.helpers.io_utils import write_yaml
+
+
+@pytest.fixture
+def repo_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    repo = create_repo_with_git(tmp_path)
+    config_dir = repo / ".edison" / "config"
+    write_yaml(
+        config_dir / "defaults.yaml",
+        {
+            "statemachine": {
+                "task": {
+                    "states": {
+                        "todo": {"allowed_transitions": [{"to": "wip"}]},
+                        "wip": {"allowed_transitions": [{"to": "done"}]},
+                        "done": {"allowed_transitions": []},
+                    },
+                },
+                "qa": {
+                    "states": {
+                        "waiting": {"allowed_transitions": [{"to": "todo"}]},
+                        "todo": {"allowed_transitions": []},
+                    }
+                },
+            },
+        },
+    )
+    write_yaml(
+        config_dir / "tasks.yaml",
+        {"tasks": {"paths": {"root": ".project/tasks", "qaRoot": ".project/qa"}}},
+    )
+    (repo / ".project" / "tasks" / "todo").mkdir(parents=True)
+    monkeypatch.chdir(repo)
+    return repo
+
+
+def _speckit_feature(root: Path, count: int, *, phase_size: int = 10):
+    from edison.core.import_.speckit import parse_feature_folder
+
+    lines = []
+    for i in range(1, count + 1):
+        if (i - 1) % phase_size == 0:
+            lines.append(f"\n## Phase {(i - 1) // phase_size + 1}: Step {i}\n")
+        marker = "[P] " if i % 3 else ""
+        lines.append(f"- [ ] T{i:05d} {marker}Implement part {i} in src/mod{i}.py")
+    feature_dir = root / "specs" / "bulk"
+    feature_dir.mkdir(parents=True, exist_ok=True)
+    (feature_dir / "tasks.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return parse_feature_folder(feature_dir)
+
+
+def test_save_many_matches_save_semantics(repo_env: Path) -> None:
+    from edison.core.task.models import Task
+    from edison.core.task.repository import TaskRepository
+
+    repo = TaskRepository(project_root=repo_env)
+    repo.save(Task.create("T-1", "One"))
+    repo.save(Task.create("T-2", "Two"))
+    edited = repo_env / ".project" / "tasks" / "todo" / "T-1.md"
+    edited.write_text(edited.read_text(encoding="utf-8") + "\nHand-written notes\n", encoding="utf-8")
+
+    one = repo.get("T-1")
+    one.title = "One (renamed)"
+    two = repo.get("T-2")
+    two.state = "wip"
+    repo.save_many([one, two, Task.create("T-3", "Three")])
+
+    assert "Hand-written notes" in edited.read_text(encoding="utf-8")
+    assert repo.get("T-1").title == "One (renamed)"
+    assert not (repo_env / ".project" / "tasks" / "todo" / "T-2.md").exists()
+    assert repo.get("T-2").state == "wip"
+    assert repo.get("T-3").title == "Three"
+
+
+@pytest.mark.parametrize("failing", ["T00017", "T00017-qa"], ids=["task", "qa"])
+def test_staged_sync_leaves_tree_untouched_on_failure(
+    repo_env: Path, monkeypatch: pytest.MonkeyPatch, failing: str
+) -> None:
+    from edison.core.entity import PersistenceError
+    from edison.core.import_.speckit import sync_speckit_feature
+
+    feature = _speckit_feature(repo_env, 30)
+    real_write_text = Path.write_text
+
+    # Task files, their depends_on edges and QA records share one publish.
+    def _failing(self: Path, *args, **kwargs):
+        if failing in self.name:
+            raise OSError("disk full")
+        return real_write_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_text", _failing)
+    with pytest.raises(PersistenceError):
+        sync_speckit_feature(feature, prefix="bulk", project_root=repo_env, staged=True)
+    monkeypatch.setattr(Path, "write_text", real_write_text)
+
+    assert list((repo_env / ".project" / "tasks" / "todo").iterdir()) == []
+    assert not (repo_env / ".project" / "qa").exists() or not any((repo_env / ".project" / "qa").rglob("*.md"))
+
+    result = sync_speckit_feature(feature, prefix="bulk", project_root=repo_env, staged=True)
+    assert len(result.created) == 30
+
+
+@pytest.mark.slow
+def test_speckit_import_5k_items(repo_env: Path) -> None:
+    """Benchmark: 5k-item SpecKit import with QA records and depends_on edges."""
+    from edison.core.import_.speckit import sync_speckit_feature
+    from edison.core.task.repository import TaskRepository
+
+    feature = _speckit_feature(repo_env, 5000)
+
+    start = time.perf_counter()
+    result = sync_speckit_feature(feature, prefix="bulk", project_root=repo_env, staged=True)
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    again = sync_speckit_feature(feature, prefix="bulk", project_root=repo_env)
+    resync = time.perf_counter() - start
+
+    assert len(result.created) == 5000
+    assert len(again.updated) == 5000 and again.created == []
+    assert len(list((repo_env / ".project" / "qa" / "waiting").glob("*.md"))) == 5000
+    task = TaskRepository(project_root=repo_env).get("bulk-T00012")
+    assert task is not None and "bulk-T00010" in task.depends_on
+    # The per-item write path cost ~0.7s/item; batched writes stay well under
+    # 60ms/item even on a loaded machine.
+    assert first < 5000 * 0.06, f"import took {first:.1f}s"
+    assert resync < 5000 * 0.06, f"re-sync took {resync:.1f}s"
@@ -0,0 +1,108 @@
+"""Tests for the shared read-through entity cache."""
+from __future__ import annotations
+
+import importlib
+import os
+import time
+from pathlib import Path
+
+import pytest
+from helpers.env_setup import setup_project_root
+from helpers.io_utils import write_yaml
+from helpers.markdown_utils import create_markdown_task
+from tests.helpers.fixtures import create_repo_with_git
+
+from edison.core.entity import clear_entity_caches
+from edison.core.utils.profiling import Profiler, enable_profiler
+
+
+def _backdate(path: Path, seconds: float = 60.0) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture
+def repo_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    repo = tmp_path
+    create_repo_with_git(repo)
+    write_yaml(
+        repo / ".edison" / "config" / "tasks.yaml",
+        {"tasks": {"paths": {"root": ".project/tasks", "qaRoot": ".project/qa"}}},
+    )
+    setup_project_root(monkeypatch, repo)
+    import edison.core.config.domains.task as task_config
+
+    importlib.reload(task_config)
+    clear_entity_caches()
+    yield repo
+    clear_entity_caches()
+
+
+def test_repositories_share_parsed_tasks(repo_env: Path) -> None:
+    from edison.core.task.repository import TaskRepository
+
+    path = repo_env / ".project" / "tasks" / "todo" / "T-1.md"
+    create_markdown_task(path, "T-1", "Task One", "todo")
+    _backdate(path)
+
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        first = TaskRepository(project_root=repo_env).get("T-1")
+        second = TaskRepository(project_root=repo_env).get("T-1")
+        listed = TaskRepository(project_root=repo_env).find_by_state("todo")
+
+    assert first is not None and second is not None
+    assert profiler.counters["entity.cache.miss"] == 1
+    assert profiler.counters["entity.cache.hit"] == 2
+    assert [t.id for t in listed] == ["T-1"]
+
+    # Callers get private copies: mutating one never leaks into the cache.
+    first.title = "Mutated"
+    first.tags.append("x")
+    again = TaskRepository(project_root=repo_env).get("T-1")
+    assert again is not None and again.title == "Task One" and again.tags == []
+
+
+def test_cache_observes_external_edits_and_repository_writes(repo_env: Path) -> None:
+    from edison.core.task.repository import TaskRepository
+
+    path = repo_env / ".project" / "tasks" / "todo" / "T-2.md"
+    create_markdown_task(path, "T-2", "Before", "todo")
+    _backdate(path, 120)
+    repo = TaskRepository(project_root=repo_env)
+    assert repo.get("T-2").title == "Before"
+
+    # Another process rewrites the file: the stat signature changes.
+    create_markdown_task(path, "T-2", "After edit", "todo")
+    _backdate(path, 60)
+    assert repo.get("T-2").title == "After edit"
+
+    # Write-through: a save that moves the file is visible to every repository.
+    task = repo.get("T-2")
+    task.state = "wip"
+    repo.save(task)
+    moved = TaskRepository(project_root=repo_env).get("T-2")
+    assert moved is not None and moved.state == "wip"
+
+
+def test_recently_modified_files_are_not_cached(tmp_path: Path) -> None:
+    from edison.core.entity import EntityCache
+
+    path = tmp_path / "record.json"
+    path.write_text("{}", encoding="utf-8")
+    cache = EntityCache()
+    loads: list[Path] = []
+
+    def _load(p: Path) -> dict:
+        loads.append(p)
+        return {"n": len(loads)}
+
+    # Written within the racy window: a same-size rewrite in the same clock tick
+    # would be invisible, so the result is not cached.
+    assert cache.get(path, _load) == {"n": 1}
+    assert len(cache) == 0
+
+    _backdate(path)
+    assert cache.get(path, _load) == {"n": 2}
+    assert cache.get(path, _load) == {"n": 2}
+    assert len(loads) == 2
@@ -0,0 +1,64 @@
+"""Tests for batched text writes (write_text_many)."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from edison.core.utils.io import write_text_many
+
+
+def _leftovers(root: Path) -> list[str]:
+    return sorted(p.name for p in root.rglob(".*") if p.is_file())
+
+
+def test_writes_every_file_and_creates_parents(tmp_path: Path) -> None:
+    files = [(tmp_path / f"d{i % 3}" / f"f{i}.md", f"content {i}") for i in range(50)]
+    write_text_many(files, max_workers=4)
+    assert all(p.read_text(encoding="utf-8") == c for p, c in files)
+
+
+def test_staged_write_failure_publishes_nothing(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    existing = tmp_path / "a.md"
+    existing.write_text("original", encoding="utf-8")
+    files = [(existing, "new a"), (tmp_path / "b.md", "new b"), (tmp_path / "c.md", "new c")]
+
+    real_write_text = Path.write_text
+
+    def _failing(self: Path, *args, **kwargs):
+        if "c.md" in self.name:
+            raise OSError("disk full")
+        return real_write_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "write_text", _failing)
+    with pytest.raises(OSError, match="disk full"):
+        write_text_many(files, staged=True)
+
+    assert existing.read_text(encoding="utf-8") == "original"
+    assert not (tmp_path / "b.md").exists()
+    assert _leftovers(tmp_path) == []
+
+
+def test_staged_publish_failure_restores_originals(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    paths = [tmp_path / f"{name}.md" for name in "abc"]
+    paths[0].write_text("original a", encoding="utf-8")
+    paths[2].write_text("original c", encoding="utf-8")
+
+    real_replace = os.replace
+    calls = {"n": 0}
+
+    def _replace(src, dst):
+        calls["n"] += 1
+        if calls["n"] == 3:  # the third publish rename fails
+            raise OSError("rename failed")
+        return real_replace(src, dst)
+
+    monkeypatch.setattr(os, "replace", _replace)
+    with pytest.raises(OSError, match="rename failed"):
+        write_text_many([(p, f"new {p.stem}") for p in paths], staged=True)
+
+    assert paths[0].read_text(encoding="utf-8") == "original a"
+    assert not paths[1].exists()
+    assert paths[2].read_text(encoding="utf-8") == "original c"
+    assert _leftovers(tmp_path) == []
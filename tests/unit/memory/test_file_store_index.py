@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from edison.core.memory.file_index import close_indexes, fts_query
+from edison.core.memory.providers import FileStoreMemoryProvider
+from edison.core.utils.profiling import Profiler, enable_profiler
+
+
+def _provider(root: Path) -> FileStoreMemoryProvider:
+    return FileStoreMemoryProvider(
+        id="file",
+        memory_root=root,
+        codebase_map_path=root / "codebase_map.json",
+        patterns_path=root / "patterns.md",
+        gotchas_path=root / "gotchas.md",
+        session_insights_dir=root / "session_insights",
+    )
+
+
+def _record(sid: str, *, worked: list[str], patterns: list[str] | None = None) -> dict:
+    return {
+        "schema": "session-insights-v1",
+        "sessionId": sid,
+        "whatWorked": worked,
+        "whatFailed": [],
+        "recommendationsForNextSession": [],
+        "discoveries": {
+            "patterns_found": patterns or [],
+            "gotchas_encountered": [],
+            "files_understood": {"src/auth/refresh.py": "token refresh rotation"},
+        },
+    }
+
+
+@pytest.fixture(autouse=True)
+def _close_indexes():
+    yield
+    close_indexes()
+
+
+def test_file_store_search_ranks_indexed_artifacts(tmp_path: Path) -> None:
+    store = _provider(tmp_path / "memory")
+    store.save_structured(_record("s1", worked=["Retry flaky network calls with backoff"]), session_id="s1")
+    store.save_structured(
+        _record("s2", worked=["Rotate refresh tokens on every use"], patterns=["Refresh tokens are single use"]),
+        session_id="s2",
+    )
+
+    hits = store.search("refresh token", limit=5)
+    texts = [h.text for h in hits]
+    # Only the codebase-map entry matches both terms ("tokens" != "token": no stemming).
+    assert texts[0] == "src/auth/refresh.py: token refresh rotation"
+    assert set(texts[1:]) == {"Rotate refresh tokens on every use", "Refresh tokens are single use"}
+    assert all(0 < (h.score or 0) < 1 for h in hits)
+    backoff = store.search("backoff", limit=5)[0]
+    assert backoff.meta is not None and backoff.meta["kind"] == "insight" and backoff.meta["sessionId"] == "s1"
+
+    # Re-saving a session replaces its insights instead of duplicating them.
+    store.save_structured(_record("s1", worked=["Use exponential backoff"]), session_id="s1")
+    assert [h.text for h in store.search("backoff", limit=5)] == ["Use exponential backoff"]
+    assert fts_query('tokens "OR" (x)') == '"tokens" OR "or" OR "x"'
+
+
+def test_dedupe_set_is_persisted_and_index_rebuilds_from_artifacts(tmp_path: Path) -> None:
+    root = tmp_path / "memory"
+    store = _provider(root)
+    store.save_structured(_record("s1", worked=[], patterns=["Prefer repositories"]), session_id="s1")
+    close_indexes()
+
+    store.save_structured(_record("s2", worked=[], patterns=["Prefer repositories", "Keep IO at edges"]), session_id="s2")
+    assert (root / "patterns.md").read_text(encoding="utf-8").splitlines() == [
+        "- Prefer repositories",
+        "- Keep IO at edges",
+    ]
+
+    close_indexes()
+    store.index_path.unlink()
+    assert [h.text for h in store.search("repositories", limit=5)] == ["Prefer repositories"]
+    assert [h.text for h in store.search("edges", limit=5)] == ["Keep IO at edges"]
+
+
+def test_index_is_rebuilt_after_artifacts_change_on_disk(tmp_path: Path) -> None:
+    root = tmp_path / "memory"
+    store = _provider(root)
+    store.save_structured(_record("s1", worked=[], patterns=["Prefer repositories"]), session_id="s1")
+
+    # A hand edit replaces the bullet; the index must follow the file, not the old save.
+    (root / "patterns.md").write_text("- Keep IO at edges\n", encoding="utf-8")
+    assert store.search("repositories", limit=5) == []
+    assert [h.text for h in store.search("edges", limit=5)] == ["Keep IO at edges"]
+
+    # The removed bullet is no longer in the dedupe set, so saving it appends it again.
+    store.save_structured(_record("s2", worked=[], patterns=["Prefer repositories"]), session_id="s2")
+    assert (root / "patterns.md").read_text(encoding="utf-8").splitlines() == [
+        "- Keep IO at edges",
+        "- Prefer repositories",
+    ]
+
+
+def test_saves_update_the_index_and_new_insight_files_trigger_a_rebuild(tmp_path: Path) -> None:
+    root = tmp_path / "memory"
+    store = _provider(root)
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        for i in range(5):
+            store.save_structured(_record(f"s{i}", worked=[f"insight number{i}"]), session_id=f"s{i}")
+            assert store.search(f"number{i}", limit=5)
+    # Only the first open (no index yet) rebuilds; saves are applied incrementally.
+    assert profiler.counters["memory.file_store.rebuild"] == 1
+
+    # An insight file dropped in by hand changes the directory signature.
+    (root / "session_insights" / "hand.json").write_text(
+        json.dumps(_record("hand", worked=["copied from another checkout"])), encoding="utf-8"
+    )
+    with enable_profiler(profiler):
+        assert [h.text for h in store.search("checkout", limit=5)] == ["copied from another checkout"]
+    assert profiler.counters["memory.file_store.rebuild"] == 2
+
+
+@pytest.mark.slow
+def test_file_store_search_scales_to_100k_insights(tmp_path: Path) -> None:
+    """Benchmark: 1000 sessions x 100 insights; saves and queries never rebuild the index."""
+    store = _provider(tmp_path / "memory")
+    vocab = [f"term{i}" for i in range(2000)]
+    sessions, per_session = 1000, 100
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        for s in range(sessions):
+            worked = [
+                f"{vocab[(s * 7 + i) % len(vocab)]} {vocab[(s * 13 + i * 3) % len(vocab)]} insight {s}-{i}"
+                for i in range(per_session)
+            ]
+            store.save_structured(_record(f"sess-{s}", worked=worked), session_id=f"sess-{s}")
+
+        index = store._index()
+        assert index is not None and len(index) >= sessions * per_session
+
+        for i in range(200):
+            assert store.search(f"{vocab[i]} {vocab[(i * 31) % len(vocab)]}", limit=10)
+    assert profiler.counters["memory.file_store.rebuild"] == 1
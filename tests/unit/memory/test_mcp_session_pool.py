@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from edison.core.mcp.config import McpServerConfig
+from edison.core.memory.mcp_client import McpSessionPool, get_mcp_session_pool
+from tests.helpers.cache_utils import reset_edison_caches
+from tests.helpers.io_utils import write_yaml
+
+_STUB_SERVER = r"""
+import json
+import os
+import sys
+
+with open(os.environ["STUB_SPAWN_LOG"], "a", encoding="utf-8") as fh:
+    fh.write(f"{os.getpid()}\n")
+exit_after = int(os.environ.get("STUB_EXIT_AFTER", "0") or "0")
+
+
+def _read_message():
+    headers = {}
+    while True:
+        line = sys.stdin.buffer.readline()
+        if not line:
+            return None
+        if line in (b"\n", b"\r\n"):
+            break
+        if b":" in line:
+            k, v = line.decode("ascii", errors="ignore").split(":", 1)
+            headers[k.strip().lower()] = v.strip()
+    body = sys.stdin.buffer.read(int(headers.get("content-length", "0") or "0"))
+    return json.loads(body.decode("utf-8"))
+
+
+def _send(obj):
+    body = json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    sys.stdout.buffer.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    sys.stdout.buffer.flush()
+
+
+calls = 0
+while True:
+    msg = _read_message()
+    if msg is None:
+        break
+    method = msg.get("method")
+    if method == "initialize":
+        _send({"jsonrpc": "2.0", "id": msg["id"], "result": {"capabilities": {"tools": {}}}})
+    elif method == "tools/call":
+        calls += 1
+        query = msg["params"]["arguments"].get("query", "")
+        results = [{"snippet": f"{query}:{calls}", "similarity": 0.9}]
+        # A notification before the response must not confuse the client.
+        _send({"jsonrpc": "2.0", "method": "notifications/progress", "params": {}})
+        _send({"jsonrpc": "2.0", "id": msg["id"], "result": {"content": [{"type": "text", "text": json.dumps({"results": results})}]}})
+        if exit_after and calls >= exit_after:
+            break
+"""
+
+
+def _stub(tmp: Path, *, exit_after: int = 0) -> tuple[McpServerConfig, Path]:
+    script = tmp / "stub_mcp_server.py"
+    script.write_text(_STUB_SERVER.lstrip(), encoding="utf-8")
+    spawn_log = tmp / "spawns.log"
+    env = {"STUB_SPAWN_LOG": str(spawn_log), "STUB_EXIT_AFTER": str(exit_after)}
+    return McpServerConfig(command="python3", args=[str(script)], env=env), spawn_log
+
+
+def _spawns(log: Path) -> int:
+    return len(log.read_text(encoding="utf-8").splitlines()) if log.exists() else 0
+
+
+def test_pool_restarts_crashed_server_and_reaps_idle(tmp_path: Path) -> None:
+    server, spawn_log = _stub(tmp_path, exit_after=2)
+    pool = McpSessionPool(idle_timeout_seconds=0.2)
+    try:
+        texts = []
+        for i in range(5):
+            res = pool.call_tool("stub", server, "search", {"query": f"q{i}"}, timeout_seconds=10)
+            assert res is not None
+            texts.append(res.content[0]["text"])
+        assert all(f'"q{i}:' in t for i, t in enumerate(texts))
+        # The stub exits after every 2nd call; each exit costs exactly one restart.
+        assert _spawns(spawn_log) == 3
+
+        deadline = time.monotonic() + 5
+        while len(pool) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert len(pool) == 0
+    finally:
+        pool.close_all()
+
+
+def test_fifty_sequential_searches_reuse_one_server(isolated_project_env: Path) -> None:
+    server, spawn_log = _stub(isolated_project_env)
+    cfg_dir = isolated_project_env / ".edison" / "config"
+    write_yaml(
+        cfg_dir / "mcp.yaml",
+        {"mcp": {"servers": {"bench-memory": {"command": server.command, "args": server.args, "env": server.env}}}},
+    )
+    write_yaml(
+        cfg_dir / "memory.yaml",
+        {
+            "memory": {
+                "enabled": True,
+                "providers": {
+                    "mcp": {
+                        "kind": "mcp-tools",
+                        "enabled": True,
+                        "serverId": "bench-memory",
+                        "searchTool": "search",
+                        "responseFormat": "json",
+                    }
+                },
+            }
+        },
+    )
+    reset_edison_caches()
+
+    from edison.core.memory import MemoryManager
+
+    mgr = MemoryManager(project_root=isolated_project_env)
+    try:
+        started = time.perf_counter()
+        for i in range(50):
+            hits = mgr.search(f"query-{i}", limit=5)
+            assert [h.text for h in hits] == [f"query-{i}:{i + 1}"]
+        elapsed = time.perf_counter() - started
+    finally:
+        get_mcp_session_pool().close_all()
+
+    # One spawn + initialize handshake for all 50 searches (previously 50).
+    assert _spawns(spawn_log) == 1
+    assert elapsed < 10.0, f"50 pooled searches took {elapsed:.2f}s"
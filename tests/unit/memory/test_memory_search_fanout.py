@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from tests.helpers.cache_utils import reset_edison_caches
+from tests.helpers.io_utils import write_yaml
+
+
+def _fake_cli(bin_dir: Path, name: str, *, sleep: float, calls_log: Path) -> None:
+    script = bin_dir / name
+    script.write_text(
+        "#!/usr/bin/env bash\n"
+        f'echo "{name}" >> "{calls_log}"\n'
+        f"sleep {sleep}\n"
+        f'echo "{name}:$2"\n',
+        encoding="utf-8",
+    )
+    script.chmod(script.stat().st_mode | 0o111)
+
+
+def _provider(command: str) -> dict:
+    return {
+        "kind": "external-cli-text",
+        "enabled": True,
+        "command": command,
+        "searchArgs": ["search", "{query}"],
+        "timeoutSeconds": 30,
+    }
+
+
+def test_search_fans_out_concurrently_with_deadline_and_cache(
+    isolated_project_env: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls_log = tmp_path / "calls.log"
+    _fake_cli(bin_dir, "mem-a", sleep=1, calls_log=calls_log)
+    _fake_cli(bin_dir, "mem-b", sleep=1, calls_log=calls_log)
+    _fake_cli(bin_dir, "mem-slow", sleep=20, calls_log=calls_log)
+    monkeypatch.setenv("PATH", os.pathsep.join([str(bin_dir), os.environ.get("PATH", "")]))
+
+    write_yaml(
+        isolated_project_env / ".edison" / "config" / "memory.yaml",
+        {
+            "memory": {
+                "enabled": True,
+                "defaults": {"maxHits": 5, "searchTimeoutSeconds": 3, "searchCacheTtlSeconds": 60},
+                "providers": {
+                    "a": _provider("mem-a"),
+                    "b": _provider("mem-b"),
+                    "slow": _provider("mem-slow"),
+                },
+            }
+        },
+    )
+    reset_edison_caches()
+
+    from edison.core.memory import MemoryManager
+
+    mgr = MemoryManager(project_root=isolated_project_env)
+    started = time.perf_counter()
+    hits = mgr.search("hello")
+    elapsed = time.perf_counter() - started
+
+    # Providers ran side by side: ~max(1s, deadline) rather than 1 + 1 + 20s.
+    assert elapsed < 6
+    assert sorted(h.text for h in hits) == ["mem-a:hello", "mem-b:hello"]
+    assert mgr.last_incomplete == ("slow",)
+
+    # Completed providers are memoized; only the straggler is queried again.
+    calls_before = calls_log.read_text(encoding="utf-8").split()
+    by_provider = mgr.search_by_provider("hello", limit=5, provider_ids=["a", "b"])
+    assert list(by_provider) == ["a", "b"]
+    assert calls_log.read_text(encoding="utf-8").split() == calls_before
+
+    # Writes through the manager invalidate memoized results.
+    mgr.save("summary")
+    mgr.search_by_provider("hello", limit=5, provider_ids=["a"])
+    assert calls_log.read_text(encoding="utf-8").split().count("mem-a") == 2
@@ -0,0 +1,166 @@
+import os
+import pty
+import subprocess
+import sys
+import tty
+from pathlib import Path
+
+import pytest
+
+from edison.core.config.domains import OrchestratorConfig
+from edison.core.orchestrator import get_output_tail, read_log_tail
+from edison.core.orchestrator.launcher import OrchestratorLauncher
+from edison.core.orchestrator.pty_pump import (
+    OutputTail,
+    PtyPump,
+    RotatingLogSink,
+    register_output_tail,
+    unregister_output_tail,
+)
+from tests.helpers.cache_utils import reset_edison_caches
+from tests.helpers.fixtures import create_repo_with_git
+from tests.helpers.io_utils import write_yaml
+
+# Writes TOTAL bytes of a deterministic pattern as fast as the PTY accepts them.
+_PRODUCER = """
+import os, sys
+total, block = int(sys.argv[1]), bytes(range(32, 127)) * 700
+out = sys.stdout.buffer
+sent = 0
+while sent < total:
+    chunk = block[: total - sent]
+    out.write(chunk)
+    sent += len(chunk)
+out.flush()
+"""
+
+
+def _expected(total: int) -> bytes:
+    block = bytes(range(32, 127)) * 700
+    return (block * (total // len(block) + 1))[:total]
+
+
+def _pump_producer(tmp_path: Path, total: int, max_bytes: int, **pump_kwargs) -> tuple[PtyPump, Path]:
+    master, slave = pty.openpty()
+    tty.setraw(slave)  # no newline translation, so bytes compare exactly
+
+    log = tmp_path / "orchestrator.log"
+    sink = RotatingLogSink(log, max_bytes=max_bytes, backups=10)
+    pump = PtyPump(master, sink=sink, **pump_kwargs).start()
+    proc = subprocess.Popen([sys.executable, "-c", _PRODUCER, str(total)], stdout=slave, stderr=slave)
+    os.close(slave)
+    assert proc.wait(timeout=60) == 0
+    pump.join(timeout=60)
+    return pump, log
+
+
+def _rotated_data(log: Path) -> tuple[list[Path], bytes]:
+    rotated = sorted(log.parent.glob(f"{log.name}.*"), key=lambda p: -int(p.suffix[1:]))
+    return rotated, b"".join(p.read_bytes() for p in [*rotated, log])
+
+
+def test_pump_rotation_and_tail_are_byte_exact(tmp_path: Path) -> None:
+    total = 2 * 1024 * 1024
+    tail = OutputTail(4096)
+    pump, log = _pump_producer(tmp_path, total, 256 * 1024, tail=tail)
+
+    assert pump.bytes_read == total
+    rotated, data = _rotated_data(log)
+    assert len(rotated) == 7
+    assert all(p.stat().st_size == 256 * 1024 for p in rotated)
+    assert data == _expected(total)
+    assert tail.getvalue() == data[-4096:]
+    assert read_log_tail(log, max_bytes=4096) == data[-4096:].decode("ascii")
+
+
+@pytest.mark.slow
+def test_pump_throughput_benchmark(tmp_path: Path) -> None:
+    """Benchmark: 32 MiB from a synthetic producer through the selectors pump."""
+    total = 32 * 1024 * 1024
+    pump, log = _pump_producer(tmp_path, total, 4 * 1024 * 1024, tail=OutputTail(4096))
+
+    assert pump.bytes_read == total
+    assert _rotated_data(log)[1] == _expected(total)
+
+
+def test_tails_are_keyed_by_session_and_pid_and_dropped_at_eof(tmp_path: Path) -> None:
+    first, second = OutputTail(256), OutputTail(256)
+    _pump_producer(tmp_path, 1000, 1 << 20, tail=first, tail_key=("sess-two", 101))
+    assert first.getvalue() == _expected(1000)[-256:]
+    assert get_output_tail("sess-two", 101) is None
+
+    register_output_tail(("sess-two", 101), first)
+    register_output_tail(("sess-two", 102), second)
+    try:
+        assert get_output_tail("sess-two", 101) is first
+        assert get_output_tail("sess-two", 102) is second
+        assert get_output_tail("sess-two") is second
+        # A stale unregister (tail no longer mapped) leaves the live entry alone.
+        unregister_output_tail(("sess-two", 102), OutputTail(1))
+        assert get_output_tail("sess-two", 102) is second
+    finally:
+        unregister_output_tail(("sess-two", 101))
+        unregister_output_tail(("sess-two", 102))
+    assert get_output_tail("sess-two") is None
+
+
+def test_read_log_tail_continues_into_rotated_backup(tmp_path: Path) -> None:
+    log = tmp_path / "orchestrator.log"
+    (tmp_path / "orchestrator.log.1").write_text("".join(f"old-{i}\n" for i in range(10)), encoding="utf-8")
+    log.write_text("new-0\nnew-1\n", encoding="utf-8")
+
+    assert read_log_tail(log, lines=2) == "new-0\nnew-1"
+    assert read_log_tail(log, lines=4) == "old-8\nold-9\nnew-0\nnew-1"
+    log.write_text("", encoding="utf-8")
+    assert read_log_tail(log, lines=2) == "old-8\nold-9"
+
+
+def test_launcher_pumps_pty_output_into_log_and_tail(tmp_path: Path, monkeypatch) -> None:
+    repo = create_repo_with_git(tmp_path, name="repo")
+    monkeypatch.setenv("AGENTS_PROJECT_ROOT", str(repo))
+    cfg_dir = repo / ".edison" / "config"
+    cfg_dir.mkdir(parents=True, exist_ok=True)
+    write_yaml(
+        cfg_dir / "logging.yaml",
+        {"logging": {"enabled": True, "orchestrator": {"output_max_bytes": 2048, "output_backups": 1, "output_tail_bytes": 256}}},
+    )
+    write_yaml(
+        cfg_dir / "orchestrator.yaml",
+        {
+            "orchestrators": {
+                "default": "tty",
+                "profiles": {
+                    "tty": {
+                        "command": sys.executable,
+                        "args": ["-c", "for i in range(400): print(f'line-{i}')"],
+                        "cwd": "{project_root}",
+                        "requires_tty": True,
+                        "initial_prompt": {"enabled": False},
+                    }
+                },
+            }
+        },
+    )
+    reset_edison_caches()
+
+    class _Ctx:
+        session_id = "sess-pty"
+        session = {"id": "sess-pty"}
+        project_root = repo
+        session_worktree = None
+        worktree_path = None
+
+    log_path = repo / ".project" / "sessions" / "sess-pty" / "orchestrator.log"
+    launcher = OrchestratorLauncher(OrchestratorConfig(repo, validate=False), _Ctx())
+    proc = launcher.launch("tty", log_path=log_path, detach=True)
+    assert proc.wait(timeout=10) == 0
+    assert launcher.pty_pump is not None
+    launcher.pty_pump.join(timeout=10)
+
+    # The pump unregisters the session's tail once the PTY closes.
+    assert get_output_tail("sess-pty", proc.pid) is None
+    assert launcher.output_tail.text(lines=1) == "line-399"
+    assert read_log_tail(log_path, lines=1) == "line-399"
+    assert log_path.stat().st_size <= 2048
+    assert (log_path.parent / "orchestrator.log.1").is_file()
+    assert not (log_path.parent / "orchestrator.log.2").exists()
@@ -0,0 +1,141 @@
+"""Process-wide project root / path resolution cache."""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+import edison.core.utils.paths.resolver as resolver_mod
+from edison.core.utils.paths import (
+    clear_path_resolution_cache,
+    get_management_paths,
+    get_project_config_dir,
+    resolve_project_root,
+)
+from edison.core.utils.profiling import Profiler, enable_profiler
+
+_AUDITED = {"open", "os.scandir", "os.listdir", "subprocess.Popen"}
+# Audit hooks cannot be removed once added (PEP 578), so the hook is module
+# global: it is installed on the first `_count_syscalls` use and only counts
+# while `_tally` is set inside that context; otherwise it returns at once.
+_tally: Counter[str] | None = None
+_hook_installed = False
+
+
+def _audit(event: str, _args: tuple) -> None:
+    if _tally is not None and event in _AUDITED:
+        _tally[event] += 1
+
+
+@contextmanager
+def _count_syscalls(monkeypatch: pytest.MonkeyPatch) -> Iterator[Counter[str]]:
+    """strace-style tally: stat-family calls plus audited open/listdir/spawn events."""
+    global _tally, _hook_installed
+    if not _hook_installed:
+        sys.addaudithook(_audit)
+        _hook_installed = True
+    tally: Counter[str] = Counter()
+
+    def _wrap(name: str):
+        real = getattr(os, name)
+
+        def _counted(*args, **kwargs):
+            tally[name] += 1
+            return real(*args, **kwargs)
+
+        return _counted
+
+    with monkeypatch.context() as m:
+        for name in ("stat", "lstat", "getcwd"):
+            m.setattr(os, name, _wrap(name))
+        _tally = tally
+        try:
+            yield tally
+        finally:
+            _tally = None
+
+
+def _command(repo: Path) -> None:
+    """Path lookups a typical CLI command makes (several per function)."""
+    for _ in range(10):
+        root = resolve_project_root()
+        get_project_config_dir(root, create=False)
+        get_management_paths(root).get_management_root()
+
+
+def _reset_all() -> None:
+    clear_path_resolution_cache()
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    (repo / ".edison" / "config").mkdir(parents=True)
+    (repo / ".edison" / "config" / "paths.yaml").write_text("paths:\n  management_dir: .project\n", encoding="utf-8")
+    old = 1_600_000_000
+    os.utime(repo / ".edison" / "config" / "paths.yaml", (old, old))
+    monkeypatch.delenv("AGENTS_PROJECT_ROOT", raising=False)
+    monkeypatch.chdir(repo / "src")
+    _reset_all()
+    yield repo
+    _reset_all()
+
+
+def test_cached_resolution_cuts_syscalls_per_command(git_repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cold: Counter[str] = Counter()
+    for _ in range(3):
+        # Before the cache every lookup re-ran marker probes, git and YAML parsing.
+        with _count_syscalls(monkeypatch) as tally:
+            for _ in range(10):
+                _reset_all()
+                _command(git_repo)
+        cold += tally
+
+    _command(git_repo)  # warm up
+    profiler = Profiler()
+    warm: Counter[str] = Counter()
+    with enable_profiler(profiler):
+        for _ in range(3):
+            with _count_syscalls(monkeypatch) as tally:
+                for _ in range(10):
+                    _command(git_repo)
+            warm += tally
+
+    # The expensive calls (git spawns, YAML opens, directory listings) disappear;
+    # what remains is a handful of stats to revalidate cached entries.
+    assert cold["subprocess.Popen"] == 30 and cold["open"] > 0 and cold["os.scandir"] > 0
+    assert warm["subprocess.Popen"] == warm["open"] == warm["os.scandir"] == 0, dict(warm)
+    assert sum(warm.values()) < sum(cold.values()), (dict(warm), dict(cold))
+    assert profiler.counters["paths.project_root.resolve"] == 300
+    assert profiler.counters.get("paths.project_root.miss", 0) == 0
+
+
+def test_cache_is_keyed_by_cwd_and_env_and_revalidated(git_repo: Path, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    assert resolve_project_root() == git_repo
+
+    # A .project marker appearing in the CWD takes precedence over the cached git root.
+    (git_repo / "src" / ".project").mkdir()
+    assert resolve_project_root() == git_repo / "src"
+
+    other = tmp_path / "other"
+    (other / ".project").mkdir(parents=True)
+    monkeypatch.setenv("AGENTS_PROJECT_ROOT", str(other))
+    assert resolve_project_root() == other.resolve()
+    monkeypatch.delenv("AGENTS_PROJECT_ROOT")
+    assert resolve_project_root() == git_repo / "src"
+
+    # Legacy reset of the module global still forces a fresh resolution.
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        resolver_mod._PROJECT_ROOT_CACHE = None
+        resolve_project_root()
+        resolve_project_root()
+    assert profiler.counters["paths.project_root.miss"] == 1
@@ -0,0 +1,177 @@
+"""Tests for the content-addressed command output store - NO MOCKS."""
+from __future__ import annotations
+
+import hashlib
+import hmac
+import random
+from pathlib import Path
+
+import pytest
+
+from edison.core.qa.evidence.command_evidence import (
+    compute_hmac_sha256,
+    compute_hmac_sha256_stream,
+    parse_command_evidence,
+    verify_command_evidence_hmac,
+    write_command_evidence,
+)
+from edison.core.qa.evidence.exceptions import EvidenceError
+from edison.core.qa.evidence.output_store import BLOB_DIRNAME, HAS_ZSTD, CommandOutputStore
+from edison.core.utils.text.frontmatter import format_frontmatter
+
+_KEY = "test-key"
+
+
+def _write(path: Path, output: str, store: CommandOutputStore | None):
+    return write_command_evidence(
+        path=path,
+        task_id="T-1",
+        round_num=0,
+        command_name="test",
+        command="pytest",
+        cwd="/repo",
+        exit_code=0,
+        output=output,
+        started_at="2026-01-01T00:00:00Z",
+        completed_at="2026-01-01T00:00:01Z",
+        hmac_key=_KEY,
+        output_store=store,
+    )
+
+
+@pytest.mark.parametrize(
+    "compression",
+    ["gzip", "none", pytest.param("zstd", marks=pytest.mark.skipif(not HAS_ZSTD, reason="zstandard not installed"))],
+)
+def test_outputs_are_deduplicated_and_read_transparently(tmp_path: Path, compression: str) -> None:
+    qa_root = tmp_path / "qa"
+    stats_path = tmp_path / "cache" / "stats.json"
+    store = CommandOutputStore(qa_root / BLOB_DIRNAME, compression=compression, min_bytes=1024, stats_path=stats_path)
+    log = "".join(f"test_case_{i} PASSED\n" for i in range(2000))
+    first = qa_root / "evidence-snapshots" / "h1" / "d1" / "clean" / "command-test.txt"
+    second = qa_root / "validation-evidence" / "T-1" / "round-1" / "command-test.txt"
+    small = qa_root / "evidence-snapshots" / "h1" / "d1" / "clean" / "command-lint.txt"
+
+    ref1 = _write(first, log, store)
+    ref2 = _write(second, log, store)
+    assert _write(small, "ok\n", store) is None  # below minBytes: stays inline
+
+    assert ref1 is not None and ref2 is not None
+    assert (ref1.deduplicated, ref2.deduplicated) == (False, True)
+    # Only the blob lands in the (git-tracked) store; counters live in the cache.
+    assert [p for p in store.root.rglob("*") if p.is_file() and not p.name.endswith(".lock")] == [
+        store.blob_path(ref1.digest, ref1.encoding)
+    ]
+    assert log not in first.read_text(encoding="utf-8")
+
+    for path, expected in ((first, log), (second, log), (small, "ok\n")):
+        parsed = parse_command_evidence(path)
+        assert parsed is not None and parsed["output"] == expected and parsed["exitCode"] == 0
+        assert verify_command_evidence_hmac(path, hmac_key=_KEY) == (True, "ok")
+
+    stats = store.stats()
+    assert (stats["outputs"], stats["blobs"], stats["logicalBytes"]) == (2, 1, 2 * len(log))
+    assert stats["savedBytes"] >= len(log)
+
+    # A tampered blob fails both the content hash and the HMAC.
+    blob = store.blob_path(ref1.digest, ref1.encoding)
+    blob.write_bytes(store._compress(log.replace("PASSED", "FAILED", 1).encode("utf-8")))
+    assert parse_command_evidence(first) is None
+    ok, msg = verify_command_evidence_hmac(first, hmac_key=_KEY)
+    assert not ok and "blob" in msg
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_streaming_hmac_matches_whole_text(seed: int) -> None:
+    rng = random.Random(seed)
+    body = "".join(rng.choice(["line\n", "\n", "x", "\n\n\n", "é"]) for _ in range(rng.randint(0, 60)))
+    fm = {"evidenceKind": "command", "exitCode": rng.randint(0, 2), "hmacSha256": "ignored"}
+    data = body.encode("utf-8")
+    cuts = sorted(rng.sample(range(len(data) + 1), min(len(data) + 1, rng.randint(0, 6))))
+    chunks = [data[a:b] for a, b in zip([0, *cuts], [*cuts, len(data)], strict=True)]
+
+    canonical = {k: v for k, v in fm.items() if k != "hmacSha256"}
+    payload = (format_frontmatter(canonical, exclude_none=True) + body).rstrip("\n") + "\n"
+    expected = hmac.new(_KEY.encode("utf-8"), payload.encode("utf-8"), hashlib.sha256).hexdigest()
+    assert compute_hmac_sha256_stream(_KEY, fm, chunks) == expected
+    if not body.startswith("\n"):  # the frontmatter parser eats blank lines after `---`
+        assert compute_hmac_sha256(_KEY, format_frontmatter(fm, exclude_none=True) + body) == expected
+
+
+def test_frontmatter_only_parse_does_not_expand_the_blob(tmp_path: Path) -> None:
+    qa_root = tmp_path / "qa"
+    store = CommandOutputStore(qa_root / BLOB_DIRNAME, compression="gzip", min_bytes=16)
+    path = qa_root / "evidence-snapshots" / "h1" / "d1" / "clean" / "command-test.txt"
+    ref = _write(path, "x" * 4096, store)
+    assert ref is not None
+
+    parsed = parse_command_evidence(path, include_output=False)
+    assert parsed is not None and parsed["exitCode"] == 0 and "output" not in parsed
+
+    # Status reads never decompress: even a corrupt blob still yields the frontmatter...
+    blob = store.blob_path(ref.digest, ref.encoding)
+    blob.write_bytes(b"not gzip")
+    assert parse_command_evidence(path, include_output=False) is not None
+    assert parse_command_evidence(path) is None
+    # ...but a missing blob still fails closed.
+    blob.unlink()
+    assert parse_command_evidence(path, include_output=False) is None
+
+
+def test_threads_storing_the_same_output_do_not_collide(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    store = CommandOutputStore(tmp_path / BLOB_DIRNAME, compression="gzip", min_bytes=16)
+    data = b"same output\n" * 50_000
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        refs = list(pool.map(lambda _i: store.put(data), range(16)))
+
+    assert {r.digest for r in refs} == {hashlib.sha256(data).hexdigest()}
+    assert b"".join(store.iter_chunks(f"sha256:{refs[0].digest}", "gzip")) == data
+    assert not list(store.root.rglob("*.tmp"))
+
+
+def test_output_file_is_streamed_into_the_store(tmp_path: Path) -> None:
+    qa_root = tmp_path / "qa"
+    store = CommandOutputStore(qa_root / BLOB_DIRNAME, compression="gzip", min_bytes=1024)
+    log = "".join(f"step {i} ok\n" for i in range(5000))
+    raw = tmp_path / "output.txt"
+    raw.write_text(log, encoding="utf-8")
+    evidence = qa_root / "evidence-snapshots" / "h1" / "d1" / "clean" / "command-build.txt"
+
+    ref = write_command_evidence(
+        path=evidence,
+        task_id="T-1",
+        round_num=0,
+        command_name="build",
+        command="make",
+        cwd="/repo",
+        exit_code=0,
+        output="",
+        output_path=raw,
+        hmac_key=_KEY,
+        output_store=store,
+    )
+
+    assert ref is not None and ref.size == len(log.encode("utf-8"))
+    again = store.put(log.encode("utf-8"))  # same digest as the in-memory path
+    assert again.digest == ref.digest and again.deduplicated
+    parsed = parse_command_evidence(evidence)
+    assert parsed is not None and parsed["output"] == log
+    assert verify_command_evidence_hmac(evidence, hmac_key=_KEY) == (True, "ok")
+
+
+@pytest.mark.skipif(HAS_ZSTD, reason="zstandard is installed")
+def test_zstd_requires_the_declared_extra(tmp_path: Path) -> None:
+    with pytest.raises(EvidenceError, match="edison\\[zstd\\]"):
+        CommandOutputStore(tmp_path / BLOB_DIRNAME, compression="zstd")
+
+
+def test_project_store_keeps_counters_out_of_the_evidence_tree(isolated_project_env: Path) -> None:
+    store = CommandOutputStore.for_project(isolated_project_env, min_bytes=0)
+    assert store.compression == "gzip"
+    assert store.stats_path is not None and store.stats_path.parent.name == "cache"
+    assert store.root not in store.stats_path.parents
+
+    store.put(b"x" * 100)
+    assert store.stats()["outputs"] == 1
@@ -0,0 +1,121 @@
+"""Tests for packed evidence round archives - NO MOCKS."""
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from edison.core.qa.evidence.analysis import list_evidence_files
+from edison.core.qa.evidence.archive import ARCHIVE_FILENAME
+from edison.core.qa.evidence.service import EvidenceService
+from edison.core.utils.profiling import Profiler, enable_profiler
+
+
+def _write_round(svc: EvidenceService, n: int) -> None:
+    svc.ensure_round(n)
+    svc.write_bundle({"approved": n % 2 == 0, "round": n}, round_num=n)
+    svc.write_implementation_report({"taskId": svc.task_id, "round": n}, round_num=n)
+    svc.write_validator_report("security", {"validatorId": "security", "round": n}, round_num=n)
+    (svc.get_round_dir(n) / "command-test.txt").write_text(f"round {n} ok\n", encoding="utf-8")
+
+
+def test_archived_rounds_read_transparently_and_unpack_on_demand(isolated_project_env: Path) -> None:
+    svc = EvidenceService(task_id="T-900", project_root=isolated_project_env)
+    for n in (1, 2, 3):
+        _write_round(svc, n)
+    before = {p.relative_to(svc.evidence_root): p.read_bytes() for p in list_evidence_files(svc.evidence_root)}
+    expected = {
+        n: (svc.read_bundle(n), svc.read_implementation_report(n), svc.read_validator_report("security", n))
+        for n in (1, 2, 3)
+    }
+
+    assert svc.archive_rounds() == [1, 2]
+    # Packed rounds stay listed; only their directories are gone.
+    assert [p.name for p in svc.list_rounds()] == ["round-1", "round-2", "round-3"]
+    assert [p.is_dir() for p in svc.list_rounds()] == [False, False, True]
+    assert svc.archived_rounds() == [1, 2]
+    assert svc.get_current_round() == 3
+    assert (svc.evidence_root / ARCHIVE_FILENAME).is_file()
+
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        for n in (1, 2, 3):
+            got = (svc.read_bundle(n), svc.read_implementation_report(n), svc.read_validator_report("security", n))
+            assert got == expected[n]
+    assert profiler.counters["qa.evidence.archive.read"] == 6
+    assert not svc.get_round_dir(1).exists()  # reads never unpack
+
+    # New rounds keep numbering after the on-disk latest round.
+    assert svc.create_next_round().name == "round-4"
+
+    # Listing needs real paths: the round is unpacked and leaves the archive.
+    reports = svc.list_validator_reports(round_num=1)
+    assert [p.name for p in reports] == ["validator-security-report.md"]
+    assert svc.archived_rounds() == [2]
+
+    svc.unpack_round(2)
+    assert svc.archived_rounds() == []
+    assert not (svc.evidence_root / ARCHIVE_FILENAME).exists()
+    after = {p.relative_to(svc.evidence_root): p.read_bytes() for p in list_evidence_files(svc.evidence_root)}
+    assert {k: v for k, v in after.items() if k.parts[0] != "round-4" and not k.name.endswith(".lock")} == before
+
+
+def _walk(root: Path) -> tuple[int, float]:
+    start = time.perf_counter()
+    entries = sum(len(dirs) + len(files) for _, dirs, files in os.walk(root))
+    return entries, time.perf_counter() - start
+
+
+def test_archiving_shrinks_directory_walks(isolated_project_env: Path) -> None:
+    """Benchmark: synthetic evidence tree (20 tasks x 10 rounds x 100 files)."""
+    tasks, rounds_per_task, files_per_round = 20, 10, 100
+    services = [EvidenceService(task_id=f"T-{i:03d}", project_root=isolated_project_env) for i in range(tasks)]
+    for svc in services:
+        for n in range(1, rounds_per_task + 1):
+            round_dir = svc.get_round_dir(n)
+            round_dir.mkdir(parents=True)
+            for f in range(files_per_round):
+                (round_dir / f"command-{f}.txt").write_text(f"{svc.task_id} {n} {f}\n", encoding="utf-8")
+    base = services[0].evidence_root.parent
+
+    entries_before, walk_before = _walk(base)
+    for svc in services:
+        assert svc.archive_rounds() == list(range(1, rounds_per_task))
+    entries_after, walk_after = _walk(base)
+
+    assert entries_before >= tasks * rounds_per_task * files_per_round
+    assert entries_after <= tasks * (files_per_round + 4)
+    assert walk_after < walk_before, (walk_before, walk_after)
+    svc = services[-1]
+    assert svc.read_bundle(1) == {}
+    assert svc._archive.read_text(3, "command-7.txt") == f"{svc.task_id} 3 7\n"
+
+
+def test_packing_appends_without_rewriting_existing_members(isolated_project_env: Path) -> None:
+    import zipfile
+
+    svc = EvidenceService(task_id="T-901", project_root=isolated_project_env)
+    for n in (1, 2, 3):
+        _write_round(svc, n)
+    assert svc.archive_rounds() == [1, 2]
+    archive = svc.evidence_root / ARCHIVE_FILENAME
+    with zipfile.ZipFile(archive) as zf:
+        before = {i.filename: (i.header_offset, i.compress_size) for i in zf.infolist()}
+
+    for n in (4, 5):
+        _write_round(svc, n)
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        assert svc.archive_rounds() == [3, 4]
+    assert profiler.counters.get("qa.evidence.archive.rewrite", 0) == 0
+    with zipfile.ZipFile(archive) as zf:
+        after = {i.filename: (i.header_offset, i.compress_size) for i in zf.infolist()}
+    assert {k: after[k] for k in before} == before
+    assert svc.archived_rounds() == [1, 2, 3, 4]
+    assert svc.read_bundle(1) == {"approved": False, "round": 1}
+    assert svc.read_bundle(4) == {"approved": True, "round": 4}
+
+    with enable_profiler(profiler):
+        svc.unpack_round(3)
+    assert profiler.counters["qa.evidence.archive.rewrite"] == 1
+    assert svc.archived_rounds() == [1, 2, 4]
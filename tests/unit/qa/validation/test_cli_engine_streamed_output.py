@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from edison.core.qa.engines.base import EngineConfig
+from edison.core.qa.engines.cli import CLIEngine
+from edison.core.qa.evidence import EvidenceService
+from edison.core.registries.validators import ValidatorMetadata
+
+
+@pytest.mark.qa
+def test_cli_engine_streams_large_output_into_evidence(tmp_path: Path) -> None:
+    prompt_file = tmp_path / "prompt.md"
+    prompt_file.write_text("PROMPT", encoding="utf-8")
+    script = "for i in $(seq 1 40000); do echo line-$i; done; echo 'Verdict: approve'; echo warn >&2"
+
+    cfg = EngineConfig.from_dict(
+        "big-output",
+        {
+            "type": "cli",
+            "command": "bash",
+            "pre_flags": ["-c", script],
+            "output_flags": [],
+            "read_only_flags": [],
+            "prompt_mode": "stdin",
+            "response_parser": "plain_text",
+        },
+    )
+    engine = CLIEngine(cfg, project_root=tmp_path)
+    validator = ValidatorMetadata(
+        id="big-output-validator", name="big-output", engine="big-output", wave="test", prompt=str(prompt_file)
+    )
+    ev = EvidenceService("t-001", project_root=tmp_path)
+    ev.create_next_round()
+
+    result = engine.run(
+        validator,
+        task_id="t-001",
+        session_id="S-1",
+        worktree_path=tmp_path,
+        round_num=1,
+        evidence_service=ev,
+    )
+
+    # The full response was parsed, but only head/tail excerpts were kept in memory.
+    assert result.verdict == "approve"
+    assert "bytes omitted" in (result.raw_output or "")
+    assert len(result.raw_output or "") < 200 * 1024
+
+    evidence = (ev.ensure_round(1) / "command-big-output-validator.txt").read_text(encoding="utf-8")
+    assert "line-1\n" in evidence and "line-40000\n" in evidence
+    assert "bytes omitted" not in evidence
+    assert evidence.endswith("=== STDERR ===\nwarn\n\n")
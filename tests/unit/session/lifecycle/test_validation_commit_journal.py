@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from edison.core.qa._utils import get_evidence_base_path
+from edison.core.session.lifecycle import transaction as txmod
+from edison.core.session.lifecycle.recovery import recover_incomplete_validation_transactions
+from edison.core.session.lifecycle.transaction import INTENT_FILENAME, ValidationTransaction
+
+
+def _stage(tx: ValidationTransaction, dst: Path, text: str) -> None:
+    staged = tx.staging_root / dst.relative_to(tx.final_root)
+    staged.parent.mkdir(parents=True, exist_ok=True)
+    staged.write_text(text, encoding="utf-8")
+
+
+def test_commit_renames_staged_files_and_links_backups(isolated_project_env: Path) -> None:
+    evidence = get_evidence_base_path(isolated_project_env)
+    existing = evidence / "t-1" / "round-1" / "report.json"
+    existing.parent.mkdir(parents=True, exist_ok=True)
+    existing.write_text("old", encoding="utf-8")
+    untouched = evidence / "t-0" / "round-1" / "report.json"
+    untouched.parent.mkdir(parents=True, exist_ok=True)
+    untouched.write_text("other", encoding="utf-8")
+    created = evidence / "t-1" / "round-1" / "validator-x.json"
+
+    tx = ValidationTransaction("sess-commit", "wave1")
+    _stage(tx, existing, "new")
+    _stage(tx, created, "created")
+    tx.commit()
+
+    assert existing.read_text(encoding="utf-8") == "new"
+    assert created.read_text(encoding="utf-8") == "created"
+    rel = existing.relative_to(isolated_project_env)
+    assert (tx.snapshot_root / rel).read_text(encoding="utf-8") == "old"
+
+    meta = json.loads(tx.meta_path.read_text(encoding="utf-8"))
+    assert meta["finalizedAt"]
+    # The manifest covers only destinations this commit replaced.
+    assert [m["path"] for m in meta["preManifest"]] == [str(rel)]
+    intent = json.loads((tx.tx_dir / INTENT_FILENAME).read_text(encoding="utf-8"))
+    assert intent["state"] == "done"
+
+
+def _crash_after_first_publish(monkeypatch: pytest.MonkeyPatch) -> None:
+    real_publish = txmod._publish
+    calls = {"n": 0}
+
+    def crash_after_first(src: Path, dst: Path) -> None:
+        calls["n"] += 1
+        if calls["n"] > 1:
+            raise OSError("simulated crash")
+        real_publish(src, dst)
+
+    monkeypatch.setattr(txmod, "_publish", crash_after_first)
+
+
+def test_failed_commit_rolls_back_before_raising(
+    isolated_project_env: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    evidence = get_evidence_base_path(isolated_project_env)
+    first = evidence / "t-3" / "round-1" / "a.json"
+    second = evidence / "t-3" / "round-1" / "b.json"
+    first.parent.mkdir(parents=True, exist_ok=True)
+    first.write_text("old-a", encoding="utf-8")
+    second.write_text("old-b", encoding="utf-8")
+
+    tx = ValidationTransaction("sess-fail", "wave1")
+    _stage(tx, first, "new-a")
+    _stage(tx, second, "new-b")
+    _crash_after_first_publish(monkeypatch)
+
+    with pytest.raises(OSError):
+        tx.commit()
+    assert first.read_text(encoding="utf-8") == "old-a"
+    assert second.read_text(encoding="utf-8") == "old-b"
+    intent = json.loads((tx.tx_dir / INTENT_FILENAME).read_text(encoding="utf-8"))
+    assert intent["state"] == "rolled-back"
+
+    tx.abort("exception: OSError")
+    assert json.loads(tx.meta_path.read_text(encoding="utf-8"))["abortedAt"]
+
+
+def test_recovery_rolls_back_a_partially_applied_commit(
+    isolated_project_env: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    evidence = get_evidence_base_path(isolated_project_env)
+    first = evidence / "t-2" / "round-1" / "a.json"
+    second = evidence / "t-2" / "round-1" / "b.json"
+    first.parent.mkdir(parents=True, exist_ok=True)
+    second.write_text("old-b", encoding="utf-8")
+
+    tx = ValidationTransaction("sess-crash", "wave1")
+    _stage(tx, first, "new-a")
+    _stage(tx, second, "new-b")
+    _crash_after_first_publish(monkeypatch)
+
+    # The in-process rollback fails too (e.g. the disk went away).
+    real_replay = txmod.replay_validation_intent
+    replays = {"n": 0}
+
+    def replay_fails_once(tx_dir: Path) -> int:
+        replays["n"] += 1
+        if replays["n"] == 1:
+            raise OSError("simulated rollback failure")
+        return real_replay(tx_dir)
+
+    monkeypatch.setattr(txmod, "replay_validation_intent", replay_fails_once)
+    with pytest.raises(OSError):
+        tx.commit()
+    assert first.read_text(encoding="utf-8") == "new-a"
+
+    # Abort must not discard the snapshot of a journaled, unfinished commit.
+    tx.abort("exception: OSError")
+    meta = json.loads(tx.meta_path.read_text(encoding="utf-8"))
+    assert not meta.get("abortedAt")
+
+    assert recover_incomplete_validation_transactions("sess-crash") == 1
+    assert not first.exists()
+    assert second.read_text(encoding="utf-8") == "old-b"
+    assert recover_incomplete_validation_transactions("sess-crash") == 0
+
+
+@pytest.mark.slow
+def test_commit_cost_is_independent_of_evidence_tree_size(isolated_project_env: Path) -> None:
+    evidence = get_evidence_base_path(isolated_project_env)
+    for t in range(500):
+        round_dir = evidence / f"task-{t}" / "round-1"
+        round_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(100):
+            (round_dir / f"report-{i}.json").write_text("{}", encoding="utf-8")
+
+    tx = ValidationTransaction("sess-bench", "wave1")
+    for i in range(20):
+        _stage(tx, evidence / "task-new" / "round-1" / f"validator-{i}.json", "{}")
+        _stage(tx, evidence / f"task-{i}" / "round-1" / "report-0.json", '{"v": 2}')
+
+    started = time.perf_counter()
+    tx.commit()
+    elapsed = time.perf_counter() - started
+
+    meta = json.loads(tx.meta_path.read_text(encoding="utf-8"))
+    assert len(meta["preManifest"]) == 20
+    # 50k existing evidence files; the commit touches 40 paths.
+    assert elapsed < 2.0, f"commit took {elapsed:.2f}s over a 50k-file evidence tree"
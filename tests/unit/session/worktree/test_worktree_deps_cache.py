@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from edison.core.config.cache import clear_all_caches
+from edison.core.session import worktree
+from edison.core.session._config import reset_config_cache
+from edison.core.session.worktree.manager.deps_cache import (
+    evict_dependency_cache,
+    restore_cached_dependencies,
+    store_cached_dependencies,
+)
+from edison.core.utils.subprocess import run_with_timeout
+from tests.helpers.env_setup import clear_path_caches
+
+
+def _install_fake_pnpm(bin_dir: Path) -> None:
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    pnpm_path = bin_dir / "pnpm"
+    pnpm_path.write_text(
+        """#!/usr/bin/env bash
+set -euo pipefail
+echo "$@" >> "${EDISON_TEST_PNPM_LOG}"
+mkdir -p node_modules/.pnpm/left-pad@1.0.0/node_modules/left-pad
+echo "module.exports = 1" > node_modules/.pnpm/left-pad@1.0.0/node_modules/left-pad/index.js
+ln -s .pnpm/left-pad@1.0.0/node_modules/left-pad node_modules/left-pad
+""",
+        encoding="utf-8",
+    )
+    pnpm_path.chmod(0o755)
+
+
+@pytest.fixture
+def cached_repo(session_git_repo_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    repo = session_git_repo_path
+    config_dir = repo / ".edison" / "config"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    worktrees_dir = tmp_path / "worktrees"
+    data = {
+        "worktrees": {
+            "enabled": True,
+            "baseDirectory": str(worktrees_dir),
+            "branchPrefix": "session/",
+            "installDeps": True,
+            "sharedState": {
+                "mode": "meta",
+                "metaBranch": "edison-meta",
+                "metaPathTemplate": str(worktrees_dir / "_meta"),
+            },
+            "depsCache": {"enabled": True},
+        }
+    }
+    (config_dir / "worktrees.yml").write_text(yaml.safe_dump(data), encoding="utf-8")
+
+    (repo / "package.json").write_text('{"name":"x","private":true}\n', encoding="utf-8")
+    (repo / "pnpm-lock.yaml").write_text("lockfileVersion: 9.0\n", encoding="utf-8")
+    (repo / ".gitignore").write_text("node_modules/\n", encoding="utf-8")
+    run_with_timeout(["git", "add", "package.json", "pnpm-lock.yaml", ".gitignore"], cwd=repo, check=True)
+    run_with_timeout(["git", "commit", "-m", "add pnpm lockfile"], cwd=repo, check=True)
+
+    log_path = tmp_path / "pnpm.log"
+    log_path.write_text("", encoding="utf-8")
+    monkeypatch.setenv("EDISON_TEST_PNPM_LOG", str(log_path))
+    fake_bin = tmp_path / "bin"
+    _install_fake_pnpm(fake_bin)
+    monkeypatch.setenv("PATH", f"{fake_bin}{os.pathsep}{os.environ.get('PATH', '')}")
+
+    clear_path_caches()
+    clear_all_caches()
+    reset_config_cache()
+    yield repo
+    clear_path_caches()
+    clear_all_caches()
+    reset_config_cache()
+
+
+def test_identical_lockfile_materializes_cached_node_modules(cached_repo: Path, tmp_path: Path) -> None:
+    first, _ = worktree.create_worktree("deps-cache-1")
+    second, _ = worktree.create_worktree("deps-cache-2")
+    assert first is not None and second is not None
+
+    # The package manager ran once; the second worktree was served from the cache.
+    assert (tmp_path / "pnpm.log").read_text(encoding="utf-8").splitlines() == ["install --frozen-lockfile"]
+    link = second / "node_modules" / "left-pad"
+    assert link.is_symlink() and os.readlink(link) == ".pnpm/left-pad@1.0.0/node_modules/left-pad"
+    assert (link / "index.js").read_text(encoding="utf-8") == "module.exports = 1\n"
+
+    # A changed lockfile is a different cache key.
+    third, _ = worktree.create_worktree("deps-cache-3")
+    assert third is not None
+    (third / "pnpm-lock.yaml").write_text("lockfileVersion: 9.0\n# changed\n", encoding="utf-8")
+    shutil.rmtree(third / "node_modules")
+    cfg = worktree._config().get_worktree_config()
+    assert not restore_cached_dependencies(worktree_path=third, cmd=["pnpm", "install", "--frozen-lockfile"], config=cfg)
+
+
+def test_cache_evicts_least_recently_used_entries_past_budget(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cfg = {"depsCache": {"enabled": True, "directory": str(cache_dir), "maxBytes": 1500}}
+    cmd = ["npm", "ci"]
+
+    def _install(name: str) -> Path:
+        wt = tmp_path / name
+        (wt / "node_modules" / "pkg").mkdir(parents=True)
+        (wt / "package-lock.json").write_text(name, encoding="utf-8")
+        (wt / "node_modules" / "pkg" / "blob.bin").write_bytes(b"x" * 1000)
+        return wt
+
+    old = store_cached_dependencies(worktree_path=_install("wt-old"), cmd=cmd, config=cfg)
+    assert old is not None
+    past = time.time() - 60
+    os.utime(old / "entry.json", (past, past))
+
+    new = store_cached_dependencies(worktree_path=_install("wt-new"), cmd=cmd, config=cfg)
+    assert new is not None and new.exists()
+    # Only one 1000-byte entry fits in the budget: the older one was evicted.
+    assert not old.exists()
+    assert evict_dependency_cache(cfg) == []
+
+    restored = tmp_path / "wt-restored"
+    restored.mkdir()
+    (restored / "package-lock.json").write_text("wt-new", encoding="utf-8")
+    assert restore_cached_dependencies(worktree_path=restored, cmd=cmd, config=cfg)
+    restored_blob = (restored / "node_modules" / "pkg" / "blob.bin").stat()
+    assert restored_blob.st_size == 1000
+    # The default mode never hardlinks into the shared cache entry.
+    assert restored_blob.st_nlink == 1
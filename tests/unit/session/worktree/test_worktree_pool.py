@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+import yaml
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.check_output(["git", *args], cwd=cwd, text=True).strip()
+
+
+def _configure(repo: Path, tmp_path: Path, *, size: int, extra: dict | None = None) -> None:
+    from edison.core.config.cache import clear_all_caches
+    from edison.core.session._config import reset_config_cache
+    from tests.helpers.env_setup import clear_path_caches
+
+    cfg_dir = repo / ".edison" / "config"
+    cfg_dir.mkdir(parents=True, exist_ok=True)
+    data = {
+        "worktrees": {
+            "enabled": True,
+            "baseBranchMode": "current",
+            "baseBranch": None,
+            "baseDirectory": str(tmp_path / "worktrees"),
+            "archiveDirectory": str(tmp_path / "worktrees" / "_archived"),
+            "branchPrefix": "session/",
+            "sharedState": {
+                "mode": "meta",
+                "metaBranch": "edison-meta",
+                "metaPathTemplate": str(tmp_path / "worktrees" / "_meta"),
+            },
+            # Stands in for a dependency install; it must run at the session path.
+            "postInstallCommands": ["pwd >> .warm"],
+            "pool": {"enabled": True, "size": size},
+            **(extra or {}),
+        }
+    }
+    (cfg_dir / "worktrees.yml").write_text(yaml.safe_dump(data), encoding="utf-8")
+    clear_path_caches()
+    clear_all_caches()
+    reset_config_cache()
+
+
+@pytest.fixture
+def replenish_calls(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    from edison.core.session.worktree.manager import pool as pool_mod
+
+    calls: list[Path] = []
+    monkeypatch.setattr(pool_mod, "schedule_pool_replenish", lambda *, repo_dir: calls.append(repo_dir))
+    return calls
+
+
+def test_session_claims_pooled_worktree_and_fast_forwards(
+    session_git_repo_path: Path, tmp_path: Path, replenish_calls: list[Path]
+) -> None:
+    from edison.core.session import worktree
+
+    repo = session_git_repo_path
+    _configure(repo, tmp_path, size=2)
+
+    created = worktree.fill_worktree_pool()
+    assert len(created) == 2
+    assert worktree.fill_worktree_pool() == []
+    entries = worktree.list_pool_entries()
+    assert {e["commit"] for e in entries} == {_git(repo, "rev-parse", "HEAD")}
+    assert all(_git(p, "branch", "--show-current") == "" for p in created)
+    # Installs embed absolute paths, so nothing is installed at the pool path.
+    assert not any((p / ".warm").exists() for p in created)
+
+    # The base moves on after the pool was filled: the claim fast-forwards.
+    (repo / "later.txt").write_text("later", encoding="utf-8")
+    _git(repo, "add", "later.txt")
+    _git(repo, "commit", "-m", "later commit")
+
+    wt_path, branch = worktree.create_worktree("sess-pooled")
+    assert wt_path is not None and branch == "session/sess-pooled"
+    assert _git(wt_path, "branch", "--show-current") == branch
+    assert _git(wt_path, "rev-parse", "HEAD") == _git(repo, "rev-parse", "HEAD")
+    assert (wt_path / "later.txt").exists()
+    # Post-install ran once, after the move, at the session path.
+    assert (wt_path / ".warm").read_text(encoding="utf-8") == f"{wt_path.resolve()}\n"
+    assert len(worktree.list_pool_entries()) == 1
+    assert replenish_calls == [repo]
+
+    # Refilling recycles the entry left on the old base commit.
+    assert len(worktree.fill_worktree_pool()) == 2
+    assert {e["commit"] for e in worktree.list_pool_entries()} == {_git(repo, "rev-parse", "HEAD")}
+
+
+def test_pool_health_check_removes_broken_entries(
+    session_git_repo_path: Path, tmp_path: Path, replenish_calls: list[Path]
+) -> None:
+    from edison.core.session import worktree
+
+    repo = session_git_repo_path
+    _configure(repo, tmp_path, size=2)
+    good, broken = worktree.fill_worktree_pool()
+    (broken / ".git").unlink()
+
+    report = worktree.check_worktree_pool()
+    assert report == {"healthy": [str(good)], "removed": [str(broken)]}
+    assert not broken.exists()
+    assert [e["path"] for e in worktree.list_pool_entries()] == [str(good)]
+
+    # A broken pool never blocks session start: the claim falls back to `git worktree add`.
+    (good / ".git").unlink()
+    wt_path, branch = worktree.create_worktree("sess-fallback")
+    assert wt_path is not None and _git(wt_path, "branch", "--show-current") == branch
+    assert worktree.list_pool_entries() == []
+
+
+def test_pool_fill_warms_deps_cache_so_claims_skip_the_install(
+    session_git_repo_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, replenish_calls: list[Path]
+) -> None:
+    from edison.core.session import worktree
+    from edison.core.utils.profiling import Profiler, enable_profiler
+
+    repo = session_git_repo_path
+    (repo / "pnpm-lock.yaml").write_text("lockfileVersion: 9.0\n", encoding="utf-8")
+    (repo / ".gitignore").write_text("node_modules/\n", encoding="utf-8")
+    _git(repo, "add", "pnpm-lock.yaml", ".gitignore")
+    _git(repo, "commit", "-m", "add pnpm lockfile")
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "pnpm.log"
+    (bin_dir / "pnpm").write_text(
+        f"#!/usr/bin/env bash\nset -euo pipefail\npwd >> {log}\n"
+        "mkdir -p node_modules/dep && echo 1 > node_modules/dep/index.js\n",
+        encoding="utf-8",
+    )
+    (bin_dir / "pnpm").chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    _configure(repo, tmp_path, size=2, extra={"installDeps": True, "depsCache": {"enabled": True}})
+
+    created = worktree.fill_worktree_pool()
+    assert len(created) == 2
+    # One install warms the cache for both entries; none of it stays at the pool path.
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 1
+    assert not any((p / "node_modules").exists() for p in created)
+
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        wt_path, _branch = worktree.create_worktree("sess-warm")
+    assert wt_path is not None
+    assert (wt_path / "node_modules" / "dep" / "index.js").is_file()
+    assert profiler.counters["worktree.deps_cache.hit"] == 1
+    # The claim restored from the cache instead of running the package manager.
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 1
+    assert (wt_path / ".warm").read_text(encoding="utf-8") == f"{wt_path.resolve()}\n"
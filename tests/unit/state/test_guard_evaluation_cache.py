@@ -0,0 +1,175 @@
+"""Tests for the per-invocation guard cache and transition matrices."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from edison.core.state import RichStateMachine, StateTransitionError, enable_guard_cache, transition_matrix
+from edison.core.state.actions import ActionRegistry
+from edison.core.state.conditions import ConditionRegistry
+from edison.core.state.guards import GuardRegistry
+from edison.core.state.validator import StateValidator
+from edison.core.utils.profiling import Profiler, enable_profiler
+
+
+class _Counting:
+    def __init__(self, result: Any = True) -> None:
+        self.calls: list[str] = []
+        self.result = result
+
+    def __call__(self, ctx: dict[str, Any]) -> Any:
+        self.calls.append(str((ctx.get("task") or {}).get("id")))
+        if isinstance(self.result, Exception):
+            raise self.result
+        if callable(self.result):
+            return self.result(ctx)
+        return self.result
+
+
+def _machine(guard: _Counting, *, condition: _Counting | None = None, action=None) -> RichStateMachine:
+    guards = GuardRegistry()
+    guards.register("slow_guard", guard)
+    conditions = ConditionRegistry()
+    actions = ActionRegistry()
+    done: dict[str, Any] = {"to": "done", "guard": "slow_guard"}
+    if condition is not None:
+        conditions.register("slow_condition", condition)
+        done["conditions"] = [{"name": "slow_condition", "error": "condition failed"}]
+    if action is not None:
+        actions.register("mutate", action)
+        done["actions"] = [{"name": "mutate"}]
+    return RichStateMachine(
+        "task",
+        {
+            "states": {
+                "wip": {"allowed_transitions": [done, {"to": "blocked"}, {"to": "todo", "guard": "slow_guard"}]},
+                "todo": {"allowed_transitions": [{"to": "wip"}]},
+                "blocked": {"allowed_transitions": []},
+                "done": {"allowed_transitions": []},
+            }
+        },
+        guards,
+        conditions,
+        actions,
+    )
+
+
+@pytest.fixture
+def audit_events(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    import edison.core.audit.logger as audit_logger
+
+    events: list[dict[str, Any]] = []
+    monkeypatch.setattr(audit_logger, "audit_event", lambda event, **fields: events.append({"event": event, **fields}))
+    return events
+
+
+def test_repeated_guards_are_evaluated_once_per_scope(audit_events: list[dict[str, Any]]) -> None:
+    guard = _Counting()
+    condition = _Counting()
+    sm = _machine(guard, condition=condition)
+    ctx = {"task": {"id": "T-1"}}
+
+    sm.validate("wip", "done", context=ctx, execute_actions=False)
+    sm.validate("wip", "done", context=ctx, execute_actions=False)
+    assert len(guard.calls) == 2  # no cache outside a scope
+
+    profiler = Profiler()
+    with enable_profiler(profiler), enable_guard_cache() as cache:
+        for _ in range(3):
+            sm.validate("wip", "done", context=dict(ctx), execute_actions=False)
+        sm.validate("wip", "done", context={"task": {"id": "T-2"}}, execute_actions=False)
+        with enable_guard_cache() as nested:
+            assert nested is cache
+            sm.validate("wip", "done", context=dict(ctx), execute_actions=False)
+
+    assert guard.calls == ["T-1", "T-1", "T-1", "T-2"]
+    assert condition.calls == ["T-1", "T-1", "T-1", "T-2"]
+    assert profiler.counters["guard.cache.hit"] == 6
+    # One guard.check event per evaluation, not per lookup.
+    assert sum(1 for e in audit_events if e["event"] == "guard.check") == 4
+
+
+def test_failures_are_cached_and_reraised(audit_events: list[dict[str, Any]]) -> None:
+    guard = _Counting(ValueError("Implementation report missing for T-1"))
+    sm = _machine(guard)
+
+    with enable_guard_cache():
+        for _ in range(2):
+            with pytest.raises(StateTransitionError, match="Implementation report missing"):
+                sm.validate("wip", "done", context={"task": {"id": "T-1"}}, execute_actions=False)
+
+    blocked = _Counting(False)
+    sm = _machine(blocked)
+    with enable_guard_cache():
+        for _ in range(2):
+            with pytest.raises(StateTransitionError, match="blocked transition"):
+                sm.validate("wip", "done", context={"task": {"id": "T-1"}}, execute_actions=False)
+
+    assert len(guard.calls) == 1 and len(blocked.calls) == 1
+    assert [e["event"] for e in audit_events] == ["guard.error", "guard.check", "guard.blocked"]
+
+
+def test_cached_failures_raise_fresh_exceptions() -> None:
+    guard = _Counting(ValueError("Implementation report missing for T-1"))
+    sm = _machine(guard)
+
+    raised: list[BaseException] = []
+    with enable_guard_cache():
+        for _ in range(3):
+            with pytest.raises(StateTransitionError) as info:
+                sm.validate("wip", "done", context={"task": {"id": "T-1"}}, execute_actions=False)
+            raised.append(info.value.__cause__)
+
+    assert len(guard.calls) == 1
+    assert all(isinstance(exc, ValueError) for exc in raised)
+    assert len({id(exc) for exc in raised}) == 3
+    # Hits do not extend one shared traceback.
+    depths = []
+    for exc in raised[1:]:
+        tb, depth = exc.__traceback__, 0
+        while tb is not None:
+            tb, depth = tb.tb_next, depth + 1
+        depths.append(depth)
+    assert depths[0] == depths[1]
+
+
+def test_actions_and_unfingerprintable_contexts_bypass_stale_entries() -> None:
+    guard = _Counting()
+    sm = _machine(guard, action=lambda ctx: None)
+
+    with enable_guard_cache() as cache:
+        sm.validate("wip", "done", context={"task": {"id": "T-1"}}, execute_actions=True)
+        assert len(cache) == 0
+        sm.validate("wip", "done", context={"task": {"id": "T-1"}}, execute_actions=True)
+        sm.validate("wip", "done", context={"task": {"id": "T-1"}, "live": object()}, execute_actions=False)
+        sm.validate("wip", "done", context={"task": {"id": "T-1"}, "live": object()}, execute_actions=False)
+
+    assert len(guard.calls) == 4
+
+
+def test_transition_matrix_evaluates_every_allowed_transition(monkeypatch: pytest.MonkeyPatch) -> None:
+    guard = _Counting(lambda ctx: ctx["task"]["id"] != "T-2")
+    profiler = Profiler()
+    sm = _machine(guard)
+    monkeypatch.setattr(StateValidator, "get_state_machine", lambda self, entity: sm)
+
+    subjects = {
+        "T-1": ("wip", {"task": {"id": "T-1"}}),
+        "T-2": ("wip", {"task": {"id": "T-2"}}),
+        "T-3": ("todo", {"task": {"id": "T-3"}}),
+        "T-4": ("", {"task": {"id": "T-4"}}),
+    }
+    with enable_profiler(profiler):
+        matrix = transition_matrix("task", subjects)
+
+    assert matrix["T-1"] == {"done": (True, ""), "blocked": (True, ""), "todo": (True, "")}
+    assert matrix["T-2"]["blocked"] == (True, "")
+    assert matrix["T-2"]["done"] == (False, "Guard 'slow_guard' blocked transition")
+    assert matrix["T-3"] == {"wip": (True, "")}
+    assert matrix["T-4"] == {}
+    # slow_guard guards both wip->done and wip->todo; the per-target to_state is
+    # not an input, so it is evaluated once per entity and shared by both edges.
+    assert guard.calls == ["T-1", "T-2"]
+    assert profiler.counters["guard.cache.hit"] == 2
+
@@ -148,3 +148,30 @@ def test_task_relationship_service_remove_related_is_symmetric(
 
     assert ("related", b) not in a_edges
     assert ("related", a) not in b_edges
+
+
+@pytest.mark.task
+def test_task_relationship_service_plan_depends_on_skips_missing_tasks_on_request(
+    isolated_project_env: Path,
+) -> None:
+    root = isolated_project_env
+
+    a = "010-a"
+    b = "010-b"
+    _create_task(root, a)
+    _create_task(root, b)
+
+    from edison.core.entity import PersistenceError
+    from edison.core.task.relationships.service import TaskRelationshipService
+
+    svc = TaskRelationshipService(project_root=root)
+    desired = {"010-gone": [b], a: [b]}
+
+    with pytest.raises(PersistenceError, match="Task not found: 010-gone"):
+        svc.plan_depends_on(desired)
+
+    changed = svc.plan_depends_on(desired, skip_missing=True)
+    assert sorted(t.id for t in changed) == [a, b]
+    # A missing dependency is still an error.
+    with pytest.raises(PersistenceError, match="Task not found: 010-gone"):
+        svc.plan_depends_on({a: ["010-gone"]}, skip_missing=True)
@@ -0,0 +1,136 @@
+"""Tests for the persisted, incrementally maintained readiness index."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from edison.core.config.domains.workflow import WorkflowConfig
+from edison.core.entity import EntityMetadata
+from edison.core.task.index import TaskIndex
+from edison.core.task.models import Task
+from edison.core.task.planning import TaskPlanner
+from edison.core.task.readiness import TaskReadinessEvaluator
+from edison.core.task.readiness_index import TaskReadinessIndex, clear_readiness_indexes
+from edison.core.task.repository import TaskRepository
+from edison.core.utils.profiling import Profiler, enable_profiler
+
+
+def _age_task_files(root: Path) -> None:
+    """Push task mtimes out of the racy window so unchanged files are not re-read."""
+    for path in root.rglob("*.md"):
+        os.utime(path, (1_600_000_000, 1_600_000_000))
+
+
+def _save(repo: TaskRepository, task_id: str, state: str, *, deps: tuple[str, ...] = (), session_id: str | None = None) -> None:
+    repo.save(
+        Task(
+            id=task_id,
+            state=state,
+            title=task_id,
+            session_id=session_id,
+            relationships=[{"type": "depends_on", "target": d} for d in deps],
+            metadata=EntityMetadata.create(created_by="test"),
+        )
+    )
+
+
+def _refresh(index: TaskReadinessIndex) -> tuple[set[str], int]:
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        changed = index.refresh()
+    return changed, profiler.counters.get("task.readiness.parse", 0)
+
+
+@pytest.mark.task
+def test_counters_follow_state_and_dependency_changes(isolated_project_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(isolated_project_env)
+    workflow = WorkflowConfig(repo_root=isolated_project_env)
+    todo = workflow.get_semantic_state("task", "todo")
+    done = workflow.get_semantic_state("task", "done")
+    repo = TaskRepository(project_root=isolated_project_env)
+
+    _save(repo, "A", todo)
+    _save(repo, "B", todo, deps=("A",))
+    _save(repo, "C", todo, deps=("A", "X"))
+    _save(repo, "D", todo)
+
+    evaluator = TaskReadinessEvaluator(project_root=isolated_project_env)
+    index = evaluator.readiness_index()
+    assert index.ready_candidates == {"A", "D"}
+    assert index.blocked_candidates == {"B", "C"}
+    assert (index.unsatisfied["C"], index.missing["C"]) == (1, 1)
+
+    _age_task_files(isolated_project_env)
+    _refresh(index)  # re-reads the files that were inside the racy window
+    assert _refresh(index) == (set(), 0)
+
+    task_a = repo.get("A")
+    task_a.state = done
+    repo.save(task_a)
+    _age_task_files(isolated_project_env)
+    changed, parsed = _refresh(index)
+    assert changed == {"A"} and parsed == 1
+    assert index.ready_candidates == {"B", "D"}
+    assert (index.unsatisfied["C"], index.missing["C"]) == (0, 1)
+
+    _save(repo, "D", todo, deps=("B",))
+    _age_task_files(isolated_project_env)
+    changed, parsed = _refresh(index)
+    assert changed == {"D"} and parsed == 1
+    assert index.ready_candidates == {"B"}
+    assert index.dependents["B"] == {"D"}
+
+    # A fresh process loads counters from disk and re-reads nothing.
+    clear_readiness_indexes()
+    reloaded = TaskReadinessIndex(
+        project_root=isolated_project_env,
+        todo_state=evaluator.todo_state(),
+        satisfied_states=evaluator.dependency_satisfied_states(),
+    )
+    assert _refresh(reloaded) == (set(), 0)
+    assert reloaded.ready_candidates == index.ready_candidates
+    assert reloaded.unsatisfied == {k: v for k, v in index.unsatisfied.items() if v}
+
+
+@pytest.mark.task
+def test_ready_blocked_and_waves_match_full_scan(isolated_project_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(isolated_project_env)
+    workflow = WorkflowConfig(repo_root=isolated_project_env)
+    todo = workflow.get_semantic_state("task", "todo")
+    done = workflow.get_semantic_state("task", "done")
+    repo = TaskRepository(project_root=isolated_project_env)
+
+    _save(repo, "base", done)
+    _save(repo, "sess-dep", done, session_id="s1")
+    _save(repo, "g1", todo, deps=("base",))
+    _save(repo, "g2", todo, deps=("sess-dep",))
+    _save(repo, "g3", todo, deps=("g1",))
+    _save(repo, "s-task", todo, deps=("sess-dep",), session_id="s1")
+    _save(repo, "s-missing", todo, deps=("nope",), session_id="s1")
+
+    evaluator = TaskReadinessEvaluator(project_root=isolated_project_env)
+    full = TaskIndex(project_root=isolated_project_env).get_task_graph()
+
+    for session_id in (None, "s1"):
+        scoped = evaluator._scoped_graph(full=full, session_id=session_id)
+        expected = [
+            evaluator._evaluate_summary(t, scoped, full)
+            for tid, t in sorted(scoped.tasks.items())
+            if t.state == todo and (session_id is None or t.session_id == session_id)
+        ]
+        ready = evaluator.list_ready_tasks(session_id=session_id)
+        blocked = evaluator.list_blocked_tasks(session_id=session_id)
+        assert ready == [r for r in expected if r.ready]
+        assert blocked == [r for r in expected if not r.ready and r.blocked_by]
+
+    assert [r.task.id for r in evaluator.list_ready_tasks()] == ["g1"]
+    assert [r.task.id for r in evaluator.list_blocked_tasks()] == ["g2", "g3"]
+
+    plan = TaskPlanner(project_root=isolated_project_env).build_plan()
+    assert [[t.id for t in w.tasks] for w in plan.waves] == [["g1"], ["g3"]]
+    assert [b["id"] for b in plan.blocked] == ["g2"]
+    session_plan = TaskPlanner(project_root=isolated_project_env).build_plan(session_id="s1")
+    assert [[t.id for t in w.tasks] for w in session_plan.waves] == [["s-task"]]
+    assert [b["id"] for b in session_plan.blocked] == ["s-missing"]
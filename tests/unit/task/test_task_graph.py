@@ -0,0 +1,140 @@
+"""Tests for the CSR task graph and TaskGraph closure queries."""
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+from edison.core.task.graph import CompactTaskGraph
+from edison.core.task.index import TaskGraph, TaskIndex, TaskSummary
+
+
+def _graph(edges: dict[str, dict]) -> TaskGraph:
+    graph = TaskGraph()
+    for task_id, rel in edges.items():
+        graph.add_task(
+            TaskSummary(
+                id=task_id,
+                path=Path(f"{task_id}.md"),
+                state="todo",
+                parent_id=rel.get("parent"),
+                depends_on=list(rel.get("deps", [])),
+                blocks_tasks=list(rel.get("blocks", [])),
+            )
+        )
+    return graph
+
+
+def test_closures_are_cycle_safe() -> None:
+    graph = _graph(
+        {
+            "A": {"parent": "C"},
+            "B": {"parent": "A", "deps": ["C"]},
+            "C": {"parent": "B", "deps": ["B"]},
+            "D": {"parent": "MISSING", "deps": ["A"]},
+        }
+    )
+    assert graph.get_all_descendants("A") == {"B", "C"}
+    assert graph.get_all_ancestors("A") == {"C", "B"}
+    # Referenced-but-missing ids are still reported.
+    assert graph.get_all_ancestors("D") == {"MISSING"}
+    assert graph.get_all_descendants("MISSING") == {"D"}
+
+    assert graph.get_all_dependencies("D") == {"A"}
+    assert graph.get_all_dependencies("B") == {"C"}
+    ordered, cyclic = graph.compact().topological_order()
+    assert ordered == ["A", "MISSING", "D"]
+    assert sorted(cyclic) == ["B", "C"]
+
+
+def test_deep_hierarchy_does_not_recurse() -> None:
+    depth = sys.getrecursionlimit() * 3
+    graph = _graph({f"T{i}": {"parent": f"T{i - 1}"} if i else {} for i in range(depth)})
+    assert len(graph.get_all_descendants("T0")) == depth - 1
+    assert len(graph.get_all_ancestors(f"T{depth - 1}")) == depth - 1
+
+
+def test_compact_snapshot_tracks_added_tasks() -> None:
+    graph = _graph({"P": {}, "C1": {"parent": "P"}})
+    assert graph.get_all_descendants("P") == {"C1"}
+    graph.add_task(TaskSummary(id="C2", path=Path("C2.md"), state="todo", parent_id="P"))
+    assert graph.get_all_descendants("P") == {"C1", "C2"}
+
+    # Re-parenting an existing task changes no collection size but still invalidates.
+    graph = _graph({"P": {}, "Q": {}, "C": {"parent": "P"}, "D": {"parent": "Q"}})
+    assert graph.get_all_descendants("Q") == {"D"}
+    graph.add_task(TaskSummary(id="C", path=Path("C.md"), state="todo", parent_id="Q"))
+    assert graph.get_all_descendants("Q") == {"D", "C"}
+
+
+def test_dependency_closures_and_topological_order() -> None:
+    graph = _graph({"a": {}, "b": {"deps": ["a"]}, "c": {"deps": ["b", "a", "a"]}, "d": {"deps": ["c"]}})
+    compact = graph.compact()
+    assert compact.dependency_closure("d") == ["c", "b", "a"]
+    assert compact.dependent_closure("a") == ["b", "c", "d"]
+    assert compact.topological_order() == (["a", "b", "c", "d"], [])
+
+
+def test_blocks_tasks_count_as_reverse_dependencies() -> None:
+    graph = _graph({"a": {"blocks": ["b"]}, "b": {}, "c": {"deps": ["b"]}})
+    assert graph.get_all_dependencies("c") == {"a", "b"}
+    assert graph.get_all_dependents("a") == {"b", "c"}
+    assert graph.compact().topological_order() == (["a", "b", "c"], [])
+
+
+def test_subgraph_reads_only_the_subtree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from edison.core.utils.text import format_frontmatter
+
+    tasks = tmp_path / ".project" / "tasks" / "todo"
+    tasks.mkdir(parents=True)
+    (tmp_path / ".project" / "sessions").mkdir(parents=True)
+
+    def _write(task_id: str, rels: list[dict]) -> None:
+        (tasks / f"{task_id}.md").write_text(
+            format_frontmatter({"id": task_id, "title": task_id, "relationships": rels}) + "\n# t\n",
+            encoding="utf-8",
+        )
+
+    _write("R", [{"type": "child", "target": "R.1"}])
+    _write("R.1", [{"type": "parent", "target": "R"}, {"type": "child", "target": "R.1.1"}])
+    _write("R.1.1", [{"type": "parent", "target": "R.1"}])
+    for i in range(20):
+        _write(f"OTHER-{i}", [])
+
+    index = TaskIndex(project_root=tmp_path)
+    read: list[str] = []
+    real_extract = index._extract_frontmatter  # noqa: SLF001
+    monkeypatch.setattr(index, "_extract_frontmatter", lambda p: read.append(p.stem) or real_extract(p))
+
+    graph = index.get_task_subgraph(["R"])
+    assert sorted(graph.tasks) == ["R", "R.1", "R.1.1"]
+    assert sorted(read) == ["R", "R.1", "R.1.1"]
+    assert graph.get_all_descendants("R") == {"R.1", "R.1.1"}
+
+
+@pytest.mark.slow
+def test_compact_graph_scales_to_50k_tasks() -> None:
+    """Benchmark: 50k-task synthetic DAG (hierarchy fan-out 8, up to 3 deps per task)."""
+    n = 50_000
+    rng = random.Random(40)
+    ids = [f"T{i}" for i in range(n)]
+    parent_of = {ids[i]: ids[(i - 1) // 8] for i in range(1, n)}
+    children: dict[str, list[str]] = {}
+    for child, parent in parent_of.items():
+        children.setdefault(parent, []).append(child)
+    deps = {ids[i]: [ids[rng.randrange(i)] for _ in range(rng.randint(0, 3))] for i in range(1, n)}
+
+    compact = CompactTaskGraph(ids, parent_of, children, deps)
+    assert len(compact.descendants("T0")) == n - 1
+    assert len(compact.descendants(*ids[1:9])) == n - 9
+    assert compact.ancestors(ids[-1])[-1] == "T0"
+
+    ordered, cyclic = compact.topological_order()
+    assert len(ordered) == n and cyclic == []
+    position = {task_id: i for i, task_id in enumerate(ordered)}
+    assert all(position[d] < position[t] for t, ds in deps.items() for d in ds)
+    closure = set(compact.dependency_closure(ids[-1]))
+    assert closure <= set(ids[:-1])
+    assert all(ids[-1] in compact.dependent_closure(d) for d in deps[ids[-1]])
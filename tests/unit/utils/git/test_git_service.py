@@ -0,0 +1,121 @@
+"""Tests for the per-invocation git service (memoized facts + cat-file readers)."""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from edison.core.utils.git.diff import get_current_branch
+from edison.core.utils.git.service import (
+    enable_git_service,
+    git_subcommand,
+    is_mutating_git_command,
+)
+from edison.core.utils.git.worktree import list_worktrees
+from edison.core.utils.profiling import Profiler, enable_profiler
+from edison.core.utils.subprocess import run_with_timeout
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_facts_come_from_one_batched_rev_parse(git_repo) -> None:
+    repo = git_repo.repo_path
+    profiler = Profiler()
+    with enable_profiler(profiler), enable_git_service() as service:
+        facts = service.facts(repo)
+        assert facts is not None
+        assert facts.toplevel == repo.resolve()
+        assert facts.head == _git(repo, "rev-parse", "HEAD")
+        assert facts.branch == _git(repo, "rev-parse", "--abbrev-ref", "HEAD")
+        assert not facts.is_linked_worktree
+
+        for _ in range(5):
+            assert get_current_branch(repo) == facts.branch
+            list_worktrees(repo)
+
+    assert profiler.counters["git.forks.rev-parse"] == 1
+    assert profiler.counters["git.forks.worktree"] == 1
+
+
+def test_facts_outside_git_and_unborn_branch(tmp_path: Path) -> None:
+    with enable_git_service() as service:
+        assert service.facts(tmp_path) is None
+
+    repo = tmp_path / "fresh"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    with enable_git_service() as service:
+        facts = service.facts(repo)
+        assert facts is not None and facts.head == "" and facts.branch == ""
+
+
+def test_edison_git_writes_invalidate_memoized_facts(git_repo) -> None:
+    repo = git_repo.repo_path
+    with enable_git_service() as service:
+        before = service.facts(repo)
+        (repo / "new.txt").write_text("x", encoding="utf-8")
+        run_with_timeout(["git", "add", "new.txt"], cwd=repo, timeout=30, check=True)
+        run_with_timeout(
+            ["git", "-c", "user.email=t@e", "-c", "user.name=t", "commit", "-q", "-m", "[GREEN] add"],
+            cwd=repo,
+            timeout=30,
+            check=True,
+        )
+        after = service.facts(repo)
+
+    assert before is not None and after is not None
+    assert after.head != before.head
+    assert after.head == _git(repo, "rev-parse", "HEAD")
+
+
+def test_object_reader_reuses_one_process(git_repo) -> None:
+    repo = git_repo.repo_path
+    head = _git(repo, "rev-parse", "HEAD")
+    subject = _git(repo, "show", "-s", "--format=%s", "HEAD")
+
+    profiler = Profiler()
+    with enable_profiler(profiler), enable_git_service() as service:
+        reader = service.objects(repo)
+        for _ in range(10):
+            info = reader.info("HEAD^{commit}")
+            assert info is not None and info[0] == head and info[1] == "commit"
+        assert reader.info("no-such-ref^{commit}") is None
+        assert reader.commit_subject("HEAD") == subject
+        sha, kind, data = reader.read("HEAD:README.md") or ("", "", b"")
+        assert kind == "blob" and data == (repo / "README.md").read_bytes()
+
+    assert profiler.counters["git.forks.cat-file"] == 2
+
+
+def test_mutating_command_classification() -> None:
+    assert git_subcommand(["git", "-C", "/x", "status"]) == ("status", [])
+    assert not is_mutating_git_command(["git", "rev-parse", "HEAD"])
+    assert not is_mutating_git_command(["git", "worktree", "list", "--porcelain"])
+    assert not is_mutating_git_command(["git", "branch", "--show-current"])
+    assert not is_mutating_git_command(["git", "config", "--get", "user.name"])
+    assert is_mutating_git_command(["git", "worktree", "add", "-b", "x", "../x"])
+    assert is_mutating_git_command(["git", "branch", "-D", "x"])
+    assert is_mutating_git_command(["git", "commit", "-m", "x"])
+
+
+def test_commits_by_other_processes_are_noticed(git_repo) -> None:
+    """Long-lived commands (compose watch, orchestrators) must not see a stale HEAD."""
+    repo = git_repo.repo_path
+    with enable_git_service() as service:
+        before = service.facts(repo)
+        worktrees_before = list_worktrees(repo)
+        # Plain subprocess: not reported to the service, like a commit from another shell.
+        (repo / "other.txt").write_text("x", encoding="utf-8")
+        _git(repo, "add", "other.txt")
+        _git(repo, "-c", "user.email=t@e", "-c", "user.name=t", "commit", "-q", "-m", "other")
+        _git(repo, "checkout", "-q", "-b", "side")
+        after = service.facts(repo)
+        worktrees_after = list_worktrees(repo)
+
+    assert before is not None and after is not None
+    assert after.head == _git(repo, "rev-parse", "HEAD") != before.head
+    assert after.branch == "side"
+    assert [w.get("head") for w in worktrees_after] != [w.get("head") for w in worktrees_before]
@@ -0,0 +1,57 @@
+"""Tests for filesystem watchers used by `edison compose watch`."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from edison.core.utils.fswatch import InotifyWatcher, PollingWatcher, create_watcher
+
+
+def _exercise(watcher, root: Path) -> None:
+    target = root / "sub" / "file.md"
+    target.write_text("v1", encoding="utf-8")
+    changed = watcher.wait(timeout=2.0)
+    assert target in changed
+
+    (root / "sub" / "ignored.swp").write_text("x", encoding="utf-8")
+    assert watcher.wait(timeout=0.3) == set()
+
+    nested = root / "sub" / "new-dir"
+    nested.mkdir()
+    watcher.wait(timeout=1.0)
+    (nested / "deep.md").write_text("v1", encoding="utf-8")
+    assert nested / "deep.md" in watcher.wait(timeout=2.0)
+
+
+def _make_root(tmp_path: Path) -> Path:
+    (tmp_path / "sub").mkdir()
+    return tmp_path
+
+
+def test_polling_watcher_detects_changes(tmp_path: Path) -> None:
+    root = _make_root(tmp_path)
+    watcher = PollingWatcher([root], ignore=lambda p: p.suffix == ".swp", interval=0.02)
+    try:
+        _exercise(watcher, root)
+    finally:
+        watcher.close()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_watcher_detects_changes(tmp_path: Path) -> None:
+    root = _make_root(tmp_path)
+    watcher = InotifyWatcher([root], ignore=lambda p: p.suffix == ".swp")
+    try:
+        _exercise(watcher, root)
+    finally:
+        watcher.close()
+
+
+def test_create_watcher_honors_force_polling(tmp_path: Path) -> None:
+    watcher = create_watcher([tmp_path], force_polling=True)
+    try:
+        assert isinstance(watcher, PollingWatcher)
+    finally:
+        watcher.close()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import json
+import os
+import stat
+import sys
+import tempfile
+from pathlib import Path
+
+import psutil
+import pytest
+
+from edison.core.utils.process import inspector
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    cache_dir = tmp_path / f"edison-{os.getuid()}" / "process-inference"
+    inspector.reset_process_inference_cache()
+    yield cache_dir
+    inspector.reset_process_inference_cache()
+
+
+def test_topmost_process_is_cached_per_parent_and_revalidated(
+    _isolated_cache: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    expected = inspector._find_topmost_process_from(psutil.Process(os.getpid()))  # noqa: SLF001
+    assert inspector.find_topmost_process() == expected
+    entry = json.loads((_isolated_cache / f"{os.getppid()}.json").read_text(encoding="utf-8"))
+    assert entry["parentStart"] == inspector._proc_start(os.getppid())  # noqa: SLF001
+
+    # A fresh invocation under the same parent reuses the entry without walking the tree.
+    walks: list[int] = []
+    real_chain = inspector._ancestor_chain  # noqa: SLF001
+
+    def counting_chain(pid: int, *, limit: int | None = None):
+        if limit is None:
+            walks.append(pid)
+        return real_chain(pid, limit=limit)
+
+    monkeypatch.setattr(inspector, "_ancestor_chain", counting_chain)
+    inspector.reset_process_inference_cache()
+    assert inspector.find_topmost_process() == expected
+    assert walks == []
+
+    # A reused parent pid (different start time) invalidates the entry.
+    entry["parentStart"] = "0"
+    (_isolated_cache / f"{os.getppid()}.json").write_text(json.dumps(entry), encoding="utf-8")
+    inspector.reset_process_inference_cache()
+    assert inspector.find_topmost_process() == expected
+    assert walks == [os.getpid()]
+
+
+def test_cache_dir_is_private_and_rejects_planted_dirs(tmp_path: Path, _isolated_cache: Path) -> None:
+    user_dir = _isolated_cache.parent
+    assert inspector._inference_cache_dir() == _isolated_cache  # noqa: SLF001
+    assert stat.S_IMODE(user_dir.stat().st_mode) == 0o700
+    assert stat.S_IMODE(_isolated_cache.stat().st_mode) == 0o700
+
+    # Readable by others (as older versions created it): ours, so it is tightened.
+    user_dir.chmod(0o755)
+    assert inspector._inference_cache_dir() == _isolated_cache  # noqa: SLF001
+    assert stat.S_IMODE(user_dir.stat().st_mode) == 0o700
+
+    # Writable by others: entries may have been planted, so the cache is not used.
+    _isolated_cache.chmod(0o777)
+    (_isolated_cache / f"{os.getppid()}.json").write_text('{"planted": true}', encoding="utf-8")
+    assert inspector._inference_cache_dir() is None  # noqa: SLF001
+    assert inspector._cached_ancestor_match() is inspector._UNCACHED  # noqa: SLF001
+
+    # A symlink pointing somewhere else is never followed.
+    _isolated_cache.chmod(0o700)
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir(mode=0o700)
+    _isolated_cache.rename(tmp_path / "old-cache")
+    _isolated_cache.symlink_to(elsewhere)
+    assert inspector._inference_cache_dir() is None  # noqa: SLF001
+
+
+@pytest.mark.skipif(not inspector._HAS_PROCFS, reason="requires /proc")  # noqa: SLF001
+def test_procfs_chain_matches_psutil() -> None:
+    fast = inspector._ancestor_chain_procfs(os.getpid())  # noqa: SLF001
+    slow = inspector._ancestor_chain_from(psutil.Process(os.getpid()))  # noqa: SLF001
+    assert [(a.pid, a.name, a.cmdline) for a in fast] == [(a.pid, a.name, a.cmdline) for a in slow]
+    assert fast[0].cmdline[0] == sys.executable or fast[0].name == "python"
@@ -0,0 +1,107 @@
+"""Tests for bounded-memory streamed subprocess capture."""
+from __future__ import annotations
+
+import hashlib
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from edison.core.utils.stream_capture import StreamCapture, StreamCaptureOptions
+from edison.core.utils.subprocess import StreamedCompletedProcess, run_with_timeout
+
+
+def test_capture_keeps_bounded_head_and_tail() -> None:
+    cap = StreamCapture(head_bytes=4, tail_bytes=4)
+    payload = b"0123456789abcdef"
+    for i in range(0, len(payload), 3):
+        cap.write(payload[i : i + 3])
+    cap.close()
+
+    assert cap.head == b"0123"
+    assert cap.tail == b"cdef"
+    assert cap.total_bytes == len(payload)
+    assert cap.omitted_bytes == 8 and cap.truncated
+    assert cap.sha256 == hashlib.sha256(payload).hexdigest()
+    assert cap.excerpt() == "0123\n... [8 bytes omitted] ...\ncdef"
+    assert cap.excerpt(4) == "01\n... [12 bytes omitted] ...\nef"
+    with pytest.raises(ValueError):
+        list(cap.iter_lines())
+
+
+def test_untruncated_capture_iterates_lines_from_memory() -> None:
+    cap = StreamCapture(head_bytes=8, tail_bytes=8)
+    cap.write(b"a\nb\nc\n")
+    assert not cap.truncated
+    assert list(cap.iter_lines()) == ["a\n", "b\n", "c\n"]
+
+
+def test_streamed_run_tees_full_output(isolated_project_env: Path) -> None:
+    out_path = isolated_project_env / "logs" / "stdout.log"
+    script = "import sys\nfor i in range(2000): print(f'line {i}')\nprint('err', file=sys.stderr)"
+
+    result = run_with_timeout(
+        [sys.executable, "-c", script],
+        timeout=30,
+        stream_capture=StreamCaptureOptions(stdout_path=out_path, head_bytes=32, tail_bytes=32),
+    )
+
+    assert isinstance(result, StreamedCompletedProcess)
+    assert result.returncode == 0
+    full = out_path.read_bytes()
+    assert result.stdout_capture.total_bytes == len(full)
+    assert result.stdout_capture.sha256 == hashlib.sha256(full).hexdigest()
+    assert result.stdout.startswith("line 0\n") and result.stdout.endswith("line 1999\n")
+    assert "bytes omitted" in result.stdout
+    assert result.stderr.strip() == "err"
+    lines = list(result.stdout_capture.iter_lines())
+    assert len(lines) == 2000 and lines[-1] == "line 1999\n"
+
+
+def test_streamed_run_timeout_and_check(isolated_project_env: Path) -> None:
+    with pytest.raises(subprocess.TimeoutExpired) as excinfo:
+        run_with_timeout(
+            [sys.executable, "-c", "import time; print('started', flush=True); time.sleep(5)"],
+            timeout=0.5,
+            stream_capture=True,
+        )
+    assert "started" in (excinfo.value.output or "")
+
+    with pytest.raises(subprocess.CalledProcessError) as failed:
+        run_with_timeout(
+            [sys.executable, "-c", "import sys; sys.stderr.write('boom'); sys.exit(3)"],
+            timeout=30,
+            check=True,
+            stream_capture=True,
+        )
+    assert failed.value.returncode == 3
+    assert failed.value.stderr == "boom"
+
+
+@pytest.mark.slow
+def test_streamed_capture_memory_is_bounded_for_500mb(isolated_project_env: Path) -> None:
+    total_mb = 500
+    script = (
+        "import sys\n"
+        "chunk = (b'x' * 1023 + b'\\n') * 1024\n"
+        f"for _ in range({total_mb}): sys.stdout.buffer.write(chunk)\n"
+    )
+
+    tracemalloc.start()
+    try:
+        result = run_with_timeout(
+            [sys.executable, "-c", script],
+            timeout=300,
+            stream_capture=StreamCaptureOptions(),
+        )
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert result.returncode == 0
+    assert result.stdout_capture.total_bytes == total_mb * 1024 * 1024
+    # communicate() would hold the whole 500MB (twice, once decoded); streamed
+    # capture keeps a 64KiB head, 64KiB tail and one read chunk.
+    assert peak < 8 * 1024 * 1024, f"peak traced memory {peak / 1e6:.1f}MB"
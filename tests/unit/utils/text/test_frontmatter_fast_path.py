@@ -0,0 +1,143 @@
+"""Tests for the libyaml-backed YAML helpers and header-only frontmatter reads."""
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+import edison.data
+from edison.core.utils.io.yaml import SafeDumper, SafeLoader, safe_dump, safe_load
+from edison.core.utils.profiling import Profiler, enable_profiler
+from edison.core.utils.text import clear_frontmatter_cache, format_frontmatter, parse_frontmatter, read_frontmatter
+from edison.core.utils.text.frontmatter import _HEADER_CHUNK, read_frontmatter_header
+
+DATA_ROOT = Path(edison.data.__file__).parent
+
+
+def _backdate(path: Path, seconds: float = 60.0) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> None:
+    clear_frontmatter_cache()
+    yield
+    clear_frontmatter_cache()
+
+
+def test_c_and_pure_yaml_agree_on_bundled_corpus() -> None:
+    files = sorted(p for p in DATA_ROOT.rglob("*") if p.suffix in {".yaml", ".yml"})
+    assert files
+    for path in files:
+        text = path.read_text(encoding="utf-8")
+        try:
+            expected = yaml.load(text, Loader=yaml.SafeLoader)
+        except yaml.YAMLError:
+            # Templated files (e.g. with {{placeholders}}) must fail the same way.
+            with pytest.raises(yaml.YAMLError):
+                safe_load(text)
+            continue
+        data = safe_load(text)
+        assert data == expected, path
+        dumped = safe_dump(data, sort_keys=False, allow_unicode=True)
+        pure = yaml.dump(data, Dumper=yaml.SafeDumper, sort_keys=False, allow_unicode=True)
+        assert yaml.load(dumped, Loader=yaml.SafeLoader) == yaml.load(pure, Loader=yaml.SafeLoader), path
+
+    # Multiline strings keep literal block style on whichever dumper is active.
+    assert "|-" in safe_dump({"body": "line one\nline two"})
+    assert SafeLoader in (yaml.SafeLoader, getattr(yaml, "CSafeLoader", None))
+    assert SafeDumper in (yaml.SafeDumper, getattr(yaml, "CSafeDumper", None))
+
+
+def test_header_read_matches_full_parse_on_bundled_markdown(tmp_path: Path) -> None:
+    files = sorted(DATA_ROOT.rglob("*.md"))
+    assert files
+    for path in files:
+        text = path.read_text(encoding="utf-8")
+        try:
+            expected = parse_frontmatter(text).frontmatter
+        except ValueError:
+            with pytest.raises(ValueError):
+                read_frontmatter(path)
+            continue
+        assert read_frontmatter(path) == expected, path
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "---\r\nid: crlf\r\ntags: [a, b]\r\n---\r\n# Body\r\n",
+        "---\nid: unclosed\ntitle: never ends\n",
+        "---\nid: rule\n---\n# Body\n\n---\n\nmore: text\n---\n",
+        "---\nid: big\nnotes: |\n" + "".join(f"  line {i} " + "x" * 60 + "\n" for i in range(400)) + "---\nbody\n",
+        "---\nid: trailing\n---\n" + "\n" * (_HEADER_CHUNK * 2) + "body",
+        "---\nid: exact\n---",
+        "# No frontmatter\n---\nid: nope\n---\n",
+        "",
+    ],
+    ids=["crlf", "unclosed", "body-rule", "larger-than-chunk", "blank-run", "eof", "none", "empty"],
+)
+def test_header_read_edge_cases(tmp_path: Path, text: str) -> None:
+    path = tmp_path / "doc.md"
+    path.write_bytes(text.encode("utf-8"))
+    text = path.read_text(encoding="utf-8")  # universal newlines, as every reader sees it
+    assert read_frontmatter(path) == parse_frontmatter(text).frontmatter
+    header = read_frontmatter_header(path)
+    assert text.startswith(header)
+    assert parse_frontmatter(header).frontmatter == parse_frontmatter(text).frontmatter
+
+
+def test_read_frontmatter_cache_and_errors(tmp_path: Path) -> None:
+    path = tmp_path / "task.md"
+    path.write_text(format_frontmatter({"id": "T-1", "tags": []}) + "# T-1\n", encoding="utf-8")
+    _backdate(path)
+
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        first = read_frontmatter(path)
+        first["tags"].append("mutated")
+        second = read_frontmatter(path)
+    assert second == {"id": "T-1", "tags": []}
+    assert profiler.counters["frontmatter.cache.hit"] == 1
+
+    # `clear_all_caches` (config reloads, test isolation) drops cached headers too.
+    from edison.core.config.cache import clear_all_caches
+
+    clear_all_caches()
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        read_frontmatter(path)
+    assert profiler.counters.get("frontmatter.cache.hit", 0) == 0
+
+    path.write_text("---\nid: [unclosed\n---\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        read_frontmatter(path)
+
+
+@pytest.mark.slow
+def test_header_scan_throughput_10k_files(tmp_path: Path) -> None:
+    """Benchmark: frontmatter of 10k task files, each with a ~4 KB body."""
+    body = "# Task\n\n" + ("Lorem ipsum dolor sit amet. " * 150) + "\n"
+    paths = []
+    for i in range(10_000):
+        path = tmp_path / f"T-{i}.md"
+        path.write_text(
+            format_frontmatter({"id": f"T-{i}", "title": f"Task {i}", "state": "todo", "tags": ["a", "b"]}) + body,
+            encoding="utf-8",
+        )
+        _backdate(path)
+        paths.append(path)
+
+    full = [parse_frontmatter(p.read_text(encoding="utf-8")).frontmatter for p in paths]
+    cold = [read_frontmatter(p) for p in paths]
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        warm = [read_frontmatter(p) for p in paths]
+
+    assert cold == full and warm == full
+    # Repeated scans (the common case within one CLI run) skip both I/O and YAML.
+    assert profiler.counters["frontmatter.cache.hit"] == len(paths)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from edison.core.web_server import manager
+from edison.core.web_server.models import WebServerConfig
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: set[tuple[str, int]] = set()
+
+    def do_GET(self) -> None:  # noqa: N802
+        type(self).peers.add(self.client_address)
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def http_server():
+    _KeepAliveHandler.peers = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_verify_steps_run_concurrently(tmp_path: Path, http_server: ThreadingHTTPServer) -> None:
+    port = http_server.server_address[1]
+    config = WebServerConfig.from_raw(
+        {
+            "url": f"http://127.0.0.1:{port}/",
+            "startup_timeout_seconds": 10,
+            "verify": {
+                "steps": [
+                    {"kind": "http"},
+                    {"kind": "command", "command": "sleep 1"},
+                    {"kind": "command", "command": "sleep 1"},
+                    {"kind": "command", "command": "sleep 1"},
+                ]
+            },
+        }
+    )
+    assert config is not None
+
+    started = time.monotonic()
+    handle = manager.ensure_web_server(config, worktree_path=tmp_path)
+    elapsed = time.monotonic() - started
+
+    assert handle.started_by_us is False
+    # Sequential execution would take >= 3s.
+    assert elapsed < 2.5
+
+
+def test_http_prober_reuses_keep_alive_connection(http_server: ThreadingHTTPServer) -> None:
+    url = f"http://127.0.0.1:{http_server.server_address[1]}/health"
+    prober = manager._HttpProber()  # noqa: SLF001
+    try:
+        assert all(prober.probe(url, timeout_seconds=2.0) for _ in range(5))
+    finally:
+        prober.close()
+    assert len(_KeepAliveHandler.peers) == 1
+
+
+def test_steps_that_passed_after_start_are_not_rerun(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    log = tmp_path / "checks.log"
+    ready = tmp_path / "ready"
+    config = WebServerConfig.from_raw(
+        {
+            "url": "http://127.0.0.1:9/",
+            "startup_timeout_seconds": 10,
+            "poll_interval_seconds": 0.05,
+            "poll_max_interval_seconds": 0.1,
+            "start": {"command": f"sh -c 'sleep 0.4; touch {ready}'"},
+            "verify": {
+                "steps": [
+                    {"kind": "command", "command": f"sh -c 'echo fast >> {log}'"},
+                    {"kind": "command", "command": f"sh -c 'echo slow >> {log}; test -f {ready}'"},
+                ]
+            },
+        }
+    )
+    assert config is not None
+
+    # The fast step "fails" only before the start, forcing a start cycle.
+    real_verify_step = manager._verify_step  # noqa: SLF001
+    calls = {"n": 0}
+
+    def _first_round_fails(idx, step, cfg, **kwargs):
+        calls["n"] += 1
+        failure = real_verify_step(idx, step, cfg, **kwargs)
+        if idx == 0 and calls["n"] <= 2:
+            return manager.VerifyFailure(idx, step.kind, "not yet")
+        return failure
+
+    monkeypatch.setattr(manager, "_verify_step", _first_round_fails)
+    handle = manager.ensure_web_server(config, worktree_path=tmp_path)
+    assert handle.started_by_us is True
+
+    lines = log.read_text(encoding="utf-8").splitlines()
+    # One fast check before the start and exactly one after it; the slow check polled until ready.
+    assert lines.count("fast") == 2
+    assert lines.count("slow") >= 3
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import random
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+from edison.core.utils.profiling import Profiler, count, enable_profiler
+from edison.core.workflow.checklists import _concurrency
+from edison.core.workflow.checklists._concurrency import map_ordered
+
+
+def test_map_ordered_keeps_input_order_and_context() -> None:
+    def _work(i: int) -> int:
+        time.sleep(random.random() / 200)
+        count("item")
+        return i * i
+
+    profiler = Profiler()
+    with enable_profiler(profiler):
+        assert map_ordered(_work, range(40)) == [i * i for i in range(40)]
+    assert profiler.counters["item"] == 40
+
+    def _fails(i: int) -> int:
+        if i in (3, 7):
+            time.sleep(0.01 if i == 3 else 0)
+            raise ValueError(f"item {i}")
+        return i
+
+    with pytest.raises(ValueError, match="item 3"):
+        map_ordered(_fails, range(10))
+
+
+def test_cli_engine_availability_is_probed_once(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    from edison.core.qa.engines.base import EngineConfig
+    from edison.core.qa.engines.cli import CLIEngine
+
+    cfg_dir = tmp_path / ".edison" / "config"
+    cfg_dir.mkdir(parents=True)
+    (cfg_dir / "orchestration.yml").write_text("orchestration:\n  allowCliEngines: true\n", encoding="utf-8")
+
+    probes: list[str] = []
+
+    def _which(cmd: str) -> str:
+        probes.append(cmd)
+        return "/bin/true"
+
+    monkeypatch.setattr(shutil, "which", _which)
+    engine = CLIEngine(EngineConfig.from_dict("gemini-cli", {"type": "cli", "command": "gemini"}), project_root=tmp_path)
+
+    assert all(engine.can_execute() for _ in range(5))
+    assert probes == ["gemini"]
+
+    monkeypatch.setenv("PATH", "/nonexistent")
+    engine.can_execute_details()
+    assert probes == ["gemini", "gemini"]
+
+
+@pytest.mark.qa
+def test_session_close_preflight_is_deterministic(isolated_project_env: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(isolated_project_env)
+
+    from edison.core.task.models import Task
+    from edison.core.task.repository import TaskRepository
+    from edison.core.workflow.checklists.session_close_preflight import SessionClosePreflightChecklistEngine
+
+    repo = TaskRepository(project_root=isolated_project_env)
+    for i in range(12):
+        task = Task.create(f"T-{i:02d}", f"Task {i}", session_id="sess-close")
+        task.state = "done"
+        repo.save(task)
+
+    engine = SessionClosePreflightChecklistEngine(project_root=isolated_project_env)
+    parallel = engine.compute(session_id="sess-close")
+    monkeypatch.setattr(_concurrency, "DEFAULT_MAX_WORKERS", 1)
+    sequential = engine.compute(session_id="sess-close")
+
+    assert parallel == sequential
+    items = {i["id"]: i for i in parallel["items"]}
+    assert "12 task(s)" in items["closing-set"]["rationale"]
+    assert "T-00, T-01, T-02, T-03, T-04 (+more)" in items["qa-ready"]["rationale"]
+    assert parallel["hasBlockers"] is True